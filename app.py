@@ -7,15 +7,18 @@ import logging
 import logging.config
 import sys
 import traceback
+from functools import partial
+from typing import Any
 
 import uvicorn
 
 from backend.main import app as api_app
+from govdocverify.cli import RenderedResult
 from govdocverify.logging_config import setup_logging
 from govdocverify.models import (
     VisibilitySettings,
 )
-from govdocverify.processing import build_results_dict
+from govdocverify.processing import index_results
 from govdocverify.processing import process_document as _run_checks
 from govdocverify.utils import extract_docx_metadata
 from govdocverify.utils.formatting import FormatStyle, ResultFormatter
@@ -31,13 +34,24 @@ def _create_error_div(error_msg: str) -> str:
     )
 
 
+def _error_result(error_msg: str) -> dict[str, Any]:
+    """Return the result of a document that could not be processed."""
+    return {"has_errors": True, "error": error_msg, "rendered": _create_error_div(error_msg)}
+
+
 def process_document(
     file_path: str,
     doc_type: str,
     visibility_settings: VisibilitySettings,
     group_by: str = "category",
-) -> str:
-    """Process a document and return formatted results."""
+) -> dict[str, Any]:
+    """Process a document and return its results.
+
+    The HTML report is the ``rendered`` key of the returned
+    :class:`~govdocverify.cli.RenderedResult`; it is only formatted when a
+    caller looks it up, so clients that only need ``by_category`` never pay
+    for it. Failures return a result whose ``rendered`` report is the error.
+    """
     logger.debug("[PROOF] process_document called")
     logger.debug(
         "[DIAG] process_document called with "
@@ -51,39 +65,47 @@ def process_document(
         formatter = ResultFormatter(style=FormatStyle.HTML)
         metadata = extract_docx_metadata(file_path)
 
-        # Run the document checks using the shared processing module
-        results = _run_checks(file_path, doc_type)
+        # Run only the visible categories using the shared processing module
+        results = _run_checks(file_path, doc_type, visibility_settings)
 
-        logger.info("Formatting results")
         logger.debug(f"Raw results type: {type(results)}")
-        logger.debug(f"Raw results dir: {dir(results)}")
 
         # Process and validate results dictionary
-        results_dict = build_results_dict(results)
+        index = index_results(results)
+        results_dict = index.results
         logger.debug(f"[DIAG] Final results_dict keys: {list(results_dict.keys())}")
 
-        logger.info(f"Results dict before formatting: {results_dict}")
-        formatted_results = formatter.format_results(
-            results_dict,
-            doc_type,
-            group_by=group_by,
-            metadata=metadata,
+        format_kwargs = {"group_by": group_by, "metadata": metadata, "index": index}
+        render = partial(formatter.format_results, results_dict, doc_type, **format_kwargs)
+        write = partial(
+            formatter.write_results, results=results_dict, doc_type=doc_type, **format_kwargs
         )
         logger.info("Document processing completed successfully")
-        return formatted_results
+        severity = getattr(results, "severity", None)
+        return RenderedResult(
+            {
+                "has_errors": not results.success if hasattr(results, "success") else False,
+                "severity": severity.name if severity is not None else None,
+                "by_category": results_dict,
+                "summary": index.summary(),
+                "metadata": metadata,
+            },
+            render=render,
+            write=write,
+        )
 
     except FileNotFoundError:
         error_msg = f"File not found: {file_path}"
         logger.error(error_msg)
-        return _create_error_div(error_msg)
+        return _error_result(error_msg)
     except PermissionError:
         error_msg = f"Permission denied: {file_path}"
         logger.error(error_msg)
-        return _create_error_div(error_msg)
+        return _error_result(error_msg)
     except Exception as e:
         error_msg = f"Error processing document: {str(e)}"
         logger.error(f"{error_msg}\n{traceback.format_exc()}")
-        return _create_error_div(error_msg)
+        return _error_result(error_msg)
 
 
 def main() -> int:
@@ -1,22 +1,31 @@
 import asyncio
 import hashlib
+import hmac
 import json
 import logging
 import os
 import tempfile
 import threading
 import time
-from contextlib import contextmanager
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
 from typing import Any
 
-from fastapi import BackgroundTasks, File, Form, HTTPException, UploadFile
+from fastapi import BackgroundTasks, File, Form, Header, HTTPException, UploadFile
 from fastapi.responses import FileResponse, JSONResponse
 
 from govdocverify import export
 from govdocverify.cli import process_document
+from govdocverify.comparison import compare_documents
 from govdocverify.models import VisibilitySettings
+from govdocverify.plugins import get_plugin_manager
+from govdocverify.sandbox import SandboxError, check_document, compare_in_sandbox, get_sandbox_pool
+from govdocverify.utils import fingerprint
+from govdocverify.utils.memory_profile import memory_stage, profile_memory
+from govdocverify.utils.ruleset import get_ruleset, refresh_ruleset
 from govdocverify.utils.security import SecurityError, rate_limit, validate_file
+from govdocverify.utils.tracing import set_span_attributes, start_trace, trace_span
 
 log = logging.getLogger(__name__)
 
@@ -35,6 +44,21 @@ _RESULTS_LOCK = threading.Lock()
 _ACTIVE_REQUESTS = 0
 _ACTIVE_LOCK = threading.Lock()
 _PROCESS_DELAY = float(os.getenv("PROCESS_DELAY", "0"))
+# Rendered reports are cached per ``(result_id, group_by)`` so identical
+# submissions skip formatting. The cache is a small in-process LRU.
+RENDER_CACHE_SIZE = int(os.getenv("RENDER_CACHE_SIZE", "64"))
+_RENDERED: "OrderedDict[tuple[str, str], str]" = OrderedDict()
+_RENDERED_LOCK = threading.Lock()
+# Uploads already checked map to their result id, so a repeated submission is
+# answered from the stored result and rendered report without checking again.
+# The key covers the upload's content, the options and the checker (rule set
+# version and checker fingerprint); uses ``CHECK_CACHE_SIZE`` entries.
+CHECK_CACHE_SIZE = int(os.getenv("CHECK_CACHE_SIZE", "64"))
+_CHECKED: "OrderedDict[str, str]" = OrderedDict()
+# Admin endpoints are only enabled when a token is configured.
+ADMIN_TOKEN_ENV = "GOVDOCVERIFY_ADMIN_TOKEN"
+# Response header naming the memory profile report written for a request.
+MEMORY_PROFILE_HEADER = "X-Memory-Profile"
 
 
 def _cleanup_results(force: bool = False) -> None:
@@ -81,6 +105,58 @@ def _load_result(result_id: str) -> dict[str, Any] | None:
     return None
 
 
+def _get_rendered(result_id: str, group_by: str, result: dict[str, Any]) -> str:
+    """Return the rendered report for ``result``, formatting it at most once per key."""
+    key = (result_id, group_by)
+    with _RENDERED_LOCK:
+        cached = _RENDERED.get(key)
+        if cached is not None:
+            _RENDERED.move_to_end(key)
+            return cached
+    rendered = result.get("rendered", "")
+    with _RENDERED_LOCK:
+        _RENDERED[key] = rendered
+        while len(_RENDERED) > RENDER_CACHE_SIZE:
+            _RENDERED.popitem(last=False)
+    return rendered
+
+
+def _check_key(content: bytes, doc_type: str, vis: VisibilitySettings) -> str:
+    """Return the check cache key of an upload checked as ``doc_type`` with ``vis``."""
+    parts = [
+        hashlib.sha256(content).hexdigest(),
+        doc_type,
+        json.dumps(vis.to_dict(), sort_keys=True),
+        get_ruleset().version,
+        fingerprint.checker_fingerprint(),
+    ]
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+def _cached_response(key: str, group_by: str) -> JSONResponse | None:
+    """Answer from an earlier check of the same upload, if its report is still cached."""
+    with _RENDERED_LOCK:
+        result_id = _CHECKED.get(key)
+        rendered = _RENDERED.get((result_id, group_by)) if result_id else None
+        if rendered is None:
+            return None
+        _CHECKED.move_to_end(key)
+        _RENDERED.move_to_end((result_id, group_by))
+    data = _load_result(result_id)
+    if data is None:
+        return None
+    return _response(data, rendered, result_id)
+
+
+def _remember_check(key: str, result_id: str) -> None:
+    """Record that the upload with check cache ``key`` produced ``result_id``."""
+    with _RENDERED_LOCK:
+        _CHECKED[key] = result_id
+        _CHECKED.move_to_end(key)
+        while len(_CHECKED) > CHECK_CACHE_SIZE:
+            _CHECKED.popitem(last=False)
+
+
 @contextmanager
 def _track_request() -> Any:
     """Track the number of active requests."""
@@ -106,22 +182,118 @@ def wait_for_active_requests(timeout: float = 30.0) -> None:
         time.sleep(0.05)
 
 
+def _memory_profile_requested(x_profile_memory: str | None, x_admin_token: str | None) -> bool:
+    """Return whether an ``X-Profile-Memory`` header asks for a memory profile.
+
+    Profiling slows a request down considerably, so it needs the admin token.
+    """
+    if (x_profile_memory or "").strip().lower() in {"", "0", "false", "no", "off"}:
+        return False
+    _require_admin(x_admin_token)
+    return True
+
+
+async def _check_upload(
+    path: str, doc_type: str, vis: VisibilitySettings, group_by: str, sandboxed: bool = True
+) -> Any:
+    """Check an uploaded document, in a sandbox process when they are enabled.
+
+    A document that exhausts or crashes its sandbox is answered with 422.
+    """
+    pool = get_sandbox_pool() if sandboxed else None
+    if pool is None:
+        return process_document(path, doc_type, vis, group_by=group_by)
+    with trace_span("sandbox"):
+        try:
+            return await asyncio.to_thread(pool.run, check_document, path, doc_type, vis, group_by)
+        except SandboxError as exc:
+            raise HTTPException(status_code=422, detail=str(exc)) from exc
+
+
+def _response(result: dict[str, Any], rendered: str, result_id: str) -> JSONResponse:
+    return JSONResponse(
+        {
+            "has_errors": result.get("has_errors", False),
+            "severity": result.get("severity"),
+            "rendered": rendered,
+            "metadata": result.get("metadata", {}),
+            "by_category": result.get("by_category", {}),
+            "result_id": result_id,
+        }
+    )
+
+
+def _result_response(
+    result: Any, doc_type: str, group_by: str, check_key: str | None = None
+) -> JSONResponse:
+    """Cache a check result and build the response.
+
+    ``check_key`` (see :func:`_check_key`) lets a repeat of the upload reuse the result.
+    """
+    if isinstance(result, dict):
+        # A lazily rendered result is hashed without its report, which
+        # is then formatted at most once per ``(result_id, group_by)``.
+        payload = dict(result)
+        result_id = fingerprint.result_id(payload, doc_type)
+        with memory_stage("format"), trace_span("format", group_by=group_by):
+            rendered = _get_rendered(result_id, group_by, result)
+        with trace_span("save_result"):
+            _save_result(result_id, {**payload, "rendered": rendered})
+        if check_key is not None:
+            _remember_check(check_key, result_id)
+        set_span_attributes(issue_count=(result.get("summary") or {}).get("total"))
+        return _response(result, rendered, result_id)
+    data = {"html": result}
+    result_id = hashlib.sha256(result.encode()).hexdigest()
+    with trace_span("save_result"):
+        _save_result(result_id, data)
+    return JSONResponse({"html": result, "result_id": result_id})
+
+
+async def _compare_uploads(
+    old_path: str, new_path: str, doc_type: str, vis: VisibilitySettings
+) -> dict[str, Any]:
+    """Compare two uploaded versions, in a sandbox process when they are enabled.
+
+    A pair that exhausts or crashes its sandbox is answered with 422.
+    """
+    pool = get_sandbox_pool()
+    if pool is None:
+        return compare_documents(old_path, new_path, doc_type, vis).to_dict()
+    with trace_span("sandbox"):
+        try:
+            return await asyncio.to_thread(
+                pool.run, compare_in_sandbox, old_path, new_path, doc_type, vis
+            )
+        except SandboxError as exc:
+            raise HTTPException(status_code=422, detail=str(exc)) from exc
+
+
 @rate_limit
 async def process_doc_endpoint(
     doc_file: UploadFile = File(...),
     doc_type: str = Form(...),
     visibility_json: str = Form("{}"),
     group_by: str = Form("category"),
+    x_profile_memory: str | None = Header(None),
+    x_admin_token: str | None = Header(None),
 ):
     tmp_path = None
-    with _track_request():
+    with (
+        _track_request(),
+        start_trace("process", **{"http.route": "/process", "doc_type": doc_type}) as trace,
+    ):
         try:
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".docx") as tmp:
-                tmp.write(await doc_file.read())
-                tmp_path = tmp.name
+            with trace_span("upload.write"):
+                content = await doc_file.read()
+                with tempfile.NamedTemporaryFile(delete=False, suffix=".docx") as tmp:
+                    tmp.write(content)
+                    tmp_path = tmp.name
+            set_span_attributes(size=len(content))
 
             try:
-                validate_file(tmp_path)
+                with trace_span("validate_file"):
+                    validate_file(tmp_path)
             except SecurityError as se:
                 raise HTTPException(status_code=400, detail=str(se)) from se
 
@@ -137,27 +309,24 @@ async def process_doc_endpoint(
                 raise HTTPException(status_code=400, detail="invalid group_by")
 
             vis = VisibilitySettings.from_dict_json(visibility_json)
-            result = process_document(tmp_path, doc_type, vis, group_by=group_by)
-
-            if isinstance(result, dict):
-                result_id = hashlib.sha256(
-                    json.dumps(result, sort_keys=True).encode()
-                ).hexdigest()
-                _save_result(result_id, result)
-                return JSONResponse(
-                    {
-                        "has_errors": result.get("has_errors", False),
-                        "severity": result.get("severity"),
-                        "rendered": result.get("rendered", ""),
-                        "metadata": result.get("metadata", {}),
-                        "by_category": result.get("by_category", {}),
-                        "result_id": result_id,
-                    }
-                )
-            data = {"html": result}
-            result_id = hashlib.sha256(result.encode()).hexdigest()
-            _save_result(result_id, data)
-            return JSONResponse({"html": result, "result_id": result_id})
+            profiling = _memory_profile_requested(x_profile_memory, x_admin_token)
+            label = doc_file.filename or "upload"
+            key = _check_key(content, doc_type, vis)
+            # A memory profile measures the checks, so it never reuses a result.
+            response = None if profiling else _cached_response(key, group_by)
+            set_span_attributes(cache_hit=response is not None)
+            profile = None
+            if response is None:
+                with profile_memory(label, doc_type) if profiling else nullcontext() as profile:
+                    # A memory profile measures this process, so it skips the sandbox.
+                    result = await _check_upload(
+                        tmp_path, doc_type, vis, group_by, sandboxed=not profiling
+                    )
+                    response = _result_response(result, doc_type, group_by, key)
+            if profile is not None:
+                response.headers[MEMORY_PROFILE_HEADER] = profile.path.name
+            response.headers["Server-Timing"] = trace.server_timing()
+            return response
 
         except HTTPException:
             raise
@@ -169,6 +338,45 @@ async def process_doc_endpoint(
                 os.unlink(tmp_path)
 
 
+@rate_limit
+async def compare_endpoint(
+    old_file: UploadFile = File(...),
+    new_file: UploadFile = File(...),
+    doc_type: str = Form(...),
+    visibility_json: str = Form("{}"),
+):
+    tmp_paths: list[str] = []
+    with _track_request():
+        try:
+            for upload in (old_file, new_file):
+                with tempfile.NamedTemporaryFile(delete=False, suffix=".docx") as tmp:
+                    tmp.write(await upload.read())
+                    tmp_paths.append(tmp.name)
+                try:
+                    validate_file(tmp_paths[-1])
+                except SecurityError as se:
+                    raise HTTPException(status_code=400, detail=str(se)) from se
+
+            try:
+                json.loads(visibility_json)
+            except json.JSONDecodeError as exc:
+                raise HTTPException(status_code=400, detail="invalid visibility_json") from exc
+
+            vis = VisibilitySettings.from_dict_json(visibility_json)
+            comparison = await _compare_uploads(tmp_paths[0], tmp_paths[1], doc_type, vis)
+            return JSONResponse(comparison)
+
+        except HTTPException:
+            raise
+        except Exception as e:
+            log.exception("comparison failed")
+            raise HTTPException(500, str(e))
+        finally:
+            for path in tmp_paths:
+                if os.path.exists(path):
+                    os.unlink(path)
+
+
 async def download_result(result_id: str, fmt: str, background: BackgroundTasks) -> FileResponse:
     data = _load_result(result_id)
     if data is None:
@@ -186,3 +394,35 @@ async def download_result(result_id: str, fmt: str, background: BackgroundTasks)
         raise HTTPException(status_code=400, detail="unsupported format")
     background.add_task(os.unlink, path)
     return FileResponse(path, media_type=media, filename=f"results{suffix}", background=background)
+
+
+def _require_admin(x_admin_token: str | None) -> None:
+    expected = os.getenv(ADMIN_TOKEN_ENV)
+    if not expected:
+        raise HTTPException(status_code=404, detail="admin endpoints are disabled")
+    if not x_admin_token or not hmac.compare_digest(x_admin_token, expected):
+        raise HTTPException(status_code=403, detail="invalid admin token")
+
+
+async def reload_ruleset_endpoint(x_admin_token: str | None = Header(None)):
+    """Recompile the rule set from its sources and swap it in for new requests."""
+    _require_admin(x_admin_token)
+
+    previous = get_ruleset().version
+    try:
+        ruleset = refresh_ruleset(force=True, raise_errors=True)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    return JSONResponse(
+        {
+            "version": ruleset.version,
+            "previous_version": previous,
+            "reloaded": ruleset.version != previous,
+        }
+    )
+
+
+async def plugin_stats_endpoint(x_admin_token: str | None = Header(None)):
+    """Report import time, run time and memory of the entry point plugins."""
+    _require_admin(x_admin_token)
+    return JSONResponse({"plugins": get_plugin_manager().stats()})
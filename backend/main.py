@@ -4,7 +4,21 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
-from backend.api import download_result, process_doc_endpoint, wait_for_active_requests
+from backend.api import (
+    compare_endpoint,
+    download_result,
+    plugin_stats_endpoint,
+    process_doc_endpoint,
+    reload_ruleset_endpoint,
+    wait_for_active_requests,
+)
+from govdocverify.processing import PRELOAD_ENV, preload_shared_rules
+from govdocverify.sandbox import set_sandbox_pool
+
+# With a forking server (for example gunicorn --preload) the rule data built
+# here is shared copy-on-write by every worker.
+if os.getenv(PRELOAD_ENV, "").lower() in {"1", "true", "yes"}:
+    preload_shared_rules()
 
 app = FastAPI(title="FAA-Document-Checker API")
 
@@ -22,13 +36,17 @@ app.add_middleware(
 )
 
 app.post("/process")(process_doc_endpoint)
+app.post("/compare")(compare_endpoint)
 app.get("/results/{result_id}.{fmt}")(download_result)
+app.post("/admin/ruleset/reload")(reload_ruleset_endpoint)
+app.get("/admin/plugins")(plugin_stats_endpoint)
 
 
 @app.on_event("shutdown")
 def _wait_for_requests() -> None:
     """Ensure in-flight requests complete before shutting down."""
     wait_for_active_requests()
+    set_sandbox_pool(None)
 
 # Optionally serve static files (for Docker deployment)
 STATIC_DIR = os.getenv("STATIC_DIR")
@@ -1,7 +1,7 @@
 import logging
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from docx import Document
 from docx.document import Document as DocxDocument
@@ -9,8 +9,17 @@ from docx.document import Document as DocxDocument
 from govdocverify.checks.base_checker import BaseChecker
 from govdocverify.checks.check_registry import CheckRegistry
 from govdocverify.models import DocumentCheckResult, Severity
+from govdocverify.utils.deadlines import raise_if_cancelled
 from govdocverify.utils.decorators import profile_performance
-from govdocverify.utils.link_utils import deprecated_lookup, find_urls
+from govdocverify.utils.document_outline import DocumentOutline, outline_of
+from govdocverify.utils.image_index import ImageIndex, image_index_of
+from govdocverify.utils.link_utils import (
+    HyperlinkIndex,
+    build_hyperlink_index,
+    get_deprecated_index,
+    scan_urls,
+)
+from govdocverify.utils.paragraph_table import paragraph_table_of
 from govdocverify.utils.terminology_utils import TerminologyManager
 
 logger = logging.getLogger(__name__)
@@ -31,7 +40,9 @@ class AccessibilityChecks(BaseChecker):
         self.terminology_manager = terminology_manager or TerminologyManager()
         logger.info("Initialized AccessibilityChecks")
 
-    @CheckRegistry.register("accessibility")
+    @CheckRegistry.register(
+        "accessibility", requires=("paragraphs", "paragraph_table", "outline", "images")
+    )
     def check_document(self, document, doc_type) -> DocumentCheckResult:
         results = DocumentCheckResult()
         # Accept Document, list, or str
@@ -52,12 +63,22 @@ class AccessibilityChecks(BaseChecker):
                 return results
         if lines is None:
             if hasattr(document, "paragraphs"):
-                lines = [p.text for p in document.paragraphs]
+                table = paragraph_table_of(document)
+                lines = (
+                    list(table.texts)
+                    if table is not None
+                    else [p.text for p in document.paragraphs]
+                )
             elif isinstance(document, list):
                 lines = document
             else:
                 lines = str(document).split("\n")
         self.run_checks(lines, doc_type, results)
+        images = image_index_of(document)
+        if images is not None:
+            self._report_missing_alt_text(images, results)
+        raise_if_cancelled(results)
+        self._check_hyperlinks(document if hasattr(document, "paragraphs") else lines, results)
         return results
 
     def check_text(self, text: str) -> DocumentCheckResult:
@@ -364,11 +385,25 @@ class AccessibilityChecks(BaseChecker):
     ) -> List[Tuple[int, str]]:
         """Extract headings from DOCX document."""
         logger.debug("Processing Document content for heading structure")
+        if paragraph_table_of(content) is not None:
+            outline = outline_of(content)
+        else:
+            outline = DocumentOutline.from_rows(self._paragraph_rows(content.paragraphs))
         headings = []
+        for heading in outline.headings:
+            text = heading.text.strip()
+            if heading.level is not None and text:
+                headings.append((heading.level, text))
+                logger.debug(f"Found heading {heading.level}: {text}")
+        return headings
 
-        for paragraph in content.paragraphs:
+    @staticmethod
+    def _paragraph_rows(paragraphs) -> Iterator[Tuple[Optional[str], str]]:
+        """Yield ``(style name, text)`` for paragraph proxies, including test mocks."""
+        for paragraph in paragraphs:
             try:
                 if not hasattr(paragraph, "style"):
+                    yield None, ""
                     continue
 
                 if hasattr(paragraph.style, "_mock_name"):
@@ -376,23 +411,10 @@ class AccessibilityChecks(BaseChecker):
                 else:
                     style_attr = getattr(paragraph.style, "name", "")
                     style_name = str(getattr(style_attr, "_mock_name", style_attr))
-                if not style_name.startswith("Heading"):
-                    continue
-
-                match = re.search(r"Heading\s+(\d+)", style_name)
-                if not match:
-                    continue
-                level = int(match.group(1))
-                text = paragraph.text.strip()
-                if text:
-                    headings.append((level, text))
-                    logger.debug(f"Found heading {level}: {text}")
-
+                yield style_name, paragraph.text
             except Exception as e:
                 logger.error(f"Error processing paragraph: {str(e)}")
-                continue
-
-        return headings
+                yield None, ""
 
     def _extract_markdown_headings(self, content: List[str]) -> List[Tuple[int, str]]:
         """Extract headings from markdown content."""
@@ -467,37 +489,34 @@ class AccessibilityChecks(BaseChecker):
             )
             return
 
-        links, lines = self._extract_links_and_lines(content, results)
+        links, lines, hyperlinks = self._extract_links_and_lines(content, results)
         if links is None or lines is None:
             return
 
         self._check_link_descriptions(links, results)
-        self._check_deprecated_links(lines, results)
+        self._check_deprecated_links(lines, results, hyperlinks)
 
     def _extract_links_and_lines(
         self, content: Union[Document, List[str]], results: DocumentCheckResult
-    ) -> Tuple[Optional[List[str]], Optional[List[str]]]:
-        """Extract links and text lines from content."""
+    ) -> Tuple[Optional[List[str]], Optional[List[str]], Optional[HyperlinkIndex]]:
+        """Extract link texts, text lines and, for DOCX content, the hyperlink index."""
         # Handle both Document and Mock objects
         if hasattr(content, "paragraphs"):  # Check for Document-like object
             return self._extract_docx_links(content)
         else:
-            return self._extract_markdown_links(content, results)
+            links, lines = self._extract_markdown_links(content, results)
+            return links, lines, None
 
-    def _extract_docx_links(self, content) -> Tuple[List[str], List[str]]:
+    def _extract_docx_links(self, content) -> Tuple[List[str], List[str], HyperlinkIndex]:
         """Extract links from DOCX document."""
-        links = []
         # Defensive: ensure only strings are joined
         lines = [
             p.text if isinstance(p.text, str) else str(p.text) if p.text is not None else ""
             for p in content.paragraphs
         ]
-        for paragraph in content.paragraphs:
-            for run in paragraph.runs:
-                if hasattr(run, "_element") and hasattr(run._element, "xpath"):
-                    if run._element.xpath(".//w:hyperlink"):
-                        links.append(run.text)
-        return links, lines
+        hyperlinks = build_hyperlink_index(content.paragraphs)
+        links = [link.text for link in hyperlinks]
+        return links, lines, hyperlinks
 
     def _extract_markdown_links(
         self, content: List[str], results: DocumentCheckResult
@@ -543,17 +562,43 @@ class AccessibilityChecks(BaseChecker):
                     severity=Severity.WARNING,
                 )
 
-    def _check_deprecated_links(self, lines: List[str], results: DocumentCheckResult) -> None:
-        """Check for deprecated FAA links."""
-        text_source = "\n".join(lines)
-        for url, span in find_urls(text_source):
-            replacement = deprecated_lookup(url)
+    def _check_deprecated_links(
+        self,
+        lines: List[str],
+        results: DocumentCheckResult,
+        hyperlinks: Optional[HyperlinkIndex] = None,
+    ) -> None:
+        """Check for deprecated FAA links in visible text and hyperlink targets."""
+        index = get_deprecated_index()
+        reported: Dict[int, List[Tuple[int, int]]] = {}
+        for match in scan_urls(lines):
+            replacement = index.lookup(match.url)
             if replacement:
                 results.add_issue(
-                    message=f"Change URL from '{url}' to '{replacement}'.",
+                    message=f"Change URL from '{match.url}' to '{replacement}'.",
                     severity=Severity.ERROR,
-                    line_number=span[0],
+                    line_number=match.paragraph + 1,
                 )
+                reported.setdefault(match.paragraph, []).append((match.start, match.end))
+
+        if not hyperlinks:
+            return
+        for link in hyperlinks.external():
+            replacement = index.lookup(link.target)
+            if not replacement:
+                continue
+            # Skip links whose visible text already reported the same URL
+            spans = reported.get(link.paragraph, ())
+            if any(start < link.end and link.start < end for start, end in spans):
+                continue
+            results.add_issue(
+                message=(
+                    f"Change the target of link '{link.text}' from '{link.target}' "
+                    f"to '{replacement}'."
+                ),
+                severity=Severity.ERROR,
+                line_number=link.paragraph + 1,
+            )
 
     def run_checks(self, document: Document, doc_type: str, results: DocumentCheckResult) -> None:
         """Run all accessibility-related checks."""
@@ -596,7 +641,33 @@ class AccessibilityChecks(BaseChecker):
     def _check_docx_alt_text(self, content: DocxDocument, results: DocumentCheckResult) -> None:
         """Check alt text in DOCX document images."""
         logger.debug("Processing Document content for alt text")
+        images = image_index_of(content)
+        if images is not None:
+            self._report_missing_alt_text(images, results)
+        else:
+            self._scan_inline_shapes(content, results)
+
+    def _report_missing_alt_text(self, images: ImageIndex, results: DocumentCheckResult) -> None:
+        """Report the indexed drawings that are neither decorative nor described."""
+        for image in images:
+            # Filter decorative images by flag or name
+            if image.decorative or self._is_decorative_image(image.name):
+                logger.debug(f"Skipping decorative image: {image.name}")
+                continue
+            if image.descr or image.title:
+                continue
+            display_name = self._get_display_name(image.name)
+            where = "" if image.part == "body" else f" in {image.part}"
+            results.add_issue(
+                message=f"Image '{display_name}'{where} is missing alt text",
+                severity=Severity.ERROR,
+                line_number=None if image.paragraph is None else image.paragraph + 1,
+                category=self.category,
+            )
+            logger.debug(f"Found image missing alt text: {display_name}")
 
+    def _scan_inline_shapes(self, content: Any, results: DocumentCheckResult) -> None:
+        """Check alt text through ``inline_shapes`` for documents without XML."""
         for shape in content.inline_shapes:
             try:
                 image_info = self._extract_image_info(shape)
@@ -1,10 +1,11 @@
 import logging
-from typing import List, Optional
+from typing import Any, Callable, List, Optional
 
 from govdocverify.checks.base_checker import BaseChecker
 from govdocverify.checks.check_registry import CheckRegistry
 
 from ..models import DocumentCheckResult
+from ..utils.paragraph_stream import paragraph_stream_of, paragraph_windows
 from ..utils.terminology_utils import TerminologyManager
 
 logger = logging.getLogger(__name__)
@@ -25,9 +26,14 @@ class AcronymChecker(BaseChecker):
         self.terminology_manager = terminology_manager or TerminologyManager()
         logger.info("Initialized AcronymChecker")
 
-    @CheckRegistry.register("acronym")
+    @CheckRegistry.register("acronym", requires=("paragraph_stream", "notes"))
     def check_document(self, document, doc_type) -> DocumentCheckResult:
-        # Accept Document, list, or str
+        # Accept a facet view (streamed), Document, list, or str
+        if paragraph_stream_of(document) is not None:
+            return self._guarded(
+                self.terminology_manager.check_windows,
+                lambda: ("\n".join(texts) for _, texts in paragraph_windows(document, notes=True)),
+            )
         if hasattr(document, "paragraphs"):
             text = "\n".join([p.text for p in document.paragraphs])
         elif isinstance(document, list):
@@ -45,9 +51,14 @@ class AcronymChecker(BaseChecker):
         Returns:
             DocumentCheckResult with any issues found
         """
+        return self._guarded(self.terminology_manager.check_text, content)
+
+    @staticmethod
+    def _guarded(check: Callable[[Any], DocumentCheckResult], content: Any) -> DocumentCheckResult:
+        """Run ``check`` on ``content``, reporting failures as an error result."""
         logger.debug("Starting acronym text check")
         try:
-            result = self.terminology_manager.check_text(content)
+            result = check(content)
             logger.debug(f"Check completed with {len(result.issues)} issues found")
             return result
         except Exception as e:
@@ -10,6 +10,11 @@ from .check_registry import CheckRegistry
 class BaseChecker:
     """Base class for all GovDocVerify checkers."""
 
+    # Whether every issue depends only on the paragraph at its line number and
+    # the module reads paragraphs through ``paragraph_windows`` alone, so it
+    # can be run on a subset of the paragraphs (see ``govdocverify.comparison``).
+    paragraph_local = False
+
     def __init__(self, terminology_manager: Any | None = None) -> None:
         self.name = self.__class__.__name__
         self.pattern_cache = None
@@ -76,6 +81,13 @@ class BaseChecker:
         """Create a standardized check result."""
         return DocumentCheckResult(success=success, issues=issues, checker_name=self.name)
 
+    @staticmethod
+    def merge_results(target: DocumentCheckResult, *parts: DocumentCheckResult) -> None:
+        """Append the issues of ``parts`` to ``target`` in order."""
+        for part in parts:
+            for issue in part.issues:
+                target.add_issue(**issue)
+
     @classmethod
     def get_registered_checks(cls) -> Dict[str, List[str]]:
         """Get all registered checks for this checker class.
@@ -86,13 +98,14 @@ class BaseChecker:
         return CheckRegistry.get_category_mappings()
 
     @classmethod
-    def register_check(cls, category: str) -> Any:
+    def register_check(cls, category: str, requires: Any = None) -> Any:
         """Decorator to register a check function.
 
         Args:
             category: The category to register the check under
+            requires: Optional names of the document facets the check consumes
 
         Returns:
             Decorator function
         """
-        return CheckRegistry.register(category)
+        return CheckRegistry.register(category, requires)
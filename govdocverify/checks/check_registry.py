@@ -1,21 +1,33 @@
 import logging
 from functools import wraps
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
 
 class CheckRegistry:
-    """Central registry for document check functions."""
+    """Central registry for document check functions.
+
+    Besides the category mapping, the registry records which document facets
+    (see :mod:`govdocverify.utils.document_facets`) each check consumes and
+    which checks are disabled, so the scheduler only builds the facets enabled
+    checks actually need.
+    """
 
     _checks: Dict[str, List[str]] = {}
+    _requirements: Dict[str, Dict[str, FrozenSet[str]]] = {}
+    _disabled: Set[Tuple[str, str]] = set()
 
     @classmethod
-    def register(cls, category: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    def register(
+        cls, category: str, requires: Optional[Iterable[str]] = None
+    ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
         """Decorator to register a check function in a specific category.
 
         Args:
             category: The category to register the check under
+            requires: Names of the document facets the check consumes. Checks
+                that declare nothing fall back to the scheduler defaults.
 
         Returns:
             Decorator function
@@ -25,6 +37,9 @@ class CheckRegistry:
         def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
             @wraps(func)
             def wrapper(*args: Any, **kwargs: Any) -> Any:
+                if (category, func.__name__) in cls._disabled:
+                    logger.debug(f"Skipping disabled check: {category}.{func.__name__}")
+                    return None
                 logger.debug(f"Executing registered check: {func.__name__}")
                 return func(*args, **kwargs)
 
@@ -40,6 +55,14 @@ class CheckRegistry:
             else:
                 logger.debug(f"Check {func.__name__} already registered in category {category}")
 
+            if requires is not None:
+                # Methods of different classes may share a name within a category
+                # (e.g. ``check_document``); the check then needs all their facets.
+                declared = cls._requirements.setdefault(category, {})
+                declared[func.__name__] = declared.get(func.__name__, frozenset()) | frozenset(
+                    requires
+                )
+
             return wrapper
 
         return decorator
@@ -69,11 +92,48 @@ class CheckRegistry:
         logger.debug(f"Found checks: {checks}")
         return checks
 
+    @classmethod
+    def get_requirements(cls, category: str) -> Optional[FrozenSet[str]]:
+        """Return the facets consumed by the enabled checks of ``category``.
+
+        Returns ``None`` when no check in the category declared its facets.
+        """
+        declared = cls._requirements.get(category)
+        if not declared:
+            return None
+        facets: Set[str] = set()
+        for name, requires in declared.items():
+            if (category, name) not in cls._disabled:
+                facets.update(requires)
+        return frozenset(facets)
+
+    @classmethod
+    def set_enabled(cls, category: str, name: str, enabled: bool = True) -> None:
+        """Enable or disable the registered check ``name`` in ``category``.
+
+        A disabled check returns ``None`` without running and its facets are no
+        longer requested from the scheduler.
+        """
+        if enabled:
+            cls._disabled.discard((category, name))
+        else:
+            cls._disabled.add((category, name))
+
+    @classmethod
+    def is_category_enabled(cls, category: str) -> bool:
+        """Return ``False`` when every registered check of ``category`` is disabled."""
+        checks = cls._checks.get(category)
+        if not checks:
+            return True
+        return any((category, name) not in cls._disabled for name in checks)
+
     @classmethod
     def clear_registry(cls) -> None:
         """Clear the check registry. Mainly used for testing."""
         logger.debug("Clearing check registry")
         logger.debug(f"Previous registry state: {cls._checks}")
         cls._checks.clear()
+        cls._requirements.clear()
+        cls._disabled.clear()
         logger.debug("Check registry cleared")
         logger.debug(f"New registry state: {cls._checks}")
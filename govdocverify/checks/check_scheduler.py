@@ -0,0 +1,246 @@
+"""Plan and run check modules along their declared facet dependencies."""
+
+import logging
+import os
+import threading
+from collections import deque
+from contextvars import copy_context
+from functools import partial
+from queue import Empty, SimpleQueue
+from typing import Any, Callable, Dict, FrozenSet, List, NamedTuple, Optional, Sequence, Tuple
+
+from govdocverify.utils.deadlines import CheckTimeout, Deadline, TimeBudgets
+from govdocverify.utils.document_facets import DEFAULT_FACETS, DocumentFacets, facet_closure
+
+from .check_registry import CheckRegistry
+
+logger = logging.getLogger(__name__)
+
+CHECK_WORKERS_ENV = "GOVDOCVERIFY_CHECK_WORKERS"
+
+# Seconds a check whose budget is spent gets to reach its next cancellation
+# point and hand over its partial issues before it is abandoned.
+CANCEL_GRACE = 0.1
+
+
+def check_workers() -> int:
+    """Return the worker count for running independent checks (default 1)."""
+    try:
+        return max(1, int(os.getenv(CHECK_WORKERS_ENV, "1")))
+    except ValueError:
+        logger.warning("Ignoring invalid %s value", CHECK_WORKERS_ENV)
+        return 1
+
+
+class ScheduledCheck(NamedTuple):
+    """A check module, its category and the facets it consumes."""
+
+    module: Any
+    category: str
+    requires: FrozenSet[str]
+
+
+class CheckOutcome(NamedTuple):
+    """The result of one scheduled check, or the exception it raised."""
+
+    check: ScheduledCheck
+    result: Any = None
+    error: Optional[BaseException] = None
+
+
+class CheckPlan:
+    """Checks to run and the facet levels that must be built before them.
+
+    The plan is a two-tier DAG: facets depend on other facets, checks depend
+    on facets. Facets of one level are independent of each other, as are all
+    checks once their facets exist, so each tier fans out over worker threads
+    when more than one worker is configured. Outcomes are always returned in
+    the order the check modules were given.
+    """
+
+    def __init__(self, checks: Sequence[ScheduledCheck]) -> None:
+        self.checks = list(checks)
+        needed = set().union(*(check.requires for check in self.checks))
+        self.facet_levels: List[List[str]] = facet_closure(needed)
+
+    @property
+    def facets(self) -> FrozenSet[str]:
+        """All facets the plan builds, including transitive dependencies."""
+        return frozenset(name for level in self.facet_levels for name in level)
+
+    def run(
+        self,
+        facets: DocumentFacets,
+        execute: Callable[[ScheduledCheck, Deadline], Any],
+        workers: Optional[int] = None,
+        deadline: Optional[Deadline] = None,
+        budgets: Optional[TimeBudgets] = None,
+    ) -> List[CheckOutcome]:
+        """Build the planned facets, then run ``execute`` for every check.
+
+        ``execute`` receives the check and its category :class:`Deadline`,
+        which starts when the check does and is nested in ``deadline``. When
+        any budget is bounded, or more than one worker is configured, every
+        check runs on its own thread and the caller stops waiting for it once
+        its category or the document budget is spent. The check then has
+        :data:`CANCEL_GRACE` seconds to reach its next
+        :func:`~govdocverify.utils.deadlines.raise_if_cancelled`, where it
+        ends its thread and hands over the issues found so far; a check that
+        misses the grace period is reported with the partial issues it last
+        passed to ``raise_if_cancelled`` and left to stop at its next
+        cancellation point. Checks are only cancelled at those points, so
+        they must keep the work between them short (see
+        ``DocumentTitleFormatCheck._find_document_titles``).
+        """
+        workers = check_workers() if workers is None else max(1, workers)
+        deadline = deadline or Deadline(None, "document")
+        budgets = budgets or TimeBudgets()
+
+        def scope(check: ScheduledCheck) -> Deadline:
+            return Deadline(budgets.for_category(check.category), check.category, deadline)
+
+        bounded = deadline.remaining() is not None or any(
+            budgets.for_category(check.category) is not None for check in self.checks
+        )
+        if workers == 1 and not bounded:
+            for level in self.facet_levels:
+                for name in level:
+                    facets.materialize(name)
+            return [_call(execute, check, scope(check)) for check in self.checks]
+
+        for level in self.facet_levels:
+            built = _run_threads(
+                [_Work(partial(_materialize, facets, name), lambda: deadline) for name in level],
+                workers,
+            )
+            if any(isinstance(outcome, CheckTimeout) for outcome in built):
+                return [CheckOutcome(check, error=_timeout(deadline)) for check in self.checks]
+            for outcome in built:
+                if isinstance(outcome, Exception):
+                    raise outcome
+        works = [
+            _Work(partial(_call, execute, check), partial(scope, check)) for check in self.checks
+        ]
+        outcomes = _run_threads(works, workers)
+        return [
+            CheckOutcome(check, error=outcome) if isinstance(outcome, CheckTimeout) else outcome
+            for check, outcome in zip(self.checks, outcomes)
+        ]
+
+
+class _Work(NamedTuple):
+    """A unit of work for :func:`_run_threads` and the deadline it runs under."""
+
+    run: Callable[[Deadline], Any]
+    deadline: Callable[[], Deadline]
+
+
+class _Running:
+    """A unit of work on its own daemon thread, run in a copy of the caller's context."""
+
+    def __init__(
+        self, run: Callable[[Deadline], Any], deadline: Deadline, finished: "SimpleQueue[None]"
+    ) -> None:
+        self.deadline = deadline
+        self.value: Any = None
+        self.done = threading.Event()
+        context = copy_context()
+
+        def target() -> None:
+            try:
+                self.value = context.run(run, deadline)
+            finally:
+                self.done.set()
+                finished.put(None)
+
+        self.thread = threading.Thread(target=target, name="govdocverify-check", daemon=True)
+        self.thread.start()
+
+    def stop(self) -> Any:
+        """Return the value, or a :class:`CheckTimeout`, of work whose deadline passed."""
+        if self.done.wait(CANCEL_GRACE):
+            return self.value
+        logger.warning("Abandoning a check that did not stop within its grace period")
+        return _timeout(self.deadline)
+
+
+def _run_threads(works: Sequence[_Work], workers: int) -> List[Any]:
+    """Run ``works`` on at most ``workers`` live threads, in order of submission.
+
+    Returns the value of every work, or a :class:`CheckTimeout` for work
+    whose deadline passed before it finished or started. Abandoned work no
+    longer counts against ``workers``.
+    """
+    finished: "SimpleQueue[None]" = SimpleQueue()
+    values: List[Any] = [None] * len(works)
+    pending = deque(range(len(works)))
+    running: Dict[int, _Running] = {}
+    while pending or running:
+        while pending and len(running) < workers:
+            index = pending.popleft()
+            deadline = works[index].deadline()
+            if deadline.expired():
+                values[index] = _timeout(deadline)
+            else:
+                running[index] = _Running(works[index].run, deadline, finished)
+        waits = [r.deadline.remaining() for r in running.values()]
+        bounded = [seconds for seconds in waits if seconds is not None]
+        if running and not any(r.done.is_set() for r in running.values()):
+            try:
+                finished.get(timeout=min(bounded) if bounded else None)
+            except Empty:
+                pass
+        for index, run in list(running.items()):
+            if run.done.is_set():
+                values[index] = running.pop(index).value
+            elif run.deadline.expired():
+                values[index] = running.pop(index).stop()
+    return values
+
+
+def _materialize(facets: DocumentFacets, name: str, deadline: Deadline) -> Optional[Exception]:
+    """Build facet ``name``, returning the error for the calling thread to raise."""
+    try:
+        facets.materialize(name)
+    except Exception as exc:
+        return exc
+    return None
+
+
+def _timeout(deadline: Deadline) -> CheckTimeout:
+    """Return the timeout of the spent ``deadline`` with a copy of its last partial issues."""
+    partial = getattr(deadline.partial, "issues", deadline.partial)
+    try:
+        deadline.check()
+    except CheckTimeout as exc:
+        return exc.with_partial(list(partial or ()))
+    return CheckTimeout(deadline.scope, deadline.seconds, list(partial or ()))
+
+
+def _call(
+    execute: Callable[[ScheduledCheck, Deadline], Any], check: ScheduledCheck, scope: Deadline
+) -> CheckOutcome:
+    try:
+        return CheckOutcome(check, result=execute(check, scope))
+    except Exception as exc:
+        return CheckOutcome(check, error=exc)
+
+
+def plan_checks(check_modules: Sequence[Tuple[Any, str]]) -> CheckPlan:
+    """Build a :class:`CheckPlan` for ``(module, category)`` pairs.
+
+    Categories whose registered checks are all disabled are dropped; categories
+    that declared no facets receive :data:`DEFAULT_FACETS`.
+    """
+    scheduled = []
+    for module, category in check_modules:
+        if not CheckRegistry.is_category_enabled(category):
+            logger.info(f"Skipping {category} checks: all registered checks are disabled")
+            continue
+        requires = CheckRegistry.get_requirements(category)
+        scheduled.append(
+            ScheduledCheck(module, category, DEFAULT_FACETS if requires is None else requires)
+        )
+    plan = CheckPlan(scheduled)
+    logger.debug("Planned facets by level: %s", plan.facet_levels)
+    return plan
@@ -9,16 +9,25 @@ except ImportError:  # pragma: no cover - optional dependency
 
 
 from govdocverify.checks.check_registry import CheckRegistry
-from govdocverify.config.validation_patterns import (
-    DATE_PATTERNS,
-    PHONE_PATTERNS,
-)
 from govdocverify.models import DocumentCheckResult, Severity
+from govdocverify.utils.deadlines import CheckTimeout, raise_if_cancelled
+from govdocverify.utils.line_scanner import LineScan, LineScanner
+from govdocverify.utils.paragraph_stream import paragraph_windows
+from govdocverify.utils.ruleset import get_ruleset
 
 from .base_checker import BaseChecker
 
 logger = logging.getLogger(__name__)
 
+_PLACEHOLDER_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"\b(TODO|FIXME|XXX|HACK|NOTE|REVIEW|DRAFT):",
+        r"\b(Add|Update|Review|Fix|Complete)\s+.*\b(here|this|needed)\b",
+        r"\b(Placeholder|Temporary|Draft)\b",
+    )
+]
+
 
 # Message constants for format checks
 class FormatMessages:
@@ -92,7 +101,18 @@ class FormatMessages:
     )
 
 
+_DASH_PATTERNS = [
+    (re.compile(r"\s+[-–—]\s+"), FormatMessages.DASH_SPACE_REMOVE_AROUND),  # Spaces around
+    (re.compile(r"\s+[-–—](?!\s)"), FormatMessages.DASH_SPACE_REMOVE_BEFORE),  # Space only before
+    (re.compile(r"(?<!\s)[-–—]\s+"), FormatMessages.DASH_SPACE_REMOVE_AFTER),  # Space only after
+]
+
+
 class FormatChecks(BaseChecker):
+    # Per-paragraph format rules, scanned in one pass by ``run_checks``. Rule
+    # packs can add their own with ``FormatChecks.line_rules.add_rule``.
+    line_rules = LineScanner()
+
     def __init__(self, terminology_manager=None) -> None:
         """Initialize the format checks.
 
@@ -107,46 +127,81 @@ class FormatChecks(BaseChecker):
         self.category = "format"
 
     def run_checks(self, document: Document, doc_type: str, results: DocumentCheckResult) -> None:
-        """Run all format-related checks."""
-        logger.info(f"Running format checks for document type: {doc_type}")
+        """Run all format-related checks.
 
-        # Get all paragraph text
-        paragraphs = [p.text for p in document.paragraphs]
-
-        # Run specific format checks
-        self._check_date_formats(paragraphs, results)
-        self._check_phone_numbers(paragraphs, results)
-        self._check_placeholders(paragraphs, results)
-        self._check_dash_spacing(paragraphs, results)
-        self._check_caption_formats(paragraphs, doc_type, results)
+        Paragraphs are read one window at a time (see
+        :func:`~govdocverify.utils.paragraph_stream.paragraph_windows`) and
+        scanned once by :attr:`line_rules`; each rule collects into its own
+        result so issues keep the per-check order of a whole-document run.
+        """
+        logger.info(f"Running format checks for document type: {doc_type}")
 
-    @CheckRegistry.register("format")
+        scan = self.line_rules.start(self, doc_type=doc_type)
+        try:
+            for first_line, paragraphs in paragraph_windows(document):
+                scan.feed(paragraphs, first_line)
+                raise_if_cancelled()
+        except CheckTimeout as exc:
+            self.merge_results(results, *scan.results.values())
+            raise exc.with_partial(results) from None
+        self.merge_results(results, *scan.finish())
+
+    @CheckRegistry.register("format", requires=("paragraph_stream",))
     def check_document(self, document: Document, doc_type: str) -> DocumentCheckResult:
         """Check document for format issues."""
         results = DocumentCheckResult()
         self.run_checks(document, doc_type, results)
         return results
 
+    def _scan_paragraphs(
+        self, name: str, paragraphs: list, results: DocumentCheckResult, first_line: int, **context
+    ) -> None:
+        """Run the line rule ``name`` alone over ``paragraphs`` into ``results``."""
+        self.line_rules.start(self, [name], {name: results}, **context).feed(paragraphs, first_line)
+
+    @line_rules.rule("dates", trigger=lambda rules: rules.date_incorrect)
+    def _rule_dates(self, scan: LineScan, results: DocumentCheckResult, line_no: int, text: str):
+        # Skip if text matches any skip patterns
+        if any(pattern.search(text) for pattern in scan.ruleset.date_skip_patterns):
+            return
+
+        # Check for incorrect date format (MM/DD/YYYY)
+        if scan.ruleset.date_incorrect.search(text):
+            results.add_issue(
+                FormatMessages.DATE_FORMAT_ERROR,
+                Severity.ERROR,
+                line_no,
+                category=getattr(self, "category", "format"),
+            )
+
     @BaseChecker.register_check("format")
-    def _check_date_formats(self, paragraphs: list, results: DocumentCheckResult):
+    def _check_date_formats(
+        self, paragraphs: list, results: DocumentCheckResult, first_line: int = 1
+    ):
         """Check for consistent date formats."""
         logger.debug(f"Checking date formats with {len(paragraphs)} paragraphs")
-        for i, text in enumerate(paragraphs):
-            # Skip if text matches any skip patterns
-            if any(re.search(pattern, text) for pattern in DATE_PATTERNS["skip_patterns"]):
-                continue
+        self._scan_paragraphs("dates", paragraphs, results, first_line)
 
-            # Check for incorrect date format (MM/DD/YYYY)
-            if re.search(DATE_PATTERNS["incorrect"], text):
-                results.add_issue(
-                    FormatMessages.DATE_FORMAT_ERROR,
-                    Severity.ERROR,
-                    i + 1,
-                    category=getattr(self, "category", "format"),
-                )
+    def _finish_phone_numbers(self, scan: LineScan, results: DocumentCheckResult) -> None:
+        self._flag_phone_numbers(scan.state.get("phone_numbers", []), results)
+
+    @line_rules.rule(
+        "phone_numbers", trigger=lambda rules: rules.phone_patterns, finish=_finish_phone_numbers
+    )
+    def _rule_phone_numbers(
+        self, scan: LineScan, results: DocumentCheckResult, line_no: int, text: str
+    ):
+        found = scan.state.setdefault("phone_numbers", [])
+        found.extend(self._phone_numbers_in_line(text, line_no, scan.ruleset.phone_patterns))
 
     @BaseChecker.register_check("format")
-    def _check_phone_numbers(self, paragraphs: list, results: DocumentCheckResult):
+    def _check_phone_numbers(
+        self,
+        paragraphs: list,
+        results: DocumentCheckResult,
+        first_line: int = 1,
+        found_numbers: list | None = None,
+    ):
         """
         Flag every line whenever more than one phone-number style is used
         anywhere in the document. Supported styles:
@@ -154,10 +209,20 @@ class FormatChecks(BaseChecker):
             123-456-7890     → "dash"
             123.456.7890     → "dot"
             1234567890       → "plain"
+
+        When ``found_numbers`` is given, the numbers of this window are appended
+        to it and the caller flags them once the whole document has been seen.
         """
         logger.debug(f"Checking phone numbers with {len(paragraphs)} paragraphs")
 
-        found_numbers = self._collect_phone_numbers_from_paragraphs(paragraphs)
+        found = self._collect_phone_numbers_from_paragraphs(paragraphs, first_line)
+        if found_numbers is not None:
+            found_numbers.extend(found)
+            return
+        self._flag_phone_numbers(found, results)
+
+    def _flag_phone_numbers(self, found_numbers: list, results: DocumentCheckResult) -> None:
+        """Flag ``found_numbers`` if they use more than one phone-number style."""
         if not found_numbers:
             return
 
@@ -167,22 +232,27 @@ class FormatChecks(BaseChecker):
         if len(styles_present) > 1:
             self._flag_inconsistent_phone_formats_in_paragraphs(found_numbers, results)
 
-    def _collect_phone_numbers_from_paragraphs(self, paragraphs: list) -> list:
+    def _collect_phone_numbers_from_paragraphs(self, paragraphs: list, first_line: int = 1) -> list:
         """Collect all phone numbers and their styles from paragraphs."""
         found: list[tuple[int, str]] = []
-        for idx, line in enumerate(paragraphs, start=1):
-            seen_spans: set[tuple[int, int]] = set()
-            for pattern in PHONE_PATTERNS:
-                for match in re.finditer(pattern, line):
-                    span = match.span()
-                    if span in seen_spans:
-                        continue
-                    seen_spans.add(span)
-                    style = self._categorise_phone_number_in_paragraph(match.group(0))
-                    logger.debug(
-                        f"Found phone number in line {idx}: {match.group(0)} (style={style})"
-                    )
-                    found.append((idx, style))
+        phone_patterns = get_ruleset().phone_patterns
+        for idx, line in enumerate(paragraphs, start=first_line):
+            found.extend(self._phone_numbers_in_line(line, idx, phone_patterns))
+        return found
+
+    def _phone_numbers_in_line(self, line: str, idx: int, phone_patterns: list) -> list:
+        """Return ``(idx, style)`` for each distinct phone number match in ``line``."""
+        found: list[tuple[int, str]] = []
+        seen_spans: set[tuple[int, int]] = set()
+        for pattern in phone_patterns:
+            for match in pattern.finditer(line):
+                span = match.span()
+                if span in seen_spans:
+                    continue
+                seen_spans.add(span)
+                style = self._categorise_phone_number_in_paragraph(match.group(0))
+                logger.debug(f"Found phone number in line {idx}: {match.group(0)} (style={style})")
+                found.append((idx, style))
         return found
 
     def _categorise_phone_number_in_paragraph(self, num: str) -> str:
@@ -224,73 +294,65 @@ class FormatChecks(BaseChecker):
             seen.add(line_no)
             logger.debug(f"Flagged line {line_no} for inconsistent phone number format")
 
+    @line_rules.rule("placeholders", trigger=_PLACEHOLDER_PATTERNS)
+    def _rule_placeholders(
+        self, scan: LineScan, results: DocumentCheckResult, line_no: int, text: str
+    ):
+        if any(pattern.search(text) for pattern in _PLACEHOLDER_PATTERNS):
+            logger.debug(f"Found placeholder in line {line_no}: {text}")
+            # Only add one issue per line
+            results.add_issue(
+                FormatMessages.PLACEHOLDER_ERROR,
+                Severity.ERROR,
+                line_no,
+                category=getattr(self, "category", "format"),
+            )
+
     @BaseChecker.register_check("format")
-    def _check_placeholders(self, paragraphs: list, results: DocumentCheckResult):
+    def _check_placeholders(
+        self, paragraphs: list, results: DocumentCheckResult, first_line: int = 1
+    ):
         """Check for placeholder text."""
         logger.debug(f"Checking placeholders with {len(paragraphs)} paragraphs")
-        placeholder_patterns = [
-            r"\b(TODO|FIXME|XXX|HACK|NOTE|REVIEW|DRAFT):",
-            r"\b(Add|Update|Review|Fix|Complete)\s+.*\b(here|this|needed)\b",
-            r"\b(Placeholder|Temporary|Draft)\b",
-        ]
-
-        for i, text in enumerate(paragraphs):
-            for pattern in placeholder_patterns:
-                if re.search(pattern, text, re.IGNORECASE):
-                    logger.debug(f"Found placeholder in line {i + 1}: {text}")
-                    try:
-                        results.add_issue(
-                            FormatMessages.PLACEHOLDER_ERROR,
-                            Severity.ERROR,
-                            i + 1,
-                            category=getattr(self, "category", "format"),
-                        )
-                        logger.debug(f"Successfully added issue for line {i + 1}")
-                        break  # Only add one issue per line
-                    except Exception as e:
-                        logger.error(f"Error adding issue: {str(e)}")
-                        logger.error(f"Error type: {type(e)}")
-                        raise
+        self._scan_paragraphs("placeholders", paragraphs, results, first_line)
+
+    # Every dash spacing pattern has a space next to the dash.
+    @line_rules.rule("dash_spacing", trigger=r"\s[-–—]|[-–—]\s")
+    def _rule_dash_spacing(
+        self, scan: LineScan, results: DocumentCheckResult, line_no: int, text: str
+    ):
+        for pattern, message in _DASH_PATTERNS:
+            for _match in pattern.finditer(text):
+                logger.debug(f"Found dash spacing issue in line {line_no}: {text}")
+                results.add_issue(
+                    message,
+                    Severity.WARNING,
+                    line_no,
+                    category=getattr(self, "category", "format"),
+                )
 
     @BaseChecker.register_check("format")
-    def _check_dash_spacing(self, paragraphs: list, results: DocumentCheckResult):
+    def _check_dash_spacing(
+        self, paragraphs: list, results: DocumentCheckResult, first_line: int = 1
+    ):
         """Check for incorrect spacing around hyphens, en-dashes, and em-dashes."""
         logger.debug(f"Checking dash spacing with {len(paragraphs)} paragraphs")
-        dash_patterns = [
-            (r"\s+[-–—]\s+", FormatMessages.DASH_SPACE_REMOVE_AROUND),  # Spaces before and after
-            (r"\s+[-–—](?!\s)", FormatMessages.DASH_SPACE_REMOVE_BEFORE),  # Space only before
-            (r"(?<!\s)[-–—]\s+", FormatMessages.DASH_SPACE_REMOVE_AFTER),  # Space only after
-        ]
-
-        for i, text in enumerate(paragraphs):
-            for pattern, message in dash_patterns:
-                if matches := re.finditer(pattern, text):
-                    for match in matches:
-                        logger.debug(f"Found dash spacing issue in line {i + 1}: {text}")
-                        try:
-                            results.add_issue(
-                                message,
-                                Severity.WARNING,
-                                i + 1,
-                                category=getattr(self, "category", "format"),
-                            )
-                            logger.debug(f"Successfully added issue for line {i + 1}")
-                        except Exception as e:
-                            logger.error(f"Error adding issue: {str(e)}")
-                            logger.error(f"Error type: {type(e)}")
-                            raise
+        self._scan_paragraphs("dash_spacing", paragraphs, results, first_line)
+
+    @line_rules.rule("captions", trigger=re.compile(r"^\s*(?:table|figure)\s", re.IGNORECASE))
+    def _rule_captions(self, scan: LineScan, results: DocumentCheckResult, line_no: int, text: str):
+        text = text.strip()
+        doc_type = scan.context["doc_type"]
+        self._check_table_caption_format(text, doc_type, line_no, results)
+        self._check_figure_caption_format(text, doc_type, line_no, results)
 
     @BaseChecker.register_check("format")
-    def _check_caption_formats(self, paragraphs: list, doc_type: str, results: DocumentCheckResult):
+    def _check_caption_formats(
+        self, paragraphs: list, doc_type: str, results: DocumentCheckResult, first_line: int = 1
+    ):
         """Check for correctly formatted table or figure captions."""
         logger.debug(f"Checking caption formats with {len(paragraphs)} paragraphs")
-
-        for i, text in enumerate(paragraphs):
-            text = text.strip()
-            line_num = i + 1
-
-            self._check_table_caption_format(text, doc_type, line_num, results)
-            self._check_figure_caption_format(text, doc_type, line_num, results)
+        self._scan_paragraphs("captions", paragraphs, results, first_line, doc_type=doc_type)
 
     def _check_table_caption_format(
         self, text: str, doc_type: str, line_num: int, results: DocumentCheckResult
@@ -535,6 +597,11 @@ class FormatChecks(BaseChecker):
         return bool(heading_pattern.match(text.strip()))
 
 
+_MULTIPLE_SECTION_SYMBOLS_RE = re.compile(
+    r"§§\s+\d+(?:\.\d+)*(?:\([a-z0-9]+\))*-\d+(?:\.\d+)*(?:\([a-z0-9]+\))*"
+)
+
+
 class FormattingChecker(BaseChecker):
     """Checks for formatting issues in documents."""
 
@@ -545,6 +612,11 @@ class FormattingChecker(BaseChecker):
         r"(?P<number>\d+(?:[-.]\d+)*(?:[A-Z])?)"
     )
 
+    # Per-line text rules, scanned in one pass by ``check_text`` and reported
+    # in this order. Rule packs can add their own with
+    # ``FormattingChecker.line_rules.add_rule``.
+    line_rules = LineScanner()
+
     def check_text(self, content: str) -> DocumentCheckResult:
         """Check text content for formatting issues, including date and phone number formats."""
         logger.debug("Starting text formatting check")
@@ -554,43 +626,77 @@ class FormattingChecker(BaseChecker):
         lines = content.split("\n")
         logger.debug(f"Split content into {len(lines)} lines")
 
-        # Run all format checks
-        issues.extend(self.check_punctuation(lines).issues)
-        issues.extend(self.check_spacing(lines).issues)
-        issues.extend(self.check_parentheses(lines).issues)
-        issues.extend(self.check_section_symbol_usage(lines).issues)
-        issues.extend(self.check_list_formatting(lines).issues)
-        issues.extend(self.check_quotation_marks(lines).issues)
-        issues.extend(self.check_placeholders(lines).issues)  # Add placeholder check
-
-        # --- Additional checks for date and phone number formats ---
-        issues.extend(self._check_date_formats_text(lines))
-        issues.extend(self._check_phone_numbers_text(lines))
+        # Run all format checks in one pass over the lines
+        scan = self.line_rules.start(self, lines=lines)
+        scan.feed(lines)
+        for result in scan.finish():
+            issues.extend(result.issues)
 
         logger.debug(f"Found {len(issues)} total issues")
         return DocumentCheckResult(
             success=len(issues) == 0, severity=Severity.ERROR if issues else None, issues=issues
         )
 
+    def _scan_lines(self, name: str, lines: List[str]) -> List[Dict]:
+        """Return the issues of the line rule ``name`` alone over ``lines``."""
+        scan = self.line_rules.start(self, [name], lines=lines)
+        scan.feed(lines)
+        return scan.finish()[0].issues
+
+    @line_rules.rule("punctuation", trigger=r"\.\.")
+    def _rule_punctuation(self, scan: LineScan, results: DocumentCheckResult, i: int, line: str):
+        if ".." in line:
+            logger.debug(f"Found double period in line {i}")
+            results.issues.append(
+                {
+                    "message": FormatMessages.DOUBLE_PERIOD_WARNING.format(line=i),
+                    "severity": Severity.WARNING,
+                    "line_number": i,
+                    "checker": "FormattingChecker",
+                }
+            )
+
     def check_punctuation(self, lines: List[str]) -> DocumentCheckResult:
         """Check for double periods and other punctuation issues."""
         logger.debug("Checking punctuation")
-        issues = []
-        for i, line in enumerate(lines, 1):
-            if ".." in line:
-                logger.debug(f"Found double period in line {i}")
-                issues.append(
-                    {
-                        "message": FormatMessages.DOUBLE_PERIOD_WARNING.format(line=i),
-                        "severity": Severity.WARNING,
-                        "line_number": i,
-                        "checker": "FormattingChecker",
-                    }
-                )
+        issues = self._scan_lines("punctuation", lines)
         return DocumentCheckResult(
             success=len(issues) == 0, severity=Severity.WARNING if issues else None, issues=issues
         )
 
+    @line_rules.rule("spacing", trigger=[_DOUBLE_SPACE_RE, _MISSING_SPACE_REF_RE])
+    def _rule_spacing(self, scan: LineScan, results: DocumentCheckResult, i: int, line: str):
+        # 1) Double or multiple spaces anywhere in the line
+        for m in self._DOUBLE_SPACE_RE.finditer(line):
+            logger.debug(f"Double space found at pos {m.start()} in line {i}: {line!r}")
+            results.issues.append(
+                {
+                    "message": FormatMessages.DOUBLE_SPACE_WARNING,
+                    "severity": Severity.WARNING,
+                    "line_number": i,
+                    "context": line.strip(),
+                    "checker": "FormattingChecker",
+                }
+            )
+
+        # 2) Missing space between prefix and number (AC25.1, CFR14 etc.)
+        for m in self._MISSING_SPACE_REF_RE.finditer(line):
+            logger.debug(
+                f"Missing space in regulatory reference at position {m.start()} in line {i}: "
+                f"{line!r}"
+            )
+            results.issues.append(
+                {
+                    "message": FormatMessages.MISSING_SPACE_WARNING.format(
+                        prefix=m.group("prefix"), number=m.group("number")
+                    ),
+                    "severity": Severity.WARNING,
+                    "line_number": i,
+                    "context": line.strip(),
+                    "checker": "FormattingChecker",
+                }
+            )
+
     def check_spacing(self, lines: List[str]) -> DocumentCheckResult:
         """
         Detect **all** spacing errors in one pass:
@@ -600,69 +706,38 @@ class FormattingChecker(BaseChecker):
         All spacing rules are centralised here and processed before other format checks.
         """
         logger.debug("Checking spacing (double & missing).")
-        issues: list[dict] = []
-
-        for i, line in enumerate(lines, 1):
-            # 1) Double or multiple spaces anywhere in the line
-            for m in self._DOUBLE_SPACE_RE.finditer(line):
-                logger.debug(f"Double space found at pos {m.start()} in line {i}: {line!r}")
-                issues.append(
-                    {
-                        "message": FormatMessages.DOUBLE_SPACE_WARNING,
-                        "severity": Severity.WARNING,
-                        "line_number": i,
-                        "context": line.strip(),
-                        "checker": "FormattingChecker",
-                    }
-                )
-
-            # 2) Missing space between prefix and number (AC25.1, CFR14 etc.)
-            for m in self._MISSING_SPACE_REF_RE.finditer(line):
-                logger.debug(
-                    "Missing space in regulatory reference at position "
-                    f"{m.start()} in line {i}: {line!r}"
-                )
-                issues.append(
-                    {
-                        "message": FormatMessages.MISSING_SPACE_WARNING.format(
-                            prefix=m.group("prefix"), number=m.group("number")
-                        ),
-                        "severity": Severity.WARNING,
-                        "line_number": i,
-                        "context": line.strip(),
-                        "checker": "FormattingChecker",
-                    }
-                )
-
+        issues = self._scan_lines("spacing", lines)
         return DocumentCheckResult(
             success=len(issues) == 0,
             severity=Severity.WARNING if issues else None,
             issues=issues,
         )
 
+    @line_rules.rule("parentheses", trigger=r"[()]")
+    def _rule_parentheses(self, scan: LineScan, results: DocumentCheckResult, i: int, line: str):
+        open_count = line.count("(")
+        close_count = line.count(")")
+        if open_count != close_count:
+            logger.debug(f"Found unmatched parentheses in line {i}")
+            snippet = line.strip()
+            if len(snippet) > 60:
+                snippet = snippet[:60] + "..."
+            results.issues.append(
+                {
+                    "message": FormatMessages.UNMATCHED_PARENTHESES_WARNING.format(
+                        line=i, context=snippet
+                    ),
+                    "severity": Severity.WARNING,
+                    "line_number": i,
+                    "context": snippet,
+                    "checker": "FormattingChecker",
+                }
+            )
+
     def check_parentheses(self, lines: List[str]) -> DocumentCheckResult:
         """Check for unmatched parentheses."""
         logger.debug("Checking parentheses")
-        issues = []
-        for i, line in enumerate(lines, 1):
-            open_count = line.count("(")
-            close_count = line.count(")")
-            if open_count != close_count:
-                logger.debug(f"Found unmatched parentheses in line {i}")
-                snippet = line.strip()
-                if len(snippet) > 60:
-                    snippet = snippet[:60] + "..."
-                issues.append(
-                    {
-                        "message": FormatMessages.UNMATCHED_PARENTHESES_WARNING.format(
-                            line=i, context=snippet
-                        ),
-                        "severity": Severity.WARNING,
-                        "line_number": i,
-                        "context": snippet,
-                        "checker": "FormattingChecker",
-                    }
-                )
+        issues = self._scan_lines("parentheses", lines)
         return DocumentCheckResult(
             success=len(issues) == 0, severity=Severity.WARNING if issues else None, issues=issues
         )
@@ -681,32 +756,30 @@ class FormattingChecker(BaseChecker):
         )
 
     def _check_cfr_section_symbols(self, lines: List[str]) -> List[Dict]:
-        """Skip 14 CFR citations.
+        """Skip 14 CFR citations.
 
         Historically the checker enforced removal of the section symbol when
         citing the Code of Federal Regulations.  FAA guidance now permits
-        citations such as ``14 CFR § 25.1309``.  The checker therefore avoids
+        citations such as ``14 CFR § 25.1309``.  The checker therefore avoids
         flagging these references and simply returns an empty list.
         """
 
         return []
 
+    @line_rules.rule("section_symbols", trigger="§")
+    def _rule_section_symbols(
+        self, scan: LineScan, results: DocumentCheckResult, i: int, line: str
+    ):
+        if "§§" in line:
+            results.issues.extend(
+                self._check_multiple_section_symbols(line, i, _MULTIPLE_SECTION_SYMBOLS_RE)
+            )
+        elif "§" in line:
+            results.issues.extend(self._check_single_section_symbols(line, i))
+
     def _check_general_section_symbols(self, lines: List[str]) -> List[Dict]:
         """Check for general section symbol usage issues."""
-        issues = []
-        multiple_symbols_pattern = re.compile(
-            r"§§\s+\d+(?:\.\d+)*(?:\([a-z0-9]+\))*-\d+(?:\.\d+)*(?:\([a-z0-9]+\))*"
-        )
-
-        for i, line in enumerate(lines, 1):
-            if "§§" in line:
-                issues.extend(
-                    self._check_multiple_section_symbols(line, i, multiple_symbols_pattern)
-                )
-            elif "§" in line:
-                issues.extend(self._check_single_section_symbols(line, i))
-
-        return issues
+        return self._scan_lines("section_symbols", lines)
 
     def _check_multiple_section_symbols(self, line: str, line_num: int, pattern) -> List[Dict]:
         """Check multiple section symbols (e.g., §§ 123-456)."""
@@ -755,126 +828,154 @@ class FormattingChecker(BaseChecker):
 
         return False
 
-    def check_list_formatting(self, lines: List[str]) -> DocumentCheckResult:
-        """Check for consistent list formatting."""
-        logger.debug("Checking list formatting")
-        issues = []
-        last_number: int | None = None
-        for i, line in enumerate(lines, 1):
-            # Numbered lists require a period and sequential numbering
-            gap_match = re.match(r"^(\d+)\.\s", line)
-            if gap_match:
-                current = int(gap_match.group(1))
-                if last_number is not None and current != last_number + 1:
-                    logger.debug(
-                        "List numbering gap: expected %s but found %s at line %s",
-                        last_number + 1,
-                        current,
-                        i,
-                    )
-                    issues.append(
-                        {
-                            "message": FormatMessages.LIST_NUMBERING_GAP_WARNING.format(
-                                expected=last_number + 1, found=current, line=i
-                            ),
-                            "severity": Severity.WARNING,
-                            "line_number": i,
-                            "checker": "FormattingChecker",
-                        }
-                    )
-                last_number = current
-            elif re.match(r"^\d+[^.\s]", line):
-                logger.debug(f"Found inconsistent list formatting in line {i}")
-                issues.append(
+    # Numbered items and bullets start with a digit or a bullet; a line that
+    # triggers nothing ends any numbered list, as it cannot be one of its items.
+    @line_rules.rule("list_formatting", trigger=r"^[\d•]")
+    def _rule_list_formatting(
+        self, scan: LineScan, results: DocumentCheckResult, i: int, line: str
+    ):
+        previous = scan.state.get("list_number")
+        last_number = previous[1] if previous and previous[0] == i - 1 else None
+
+        # Numbered lists require a period and sequential numbering
+        gap_match = re.match(r"^(\d+)\.\s", line)
+        if gap_match:
+            current = int(gap_match.group(1))
+            if last_number is not None and current != last_number + 1:
+                logger.debug(
+                    "List numbering gap: expected %s but found %s at line %s",
+                    last_number + 1,
+                    current,
+                    i,
+                )
+                results.issues.append(
                     {
-                        "message": FormatMessages.LIST_FORMAT_WARNING.format(line=i),
+                        "message": FormatMessages.LIST_NUMBERING_GAP_WARNING.format(
+                            expected=last_number + 1, found=current, line=i
+                        ),
                         "severity": Severity.WARNING,
                         "line_number": i,
                         "checker": "FormattingChecker",
                     }
                 )
-                last_number = None
-            else:
-                last_number = None
+            scan.state["list_number"] = (i, current)
+        elif re.match(r"^\d+[^.\s]", line):
+            logger.debug(f"Found inconsistent list formatting in line {i}")
+            results.issues.append(
+                {
+                    "message": FormatMessages.LIST_FORMAT_WARNING.format(line=i),
+                    "severity": Severity.WARNING,
+                    "line_number": i,
+                    "checker": "FormattingChecker",
+                }
+            )
+
+        self._bullet_issues(scan.lines, i, line, results)
+
+    def _bullet_issues(
+        self, lines: List[str] | None, i: int, line: str, results: DocumentCheckResult
+    ) -> None:
+        """Bullet list checks of line ``i``, which look at its neighbours in ``lines``."""
+        if line.startswith("•") and not line.startswith("• "):
+            logger.debug(f"Found inconsistent bullet spacing in line {i}")
+            results.issues.append(
+                {
+                    "message": FormatMessages.BULLET_SPACING_WARNING.format(line=i),
+                    "severity": Severity.WARNING,
+                    "line_number": i,
+                    "checker": "FormattingChecker",
+                }
+            )
 
-            # Bullet list checks
-            if line.startswith("•") and not line.startswith("• "):
-                logger.debug(f"Found inconsistent bullet spacing in line {i}")
-                issues.append(
+        if line.startswith("• "):
+            lines = lines or ()
+            prev = lines[i - 2] if 1 < i <= len(lines) + 1 else ""
+            nxt = lines[i] if i < len(lines) else ""
+            if not prev.strip().startswith("•") and not nxt.strip().startswith("•"):
+                logger.debug(f"Found orphan bullet in line {i}")
+                results.issues.append(
                     {
-                        "message": FormatMessages.BULLET_SPACING_WARNING.format(line=i),
+                        "message": FormatMessages.ORPHAN_BULLET_WARNING.format(line=i),
                         "severity": Severity.WARNING,
                         "line_number": i,
                         "checker": "FormattingChecker",
                     }
                 )
 
-            if line.startswith("• "):
-                prev = lines[i - 2] if i > 1 else ""
-                nxt = lines[i] if i < len(lines) else ""
-                if not prev.strip().startswith("•") and not nxt.strip().startswith("•"):
-                    logger.debug(f"Found orphan bullet in line {i}")
-                    issues.append(
-                        {
-                            "message": FormatMessages.ORPHAN_BULLET_WARNING.format(line=i),
-                            "severity": Severity.WARNING,
-                            "line_number": i,
-                            "checker": "FormattingChecker",
-                        }
-                    )
-
+    def check_list_formatting(self, lines: List[str]) -> DocumentCheckResult:
+        """Check for consistent list formatting."""
+        logger.debug("Checking list formatting")
+        issues = self._scan_lines("list_formatting", lines)
         return DocumentCheckResult(
             success=len(issues) == 0,
             severity=Severity.WARNING if issues else None,
             issues=issues,
         )
 
+    @line_rules.rule("quotation_marks", trigger='"')
+    def _rule_quotation_marks(
+        self, scan: LineScan, results: DocumentCheckResult, i: int, line: str
+    ):
+        if '"' in line:
+            logger.debug(f"Found inconsistent quotation marks in line {i}")
+            results.issues.append(
+                {
+                    "message": FormatMessages.QUOTATION_MARKS_WARNING.format(line=i),
+                    "severity": Severity.WARNING,
+                    "line_number": i,
+                    "checker": "FormattingChecker",
+                }
+            )
+
     def check_quotation_marks(self, lines: List[str]) -> DocumentCheckResult:
         """Check for consistent quotation mark usage."""
         logger.debug("Checking quotation marks")
-        issues = []
-        for i, line in enumerate(lines, 1):
-            if '"' in line and '"' in line:
-                logger.debug(f"Found inconsistent quotation marks in line {i}")
-                issues.append(
-                    {
-                        "message": FormatMessages.QUOTATION_MARKS_WARNING.format(line=i),
-                        "severity": Severity.WARNING,
-                        "line_number": i,
-                        "checker": "FormattingChecker",
-                    }
-                )
+        issues = self._scan_lines("quotation_marks", lines)
         return DocumentCheckResult(
             success=len(issues) == 0, severity=Severity.WARNING if issues else None, issues=issues
         )
 
+    @line_rules.rule("placeholders", trigger=_PLACEHOLDER_PATTERNS)
+    def _rule_placeholders(self, scan: LineScan, results: DocumentCheckResult, i: int, line: str):
+        if any(pattern.search(line) for pattern in _PLACEHOLDER_PATTERNS):
+            logger.debug(f"Found placeholder in line {i}")
+            # Only add one issue per line
+            results.issues.append(
+                {
+                    "message": FormatMessages.PLACEHOLDER_ERROR,
+                    "severity": Severity.ERROR,
+                    "line_number": i,
+                    "checker": "FormattingChecker",
+                }
+            )
+
     def check_placeholders(self, lines: List[str]) -> DocumentCheckResult:
         """Check for placeholder text."""
         logger.debug("Checking placeholders")
-        issues = []
-        placeholder_patterns = [
-            r"\b(TODO|FIXME|XXX|HACK|NOTE|REVIEW|DRAFT):",
-            r"\b(Add|Update|Review|Fix|Complete)\s+.*\b(here|this|needed)\b",
-            r"\b(Placeholder|Temporary|Draft)\b",
-        ]
-
-        for i, line in enumerate(lines, 1):
-            for pattern in placeholder_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
-                    logger.debug(f"Found placeholder in line {i}")
-                    issues.append(
-                        {
-                            "message": FormatMessages.PLACEHOLDER_ERROR,
-                            "severity": Severity.ERROR,
-                            "line_number": i,
-                            "checker": "FormattingChecker",
-                        }
-                    )
-                    break  # Only add one issue per line
+        issues = self._scan_lines("placeholders", lines)
         return DocumentCheckResult(
             success=len(issues) == 0, severity=Severity.ERROR if issues else None, issues=issues
         )
 
+    @line_rules.rule("dates", trigger=lambda rules: rules.date_incorrect)
+    def _rule_dates(self, scan: LineScan, results: DocumentCheckResult, i: int, text: str):
+        # Skip if text matches any skip patterns
+        if any(pattern.search(text) for pattern in scan.ruleset.date_skip_patterns):
+            logger.debug(f"[Text] Skipping line {i} due to skip pattern: {text!r}")
+            return
+        # Check for incorrect date format (MM/DD/YYYY)
+        if scan.ruleset.date_incorrect.search(text):
+            logger.debug(f"[Text] Found incorrect date format in line {i}: {text!r}")
+            results.issues.append(
+                {
+                    "message": FormatMessages.DATE_FORMAT_ERROR,
+                    "severity": Severity.ERROR,
+                    "line_number": i,
+                    "context": text.strip(),
+                    "checker": "FormattingChecker",
+                }
+            )
+
     def _check_date_formats_text(self, lines: list) -> list:
         """
         Check for consistent date formats in plain text (line-by-line),
@@ -882,25 +983,20 @@ class FormattingChecker(BaseChecker):
         Returns a list of issues.
         """
         logger.debug(f"[Text] Checking date formats with {len(lines)} lines")
-        issues = []
-        for i, text in enumerate(lines):
-            # Skip if text matches any skip patterns
-            if any(re.search(pattern, text) for pattern in DATE_PATTERNS["skip_patterns"]):
-                logger.debug(f"[Text] Skipping line {i + 1} due to skip pattern: {text!r}")
-                continue
-            # Check for incorrect date format (MM/DD/YYYY)
-            if re.search(DATE_PATTERNS["incorrect"], text):
-                logger.debug(f"[Text] Found incorrect date format in line {i + 1}: {text!r}")
-                issues.append(
-                    {
-                        "message": FormatMessages.DATE_FORMAT_ERROR,
-                        "severity": Severity.ERROR,
-                        "line_number": i + 1,
-                        "context": text.strip(),
-                        "checker": "FormattingChecker",
-                    }
-                )
-        return issues
+        return self._scan_lines("dates", lines)
+
+    def _finish_phone_numbers(self, scan: LineScan, results: DocumentCheckResult) -> None:
+        results.issues.extend(self._phone_format_issues(scan.state.get("phone_numbers", [])))
+
+    @line_rules.rule(
+        "phone_numbers", trigger=lambda rules: rules.phone_patterns, finish=_finish_phone_numbers
+    )
+    def _rule_phone_numbers(
+        self, scan: LineScan, results: DocumentCheckResult, idx: int, line: str
+    ):
+        style = self._phone_number_style(line, idx, scan.ruleset.phone_patterns)
+        if style is not None:
+            scan.state.setdefault("phone_numbers", []).append((idx, style))
 
     def _check_phone_numbers_text(self, lines: list) -> list:
         """
@@ -909,8 +1005,10 @@ class FormattingChecker(BaseChecker):
         Returns a list of issues.
         """
         logger.debug(f"[Text] Checking phone numbers with {len(lines)} lines")
+        return self._phone_format_issues(self._collect_phone_numbers_from_lines(lines))
 
-        found_numbers = self._collect_phone_numbers_from_lines(lines)
+    def _phone_format_issues(self, found_numbers: list) -> list:
+        """Return issues for ``found_numbers`` if they use more than one style."""
         if not found_numbers:
             return []
 
@@ -925,20 +1023,27 @@ class FormattingChecker(BaseChecker):
     def _collect_phone_numbers_from_lines(self, lines: list) -> list:
         """Collect phone numbers from individual lines."""
         found = []  # (line_number, style)
+        phone_patterns = get_ruleset().phone_patterns
 
         for idx, line in enumerate(lines, start=1):
-            for pattern in PHONE_PATTERNS:
-                match = re.search(pattern, line)
-                if match:
-                    style = self._categorise_phone_number_text(match.group(0))
-                    logger.debug(
-                        f"[Text] Found phone number in line {idx}: {match.group(0)} (style={style})"
-                    )
-                    found.append((idx, style))
-                    break  # Only add each number once
+            style = self._phone_number_style(line, idx, phone_patterns)
+            if style is not None:
+                found.append((idx, style))
 
         return found
 
+    def _phone_number_style(self, line: str, idx: int, phone_patterns: list) -> str | None:
+        """Return the style of the first phone number in ``line``, if any."""
+        for pattern in phone_patterns:
+            match = pattern.search(line)
+            if match:
+                style = self._categorise_phone_number_text(match.group(0))
+                logger.debug(
+                    f"[Text] Found phone number in line {idx}: {match.group(0)} (style={style})"
+                )
+                return style  # Only add each number once
+        return None
+
     def _categorise_phone_number_text(self, num: str) -> str:
         """Categorize a phone number into its style for text checking."""
         # Normalize whitespace while preserving separator style so dotted
@@ -7,6 +7,7 @@ from docx.document import Document as DocxDocument
 from govdocverify.checks.check_registry import CheckRegistry
 from govdocverify.models import DocumentCheckResult, Severity
 from govdocverify.utils.decorators import profile_performance
+from govdocverify.utils.document_outline import OutlineNode, outline_of
 from govdocverify.utils.terminology_utils import TerminologyManager
 from govdocverify.utils.text_utils import normalize_heading
 
@@ -55,7 +56,7 @@ class HeadingChecks(BaseChecker):
             return doc_type  # Preserve original for unknown types
         return normalized
 
-    @CheckRegistry.register("heading")
+    @CheckRegistry.register("heading", requires=("outline",))
     def check_document(self, document: DocxDocument, doc_type: str) -> DocumentCheckResult:
         """Check document for heading issues."""
         doc_type_norm = self._normalize_doc_type(doc_type)
@@ -552,18 +553,12 @@ class HeadingChecks(BaseChecker):
         """Run all heading-related checks."""
         logger.info(f"Running heading checks for document type: {doc_type}")
 
-        # Get all paragraphs with heading style and track their line numbers
-        headings_with_lines = []
-        line_number = 1
-
-        for paragraph in document.paragraphs:
-            if paragraph.style.name.startswith("Heading"):
-                headings_with_lines.append((paragraph, line_number))
-            line_number += 1
+        outline = outline_of(document)
+        headings = outline.headings if outline is not None else []
 
         # Check heading structure
-        self._check_heading_hierarchy(headings_with_lines, results)
-        self._check_heading_format(headings_with_lines, results, doc_type)
+        self._check_heading_hierarchy(headings, results)
+        self._check_heading_format(headings, results, doc_type)
 
     def _check_heading_sequence(self, current_level: int, previous_level: int) -> Optional[str]:
         """
@@ -586,23 +581,26 @@ class HeadingChecks(BaseChecker):
                     )
             return None
 
-    def _check_heading_hierarchy(self, headings_with_lines, results):
+    def _check_heading_hierarchy(self, headings: List[OutlineNode], results):
         """Check if headings follow proper hierarchy."""
         previous_level = 0
-        for heading, line_number in headings_with_lines:
-            level = int(heading.style.name.replace("Heading ", ""))
-            error_message = self._check_heading_sequence(level, previous_level)
+        for heading in headings:
+            if heading.level is None:
+                continue
+            error_message = self._check_heading_sequence(heading.level, previous_level)
 
             if error_message:
                 results.add_issue(
                     message=f"{error_message} (Current heading: {heading.text})",
                     severity=Severity.ERROR,
-                    line_number=line_number,
+                    line_number=heading.line_number,
                     category=getattr(self, "category", "heading"),
                 )
-            previous_level = level
+            previous_level = heading.level
 
-    def _check_heading_format(self, headings_with_lines, results, doc_type: str = "GENERAL"):
+    def _check_heading_format(
+        self, headings: List[OutlineNode], results, doc_type: str = "GENERAL"
+    ):
         """
         Check heading format (capitalization, punctuation, etc).
 
@@ -616,8 +614,9 @@ class HeadingChecks(BaseChecker):
         period_requirements = self.terminology_manager.terminology_data.get("heading_periods", {})
         requires_period = period_requirements.get(doc_type_norm, False)
 
-        for heading, line_number in headings_with_lines:
+        for heading in headings:
             text = heading.text.strip()
+            line_number = heading.line_number
 
             # Skip period check for long text that's likely a paragraph
             # incorrectly marked as heading
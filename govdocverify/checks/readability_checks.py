@@ -31,7 +31,7 @@ class ReadabilityChecks(BaseChecker):
         self.category = "readability"
         logger.info("Initialized ReadabilityChecks with terminology manager")
 
-    @CheckRegistry.register("readability")
+    @CheckRegistry.register("readability", requires=("paragraphs",))
     def check_document(self, document: Document, doc_type: str) -> DocumentCheckResult:
         """Check document for readability issues."""
         results = DocumentCheckResult()
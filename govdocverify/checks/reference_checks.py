@@ -1,14 +1,89 @@
 import logging
 import re
-from typing import List
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterator, List, Optional, Tuple
 
+from govdocverify.checks.check_registry import CheckRegistry
 from govdocverify.models import DocumentCheckResult, Severity
+from govdocverify.utils.cross_references import (
+    FIGURE,
+    TABLE,
+    CrossReferenceIndex,
+    Reference,
+    cross_reference_index_of,
+)
+from govdocverify.utils.deadlines import CheckTimeout, raise_if_cancelled
+from govdocverify.utils.paragraph_table import ParagraphTable, paragraph_table_of
 from govdocverify.utils.terminology_utils import TerminologyManager
 
 from .base_checker import BaseChecker
 
 logger = logging.getLogger(__name__)
 
+# A document number followed by the comma that introduces its title.
+DOCUMENT_REFERENCE = r"\b(?:AC|Order|AD|SFAR|Notice|Policy|Memo)\s+[\d.-]+[A-Z]?,"
+DOCUMENT_REFERENCE_PATTERN = re.compile(DOCUMENT_REFERENCE, re.IGNORECASE)
+# The ", dated" or " dated" that ends a title.
+TITLE_END_PATTERN = re.compile(r",\s*dated|\s+dated", re.IGNORECASE)
+_TITLE_END_STARTS = re.compile(r"(?=,\s*dated|\s+dated)", re.IGNORECASE)
+_QUOTE = re.compile('"')
+_COMMA = re.compile(",")
+_LEADING_SPACE = re.compile(r"\s*")
+# Longest "<number>, <title>, dated" reference looked at when matching a title.
+MAX_TITLE_REFERENCE_CHARS = 500
+
+
+class _TitleScan:
+    """Where the title after one document reference ends.
+
+    Titles used to be matched with the nested-quantifier pattern
+    ``,\\s*([^,]*(?:"[^"]*"[^,]*)*[^,]*?)(?:,\\s*dated|\\s+dated)``: a title
+    may contain commas only inside quoted spans, and a quote that is never
+    closed is an ordinary character. That pattern backtracks exponentially in
+    the number of quotes when no title end follows. This scan gives the
+    title end the pattern's backtracking order would reach, from the sorted
+    positions of the quotes, commas and title ends, in time linear in their
+    number.
+
+    The pattern tries the longest comma-free run first and, at each shorter
+    end of the run, a quoted span before the earliest title end. So the title
+    starting at ``q`` ends where the highest quote of its run whose span
+    leads to a title end says, provided that quote lies above the run's last
+    title end; otherwise at that last title end.
+    """
+
+    def __init__(self, text: str, pos: int, limit: int) -> None:
+        self.limit = limit
+        self.quotes = [m.start() for m in _QUOTE.finditer(text, pos, limit)]
+        self.commas = [m.start() for m in _COMMA.finditer(text, pos, limit)]
+        self.ends = [m.start() for m in _TITLE_END_STARTS.finditer(text, pos, limit)]
+        # Run end -> (highest quote of the run whose span leads to a title end, that end)
+        self.spans: Dict[int, Tuple[int, int]] = {}
+        for opening, closing in reversed(list(zip(self.quotes, self.quotes[1:]))):
+            run_end = self._run_end(opening)
+            if run_end in self.spans or opening <= self._last_end(run_end):
+                continue
+            end = self.end_from(closing + 1)
+            if end is not None:
+                self.spans[run_end] = (opening, end)
+
+    def _run_end(self, pos: int) -> int:
+        index = bisect_left(self.commas, pos)
+        return self.commas[index] if index < len(self.commas) else self.limit
+
+    def _last_end(self, run_end: int) -> int:
+        index = bisect_right(self.ends, run_end)
+        return self.ends[index - 1] if index else -1
+
+    def end_from(self, pos: int) -> Optional[int]:
+        """Return the end of a title starting at ``pos``, ``None`` if there is none."""
+        run_end = self._run_end(pos)
+        opening, end = self.spans.get(run_end, (-1, None))
+        if opening >= pos:
+            return end
+        last = self._last_end(run_end)
+        return last if last >= pos else None
+
 
 # Message constants for reference checks
 class ReferenceMessages:
@@ -61,16 +136,23 @@ class DocumentTitleFormatCheck(BaseChecker):
 
         return self._check_document_title_formatting(lines, doc_type)
 
-    def _check_document_title_formatting(self, lines: List, doc_type: str) -> DocumentCheckResult:
-        """Check for proper document title formatting based on document type."""
+    def _check_document_title_formatting(
+        self, lines: List, doc_type: str, table: Optional[ParagraphTable] = None
+    ) -> DocumentCheckResult:
+        """Check for proper document title formatting based on document type.
+
+        When ``table`` is given, ``lines`` are its paragraph texts and italic
+        regions are read from its run spans instead of the paragraph runs.
+        """
         logger.debug(f"Checking document title formatting for doc_type: {doc_type}")
         issues = []
 
-        # Pattern to match document references with titles
-        doc_title_pattern = self._get_document_title_pattern()
-
         for line_idx, line in enumerate(lines):
-            if hasattr(line, "text"):
+            raise_if_cancelled(issues)
+            if table is not None:
+                text = line
+                italic_regions = table.italic_regions(line_idx)
+            elif hasattr(line, "text"):
                 text = line.text
                 italic_regions = self._get_italic_regions(line)
             else:
@@ -78,11 +160,8 @@ class DocumentTitleFormatCheck(BaseChecker):
                 italic_regions = None
 
             logger.debug(f"Processing line {line_idx + 1}: {text[:100]}...")
-            matches = doc_title_pattern.finditer(text)
-
-            for match in matches:
-                title_text = match.group(1).strip().rstrip(",")
-                start, end = match.span(1)
+            for start, end in self._find_document_titles(text):
+                title_text = text[start:end].strip().rstrip(",")
                 logger.debug(f"Found document title: '{title_text}'")
 
                 issue = self._check_title_format(
@@ -101,12 +180,30 @@ class DocumentTitleFormatCheck(BaseChecker):
 
         return self._create_check_result(issues, doc_type)
 
-    def _get_document_title_pattern(self) -> re.Pattern:
-        """Get the regex pattern for matching document titles."""
-        return re.compile(
-            r'\b(?:AC|Order|AD|SFAR|Notice|Policy|Memo)\s+[\d.-]+[A-Z]?,\s*([^,]*(?:"[^"]*"[^,]*)*[^,]*?)(?:,\s*dated|\s+dated)',
-            re.IGNORECASE,
-        )
+    def _find_document_titles(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Yield the ``(start, end)`` spans of the document titles in ``text``.
+
+        A title follows a document reference such as ``AC 25-1A,`` and ends
+        before ``, dated`` or `` dated`` (see :class:`_TitleScan`). Matching
+        looks at most :data:`MAX_TITLE_REFERENCE_CHARS` ahead of each
+        reference, so the scan stays linear in the paragraph length.
+        """
+        matched_to = 0
+        for reference in DOCUMENT_REFERENCE_PATTERN.finditer(text):
+            limit = reference.start() + MAX_TITLE_REFERENCE_CHARS
+            if reference.start() < matched_to or reference.end() > limit:
+                continue
+            scan = _TitleScan(text, reference.end(), limit)
+            start = _LEADING_SPACE.match(text, reference.end(), limit).end()
+            end = scan.end_from(start)
+            # Like ``\s*`` in the pattern, give back leading whitespace when
+            # nothing else matches: "AC 1-1, dated ..." has an empty title.
+            while end is None and start > reference.end():
+                start -= 1
+                end = scan.end_from(start)
+            if end is not None:
+                matched_to = TITLE_END_PATTERN.match(text, end, limit).end()
+                yield start, end
 
     def _check_title_format(
         self,
@@ -295,9 +392,18 @@ class DocumentTitleFormatCheck(BaseChecker):
 
     def run_checks(self, document, doc_type, results: DocumentCheckResult) -> None:
         """Run document title formatting checks."""
-        lines = self._extract_lines_from_document(document)
-        check_result = self._check_document_title_formatting(lines, doc_type)
-
+        table = paragraph_table_of(document)
+        lines = table.texts if table is not None else self._extract_lines_from_document(document)
+        try:
+            check_result = self._check_document_title_formatting(lines, doc_type, table)
+        except CheckTimeout as exc:
+            # Report the titles checked before the cut-off in the usual format.
+            self._add_title_issues(self._create_check_result(exc.partial or [], doc_type), results)
+            raise exc.with_partial(results) from None
+        self._add_title_issues(check_result, results)
+
+    def _add_title_issues(self, check_result: DocumentCheckResult, results) -> None:
+        """Add ``check_result`` issues to ``results`` using static messages."""
         # Only mark as failed if there are actual errors
         if not check_result.success:
             results.success = False
@@ -355,6 +461,7 @@ class DocumentTitleFormatCheck(BaseChecker):
         else:
             return issue_text
 
+    @CheckRegistry.register("formatting", requires=("paragraph_table",))
     def check_document(self, document, doc_type) -> DocumentCheckResult:
         """
         Accepts a Document, list, or str. Uses run_checks to ensure proper formatting.
@@ -418,8 +525,14 @@ class TableFigureReferenceCheck(BaseChecker):
             lines = str(text).split("\n")
         return self._check_core(lines)
 
-    def _check_core(self, lines: List[str]) -> DocumentCheckResult:
-        """Main logic for checking references, expects a list of strings."""
+    def _check_core(
+        self, lines: List[str], index: Optional[CrossReferenceIndex] = None
+    ) -> DocumentCheckResult:
+        """Main logic for checking references, expects a list of strings.
+
+        The table and figure references come from ``index``, which is built
+        from ``lines`` when the document does not provide one.
+        """
         logger.debug(f"Starting text check with {len(lines)} lines")
 
         # Handle empty cases
@@ -429,9 +542,11 @@ class TableFigureReferenceCheck(BaseChecker):
 
         issues = []
         patterns = self._initialize_patterns()
+        index = index if index is not None else CrossReferenceIndex.from_lines(lines)
         in_code_block = False
 
         for line_idx, line in enumerate(lines):
+            raise_if_cancelled(issues)
             logger.debug(f"Processing line {line_idx + 1}: {line[:50]}...")
 
             # Handle code blocks and skip special lines
@@ -440,7 +555,9 @@ class TableFigureReferenceCheck(BaseChecker):
                     in_code_block = not in_code_block
                 continue
 
-            line_issues = self._process_line_references(line, line_idx, patterns, in_code_block)
+            line_issues = self._process_line_references(
+                line, line_idx, patterns, in_code_block, index
+            )
             issues.extend(line_issues)
 
         return self._create_final_result(issues)
@@ -469,8 +586,6 @@ class TableFigureReferenceCheck(BaseChecker):
 
         patterns = {
             "caption": re.compile(r"^(Table|Figure)\s+\d+(?:[\.-]\d+)*\.\s+[A-Z]", re.IGNORECASE),
-            "table_ref": re.compile(r"\b([Tt]able)s?\s+(\d+(?:[\.-]\d+)*)"),
-            "figure_ref": re.compile(r"\b([Ff]igure)s?\s+(\d+(?:[\.-]\d+)*)"),
             "special_context": re.compile(
                 "|".join(
                     [
@@ -485,8 +600,6 @@ class TableFigureReferenceCheck(BaseChecker):
         }
 
         logger.debug(f"Caption pattern: {patterns['caption'].pattern}")
-        logger.debug(f"Table reference pattern: {patterns['table_ref'].pattern}")
-        logger.debug(f"Figure reference pattern: {patterns['figure_ref'].pattern}")
 
         return patterns
 
@@ -505,7 +618,12 @@ class TableFigureReferenceCheck(BaseChecker):
         return False
 
     def _process_line_references(
-        self, line: str, line_idx: int, patterns: dict, in_code_block: bool
+        self,
+        line: str,
+        line_idx: int,
+        patterns: dict,
+        in_code_block: bool,
+        index: CrossReferenceIndex,
     ) -> List[dict]:
         """Process references in a single line."""
         if in_code_block:
@@ -515,24 +633,14 @@ class TableFigureReferenceCheck(BaseChecker):
         is_special_context = bool(patterns["special_context"].match(line.strip()))
         logger.debug(f"Line is in special context: {is_special_context}")
 
-        # Clean the line for reference checking
-        cleaned_line = self._clean_line_for_checking(line)
-
-        # Check for references
-        ref_patterns = [(patterns["table_ref"], "Table"), (patterns["figure_ref"], "Figure")]
-        for pattern, ref_type in ref_patterns:
-            matches = list(pattern.finditer(cleaned_line))
-            logger.debug(f"Found {len(matches)} {ref_type} references in line")
-
-            for match in matches:
-                ref_issues = self._check_reference_match(
-                    match,
-                    ref_type,
-                    line,
-                    cleaned_line,
-                    is_special_context,
+        for kind, ref_type in ((TABLE, "Table"), (FIGURE, "Figure")):
+            references = index.references_on(line_idx, kind)
+            logger.debug(f"Found {len(references)} {ref_type} references in line")
+
+            for reference in references:
+                issues.extend(
+                    self._check_reference_match(reference, ref_type, line, is_special_context)
                 )
-                issues.extend(ref_issues)
 
         return issues
 
@@ -544,22 +652,18 @@ class TableFigureReferenceCheck(BaseChecker):
 
     def _check_reference_match(
         self,
-        match,
+        reference: Reference,
         ref_type: str,
         original_line: str,
-        cleaned_line: str,
         is_special_context: bool,
     ) -> List[dict]:
-        """Check a single reference match and return list of issues if found."""
+        """Check a single reference and return list of issues if found."""
         issues = []
-        ref_text = match.group()
-        word = match.group(1)
-        number_part = match.group(2)
-
-        start, end = match.span()
-        orig_match = re.search(re.escape(ref_text), original_line)
-        if orig_match:
-            start, end = orig_match.span()
+        ref_text = reference.text
+        word = reference.word
+        number_part = reference.number
+
+        start, end = reference.start, reference.end
         before = original_line[:start]
         after = original_line[end:]
         before_stripped = before.rstrip()
@@ -610,7 +714,9 @@ class TableFigureReferenceCheck(BaseChecker):
             issues.append(numbering_issue)
 
         # Check sentence position and capitalization
-        is_sentence_start = self._is_sentence_start(cleaned_line, match)
+        is_sentence_start = self._is_sentence_start(
+            self._clean_line_for_checking(original_line[:start])
+        )
 
         cap_issue = self._validate_reference_capitalization(
             ref_text,
@@ -644,9 +750,9 @@ class TableFigureReferenceCheck(BaseChecker):
             or re.search(r"\s{2,}", rest) is not None
         )
 
-    def _is_sentence_start(self, cleaned_line: str, match) -> bool:
-        """Determine if reference is at the start of a sentence."""
-        text_before = cleaned_line[: match.start()].strip()
+    def _is_sentence_start(self, text_before: str) -> bool:
+        """Determine if a reference preceded by cleaned ``text_before`` starts a sentence."""
+        text_before = text_before.strip()
         text_before_clean = re.sub(r"^[\s\W]+", "", text_before)
         logger.debug(f"Text before reference: '{text_before}' (cleaned: '{text_before_clean}')")
 
@@ -734,9 +840,18 @@ class TableFigureReferenceCheck(BaseChecker):
         return result
 
     def run_checks(self, document, doc_type, results: DocumentCheckResult) -> None:
-        lines = self._extract_lines_from_document(document)
-        check_result = self._check_core(lines)
-
+        index = cross_reference_index_of(document)
+        lines = index.lines if index is not None else self._extract_lines_from_document(document)
+        try:
+            check_result = self._check_core(lines, index)
+        except CheckTimeout as exc:
+            # Report the references checked before the cut-off in the usual format.
+            self._add_reference_issues(self._create_final_result(exc.partial or []), results)
+            raise exc.with_partial(results) from None
+        self._add_reference_issues(check_result, results)
+
+    def _add_reference_issues(self, check_result: DocumentCheckResult, results) -> None:
+        """Add ``check_result`` issues to ``results`` using static messages."""
         severity = check_result.severity or Severity.INFO
 
         # Only mark as failed if there are actual errors
@@ -806,6 +921,7 @@ class TableFigureReferenceCheck(BaseChecker):
         else:
             return issue_text
 
+    @CheckRegistry.register("formatting", requires=("cross_references",))
     def check_document(self, document, doc_type) -> DocumentCheckResult:
         """
         Accepts a Document, list, or str. Uses run_checks to ensure proper formatting.
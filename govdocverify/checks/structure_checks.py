@@ -1,16 +1,28 @@
 import logging
 import re
 import xml.etree.ElementTree as ET
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, List, Optional, Set
 
 from docx import Document
 from docx.document import Document as DocxDocument
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
 
 from govdocverify.checks.check_registry import CheckRegistry
-from govdocverify.config.boilerplate_texts import BOILERPLATE_PARAGRAPHS
 from govdocverify.models import DocumentCheckResult, Severity
+from govdocverify.utils.cross_references import (
+    FIGURE,
+    SECTION,
+    TABLE,
+    CrossReferenceIndex,
+    Reference,
+    cross_reference_index_of,
+)
+from govdocverify.utils.deadlines import raise_if_cancelled
 from govdocverify.utils.decorators import profile_performance
+from govdocverify.utils.document_outline import outline_of
+from govdocverify.utils.notes_index import NotesIndex, notes_index_of
+from govdocverify.utils.paragraph_table import ParagraphTable, paragraph_table_of
+from govdocverify.utils.ruleset import get_ruleset
 
 from .base_checker import BaseChecker
 
@@ -22,6 +34,7 @@ WORD_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
 FOOTNOTE_REFERENCE_TAG = f"{{{WORD_NAMESPACE}}}footnoteReference"
 FOOTNOTE_ID_ATTR = f"{{{WORD_NAMESPACE}}}id"
 FOOTNOTE_TEXT_PATTERN = re.compile(r"\[(\d+)\]")
+APPENDIX_WORD_PATTERN = re.compile(r"appendix", re.IGNORECASE)
 
 
 class StructureMessages:
@@ -142,8 +155,6 @@ class WatermarkRequirement:
 class StructureChecks(BaseChecker):
     """Checks for document structure issues."""
 
-    AC_REQUIRED_PARAGRAPHS = [p for p in BOILERPLATE_PARAGRAPHS[1:5]]
-
     VALID_WATERMARKS = [
         WatermarkRequirement("draft for FAA review", "internal_review"),
         WatermarkRequirement("draft for public comments", "public_comment"),
@@ -164,13 +175,20 @@ class StructureChecks(BaseChecker):
 
     @staticmethod
     def _find_watermark_in_paragraphs(paragraphs, valid_marks=None) -> Optional[str]:
-        for para in paragraphs:
-            style_name = getattr(para.style, "name", "").lower()
-            if "watermark" in style_name and para.text.strip():
-                return para.text.strip()
-            normalized = StructureChecks._normalize_watermark_text(para.text)
+        rows = (
+            (para.text, getattr(getattr(para, "style", None), "name", "")) for para in paragraphs
+        )
+        return StructureChecks._find_watermark_in_rows(rows, valid_marks)
+
+    @staticmethod
+    def _find_watermark_in_rows(rows, valid_marks=None) -> Optional[str]:
+        """Return the watermark among ``(text, style name)`` rows, if any."""
+        for text, style_name in rows:
+            if "watermark" in (style_name or "").lower() and text.strip():
+                return text.strip()
+            normalized = StructureChecks._normalize_watermark_text(text)
             if valid_marks and normalized in valid_marks:
-                return para.text.strip()
+                return text.strip()
         return None
 
     @staticmethod
@@ -189,7 +207,9 @@ class StructureChecks(BaseChecker):
         ]
         return " ".join(texts).strip()
 
-    @CheckRegistry.register("structure")
+    @CheckRegistry.register(
+        "structure", requires=("paragraphs", "paragraph_table", "outline", "notes")
+    )
     def run_checks(
         self,
         document: DocxDocument,
@@ -200,12 +220,24 @@ class StructureChecks(BaseChecker):
         logger.info(f"Running structure checks for document type: {doc_type}")
 
         paragraphs = document.paragraphs
-        self._check_section_balance(paragraphs, results)
+        table = paragraph_table_of(document)
+        if table is not None:
+            self._check_section_balance(paragraphs, results, outline_of(document), table.texts)
+        else:
+            self._check_section_balance(paragraphs, results)
+        raise_if_cancelled(results)
         self._check_list_formatting(paragraphs, results)
+        raise_if_cancelled(results)
         self._check_cross_references(document, results)
+        raise_if_cancelled(results)
         self._check_parentheses(paragraphs, results)
-        self._check_footnote_sequence(paragraphs, results)
+        raise_if_cancelled(results)
+        self._check_footnote_sequence(
+            paragraphs, results, table, notes_index_of(document) if table is not None else None
+        )
+        raise_if_cancelled(results)
         self._check_watermark(document, results, doc_type)
+        raise_if_cancelled(results)
         self._check_required_ac_paragraphs(paragraphs, doc_type, results)
 
     def _check_paragraph_length(
@@ -278,10 +310,18 @@ class StructureChecks(BaseChecker):
             preview_words = words[:max_words]
             return " ".join(preview_words) + "..."
 
-    def _check_section_balance(self, paragraphs, results):
-        """Check for balanced section lengths using ratio and difference thresholds."""
+    def _check_section_balance(self, paragraphs, results, outline=None, texts=None):
+        """Check for balanced section lengths using ratio and difference thresholds.
+
+        With a document ``outline`` and the paragraph ``texts`` the sections
+        come from the outline; otherwise headings are detected in
+        ``paragraphs``.
+        """
         list_pattern, bullet_pattern = self._compile_section_patterns()
-        sections_data = self._extract_sections(paragraphs, list_pattern, bullet_pattern)
+        if outline is not None and texts is not None:
+            sections_data = self._outline_sections(outline, texts, list_pattern, bullet_pattern)
+        else:
+            sections_data = self._extract_sections(paragraphs, list_pattern, bullet_pattern)
 
         if len(sections_data) > 1:
             self._analyze_section_balance(sections_data, results)
@@ -363,6 +403,21 @@ class StructureChecks(BaseChecker):
 
         return sections_data
 
+    def _outline_sections(self, outline, texts, list_pattern, bullet_pattern):
+        """Describe the sections of ``outline`` like :meth:`_extract_sections` does."""
+        sections_data = []
+        for heading, body in outline.sections():
+            section = [texts[index] for index in body]
+            name = heading.text if heading is not None else None
+            sections_data.append(
+                {
+                    "name": name,
+                    "length": len(section),
+                    "is_list": self._is_list_section(section, name, list_pattern, bullet_pattern),
+                }
+            )
+        return sections_data
+
     def _is_list_section(self, section, section_name, list_pattern, bullet_pattern):
         """Determine if a section is a list section based on title and content."""
         if section_name and list_pattern.search(section_name):
@@ -525,18 +580,27 @@ class StructureChecks(BaseChecker):
                     context=snippet,
                 )
 
-    def _check_footnote_sequence(self, paragraphs, results) -> None:
-        """Ensure detected footnotes follow sequential numbering."""
+    def _check_footnote_sequence(
+        self,
+        paragraphs,
+        results,
+        table: Optional[ParagraphTable] = None,
+        notes: Optional[NotesIndex] = None,
+    ) -> None:
+        """Ensure detected footnotes follow sequential numbering.
+
+        When ``table`` is given, paragraph text, style and runs are read from it
+        instead of the paragraph proxies; ``notes`` narrows the paragraphs read.
+        """
         expected_number = 1
         seen_numbers: Set[int] = set()
 
-        for index, paragraph in enumerate(paragraphs, start=1):
-            if self._is_appendix_heading(paragraph):
+        for index, is_appendix, footnote_numbers in self._footnote_rows(paragraphs, table, notes):
+            if is_appendix:
                 expected_number = 1
                 seen_numbers.clear()
                 continue
 
-            footnote_numbers = self._extract_footnote_numbers(paragraph)
             if not footnote_numbers:
                 continue
 
@@ -583,6 +647,42 @@ class StructureChecks(BaseChecker):
                     )
                     seen_numbers.add(number)
 
+    def _footnote_rows(
+        self, paragraphs, table: Optional[ParagraphTable], notes: Optional[NotesIndex] = None
+    ):
+        """Yield ``(line, is appendix heading, footnote numbers)`` per paragraph.
+
+        With ``table`` and ``notes``, only paragraphs that can yield a row
+        other than ``(line, False, [])`` are visited.
+        """
+        if table is None:
+            for index, paragraph in enumerate(paragraphs, start=1):
+                if self._is_appendix_heading(paragraph):
+                    yield index, True, []
+                else:
+                    yield index, False, self._extract_footnote_numbers(paragraph)
+            return
+        if notes is None:
+            candidates: Iterable[int] = range(len(paragraphs))
+        else:
+            candidates = self._footnote_candidates(table, notes)
+        for index in candidates:
+            if self._is_appendix_text(table.texts[index], table.styles[index] or ""):
+                yield index + 1, True, []
+            else:
+                yield index + 1, False, self._table_footnote_numbers(table, index)
+
+    @staticmethod
+    def _footnote_candidates(table: ParagraphTable, notes: NotesIndex) -> List[int]:
+        """Paragraphs with a note reference, a ``[n]`` marker or the word appendix."""
+        text = table.text
+        markers = (
+            table.paragraph_at(match.start())
+            for pattern in (FOOTNOTE_TEXT_PATTERN, APPENDIX_WORD_PATTERN)
+            for match in pattern.finditer(text)
+        )
+        return sorted(set(notes.paragraphs_with("footnote")).union(markers))
+
     def _is_appendix_heading(self, paragraph) -> bool:
         """Determine whether a paragraph marks the beginning of an appendix."""
         text = getattr(paragraph, "text", "")
@@ -590,7 +690,15 @@ class StructureChecks(BaseChecker):
             return False
 
         style = getattr(paragraph, "style", None)
-        style_name = getattr(style, "name", "").lower()
+        return self._is_appendix_text(text, getattr(style, "name", ""))
+
+    @staticmethod
+    def _is_appendix_text(text: str, style_name: str) -> bool:
+        """Appendix test on a paragraph's text and style name."""
+        if not text:
+            return False
+
+        style_name = style_name.lower()
         normalized_text = text.strip().lower()
 
         if style_name.startswith("heading") and "appendix" in normalized_text:
@@ -614,6 +722,21 @@ class StructureChecks(BaseChecker):
 
         return numbers
 
+    @staticmethod
+    def _table_footnote_numbers(table: ParagraphTable, index: int) -> List[int]:
+        """Footnote numbers of paragraph ``index``, as :meth:`_extract_footnote_numbers`."""
+        numbers: List[int] = []
+        text = table.texts[index]
+        for span in table.runs[index]:
+            if span.hyperlink:  # ``Paragraph.runs`` skips runs inside hyperlinks
+                continue
+            numbers.extend(
+                int(match.group(1))
+                for match in FOOTNOTE_TEXT_PATTERN.finditer(text[span.start : span.end])
+            )
+            numbers.extend(span.footnotes)
+        return numbers
+
     def _extract_numbers_from_run(self, run) -> List[int]:
         """Extract potential footnote numbers from a python-docx run."""
         numbers: List[int] = []
@@ -632,6 +755,9 @@ class StructureChecks(BaseChecker):
 
         return numbers
 
+    @CheckRegistry.register(
+        "structure", requires=("paragraphs", "paragraph_table", "sections", "part")
+    )
     def _check_watermark(
         self, document: Document, results: DocumentCheckResult, doc_type: str
     ) -> None:
@@ -672,13 +798,18 @@ class StructureChecks(BaseChecker):
         valid_marks.append("draft")
 
         # Check body paragraphs
-        text = self._find_watermark_in_paragraphs(doc.paragraphs, valid_marks)
+        table = paragraph_table_of(doc)
+        text = (
+            self._find_watermark_in_rows(zip(table.texts, table.styles), valid_marks)
+            if table is not None
+            else self._find_watermark_in_paragraphs(doc.paragraphs, valid_marks)
+        )
         if text:
             logger.debug("Watermark found in body paragraphs: %s", text)
             return text
 
-        # Check header and footer paragraphs
-        for section in doc.sections:
+        # Check header and footer paragraphs (plain-text sources have none)
+        for section in getattr(doc, "sections", ()):
             header_mark = self._find_watermark_in_paragraphs(section.header.paragraphs, valid_marks)
             if header_mark:
                 logger.debug("Watermark found in header paragraph: %s", header_mark)
@@ -689,7 +820,8 @@ class StructureChecks(BaseChecker):
                 return footer_mark
 
         # Search header and footer XML for watermark text (e.g., WordArt shapes)
-        for rel in doc.part.rels.values():
+        part = getattr(doc, "part", None)
+        for rel in part.rels.values() if part is not None else ():
             if rel.reltype in (RT.HEADER, RT.FOOTER):
                 try:
                     root = ET.fromstring(rel.target_part.blob)  # nosec B314
@@ -736,7 +868,10 @@ class StructureChecks(BaseChecker):
     def _check_required_ac_paragraphs(
         self, paragraphs, doc_type: str, results: DocumentCheckResult
     ) -> None:
-        """Ensure Advisory Circulars contain required boilerplate paragraphs."""
+        """Ensure Advisory Circulars contain required boilerplate paragraphs.
+
+        The paragraphs come from the current rule set, so reloaded rules apply.
+        """
         if doc_type != "Advisory Circular":
             return
 
@@ -745,7 +880,7 @@ class StructureChecks(BaseChecker):
             for i, p in enumerate(paragraphs, 1)
         }
 
-        for para in self.AC_REQUIRED_PARAGRAPHS:
+        for para in get_ruleset().boilerplate_paragraphs[1:5]:
             norm_para = re.sub(r"\s+", " ", para.strip()).lower()
             if norm_para not in normalised_doc:
                 preview = self._get_text_preview(para)
@@ -756,13 +891,11 @@ class StructureChecks(BaseChecker):
                 )
 
     def _extract_paragraph_numbering(self, doc: DocxDocument) -> List[tuple]:
-        """Extract paragraph numbering from headings."""
-        heading_structure = []
-        for para in doc.paragraphs:
-            if para.style.name.startswith("Heading"):
-                if match := re.match(r"^([A-Z]?\.?\d+(?:\.\d+)*)\s+(.+)$", para.text):
-                    heading_structure.append((match.group(1), match.group(2)))
-        return heading_structure
+        """Extract ``(number, title)`` pairs of the numbered headings."""
+        outline = outline_of(doc)
+        if outline is None:
+            return []
+        return [(heading.number, heading.title) for heading in outline.headings if heading.number]
 
     @profile_performance
     def check_cross_references(self, doc_path: str) -> DocumentCheckResult:
@@ -792,16 +925,18 @@ class StructureChecks(BaseChecker):
     def _initialize_cross_reference_data(self, doc):
         """Initialize data structures for cross-reference checking."""
         heading_structure = self._extract_paragraph_numbering(doc)
-        valid_sections = {number for number, _ in heading_structure}
-        tables, figures = self._extract_tables_and_figures(doc)
+        index = cross_reference_index_of(doc)
+        if index is None:
+            index = CrossReferenceIndex.from_lines([p.text for p in doc.paragraphs])
         skip_regex = self._compile_skip_patterns()
 
         return {
             "heading_structure": heading_structure,
-            "valid_sections": valid_sections,
-            "tables": tables,
-            "figures": figures,
+            "valid_sections": set(index.labels[SECTION]),
+            "tables": set(index.labels[TABLE]),
+            "figures": set(index.labels[FIGURE]),
             "skip_regex": skip_regex,
+            "index": index,
         }
 
     def _compile_skip_patterns(self):
@@ -821,66 +956,52 @@ class StructureChecks(BaseChecker):
         ]
         return re.compile("|".join(skip_patterns), re.IGNORECASE)
 
-    def _extract_tables_and_figures(self, doc):
-        """Extract table and figure identifiers from the document."""
-        tables = set()
-        figures = set()
-
-        for para in doc.paragraphs:
-            text = para.text.strip() if hasattr(para, "text") else ""
-
-            if text.lower().startswith("table"):
-                table_id = self._extract_table_id(text)
-                if table_id:
-                    tables.add(table_id)
-
-            if text.lower().startswith("figure"):
-                figure_id = self._extract_figure_id(text)
-                if figure_id:
-                    figures.add(figure_id)
-
-        return tables, figures
-
-    def _extract_table_id(self, text):
-        """Extract table ID from table caption text."""
-        matches = [
-            re.match(r"^table\s+(\d{1,2}(?:-\d+)?)\b", text, re.IGNORECASE),
-            re.match(r"^table\s+(\d{1,2}(?:\.\d+)?)\b", text, re.IGNORECASE),
-        ]
-        for match in matches:
-            if match:
-                return match.group(1)
-        return None
-
-    def _extract_figure_id(self, text):
-        """Extract figure ID from figure caption text."""
-        matches = [
-            re.match(r"^figure\s+(\d{1,2}(?:-\d+)?)\b", text, re.IGNORECASE),
-            re.match(r"^figure\s+(\d{1,2}(?:\.\d+)?)\b", text, re.IGNORECASE),
-        ]
-        for match in matches:
-            if match:
-                return match.group(1)
-        return None
-
     def _process_cross_references(self, doc, cross_ref_data):
-        """Process all cross-references in the document."""
+        """Report references whose table, figure or section is not in the document."""
         issues = []
+        index = cross_ref_data["index"]
 
-        for para in doc.paragraphs:
-            para_text = para.text.strip() if hasattr(para, "text") else ""
+        for line_idx, line in enumerate(index.lines):
+            para_text = line.strip()
             if not para_text or cross_ref_data["skip_regex"].search(para_text):
                 continue
-
-            # Check all types of references
-            self._check_table_references(para_text, cross_ref_data["tables"], issues)
-            self._check_figure_references(para_text, cross_ref_data["figures"], issues)
-            self._check_section_references(
-                para_text, cross_ref_data["valid_sections"], cross_ref_data["skip_regex"], issues
-            )
+            for reference in index.references_on(line_idx):
+                if reference.word.lower() == "subsection" or index.defines(
+                    reference.kind, reference.key
+                ):
+                    continue
+                issue = self._cross_reference_issue(reference, para_text)
+                if issue is not None:
+                    issues.append(issue)
 
         return issues
 
+    @staticmethod
+    def _cross_reference_issue(reference, para_text: str) -> Optional[Dict[str, Any]]:
+        """Issue dictionary for an unresolved ``reference`` found in ``para_text``."""
+        if reference.kind in (TABLE, FIGURE):
+            label = reference.kind.capitalize()
+            return {
+                "type": label,
+                "reference": reference.number,
+                "context": para_text,
+                "message": f"Referenced {label} {reference.number} not found in document",
+                "severity": Severity.ERROR,
+            }
+        if reference.kind != SECTION:
+            return None
+        context_snippet = para_text[:60] + "..." if len(para_text) > 60 else para_text
+        return {
+            "type": "Paragraph",
+            "reference": reference.key,
+            "context": para_text,
+            "message": (
+                f"Reference to '{reference.key}' not found. "
+                f"Please check this section exists: '{context_snippet}'"
+            ),
+            "severity": Severity.ERROR,
+        }
+
     def _build_cross_reference_result(self, issues, cross_ref_data):
         """Build the final DocumentCheckResult for cross-references."""
         return DocumentCheckResult(
@@ -896,74 +1017,6 @@ class StructureChecks(BaseChecker):
             },
         )
 
-    def _check_figure_references(self, para_text: str, figures: set, issues: list) -> None:
-        """Check figure references."""
-        figure_refs = re.finditer(
-            r"(?:see|in|refer to)?\s*(?:figure|Figure)\s+(\d{1,2}(?:[-\.]\d+)?)\b", para_text
-        )
-        for match in figure_refs:
-            ref = match.group(1)
-            if ref not in figures:
-                issues.append(
-                    {
-                        "type": "Figure",
-                        "reference": ref,
-                        "context": para_text,
-                        "message": f"Referenced Figure {ref} not found in document",
-                        "severity": Severity.ERROR,
-                    }
-                )
-
-    def _check_section_references(
-        self, para_text: str, valid_sections: set, skip_regex: re.Pattern, issues: list
-    ) -> None:
-        """Check section references."""
-        if skip_regex.search(para_text):
-            return
-
-        section_refs = re.finditer(
-            r"(?:paragraph|section|appendix)\s+([A-Z]?\.?\d+(?:\.\d+)*)",
-            para_text,
-            re.IGNORECASE,
-        )
-
-        for match in section_refs:
-            ref = match.group(1).strip(".")
-            if ref not in valid_sections:
-                found = any(valid_section.strip(".") == ref for valid_section in valid_sections)
-                if not found:
-                    context_snippet = para_text[:60] + "..." if len(para_text) > 60 else para_text
-                    issues.append(
-                        {
-                            "type": "Paragraph",
-                            "reference": ref,
-                            "context": para_text,
-                            "message": (
-                                f"Reference to '{ref}' not found. "
-                                f"Please check this section exists: '{context_snippet}'"
-                            ),
-                            "severity": Severity.ERROR,
-                        }
-                    )
-
-    def _check_table_references(self, para_text: str, tables: set, issues: list) -> None:
-        """Check table references."""
-        table_refs = re.finditer(
-            r"(?:see|in|refer to)?\s*(?:table|Table)\s+(\d{1,2}(?:[-\.]\d+)?)\b", para_text
-        )
-        for match in table_refs:
-            ref = match.group(1)
-            if ref not in tables:
-                issues.append(
-                    {
-                        "type": "Table",
-                        "reference": ref,
-                        "context": para_text,
-                        "message": f"Referenced Table {ref} not found in document",
-                        "severity": Severity.ERROR,
-                    }
-                )
-
     def check_document(self, document: DocxDocument, doc_type: str) -> DocumentCheckResult:
         """Check document for structure issues. Accepts a python-docx Document object."""
         logger.info("[StructureChecks] check_document called")
@@ -1010,8 +1063,9 @@ class StructureChecks(BaseChecker):
         # Initialize result structure
         result = {"has_errors": False, "errors": [], "warnings": []}
 
-        # Extract section definitions from content
-        defined_sections = self._extract_defined_sections(content)
+        # Section definitions and references come from one pass over the content
+        index = CrossReferenceIndex.from_lines(content)
+        defined_sections = set(index.labels[SECTION])
         logger.debug(f"Found defined sections: {defined_sections}")
 
         # Build section line mapping for circular reference detection
@@ -1021,7 +1075,12 @@ class StructureChecks(BaseChecker):
         # Check each line for cross-references
         for line_num, line in enumerate(content, 1):
             self._check_line_cross_references(
-                line, line_num, defined_sections, section_lines, result
+                line,
+                line_num,
+                defined_sections,
+                section_lines,
+                result,
+                index.references_on(line_num - 1, SECTION),
             )
 
         appendix_sequence = result.pop("_appendix_sequence", None)
@@ -1036,23 +1095,6 @@ class StructureChecks(BaseChecker):
 
         return result
 
-    def _extract_defined_sections(self, content: List[str]) -> set:
-        """Extract section numbers that are defined in the content."""
-        defined_sections = set()
-
-        # Pattern to match section definitions like "2.1 Title", "25.1309 Title", etc.
-        section_def_pattern = re.compile(r"^([A-Z]?\.?\d+(?:\.\d+)*)\s+(.+)$")
-
-        for line in content:
-            line = line.strip()
-            match = section_def_pattern.match(line)
-            if match:
-                section_num = match.group(1).strip(".")
-                defined_sections.add(section_num)
-                logger.debug(f"Found section definition: {section_num}")
-
-        return defined_sections
-
     def _build_section_line_mapping(self, content: List[str]) -> Dict[str, int]:
         """Build mapping of section numbers to their line numbers."""
         section_lines = {}
@@ -1075,8 +1117,13 @@ class StructureChecks(BaseChecker):
         defined_sections: set,
         section_lines: Dict[str, int],
         result: Dict[str, Any],
+        references: Optional[List[Reference]] = None,
     ):
-        """Check a single line for cross-reference issues."""
+        """Check a single line for cross-reference issues.
+
+        ``references`` are the indexed section references of the line; they
+        are found in ``line`` when not given.
+        """
         line = line.strip()
         if not line:
             return
@@ -1106,7 +1153,7 @@ class StructureChecks(BaseChecker):
         # Check for cross-references
         appendix_letters = self._check_appendix_references(line, line_num, result)
         self._check_section_references_in_line(
-            line, line_num, defined_sections, result, appendix_letters
+            line, line_num, defined_sections, result, appendix_letters, references
         )
         self._check_reference_formatting(line, line_num, result)
         self._check_circular_references(line, line_num, defined_sections, section_lines, result)
@@ -1151,40 +1198,43 @@ class StructureChecks(BaseChecker):
         defined_sections: set,
         result: Dict[str, Any],
         appendix_letters_in_line: Optional[Set[str]] = None,
+        references: Optional[List[Reference]] = None,
     ):
         """Check for references to sections and verify they exist."""
-        # Pattern to match references like "paragraph 2.1", "section 25.1309", etc.
-        ref_patterns = [
-            r"(?:paragraph|section|subsection)\s+([A-Z]?\.?\d+(?:\.\d+)*)",
+        # References like "paragraph 2.1" or "section 25.1309", from the index
+        # when available, then "section (a)" and "section (1)" forms.
+        if references is None:
+            references = CrossReferenceIndex.from_lines([line]).references_on(0, SECTION)
+        found = [r.number for r in references if r.word.lower() != "appendix"]
+        for pattern in (
             r"(?:paragraph|section|subsection)\s+\(([a-z])\)",
             r"(?:paragraph|section|subsection)\s+\((\d+)\)",
-        ]
+        ):
+            found.extend(match.group(1) for match in re.finditer(pattern, line, re.IGNORECASE))
 
-        for pattern in ref_patterns:
-            matches = re.finditer(pattern, line, re.IGNORECASE)
-            for match in matches:
-                ref = match.group(1).strip(".")
-                logger.debug(f"Found reference to '{ref}' in line {line_num}")
+        for number in found:
+            ref = number.strip(".")
+            logger.debug(f"Found reference to '{ref}' in line {line_num}")
 
-                # Skip single letter or single digit references for now
-                if len(ref) == 1:
-                    continue
+            # Skip single letter or single digit references for now
+            if len(ref) == 1:
+                continue
 
-                if appendix_letters_in_line:
-                    ref_prefix = ref.split(".", 1)[0].upper()
-                    if ref_prefix in appendix_letters_in_line:
-                        logger.debug(
-                            "Skipping section reference '%s' in line %s due to appendix context",
-                            ref,
-                            line_num,
-                        )
-                        continue
+            if appendix_letters_in_line:
+                ref_prefix = ref.split(".", 1)[0].upper()
+                if ref_prefix in appendix_letters_in_line:
+                    logger.debug(
+                        "Skipping section reference '%s' in line %s due to appendix context",
+                        ref,
+                        line_num,
+                    )
+                    continue
 
-                if ref not in defined_sections:
-                    error_msg = f"Reference to non-existent section {ref}"
-                    result["errors"].append({"message": error_msg, "line_number": line_num})
-                    result["has_errors"] = True
-                    logger.debug(f"Added error: {error_msg}")
+            if ref not in defined_sections:
+                error_msg = f"Reference to non-existent section {ref}"
+                result["errors"].append({"message": error_msg, "line_number": line_num})
+                result["has_errors"] = True
+                logger.debug(f"Added error: {error_msg}")
 
     def _check_reference_formatting(self, line: str, line_num: int, result: Dict[str, Any]):
         """Check for formatting issues in references."""
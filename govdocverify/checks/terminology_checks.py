@@ -7,13 +7,11 @@ from typing import Any, Dict
 from docx.document import Document as DocxDocument
 
 from govdocverify.checks.check_registry import CheckRegistry
-from govdocverify.config.terminology_rules import (
-    FORBIDDEN_TERMS,
-    TERM_REPLACEMENTS,
-    TERMINOLOGY_VARIANTS,
-    TerminologyMessages,
-)
+from govdocverify.config.terminology_rules import TerminologyMessages
 from govdocverify.models import DocumentCheckResult, Severity
+from govdocverify.utils.deadlines import CheckTimeout, raise_if_cancelled
+from govdocverify.utils.paragraph_stream import paragraph_windows
+from govdocverify.utils.ruleset import get_ruleset
 
 from .base_checker import BaseChecker
 
@@ -35,6 +33,8 @@ ABOVE_BELOW_REF_PATTERN = re.compile(
 class TerminologyChecks(BaseChecker):
     """Class for handling terminology-related checks."""
 
+    paragraph_local = True
+
     def __init__(self, terminology_manager: Any | None = None) -> None:
         super().__init__(terminology_manager)
         self.category: str = "terminology"
@@ -45,7 +45,7 @@ class TerminologyChecks(BaseChecker):
         )
         logger.info("Initialized TerminologyChecks with terminology manager")
 
-    @CheckRegistry.register("terminology")
+    @CheckRegistry.register("terminology", requires=("paragraph_stream", "notes"))
     def check_document(self, document: DocxDocument, doc_type: str) -> DocumentCheckResult:
         """Check document for terminology issues."""
         results = DocumentCheckResult()
@@ -55,40 +55,52 @@ class TerminologyChecks(BaseChecker):
     def run_checks(
         self, document: DocxDocument, doc_type: str, results: DocumentCheckResult
     ) -> None:
-        """Run all terminology-related checks."""
+        """Run all terminology-related checks, one paragraph window at a time."""
         logger.info(f"Running terminology checks for document type: {doc_type}")
 
-        text_content = [p.text for p in document.paragraphs]
-        self._check_proposed_wording(text_content, doc_type, results)
-        self._check_consistency(text_content, results)
-        self._check_forbidden_terms(text_content, results)
-        self._check_term_replacements(text_content, results)
-
-    def _check_consistency(self, paragraphs: list[str], results: DocumentCheckResult) -> None:
+        proposed, consistency, forbidden, replacements = (
+            DocumentCheckResult() for _ in range(4)
+        )
+        try:
+            for first_line, text_content in paragraph_windows(document, notes=True):
+                self._check_proposed_wording(text_content, doc_type, proposed, first_line)
+                self._check_consistency(text_content, consistency, first_line)
+                self._check_forbidden_terms(text_content, forbidden, first_line)
+                self._check_term_replacements(text_content, replacements, first_line)
+                raise_if_cancelled()
+        except CheckTimeout as exc:
+            self.merge_results(results, proposed, consistency, forbidden, replacements)
+            raise exc.with_partial(results) from None
+        self.merge_results(results, proposed, consistency, forbidden, replacements)
+
+    def _check_consistency(
+        self, paragraphs: list[str], results: DocumentCheckResult, first_line: int = 1
+    ) -> None:
         """Check for consistent terminology usage."""
-        for i, text in enumerate(paragraphs):
+        matchers = get_ruleset().variant_matchers
+        for i, text in enumerate(paragraphs, start=first_line - 1):
             logger.debug(f"[Terminology] Checking line {i+1}: {text!r}")
-            for standard, variants in TERMINOLOGY_VARIANTS.items():
-                for variant in variants:
-                    pattern = rf"\b{re.escape(variant)}\b"
-                    flags = 0 if variant.lower() == standard.lower() else re.IGNORECASE
-                    if re.search(pattern, text, flags):
-                        logger.debug(
-                            f"[Terminology] Matched variant '{variant}' (should use '{standard}') "
-                            f"in line {i+1}"
-                        )
-                        results.add_issue(
-                            message=TerminologyMessages.INCONSISTENT_TERMINOLOGY.format(
-                                standard=standard, variant=variant
-                            ),
-                            severity=Severity.INFO,
-                            line_number=i + 1,
-                            category=getattr(self, "category", "terminology"),
-                        )
+            for standard, variant, pattern in matchers:
+                if pattern.search(text):
+                    logger.debug(
+                        f"[Terminology] Matched variant '{variant}' (should use '{standard}') "
+                        f"in line {i+1}"
+                    )
+                    results.add_issue(
+                        message=TerminologyMessages.INCONSISTENT_TERMINOLOGY.format(
+                            standard=standard, variant=variant
+                        ),
+                        severity=Severity.INFO,
+                        line_number=i + 1,
+                        category=getattr(self, "category", "terminology"),
+                    )
 
-    def _check_forbidden_terms(self, paragraphs: list[str], results: DocumentCheckResult) -> None:
+    def _check_forbidden_terms(
+        self, paragraphs: list[str], results: DocumentCheckResult, first_line: int = 1
+    ) -> None:
         """Check for forbidden or discouraged terms."""
-        for i, text in enumerate(paragraphs):
+        matchers = get_ruleset().forbidden_matchers
+        for i, text in enumerate(paragraphs, start=first_line - 1):
             logger.debug(f"[Terminology] Checking forbidden terms in line {i+1}: {text!r}")
             if ABOVE_BELOW_REF_PATTERN.search(text):
                 logger.debug(f"[Terminology] Matched relative reference in line {i+1}")
@@ -98,9 +110,8 @@ class TerminologyChecks(BaseChecker):
                     line_number=i + 1,
                     category=getattr(self, "category", "terminology"),
                 )
-            for term, message in FORBIDDEN_TERMS.items():
-                pattern = rf"\b{re.escape(term)}\b"
-                if re.search(pattern, text, re.IGNORECASE):
+            for term, message, pattern in matchers:
+                if pattern.search(text):
                     logger.debug(f"[Terminology] Matched forbidden term '{term}' in line {i+1}")
                     results.add_issue(
                         message=message,
@@ -109,40 +120,18 @@ class TerminologyChecks(BaseChecker):
                         category=getattr(self, "category", "terminology"),
                     )
 
-    def _check_term_replacements(self, paragraphs: list[str], results: DocumentCheckResult) -> None:
+    def _check_term_replacements(
+        self, paragraphs: list[str], results: DocumentCheckResult, first_line: int = 1
+    ) -> None:
         """
         Flag any outdated terms that have a direct replacement in
         TERM_REPLACEMENTS.  Suggest the approved wording.
         """
-        for i, text in enumerate(paragraphs):
+        replacements = get_ruleset().term_replacements
+        for i, text in enumerate(paragraphs, start=first_line - 1):
             logger.debug(f"[Terminology] Checking term replacements in line {i+1}: {text!r}")
-            for obsolete, approved in TERM_REPLACEMENTS.items():
-                # Handle special cases that need different regex patterns
-                if obsolete in [
-                    "CFR Part",
-                    "U.S.C",
-                    "USC",
-                    "in accordance with",
-                    "in compliance with",
-                ]:
-                    # For phrases and specific formatting, use exact matching
-                    if obsolete == "CFR Part":
-                        pattern = r"\bCFR\s+Part\b"
-                    elif obsolete == "U.S.C":
-                        # Match U.S.C without a final period - more precise pattern
-                        pattern = r"\bU\.S\.C(?!\.)(?=\s|$)"
-                    elif obsolete == "USC":
-                        # Match USC without periods
-                        pattern = r"\bUSC\b"
-                    elif obsolete in ["in accordance with", "in compliance with"]:
-                        # Match the full phrase
-                        pattern = rf"\b{re.escape(obsolete)}\b"
-                    else:
-                        pattern = rf"\b{re.escape(obsolete)}\b"
-                else:
-                    # Standard word boundary matching for other terms
-                    pattern = rf"\b{re.escape(obsolete)}\b"
-
+            for obsolete, approved in replacements.items():
+                pattern = self._get_pattern_for_obsolete_term(obsolete)
                 if re.search(pattern, text, re.IGNORECASE):
                     logger.debug(f"[Terminology] Matched obsolete term '{obsolete}' in line {i+1}")
                     results.add_issue(
@@ -194,6 +183,7 @@ class TerminologyChecks(BaseChecker):
     def _check_forbidden_terms_in_lines(self, lines: list[str]) -> list[Dict[str, Any]]:
         """Check for forbidden terms in text lines."""
         issues: list[Dict[str, Any]] = []
+        matchers = get_ruleset().forbidden_matchers
         for i, line in enumerate(lines, 1):
             if ABOVE_BELOW_REF_PATTERN.search(line):
                 logger.debug(f"[Terminology] Matched relative reference in line {i}")
@@ -204,9 +194,8 @@ class TerminologyChecks(BaseChecker):
                         "category": getattr(self, "category", "terminology"),
                     }
                 )
-            for term, message in FORBIDDEN_TERMS.items():
-                pattern = rf"\b{re.escape(term)}\b"
-                if re.search(pattern, line, re.IGNORECASE):
+            for term, message, pattern in matchers:
+                if pattern.search(line):
                     logger.debug(f"[Terminology] Matched forbidden term '{term}' in line {i}")
                     issues.append(
                         {
@@ -220,30 +209,29 @@ class TerminologyChecks(BaseChecker):
     def _check_terminology_variants_in_lines(self, lines: list[str]) -> list[Dict[str, Any]]:
         """Check for terminology variants in text lines."""
         issues: list[Dict[str, Any]] = []
+        matchers = get_ruleset().variant_matchers
         for i, line in enumerate(lines, 1):
-            for standard, variants in TERMINOLOGY_VARIANTS.items():
-                for variant in variants:
-                    pattern = rf"\b{re.escape(variant)}\b"
-                    flags = 0 if variant.lower() == standard.lower() else re.IGNORECASE
-                    if re.search(pattern, line, flags):
-                        logger.debug(
-                            f"[Terminology] Matched variant '{variant}' (should use '{standard}') "
-                            f"in line {i}"
-                        )
-                        issues.append(
-                            {
-                                "message": f'Change "{variant}" to "{standard}".',
-                                "severity": Severity.WARNING,
-                                "category": getattr(self, "category", "terminology"),
-                            }
-                        )
+            for standard, variant, pattern in matchers:
+                if pattern.search(line):
+                    logger.debug(
+                        f"[Terminology] Matched variant '{variant}' (should use '{standard}') "
+                        f"in line {i}"
+                    )
+                    issues.append(
+                        {
+                            "message": f'Change "{variant}" to "{standard}".',
+                            "severity": Severity.WARNING,
+                            "category": getattr(self, "category", "terminology"),
+                        }
+                    )
         return issues
 
     def _check_obsolete_terms_in_lines(self, lines: list[str]) -> list[Dict[str, Any]]:
         """Check for obsolete terms that need replacement."""
         issues: list[Dict[str, Any]] = []
+        replacements = get_ruleset().term_replacements
         for i, line in enumerate(lines, 1):
-            for obsolete, approved in TERM_REPLACEMENTS.items():
+            for obsolete, approved in replacements.items():
                 pattern = self._get_pattern_for_obsolete_term(obsolete)
                 if re.search(pattern, line, re.IGNORECASE):
                     logger.debug(f"[Terminology] Matched obsolete term '{obsolete}' in line {i}")
@@ -529,13 +517,14 @@ class TerminologyChecks(BaseChecker):
         paragraphs: list[str],
         doc_type: str,
         results: DocumentCheckResult,
+        first_line: int = 1,
     ) -> None:
         """Flag any occurrence of 'propos*' in non-proposed documents."""
         if self._is_proposed_phase(doc_type):
             logger.debug("Document is in proposed phase – skipping proposed-wording check")
             return
 
-        for idx, text in enumerate(paragraphs, start=1):
+        for idx, text in enumerate(paragraphs, start=first_line):
             logger.debug(f"_check_proposed_wording: line {idx}: {repr(text)}")
             match = self._PROPOSE_REGEX.search(text)
             logger.debug(f"_check_proposed_wording: regex match: {match}")
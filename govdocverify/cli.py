@@ -5,9 +5,11 @@ import json
 import logging
 import os
 import sys
+from contextlib import nullcontext
+from functools import partial
 from glob import glob
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional, TextIO
 
 from govdocverify import export
 from govdocverify.logging_config import setup_logging
@@ -16,11 +18,13 @@ from govdocverify.models import (
     DocumentTypeError,
     VisibilitySettings,
 )
-from govdocverify.processing import build_results_dict
+from govdocverify.processing import index_results
 from govdocverify.processing import process_document as _run_checks
 from govdocverify.utils import extract_docx_metadata
 from govdocverify.utils.formatting import FormatStyle, ResultFormatter
+from govdocverify.utils.memory_profile import memory_stage, profile_memory
 from govdocverify.utils.security import SecurityError, sanitize_file_path
+from govdocverify.utils.tracing import trace_span
 
 logger = logging.getLogger(__name__)
 
@@ -41,13 +45,73 @@ def _safe_print(text: str) -> None:
         sys.stdout.flush()
 
 
+class RenderedResult(dict):
+    """Result dictionary whose ``rendered`` report is produced on first access.
+
+    ``rendered`` behaves like a normal key for lookups, ``get`` and ``in``, but
+    the report is only formatted when one of them asks for it. Until then the
+    key is absent from iteration and ``json.dumps``, so JSON output never pays
+    for rendering. :meth:`write_rendered` streams the report to a file-like
+    object without materializing it.
+    """
+
+    def __init__(
+        self,
+        data: dict[str, Any],
+        render: Callable[[], str],
+        write: Callable[[TextIO], int],
+    ) -> None:
+        super().__init__(data)
+        self._render = render
+        self._write = write
+
+    def __missing__(self, key: str) -> Any:
+        if key != "rendered":
+            raise KeyError(key)
+        value = self._render()
+        self["rendered"] = value
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return key == "rendered" or super().__contains__(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key == "rendered":
+            return self[key]
+        return super().get(key, default)
+
+    @property
+    def is_rendered(self) -> bool:
+        """Return ``True`` once the report has been formatted."""
+        return super().__contains__("rendered")
+
+    def write_rendered(self, stream: TextIO) -> int:
+        """Write the report to ``stream`` and return the characters written."""
+        if self.is_rendered:
+            return stream.write(self["rendered"])
+        return self._write(stream)
+
+
+def _write_rendered(result: dict[str, Any], path: Path) -> None:
+    """Write the rendered report of ``result`` to ``path``."""
+    with open(path, "w", encoding="utf-8") as fh:
+        if isinstance(result, RenderedResult):
+            result.write_rendered(fh)
+        else:
+            fh.write(result["rendered"])
+
+
 def process_document(  # noqa: C901 - function is complex but mirrors CLI logic
     file_path: str,
     doc_type: str,
     visibility_settings: Optional[VisibilitySettings] = None,
     group_by: str = "category",
 ) -> dict[str, Any]:
-    """Process a document and return results as a dictionary."""
+    """Process a document and return results as a dictionary.
+
+    The returned :class:`RenderedResult` formats the ``rendered`` report
+    lazily, the first time it is requested.
+    """
     logger.debug("[PROOF] process_document called")
     logger.debug(
         "[DIAG] process_document called with "
@@ -65,43 +129,32 @@ def process_document(  # noqa: C901 - function is complex but mirrors CLI logic
             visibility_settings = VisibilitySettings()
 
         formatter = ResultFormatter(style=FormatStyle.PLAIN)
-        metadata = extract_docx_metadata(file_path)
+        with memory_stage("metadata"), trace_span("extract_docx_metadata"):
+            metadata = extract_docx_metadata(file_path)
 
-        # Run the document checks using the shared processing module
-        results = _run_checks(file_path, doc_type)
+        # Run only the visible categories using the shared processing module
+        results = _run_checks(file_path, doc_type, visibility_settings)
 
         logger.info("Formatting results")
         logger.debug(f"Raw results type: {type(results)}")
         logger.debug(f"Raw results dir: {dir(results)}")
 
-        # Build a normalized results dictionary
-        results_dict = build_results_dict(results)
-
-        # --- FILTER RESULTS BASED ON VISIBILITY SETTINGS ---
-        # Only include categories where visibility_settings.<category> is True
-        # If --show-only is used, only include those categories,
-        # even if others are present in results_dict
-        if hasattr(visibility_settings, "_show_only_set") and visibility_settings._show_only_set:
-            # Strict filtering: only show categories in show_only_set
-            filtered_results_dict = {
-                cat: checks
-                for cat, checks in results_dict.items()
-                if cat in visibility_settings._show_only_set
-            }
-        else:
-            visibility_map = visibility_settings.to_dict()
-            filtered_results_dict = {}
-            for category, checks in results_dict.items():
-                if category in visibility_map and not visibility_map[category]:
-                    continue  # Skip hidden categories
-                filtered_results_dict[category] = checks
-        # ---------------------------------------------------
-
-        formatted_results = formatter.format_results(
-            filtered_results_dict,
-            doc_type,
-            group_by=group_by,
-            metadata=metadata,
+        # Index the normalized results once; filtering and formatting reuse it
+        with memory_stage("index"), trace_span("build_results_dict"):
+            index = index_results(results)
+
+            # Hidden categories were never run; this also drops fallback groups
+            # (``all``/``general``) that a --show-only selection does not name.
+            index = index.select(visibility_settings.is_category_visible)
+        filtered_results_dict = index.results
+
+        format_kwargs = {"group_by": group_by, "metadata": metadata, "index": index}
+        render = partial(formatter.format_results, filtered_results_dict, doc_type, **format_kwargs)
+        write = partial(
+            formatter.write_results,
+            results=filtered_results_dict,
+            doc_type=doc_type,
+            **format_kwargs,
         )
         logger.info("Document processing completed successfully")
 
@@ -110,13 +163,17 @@ def process_document(  # noqa: C901 - function is complex but mirrors CLI logic
         severity_name = (
             results.severity.name if getattr(results, "severity", None) is not None else None
         )
-        return {
-            "has_errors": has_errors,
-            "severity": severity_name,
-            "rendered": formatted_results,
-            "by_category": filtered_results_dict,
-            "metadata": metadata,
-        }
+        return RenderedResult(
+            {
+                "has_errors": has_errors,
+                "severity": severity_name,
+                "by_category": filtered_results_dict,
+                "summary": index.summary(),
+                "metadata": metadata,
+            },
+            render=render,
+            write=write,
+        )
 
     except FileNotFoundError:
         error_msg = f"ERROR: File not found: {file_path}"
@@ -136,26 +193,8 @@ def process_document(  # noqa: C901 - function is complex but mirrors CLI logic
         raise
 
 
-def _create_argument_parser() -> argparse.ArgumentParser:
-    """Create and configure the argument parser."""
-    parser = argparse.ArgumentParser(description="GovDocVerify CLI")
-    parser.add_argument("--file", type=str, required=True, help="Path to document file")
-    parser.add_argument("--type", type=str, required=True, help="Document type")
-    parser.add_argument(
-        "--group-by",
-        type=str,
-        choices=["category", "severity"],
-        default="category",
-        help="Group results by category or severity",
-    )
-    parser.add_argument("--debug", action="store_true", help="Enable debug mode")
-    parser.add_argument(
-        "--json",
-        action="store_true",
-        help="Output results as JSON instead of formatted text",
-    )
-
-    # Add visibility control flags
+def _add_visibility_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the category visibility flags to ``parser``."""
     visibility_group = parser.add_argument_group("Visibility Controls")
     visibility_group.add_argument(
         "--show-all", action="store_true", help="Show all sections (default)"
@@ -214,6 +253,28 @@ def _create_argument_parser() -> argparse.ArgumentParser:
             "acronym, headings, structure, format, accessibility, document_status."
         ),
     )
+
+
+def _create_argument_parser() -> argparse.ArgumentParser:
+    """Create and configure the argument parser."""
+    parser = argparse.ArgumentParser(description="GovDocVerify CLI")
+    parser.add_argument("--file", type=str, required=True, help="Path to document file")
+    parser.add_argument("--type", type=str, required=True, help="Document type")
+    parser.add_argument(
+        "--group-by",
+        type=str,
+        choices=["category", "severity"],
+        default="category",
+        help="Group results by category or severity",
+    )
+    parser.add_argument("--debug", action="store_true", help="Enable debug mode")
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output results as JSON instead of formatted text",
+    )
+
+    _add_visibility_arguments(parser)
     parser.add_argument(
         "--out",
         choices=["html", "docx", "pdf"],
@@ -226,9 +287,34 @@ def _create_argument_parser() -> argparse.ArgumentParser:
         default=".",
         help="Directory where output files will be saved",
     )
+    parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="Trace allocations per stage and write a JSON report to perf/artifacts",
+    )
     return parser
 
 
+def _emit_result(result: dict[str, Any], file_path: str, args: argparse.Namespace) -> None:
+    """Save the requested output files for ``result`` and print it."""
+    if args.out:
+        output_dir = Path(args.output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        base = Path(file_path).stem
+        for fmt in args.out:
+            out_path = output_dir / f"{base}.{fmt}"
+            if fmt == "html":
+                _write_rendered(result, out_path)
+            elif fmt == "docx":
+                export.save_results_as_docx(result, str(out_path))
+            elif fmt == "pdf":
+                export.save_results_as_pdf(result, str(out_path))
+    if args.json:
+        _safe_print(json.dumps(result))
+    else:
+        _safe_print(result["rendered"])
+
+
 def _validate_argument_exclusivity(args, parser: argparse.ArgumentParser) -> None:
     """Validate that mutually exclusive arguments are not used together."""
     if args.show_only:
@@ -346,8 +432,150 @@ def _create_visibility_settings(args, parser: argparse.ArgumentParser) -> Visibi
     )
 
 
+def _create_compare_parser() -> argparse.ArgumentParser:
+    """Create the argument parser of the ``compare`` subcommand."""
+    parser = argparse.ArgumentParser(
+        prog="govdocverify compare",
+        description="Report the issues a new document version adds, resolves or keeps",
+    )
+    parser.add_argument("--old", type=str, required=True, help="Path to the old version")
+    parser.add_argument("--new", type=str, required=True, help="Path to the new version")
+    parser.add_argument("--type", type=str, required=True, help="Document type")
+    parser.add_argument("--debug", action="store_true", help="Enable debug mode")
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output the comparison as JSON instead of formatted text",
+    )
+    _add_visibility_arguments(parser)
+    return parser
+
+
+def _format_comparison(comparison: dict[str, Any]) -> str:
+    """Render a comparison dictionary as plain text."""
+    summary = comparison["summary"]
+    paragraphs = comparison["paragraphs"]
+    lines = [
+        f"{paragraphs['changed']} of {paragraphs['new']} paragraphs changed: "
+        f"{summary['new']} new, {summary['resolved']} resolved, "
+        f"{summary['persisting']} persisting issues"
+    ]
+    for title, key in (("New issues", "new"), ("Resolved issues", "resolved")):
+        if not comparison[key]:
+            continue
+        lines.extend(["", f"{title}:"])
+        for issue in comparison[key]:
+            line = issue.get("line_number")
+            where = f"line {line}: " if line is not None else ""
+            message = issue.get("message", issue.get("error", ""))
+            lines.append(f"  [{issue.get('category', 'general')}] {where}{message}")
+    return "\n".join(lines)
+
+
+def compare_main(argv: list[str]) -> int:
+    """Run the ``compare`` subcommand; exit with 1 when the new version adds issues."""
+    from govdocverify.comparison import compare_documents
+
+    parser = _create_compare_parser()
+    args = parser.parse_args(argv)
+    _validate_argument_exclusivity(args, parser)
+    setup_logging(debug=args.debug)
+    visibility_settings = _create_visibility_settings(args, parser)
+
+    try:
+        doc_type = DocumentType.from_string(args.type).value
+    except DocumentTypeError:
+        logger.error(f"Invalid document type: {args.type}")
+        return 1
+
+    try:
+        old_path, new_path = sanitize_file_path(args.old), sanitize_file_path(args.new)
+        comparison = compare_documents(old_path, new_path, doc_type, visibility_settings)
+    except Exception as exc:
+        logger.error(f"Error comparing {args.old} with {args.new}: {exc}")
+        return 1
+
+    data = comparison.to_dict()
+    _safe_print(json.dumps(data) if args.json else _format_comparison(data))
+    return 1 if comparison.has_new_issues else 0
+
+
+def _create_crawl_parser() -> argparse.ArgumentParser:
+    """Create the argument parser of the ``crawl`` subcommand."""
+    from govdocverify.crawl import DEFAULT_MANIFEST
+
+    parser = argparse.ArgumentParser(
+        prog="govdocverify crawl",
+        description="Check a directory tree, skipping documents unchanged since the last crawl",
+    )
+    parser.add_argument("root", help="Directory to crawl")
+    parser.add_argument("--type", type=str, required=True, help="Document type")
+    parser.add_argument(
+        "--manifest",
+        default=DEFAULT_MANIFEST,
+        help=f"SQLite manifest recording checked files (default {DEFAULT_MANIFEST})",
+    )
+    parser.add_argument(
+        "--pattern",
+        nargs="+",
+        default=["*.docx"],
+        help="File name patterns to check (default *.docx)",
+    )
+    parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument(
+        "--preload",
+        action="store_true",
+        help="Build the rule data once before starting the workers",
+    )
+    parser.add_argument("--debug", action="store_true", help="Enable debug mode")
+    parser.add_argument("--json", action="store_true", help="Output the final counts as JSON")
+    return parser
+
+
+def _report_crawl(stats: Any) -> None:
+    eta = "unknown" if stats.eta is None else f"{stats.eta:.0f}s"
+    sys.stderr.write(
+        f"{stats.checked + stats.failed}/{stats.queued} checked "
+        f"({stats.skipped} unchanged, {stats.failed} failed), "
+        f"{stats.throughput:.2f} files/s, ETA {eta}\n"
+    )
+
+
+def crawl_main(argv: list[str]) -> int:
+    """Run the ``crawl`` subcommand; exit with 1 when some file could not be checked."""
+    from govdocverify.crawl import crawl
+    from govdocverify.processing import PRELOAD_ENV, preload_shared_rules
+
+    args = _create_crawl_parser().parse_args(argv)
+    setup_logging(debug=args.debug)
+    try:
+        doc_type = DocumentType.from_string(args.type).value
+    except DocumentTypeError:
+        logger.error(f"Invalid document type: {args.type}")
+        return 1
+
+    # Forked workers then share the rule data instead of building it each.
+    if args.preload or os.getenv(PRELOAD_ENV, "").lower() in {"1", "true", "yes"}:
+        preload_shared_rules()
+    stats = crawl(
+        args.root,
+        doc_type,
+        manifest_path=args.manifest,
+        patterns=args.pattern,
+        workers=args.workers,
+        progress=_report_crawl,
+    )
+    if args.json:
+        _safe_print(json.dumps(stats.to_dict()))
+    return 1 if stats.failed else 0
+
+
 def main() -> int:  # noqa: C901 - command-line parsing is inherently complex
     """Main entry point for the CLI application."""
+    if len(sys.argv) > 1 and sys.argv[1] == "compare":
+        return compare_main(sys.argv[2:])
+    if len(sys.argv) > 1 and sys.argv[1] == "crawl":
+        return crawl_main(sys.argv[2:])
     try:
         # Handle positional argument usage: script.py <file> <doc_type>
         if (
@@ -394,25 +622,15 @@ def main() -> int:  # noqa: C901 - command-line parsing is inherently complex
         exit_code = 0
         for file_path in files:
             try:
-                result = process_document(
-                    file_path, doc_type, visibility_settings, group_by=args.group_by
+                profile = (
+                    profile_memory(file_path, doc_type) if args.profile_memory else nullcontext()
                 )
-                if args.out:
-                    output_dir = Path(args.output_dir)
-                    output_dir.mkdir(parents=True, exist_ok=True)
-                    base = Path(file_path).stem
-                    for fmt in args.out:
-                        out_path = output_dir / f"{base}.{fmt}"
-                        if fmt == "html":
-                            out_path.write_text(result["rendered"], encoding="utf-8")
-                        elif fmt == "docx":
-                            export.save_results_as_docx(result, str(out_path))
-                        elif fmt == "pdf":
-                            export.save_results_as_pdf(result, str(out_path))
-                if args.json:
-                    _safe_print(json.dumps(result))
-                else:
-                    _safe_print(result["rendered"])
+                with profile:
+                    result = process_document(
+                        file_path, doc_type, visibility_settings, group_by=args.group_by
+                    )
+                    with memory_stage("format"):
+                        _emit_result(result, file_path, args)
                 if result.get("has_errors", False):
                     exit_code = 1
             except Exception as exc:  # pragma: no cover - logging path
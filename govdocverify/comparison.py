@@ -0,0 +1,268 @@
+"""Compare two versions of a document and report what changed in the findings.
+
+The paragraphs of both versions are aligned with a diff over paragraph
+hashes: identical paragraphs anchor the alignment and the runs between them
+are the changed regions. Check modules declaring ``paragraph_local`` are
+run on the whole old version but only on the changed paragraphs of the new
+one; their findings on unchanged paragraphs are carried over. All other
+modules look at the document as a whole and are run on both versions.
+
+Findings are then matched between the versions by category, severity,
+message and position: a finding on an unchanged paragraph matches the same
+finding on its counterpart, one inside a changed region matches the same
+finding anywhere in that region, and one without a line number matches the
+same document-level finding. Unmatched findings of the new version are new,
+unmatched findings of the old version are resolved, and matched ones persist.
+"""
+
+import hashlib
+import logging
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from govdocverify.document_checker import FAADocumentChecker
+from govdocverify.models import DocumentCheckResult, VisibilitySettings
+from govdocverify.processing import document_source
+from govdocverify.utils.document_facets import DocumentFacets
+from govdocverify.utils.notes_index import notes_index_of
+from govdocverify.utils.paragraph_stream import ParagraphRecord, ParagraphStream, stream_window
+
+logger = logging.getLogger(__name__)
+
+Anchor = Optional[Tuple[str, int]]
+
+
+def paragraph_hash(text: str) -> bytes:
+    """Return the digest identifying a paragraph's text."""
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+class ParagraphAlignment:
+    """Paragraph correspondence between an old and a new version.
+
+    Paragraphs are 0-based here. Every paragraph gets an anchor: equal
+    paragraphs share ``("=", old_index)``, and the paragraphs of a changed
+    region share ``("~", region)``; paragraphs only deleted or only inserted
+    get ``("-", region)`` or ``("+", region)``.
+    """
+
+    def __init__(self, old_hashes: Sequence[bytes], new_hashes: Sequence[bytes]) -> None:
+        self.old_count = len(old_hashes)
+        self.new_count = len(new_hashes)
+        self.old_anchors: List[Tuple[str, int]] = [("-", -1)] * self.old_count
+        self.new_anchors: List[Tuple[str, int]] = [("+", -1)] * self.new_count
+        self.new_to_old: Dict[int, int] = {}
+        matcher = SequenceMatcher(None, old_hashes, new_hashes, autojunk=False)
+        for region, (tag, i1, i2, j1, j2) in enumerate(matcher.get_opcodes()):
+            if tag == "equal":
+                for offset in range(i2 - i1):
+                    self.old_anchors[i1 + offset] = ("=", i1 + offset)
+                    self.new_anchors[j1 + offset] = ("=", i1 + offset)
+                    self.new_to_old[j1 + offset] = i1 + offset
+                continue
+            mark = {"replace": "~", "delete": "-", "insert": "+"}[tag]
+            self.old_anchors[i1:i2] = [(mark, region)] * (i2 - i1)
+            self.new_anchors[j1:j2] = [(mark, region)] * (j2 - j1)
+
+    @classmethod
+    def from_texts(cls, old: Iterable[str], new: Iterable[str]) -> "ParagraphAlignment":
+        return cls([paragraph_hash(t) for t in old], [paragraph_hash(t) for t in new])
+
+    @property
+    def changed(self) -> frozenset:
+        """0-based indexes of the new paragraphs without an identical counterpart."""
+        return frozenset(range(self.new_count)) - frozenset(self.new_to_old)
+
+    def old_line(self, new_line: int) -> Optional[int]:
+        """Return the old 1-based line of an unchanged new line, else ``None``."""
+        old = self.new_to_old.get(new_line - 1)
+        return None if old is None else old + 1
+
+    def anchor(self, line: Any, old: bool) -> Anchor:
+        anchors = self.old_anchors if old else self.new_anchors
+        if isinstance(line, int) and not isinstance(line, bool) and 1 <= line <= len(anchors):
+            return anchors[line - 1]
+        return None
+
+
+class ChangedParagraphStream(ParagraphStream):
+    """Paragraph stream yielding only the paragraphs at ``indexes``.
+
+    Windows never span a gap, so each window's first record gives the line
+    number of all of its records. Notes are yielded when the paragraph
+    referencing them is.
+    """
+
+    def __init__(
+        self, source: Any, indexes: Iterable[int], notes: Optional[Callable[[], Any]] = None
+    ) -> None:
+        super().__init__(source, notes=notes)
+        self.indexes = frozenset(indexes)
+
+    def __iter__(self) -> Iterator[ParagraphRecord]:
+        return (record for record in super().__iter__() if record.index in self.indexes)
+
+    def note_windows(self) -> Iterator[Tuple[int, List[str]]]:
+        return ((line, texts) for line, texts in super().note_windows() if line - 1 in self.indexes)
+
+    def windows(self, size: Optional[int] = None) -> Iterator[List[ParagraphRecord]]:
+        size = size or stream_window()
+        window: List[ParagraphRecord] = []
+        for record in self:
+            if window and (len(window) == size or record.index != window[-1].index + 1):
+                yield window
+                window = []
+            window.append(record)
+        if window:
+            yield window
+
+
+@dataclass
+class DocumentComparison:
+    """Findings of a new version relative to an old one."""
+
+    new_issues: List[Dict[str, Any]] = field(default_factory=list)
+    resolved_issues: List[Dict[str, Any]] = field(default_factory=list)
+    persisting_issues: List[Dict[str, Any]] = field(default_factory=list)
+    paragraphs: Dict[str, int] = field(default_factory=dict)
+    partial_failures: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def has_new_issues(self) -> bool:
+        return bool(self.new_issues)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "new": self.new_issues,
+            "resolved": self.resolved_issues,
+            "persisting": self.persisting_issues,
+            "summary": {
+                "new": len(self.new_issues),
+                "resolved": len(self.resolved_issues),
+                "persisting": len(self.persisting_issues),
+            },
+            "paragraphs": self.paragraphs,
+            "partial_failures": self.partial_failures,
+        }
+
+
+def _issue_key(issue: Dict[str, Any], anchor: Anchor) -> Hashable:
+    message = str(issue.get("message", issue.get("error", "")))
+    line = issue.get("line_number")
+    if anchor is not None:
+        # Messages naming their own line would never match after a move.
+        message = re.sub(rf"\bline {line}\b", "line", message)
+    return (issue.get("category"), issue.get("severity"), message, anchor)
+
+
+def classify_issues(
+    old_issues: Sequence[Dict[str, Any]],
+    new_issues: Sequence[Dict[str, Any]],
+    alignment: ParagraphAlignment,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Split findings into ``(new, resolved, persisting)`` lists."""
+    old_keys = [_issue_key(i, alignment.anchor(i.get("line_number"), old=True)) for i in old_issues]
+    available = Counter(old_keys)
+    new, persisting = [], []
+    for issue in new_issues:
+        key = _issue_key(issue, alignment.anchor(issue.get("line_number"), old=False))
+        if available[key]:
+            available[key] -= 1
+            persisting.append(issue)
+        else:
+            new.append(issue)
+    resolved = []
+    for issue, key in zip(old_issues, old_keys):
+        if available[key]:
+            available[key] -= 1
+            resolved.append(issue)
+    return new, resolved, persisting
+
+
+def _paragraph_texts(source: Any) -> List[str]:
+    return [record.text for record in ParagraphStream(source)]
+
+
+def _carry_over(
+    old_issues: Iterable[Dict[str, Any]], alignment: ParagraphAlignment
+) -> List[Dict[str, Any]]:
+    """Return the old findings on unchanged paragraphs, renumbered for the new version."""
+    old_to_new = {old: new for new, old in alignment.new_to_old.items()}
+    carried = []
+    for issue in old_issues:
+        anchor = alignment.anchor(issue.get("line_number"), old=True)
+        if anchor is not None and anchor[0] == "=":
+            carried.append({**issue, "line_number": old_to_new[anchor[1]] + 1})
+    return carried
+
+
+def compare_documents(
+    old_path: str,
+    new_path: str,
+    doc_type: str,
+    visibility_settings: Optional[VisibilitySettings] = None,
+    checker: Optional[FAADocumentChecker] = None,
+) -> DocumentComparison:
+    """Check the new version of a document against its old version.
+
+    Categories hidden by ``visibility_settings`` are not executed.
+    """
+    checker = checker or FAADocumentChecker()
+    old_source, new_source = document_source(old_path), document_source(new_path)
+    alignment = ParagraphAlignment.from_texts(
+        _paragraph_texts(old_source), _paragraph_texts(new_source)
+    )
+    changed = alignment.changed
+    logger.info(
+        f"Comparing {alignment.old_count} old with {alignment.new_count} new paragraphs; "
+        f"{len(changed)} changed"
+    )
+
+    modules = checker.enabled_check_modules(visibility_settings)
+    local = [m for m in modules if getattr(m[0], "paragraph_local", False)]
+    whole = [m for m in modules if m not in local]
+
+    def run(source: Any, check_modules: list) -> DocumentCheckResult:
+        if not check_modules:
+            return DocumentCheckResult()
+        return checker.run_all_document_checks(
+            source, doc_type, visibility_settings, check_modules=check_modules
+        )
+
+    changed_view = DocumentFacets(new_source)
+    changed_view.provide(
+        "paragraph_stream",
+        ChangedParagraphStream(new_source, changed, notes=lambda: notes_index_of(changed_view)),
+    )
+    old_local = run(old_source, local)
+    runs = [run(old_source, whole), old_local, run(new_source, whole), run(changed_view, local)]
+
+    old_issues = runs[0].issues + old_local.issues
+    new_issues = runs[2].issues + runs[3].issues + _carry_over(old_local.issues, alignment)
+    new, resolved, persisting = classify_issues(old_issues, new_issues, alignment)
+    return DocumentComparison(
+        new_issues=new,
+        resolved_issues=resolved,
+        persisting_issues=persisting,
+        paragraphs={
+            "old": alignment.old_count,
+            "new": alignment.new_count,
+            "unchanged": len(alignment.new_to_old),
+            "changed": len(changed),
+        },
+        partial_failures=[failure for result in runs for failure in result.partial_failures],
+    )
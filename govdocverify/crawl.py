@@ -0,0 +1,504 @@
+"""Check a directory tree of documents, resumably.
+
+:func:`crawl` records every checked file in a SQLite manifest: its path,
+size, modification time, content hash, document type, the rule set version
+and checker fingerprint it was checked with and the id of its stored result
+(the same :func:`~govdocverify.utils.fingerprint.result_id` the API reports).
+A later crawl of the same tree skips files whose size and modification time
+(or, failing that, content hash) are unchanged, so an interrupted crawl
+resumes where it stopped. Files are checked in a process pool; the manifest is committed
+every few seconds and progress reports give the throughput and ETA.
+
+When the rule set changed since a file was checked, the file is only checked
+again if the new rules could change its result. The manifest keeps a
+snapshot of every rule set it has seen. Changes confined to the word-level
+rules (term replacements, forbidden terms, variants and the valid word list)
+affect only documents containing a changed word, which is tested against a
+small Bloom filter of each document's words stored with its entry. Any other
+rule change re-checks every file, as does a change of the checker itself
+(see :func:`~govdocverify.utils.fingerprint.checker_fingerprint`): another
+govdocverify version, installed or disabled plugins, or an edited redirect
+table.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import time
+import zlib
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set
+
+from govdocverify.utils.fingerprint import checker_fingerprint, result_id
+from govdocverify.utils.ruleset import RuleSet, get_ruleset
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MANIFEST = "govdocverify-crawl.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    doc_type TEXT NOT NULL,
+    ruleset_version TEXT,
+    result_id TEXT,
+    has_errors INTEGER,
+    error TEXT,
+    words BLOB,
+    checked_at REAL NOT NULL,
+    checker TEXT
+);
+CREATE TABLE IF NOT EXISTS results (result_id TEXT PRIMARY KEY, payload BLOB NOT NULL);
+CREATE TABLE IF NOT EXISTS rulesets (version TEXT PRIMARY KEY, snapshot BLOB NOT NULL);
+"""
+
+# Word-level rule tables: a change to one of their entries only matters to
+# documents containing the words of that entry.
+_WORD_RULES = (
+    "term_replacements",
+    "forbidden_terms",
+    "terminology_variants",
+    "multiple_accepted_forms",
+)
+_WORD = re.compile(r"[^\W_]+")
+_FILTER_BITS = 8 * 2048
+_FILTER_HASHES = 3
+_COMMIT_INTERVAL = 5.0
+
+
+def _words(text: str) -> Set[str]:
+    return set(_WORD.findall(text.lower()))
+
+
+def _filter_positions(word: str) -> Iterator[int]:
+    digest = hashlib.blake2b(word.encode("utf-8"), digest_size=4 * _FILTER_HASHES).digest()
+    for index in range(_FILTER_HASHES):
+        yield int.from_bytes(digest[4 * index : 4 * index + 4], "little") % _FILTER_BITS
+
+
+def word_filter(words: Iterable[str]) -> bytes:
+    """Return a Bloom filter of the lowercased ``words``."""
+    bits = bytearray(_FILTER_BITS // 8)
+    for word in words:
+        for position in _filter_positions(word):
+            bits[position >> 3] |= 1 << (position & 7)
+    return bytes(bits)
+
+
+def might_contain(bloom: Optional[bytes], words: Iterable[str]) -> bool:
+    """Return ``False`` only if the document behind ``bloom`` lacks one of ``words``."""
+    if not bloom:
+        return True
+    return all(
+        bloom[position >> 3] & (1 << (position & 7))
+        for word in words
+        for position in _filter_positions(word)
+    )
+
+
+def _pattern_state(value: Any) -> Any:
+    if isinstance(value, re.Pattern):
+        return [value.pattern, value.flags]
+    raise TypeError(f"Cannot snapshot {type(value).__name__}")
+
+
+def ruleset_snapshot(ruleset: RuleSet) -> Dict[str, Any]:
+    """Return the parts of ``ruleset`` :class:`RuleChange` compares.
+
+    The word-level rules are kept as data; everything else is reduced to a
+    digest, since any change there re-checks every document anyway.
+    """
+    others = {
+        "terminology": ruleset.terminology,
+        "acronym_ignore_patterns": ruleset.acronym_ignore_patterns,
+        "required_language": ruleset.required_language,
+        "phone_patterns": ruleset.phone_patterns,
+        "placeholder_patterns": ruleset.placeholder_patterns,
+        "date_incorrect": ruleset.date_incorrect,
+        "date_skip_patterns": ruleset.date_skip_patterns,
+        "boilerplate_paragraphs": ruleset.boilerplate_paragraphs,
+        "deprecated_urls": ruleset.deprecated_urls,
+    }
+    encoded = json.dumps(others, sort_keys=True, default=_pattern_state).encode()
+    snapshot = {
+        "others": hashlib.sha256(encoded).hexdigest(),
+        "word_rules": {name: getattr(ruleset, name) for name in _WORD_RULES},
+        "valid_words": sorted(ruleset.valid_words),
+    }
+    # Round trip so a fresh snapshot compares equal to a stored one.
+    return json.loads(json.dumps(snapshot))
+
+
+class RuleChange:
+    """What changed between two rule set snapshots.
+
+    ``words`` lists, per changed word-level rule, the words a document must
+    contain for the change to matter; ``everything`` is set when a change
+    may matter to any document.
+    """
+
+    def __init__(self, old: Optional[Dict[str, Any]], new: Dict[str, Any]) -> None:
+        self.words: List[Set[str]] = []
+        self.everything = old is None or old["others"] != new["others"]
+        if self.everything:
+            return
+        for name in _WORD_RULES:
+            before, after = old["word_rules"].get(name, {}), new["word_rules"].get(name, {})
+            for key in set(before) | set(after):
+                if before.get(key) != after.get(key):
+                    self._add_entry(key, before.get(key), after.get(key))
+        for word in set(old["valid_words"]).symmetric_difference(new["valid_words"]):
+            self._add(word)
+
+    def _add_entry(self, key: str, *values: Any) -> None:
+        self._add(key)
+        for value in values:
+            # Variant lists hold text the checks search for; strings are messages.
+            if isinstance(value, list):
+                for variant in value:
+                    self._add(variant)
+
+    def _add(self, text: str) -> None:
+        words = _words(text)
+        if not words:
+            self.everything = True
+        self.words.append(words)
+
+    def affects(self, bloom: Optional[bytes]) -> bool:
+        """Return whether the change could alter the result of the document behind ``bloom``."""
+        return self.everything or any(might_contain(bloom, words) for words in self.words)
+
+
+def content_hash(path: str) -> str:
+    """Return the SHA-256 hex digest of the file at ``path``."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class CrawlManifest:
+    """SQLite record of the files a crawl has checked."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._db = sqlite3.connect(path)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+        columns = {row["name"] for row in self._db.execute("PRAGMA table_info(documents)")}
+        if "checker" not in columns:  # manifest written before checker fingerprints
+            self._db.execute("ALTER TABLE documents ADD COLUMN checker TEXT")
+        self._snapshots: Dict[str, Optional[Dict[str, Any]]] = {}
+
+    def entry(self, path: str) -> Optional[sqlite3.Row]:
+        return self._db.execute("SELECT * FROM documents WHERE path = ?", (path,)).fetchone()
+
+    def result(self, rid: str) -> Optional[Dict[str, Any]]:
+        """Return the stored result payload with id ``rid``."""
+        row = self._db.execute("SELECT payload FROM results WHERE result_id = ?", (rid,)).fetchone()
+        return None if row is None else json.loads(zlib.decompress(row["payload"]))
+
+    def snapshot(self, version: str) -> Optional[Dict[str, Any]]:
+        """Return the snapshot of rule set ``version``, if it was recorded."""
+        if version not in self._snapshots:
+            row = self._db.execute(
+                "SELECT snapshot FROM rulesets WHERE version = ?", (version,)
+            ).fetchone()
+            self._snapshots[version] = (
+                None if row is None else json.loads(zlib.decompress(row["snapshot"]))
+            )
+        return self._snapshots[version]
+
+    def record_ruleset(self, ruleset: RuleSet) -> Dict[str, Any]:
+        """Store the snapshot of ``ruleset`` and return it."""
+        snapshot = self.snapshot(ruleset.version)
+        if snapshot is None:
+            snapshot = ruleset_snapshot(ruleset)
+            self._db.execute(
+                "INSERT OR REPLACE INTO rulesets VALUES (?, ?)",
+                (ruleset.version, zlib.compress(json.dumps(snapshot).encode())),
+            )
+            self._snapshots[ruleset.version] = snapshot
+        return snapshot
+
+    def record(self, item: "CrawlItem", outcome: Dict[str, Any]) -> None:
+        """Store the outcome of checking ``item``."""
+        rid = outcome.get("result_id")
+        if rid is not None:
+            self._db.execute(
+                "INSERT OR IGNORE INTO results VALUES (?, ?)",
+                (rid, zlib.compress(outcome["payload"].encode())),
+            )
+        self._db.execute(
+            "INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                item.path,
+                item.size,
+                item.mtime_ns,
+                outcome.get("content_hash") or item.content_hash or "",
+                item.doc_type,
+                outcome.get("ruleset_version"),
+                rid,
+                None if rid is None else int(outcome["has_errors"]),
+                outcome.get("error"),
+                outcome.get("words"),
+                time.time(),
+                outcome.get("checker"),
+            ),
+        )
+
+    def touch(self, item: "CrawlItem") -> None:
+        """Record the new size and modification time of an unchanged file."""
+        self._db.execute(
+            "UPDATE documents SET size = ?, mtime_ns = ? WHERE path = ?",
+            (item.size, item.mtime_ns, item.path),
+        )
+
+    def summary(self) -> Dict[str, int]:
+        row = self._db.execute(
+            "SELECT COUNT(*) AS documents, COALESCE(SUM(has_errors), 0) AS with_errors, "
+            "COALESCE(SUM(error IS NOT NULL), 0) AS failed FROM documents"
+        ).fetchone()
+        return dict(row)
+
+    def commit(self) -> None:
+        self._db.commit()
+
+    def close(self) -> None:
+        self._db.commit()
+        self._db.close()
+
+
+@dataclass
+class CrawlItem:
+    """A file found by the crawl, with its manifest entry."""
+
+    path: str
+    size: int
+    mtime_ns: int
+    doc_type: str
+    content_hash: Optional[str] = None
+
+
+@dataclass
+class CrawlStats:
+    """Progress of a crawl; ``eta`` is in seconds."""
+
+    found: int = 0
+    skipped: int = 0
+    queued: int = 0
+    checked: int = 0
+    failed: int = 0
+    started: float = field(default_factory=time.monotonic)
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    @property
+    def throughput(self) -> float:
+        """Files checked per second."""
+        done = self.checked + self.failed
+        return done / self.elapsed if done and self.elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> Optional[float]:
+        remaining = self.queued - self.checked - self.failed
+        return remaining / self.throughput if self.throughput else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "found": self.found,
+            "skipped": self.skipped,
+            "queued": self.queued,
+            "checked": self.checked,
+            "failed": self.failed,
+            "elapsed": round(self.elapsed, 3),
+            "throughput": round(self.throughput, 3),
+            "eta": None if self.eta is None else round(self.eta, 1),
+        }
+
+
+def iter_documents(root: str, patterns: Sequence[str]) -> Iterator[str]:
+    """Yield the files below ``root`` whose names match one of ``patterns``, sorted."""
+    for directory, dirs, files in os.walk(root):
+        dirs.sort()
+        for name in sorted(files):
+            if any(fnmatch.fnmatch(name, pattern) for pattern in patterns):
+                yield os.path.join(directory, name)
+
+
+def check_file(path: str, doc_type: str) -> Dict[str, Any]:
+    """Check one file in a worker process and return its manifest outcome."""
+    from govdocverify.cli import process_document
+    from govdocverify.processing import document_source
+    from govdocverify.utils.document_facets import DocumentFacets
+
+    outcome: Dict[str, Any] = {
+        "ruleset_version": get_ruleset().version,
+        "checker": checker_fingerprint(),
+    }
+    try:
+        outcome["content_hash"] = content_hash(path)
+        payload = dict(process_document(path, doc_type))
+        # The filter covers the text the checks read: the body paragraphs
+        # and the footnotes and endnotes.
+        stream = DocumentFacets(document_source(path)).get("paragraph_stream")
+        words: Set[str] = set()
+        for record in stream:
+            words.update(_words(record.text))
+        for _, texts in stream.note_windows():
+            for text in texts:
+                words.update(_words(text))
+    except Exception as exc:
+        logger.error(f"Failed to check {path}: {exc}")
+        outcome["error"] = str(exc) or type(exc).__name__
+        return outcome
+    outcome["payload"] = json.dumps(payload, sort_keys=True, default=str)
+    outcome["result_id"] = result_id(payload, doc_type)
+    outcome["has_errors"] = bool(payload.get("has_errors"))
+    outcome["words"] = word_filter(words)
+    return outcome
+
+
+class _Planner:
+    """Decide which found files need checking."""
+
+    def __init__(self, manifest: CrawlManifest, ruleset: RuleSet) -> None:
+        self.manifest = manifest
+        self.version = ruleset.version
+        self.checker = checker_fingerprint()
+        self.snapshot = manifest.record_ruleset(ruleset)
+        self._changes: Dict[str, RuleChange] = {}
+
+    def _change(self, version: Optional[str]) -> RuleChange:
+        key = version or ""
+        if key not in self._changes:
+            old = self.manifest.snapshot(version) if version else None
+            self._changes[key] = RuleChange(old, self.snapshot)
+        return self._changes[key]
+
+    def needs_check(self, item: CrawlItem) -> bool:
+        entry = self.manifest.entry(item.path)
+        if entry is None or entry["error"] is not None or entry["doc_type"] != item.doc_type:
+            return True
+        if (entry["size"], entry["mtime_ns"]) != (item.size, item.mtime_ns):
+            item.content_hash = content_hash(item.path)
+            if item.content_hash != entry["content_hash"]:
+                return True
+            self.manifest.touch(item)
+        if entry["checker"] != self.checker:
+            return True  # other code, plugins or redirects: like RuleChange.everything
+        if entry["ruleset_version"] == self.version:
+            return False
+        return self._change(entry["ruleset_version"]).affects(entry["words"])
+
+
+def _plan(
+    root: str, doc_type: str, patterns: Sequence[str], planner: _Planner, stats: CrawlStats
+) -> List[CrawlItem]:
+    pending = []
+    for path in iter_documents(root, patterns):
+        try:
+            stat = os.stat(path)
+        except OSError as exc:
+            logger.warning(f"Skipping {path}: {exc}")
+            continue
+        stats.found += 1
+        item = CrawlItem(os.path.abspath(path), stat.st_size, stat.st_mtime_ns, doc_type)
+        if planner.needs_check(item):
+            pending.append(item)
+        else:
+            stats.skipped += 1
+    stats.queued = len(pending)
+    return pending
+
+
+def crawl(
+    root: str,
+    doc_type: str,
+    manifest_path: str = DEFAULT_MANIFEST,
+    patterns: Sequence[str] = ("*.docx",),
+    workers: Optional[int] = None,
+    progress: Optional[Callable[[CrawlStats], None]] = None,
+    progress_interval: float = 2.0,
+) -> CrawlStats:
+    """Check the documents below ``root`` that changed since the last crawl.
+
+    ``progress`` is called with the running :class:`CrawlStats` at most every
+    ``progress_interval`` seconds and once at the end.
+    """
+    manifest = CrawlManifest(manifest_path)
+    stats = CrawlStats()
+    try:
+        pending = _plan(root, doc_type, patterns, _Planner(manifest, get_ruleset()), stats)
+        manifest.commit()
+        logger.info(f"Crawl of {root}: {stats.found} files, {stats.queued} to check")
+        if pending:
+            _run_pool(pending, manifest, stats, workers, progress, progress_interval)
+    finally:
+        manifest.close()
+    if progress is not None:
+        progress(stats)
+    return stats
+
+
+def _run_pool(
+    pending: List[CrawlItem],
+    manifest: CrawlManifest,
+    stats: CrawlStats,
+    workers: Optional[int],
+    progress: Optional[Callable[[CrawlStats], None]],
+    progress_interval: float,
+) -> None:
+    """Check ``pending`` in a process pool, recording each outcome as it arrives."""
+    workers = workers or os.cpu_count() or 1
+    queue = iter(pending)
+    running: Dict[Future, CrawlItem] = {}
+    last_commit = last_report = time.monotonic()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+
+        def submit() -> None:
+            item = next(queue, None)
+            if item is not None:
+                running[pool.submit(check_file, item.path, item.doc_type)] = item
+
+        # A bounded number of files in flight keeps memory flat on huge trees.
+        for _ in range(4 * workers):
+            submit()
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                outcome = _outcome(future)
+                manifest.record(running.pop(future), outcome)
+                if "error" in outcome:
+                    stats.failed += 1
+                else:
+                    stats.checked += 1
+                submit()
+            now = time.monotonic()
+            if now - last_commit >= _COMMIT_INTERVAL:
+                manifest.commit()
+                last_commit = now
+            if progress is not None and now - last_report >= progress_interval:
+                progress(stats)
+                last_report = now
+
+
+def _outcome(future: Future) -> Dict[str, Any]:
+    try:
+        return future.result()
+    except Exception as exc:  # the worker died, e.g. killed for its memory use
+        return {"error": str(exc) or type(exc).__name__}
@@ -1,13 +1,12 @@
 import logging
-from functools import lru_cache
-from types import SimpleNamespace
-from typing import Any, cast
+from typing import Any, Optional, cast
 
-from docx import Document
+from docx import Document  # noqa: F401 - kept importable for callers patching it
 
 from govdocverify.checks.accessibility_checks import AccessibilityChecks
 from govdocverify.checks.acronym_checks import AcronymChecker
 from govdocverify.checks.check_registry import CheckRegistry
+from govdocverify.checks.check_scheduler import plan_checks
 from govdocverify.checks.format_checks import FormatChecks
 from govdocverify.checks.heading_checks import HeadingChecks
 from govdocverify.checks.readability_checks import ReadabilityChecks
@@ -17,20 +16,21 @@ from govdocverify.checks.reference_checks import (
 )
 from govdocverify.checks.structure_checks import StructureChecks
 from govdocverify.checks.terminology_checks import TerminologyChecks
-from govdocverify.models import DocumentCheckResult, Severity
+from govdocverify.models import DocumentCheckResult, Severity, VisibilitySettings
+from govdocverify.plugins.loader import get_plugin_manager
+from govdocverify.utils.deadlines import CheckTimeout, Deadline, TimeBudgets, deadline_scope
+from govdocverify.utils.document_facets import DocumentFacets
+from govdocverify.utils.memory_profile import active_memory_profile, memory_stage
 from govdocverify.utils.pattern_cache import PatternCache
+from govdocverify.utils.result_index import ResultIndex
+from govdocverify.utils.ruleset import refresh_ruleset
 from govdocverify.utils.terminology_utils import TerminologyManager
+from govdocverify.utils.text_source import TextFile
+from govdocverify.utils.tracing import set_span_attributes, trace_span
 
 from .utils.check_discovery import validate_check_registration
 from .utils.security import SecurityError, validate_source
 
-
-@lru_cache(maxsize=8)
-def _load_docx_cached(path: str) -> Document:
-    """Return a cached ``Document`` instance for the given path."""
-    return Document(path)
-
-
 logger = logging.getLogger(__name__)
 
 
@@ -41,6 +41,9 @@ class FAADocumentChecker:
         """Initialize the GovDocVerify checker with all check modules."""
         logger.debug("Initializing FAADocumentChecker")
 
+        # Time budgets for check runs; ``None`` reads them from the environment
+        self.time_budgets: Optional[TimeBudgets] = None
+
         # Initialize pattern cache for heading checks
         self.pattern_cache = PatternCache()
         logger.debug(f"PatternCache initialized: {self.pattern_cache}")
@@ -79,6 +82,9 @@ class FAADocumentChecker:
         self.document_title_checks = DocumentTitleFormatCheck()
         logger.debug(f"DocumentTitleFormatCheck initialized: {self.document_title_checks}")
 
+        # Entry point plugins, imported when their category is first requested
+        self.plugins = get_plugin_manager()
+
         # Validate check registration
         validation_results = validate_check_registration()
         if validation_results["missing_categories"] or validation_results["missing_checks"]:
@@ -92,12 +98,33 @@ class FAADocumentChecker:
         logger.debug("FAADocumentChecker initialized successfully")
 
     def run_all_document_checks(
-        self, document_path: str, doc_type: str = None
+        self,
+        document_path: str,
+        doc_type: str = None,
+        visibility_settings: Optional[VisibilitySettings] = None,
+        check_modules: Optional[list] = None,
     ) -> DocumentCheckResult:
-        """Run all document checks."""
+        """Run all document checks.
+
+        When ``visibility_settings`` is given, only the categories it makes
+        visible are executed; hidden categories are absent from the results.
+        ``check_modules`` runs the given ``(module, category)`` pairs instead
+        of the enabled ones (see :meth:`enabled_check_modules`).
+        Categories that exceed their time budget are reported in
+        ``partial_failures`` together with the issues found before the cut-off.
+        ``document_path`` may also be a raw string, a list of lines, a
+        :class:`~govdocverify.utils.text_source.TextFile` or a prepared
+        :class:`~govdocverify.utils.document_facets.DocumentFacets` view.
+        """
         try:
-            # Validate source before any processing
-            validate_source(document_path)
+            deadline = Deadline(self._time_budgets().document, "document")
+            # Validate source before any processing; text files were opened
+            # by the caller and are not a path or URL to vet.
+            source = getattr(document_path, "source", document_path)
+            if not isinstance(source, TextFile):
+                validate_source(source)
+            # Pick up edited rule files without restarting long-lived workers.
+            refresh_ruleset()
 
             combined_results = DocumentCheckResult()
             per_check_results = {}
@@ -106,15 +133,25 @@ class FAADocumentChecker:
             doc = self._load_document(document_path)
 
             # Define all check modules with their names for logging
-            check_modules = self._get_check_modules()
+            if check_modules is None:
+                check_modules = self.enabled_check_modules(visibility_settings)
 
             # Run all checks
-            self._run_checks(check_modules, doc, doc_type, combined_results, per_check_results)
+            with trace_span("run_checks", doc_type=doc_type):
+                self._run_checks(
+                    check_modules, doc, doc_type, combined_results, per_check_results, deadline
+                )
+                set_span_attributes(
+                    paragraph_count=self._paragraph_count(doc),
+                    issue_count=len(combined_results.issues),
+                )
 
             # Ensure per_check_results is populated with all issues
-            self._populate_check_results(combined_results, per_check_results)
+            with memory_stage("aggregate"), trace_span("aggregate"):
+                index = self._populate_check_results(combined_results, per_check_results)
 
             combined_results.per_check_results = per_check_results
+            combined_results.result_index = index
             combined_results.success = (
                 len(combined_results.issues) == 0 and not combined_results.partial_failures
             )
@@ -131,31 +168,35 @@ class FAADocumentChecker:
                 success=False, issues=[{"error": f"Error running document checks: {str(e)}"}]
             )
 
-    def _load_document(self, document_path: str) -> SimpleNamespace:
-        """Load document from path or create a lightweight representation."""
-        if isinstance(document_path, str) and (
-            document_path.lower().endswith(".docx") or document_path.lower().endswith(".doc")
-        ):
-            doc_obj = _load_docx_cached(document_path)
-            paragraphs = list(doc_obj.paragraphs)
-            text = "\n".join(p.text for p in paragraphs)
-            logger.debug(
-                "Loaded document from file: %s, extracted text length: %d",
-                document_path,
-                len(text),
-            )
-            return SimpleNamespace(paragraphs=paragraphs, text=text)
-
-        if isinstance(document_path, list):
-            lines = document_path
-            logger.debug(f"Creating document from list of strings, count: {len(document_path)}")
-        else:
-            lines = str(document_path).splitlines()
-            logger.debug(f"Creating document from raw string, line count: {len(lines)}")
-
-        paragraphs = [SimpleNamespace(text=line) for line in lines]
-        text = "\n".join(lines)
-        return SimpleNamespace(paragraphs=paragraphs, text=text)
+    def _load_document(self, document_path: str) -> DocumentFacets:
+        """Return a lazy facet view of a DOCX path, raw string or list of lines.
+
+        Nothing is parsed here; the scheduler builds the facets the enabled
+        checks declared. A view passed in is used as is.
+        """
+        if isinstance(document_path, DocumentFacets):
+            return document_path
+        return DocumentFacets(document_path)
+
+    @staticmethod
+    def _paragraph_count(doc: DocumentFacets) -> Optional[int]:
+        """Return the paragraph count if a check already built the paragraphs."""
+        for name in ("paragraph_table", "paragraphs"):
+            built = doc.peek(name)
+            if built is not None:
+                return len(built)
+        return None
+
+    def _time_budgets(self) -> TimeBudgets:
+        """Return the configured time budgets, falling back to the environment."""
+        return self.time_budgets or TimeBudgets.from_env()
+
+    def enabled_check_modules(self, visibility_settings=None):
+        """Return the built-in and plugin ``(module, category)`` pairs to run."""
+        return self._select_check_modules(
+            self._get_check_modules() + self._get_plugin_modules(visibility_settings),
+            visibility_settings,
+        )
 
     def _get_check_modules(self):
         """Get all check modules with their category names."""
@@ -171,12 +212,71 @@ class FAADocumentChecker:
             (self.document_title_checks, "formatting"),
         ]
 
-    def _run_checks(self, check_modules, doc, doc_type, combined_results, per_check_results):
-        """Run all check modules and collect results."""
-        for check_module, category in check_modules:
+    def _get_plugin_modules(self, visibility_settings=None):
+        """Get plugin check modules for the visible plugin categories.
+
+        Only plugins serving one of those categories are imported.
+        """
+        categories = [
+            category
+            for category in self.plugins.categories()
+            if visibility_settings is None or visibility_settings.is_category_visible(category)
+        ]
+        return self.plugins.check_modules(categories) if categories else []
+
+    @staticmethod
+    def _select_check_modules(check_modules, visibility_settings=None):
+        """Drop check modules whose category is hidden by ``visibility_settings``."""
+        if visibility_settings is None:
+            return check_modules
+        selected = [m for m in check_modules if visibility_settings.is_category_visible(m[1])]
+        skipped = sorted({c for _, c in check_modules} - {c for _, c in selected})
+        if skipped:
+            logger.info(f"Skipping hidden categories: {', '.join(skipped)}")
+        return selected
+
+    def _run_checks(
+        self, check_modules, doc, doc_type, combined_results, per_check_results, deadline=None
+    ):
+        """Run all check modules and collect results.
+
+        Modules are planned along the facets their categories declared in
+        :class:`CheckRegistry`; results are merged in ``check_modules`` order.
+        Each category runs under its own time budget nested in ``deadline``.
+        While a memory profile is recorded, the facets are built up front and
+        the categories run one at a time, each as its own stage.
+        """
+        plan = plan_checks(check_modules)
+        budgets = self._time_budgets()
+        if deadline is None:
+            deadline = Deadline(budgets.document, "document")
+        workers = self._load_for_memory_profile(plan, doc)
+
+        def execute(check, scope):
+            scope.check()
+            logger.info(f"Running {check.category} checks...")
+            with (
+                memory_stage(f"category:{check.category}"),
+                trace_span(f"check.{check.category}", category=check.category),
+                deadline_scope(scope),
+            ):
+                result = check.module.check_document(doc, doc_type)
+                set_span_attributes(issue_count=len(getattr(result, "issues", None) or ()))
+                return result
+
+        outcomes = plan.run(doc, execute, workers=workers, deadline=deadline, budgets=budgets)
+        for outcome in outcomes:
+            category = outcome.check.category
+            if isinstance(outcome.error, CheckTimeout):
+                self._handle_timeout(outcome.error, category, per_check_results, combined_results)
+                continue
+            if outcome.error is not None:
+                self._handle_check_error(
+                    outcome.error, category, per_check_results, combined_results
+                )
+                continue
+            result = outcome.result
             try:
-                logger.info(f"Running {category} checks...")
-                result = check_module.check_document(doc, doc_type)
                 self._process_check_result(result, category, per_check_results)
 
                 # Collect issues from the result
@@ -188,6 +288,21 @@ class FAADocumentChecker:
             except Exception as e:
                 self._handle_check_error(e, category, per_check_results, combined_results)
 
+    @staticmethod
+    def _load_for_memory_profile(plan, doc) -> Optional[int]:
+        """Build the planned facets as the ``load`` stage of an active memory profile.
+
+        Returns one worker so each category is then measured on its own, or
+        ``None`` (the configured workers) when no profile is recorded.
+        """
+        if active_memory_profile() is None:
+            return None
+        with memory_stage("load"):
+            for level in plan.facet_levels:
+                for name in level:
+                    doc.materialize(name)
+        return 1
+
     def _process_check_result(self, result, category, per_check_results):
         """Process individual check result."""
         per_check_results.setdefault(category, {})
@@ -198,29 +313,56 @@ class FAADocumentChecker:
                 per_check_results[category][check_func] = getattr(result, check_func)
 
     def _handle_check_error(self, error, category, per_check_results, combined_results):
-        """Handle errors that occur during check execution."""
+        """Handle errors that occur during check execution.
+
+        A category fails as a whole, so its error is recorded once, under its
+        first registered check, however many checks the category registers.
+        """
         logger.error(f"Error in {category} checks: {str(error)}")
         per_check_results.setdefault(category, {})
-        for check_func in CheckRegistry.get_checks_for_category(category):
-            dcr = DocumentCheckResult(
+        checks = CheckRegistry.get_checks_for_category(category)
+        if checks:
+            per_check_results[category][checks[0]] = DocumentCheckResult(
                 success=False,
                 issues=[{"error": f"Error in {category} checks: {str(error)}"}],
             )
-            per_check_results[category][check_func] = dcr
         combined_results.partial_failures.append(
             {"error": f"Error in {category} checks: {str(error)}", "category": category}
         )
         combined_results.success = False
 
+    def _handle_timeout(self, timeout, category, per_check_results, combined_results):
+        """Record a timed-out category, keeping the issues found before the cut-off."""
+        logger.warning(f"{category} checks timed out: {timeout}")
+        partial = getattr(timeout.partial, "issues", timeout.partial) or []
+        combined_results.issues.extend(partial)
+        checks = CheckRegistry.get_checks_for_category(category) or ["general"]
+        per_check_results.setdefault(category, {})[checks[0]] = DocumentCheckResult(
+            success=False, issues=list(partial)
+        )
+        combined_results.partial_failures.append(
+            {
+                "error": f"{category} checks timed out: {timeout}",
+                "category": category,
+                "timeout": True,
+                "scope": timeout.scope,
+                "budget": timeout.budget,
+                "partial_issues": len(partial),
+            }
+        )
+        combined_results.success = False
+
     def _populate_check_results(
         self,
         combined_results: DocumentCheckResult,
         per_check_results: dict[str, dict[str, Any]],
-    ) -> None:
-        """Ensure per_check_results is populated with all issues."""
-        if (
-            not per_check_results or not self._has_any_issues(per_check_results)
-        ) and combined_results.issues:
+    ) -> ResultIndex:
+        """Ensure per_check_results is populated with all issues.
+
+        Returns the :class:`ResultIndex` over the final ``per_check_results``.
+        """
+        index = ResultIndex(per_check_results)
+        if not index.has_issues and combined_results.issues:
             # Group issues by category if possible
             grouped = {}
             for issue in combined_results.issues:
@@ -233,16 +375,8 @@ class FAADocumentChecker:
                 grouped[category]["issues"].append(issue)
             # Convert to per_check_results structure
             per_check_results.update({cat: {"general": res} for cat, res in grouped.items()})
-
-    def _has_any_issues(self, per_check_results: dict[str, dict[str, Any]]) -> bool:
-        """Check if any results contain issues."""
-        for cat in per_check_results.values():
-            for check in cat.values():
-                if hasattr(check, "issues") and check.issues:
-                    return True
-                if isinstance(check, dict) and check.get("issues"):
-                    return True
-        return False
+            index = ResultIndex(per_check_results)
+        return index
 
     def check_paragraph_length(
         self,
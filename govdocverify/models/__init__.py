@@ -269,6 +269,10 @@ class DocumentCheckResult:
         return cls.from_dict(json.loads(json_str))
 
 
+# Check categories whose visibility setting uses a different name.
+_VISIBILITY_KEYS = {"heading": "headings"}
+
+
 @dataclass
 class VisibilitySettings:
     """Settings for controlling visibility of different check categories."""
@@ -303,6 +307,20 @@ class VisibilitySettings:
         data["version"] = self.SERIALIZATION_VERSION
         return data
 
+    def is_category_visible(self, category: str) -> bool:
+        """Return ``True`` if results of check ``category`` should be produced.
+
+        With a ``--show-only`` selection (``_show_only_set``) only the listed
+        categories are visible; otherwise a category is visible unless its
+        setting is off. Check categories without a setting, such as
+        ``formatting``, are visible by default.
+        """
+        key = _VISIBILITY_KEYS.get(category, category)
+        show_only = getattr(self, "_show_only_set", None)
+        if show_only:
+            return key in show_only
+        return bool(self.to_dict().get(key, True))
+
     @classmethod
     def from_dict(cls, settings: Dict[str, Any]) -> "VisibilitySettings":
         """Create settings from dictionary format.
@@ -2,9 +2,11 @@
 
 This package exposes the :class:`~govdocverify.plugins.base.Plugin` base
 class used to build extensions that provide additional checks or
-processing hooks.
+processing hooks, and the :class:`~govdocverify.plugins.loader.PluginManager`
+that discovers them through package entry points.
 """
 
 from .base import Plugin
+from .loader import ENTRY_POINT_GROUP, PluginManager, get_plugin_manager
 
-__all__ = ["Plugin"]
+__all__ = ["ENTRY_POINT_GROUP", "Plugin", "PluginManager", "get_plugin_manager"]
@@ -23,11 +23,17 @@ Example::
 
 Plugins may perform any setup they require inside :meth:`register` but
 should avoid side effects at import time.
+
+Plugins that contribute checks return ``(module, category)`` pairs from
+:meth:`check_modules`; each module exposes ``check_document(document,
+doc_type)`` like the built-in check modules and runs alongside them. See
+:mod:`govdocverify.plugins.loader` for discovery through entry points.
 """
 
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import Any, Iterable, Tuple
 
 
 class Plugin(ABC):
@@ -43,3 +49,7 @@ class Plugin(ABC):
     def register(self) -> None:
         """Hook for performing plugin registration."""
         raise NotImplementedError
+
+    def check_modules(self) -> Iterable[Tuple[Any, str]]:
+        """Return the ``(module, category)`` pairs of checks this plugin runs."""
+        return ()
@@ -0,0 +1,283 @@
+"""Discover plugins through package entry points and account for their cost.
+
+Rule packs advertise plugins in the ``govdocverify.plugins`` entry point
+group; the entry point name is the check category the plugin serves::
+
+    [project.entry-points."govdocverify.plugins"]
+    hazmat = "acme_rules.hazmat:HazmatPlugin"
+
+Discovery only reads package metadata. A plugin is imported, instantiated and
+registered the first time one of its categories is requested, so categories
+hidden for a run, and disabled plugins, cost nothing. Plugin check modules are
+wrapped so each run records its wall time and growth of the process's peak
+resident memory; import time and the memory the import retained are recorded
+once. :meth:`PluginManager.stats` reports the figures, and a plugin listed
+(by plugin or distribution name) in ``GOVDOCVERIFY_DISABLED_PLUGINS`` is
+skipped; naming its distribution also avoids importing it.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from importlib.metadata import EntryPoint, entry_points
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .base import Plugin
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "govdocverify.plugins"
+DISABLED_PLUGINS_ENV = "GOVDOCVERIFY_DISABLED_PLUGINS"
+
+
+@dataclass
+class PluginStats:
+    """Cost of one plugin entry point in this process.
+
+    ``name`` is the entry point value until the plugin is loaded, then the
+    plugin's own name. Memory figures are in bytes; ``peak_rss_growth`` is the
+    largest rise of the process's peak resident set seen during one run.
+    """
+
+    name: str
+    category: str
+    distribution: Optional[str]
+    loaded: bool = False
+    disabled: bool = False
+    error: Optional[str] = None
+    import_seconds: Optional[float] = None
+    import_memory: Optional[int] = None
+    runs: int = 0
+    run_seconds: float = 0.0
+    max_run_seconds: float = 0.0
+    peak_rss_growth: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _peak_rss() -> Optional[int]:
+    if resource is None:
+        return None
+    # ``ru_maxrss`` is in kilobytes on Linux.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+@contextmanager
+def _traced_import() -> Iterator[Dict[str, int]]:
+    """Yield a dict receiving the bytes allocated and still held by the block."""
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    usage: Dict[str, int] = {}
+    try:
+        yield usage
+    finally:
+        usage["retained"] = max(0, tracemalloc.get_traced_memory()[0] - before)
+        if started:
+            tracemalloc.stop()
+
+
+class _AccountedModule:
+    """Check module proxy recording each ``check_document`` call in ``stats``."""
+
+    def __init__(self, module: Any, stats: PluginStats, lock: threading.Lock) -> None:
+        self.module = module
+        self.stats = stats
+        self._lock = lock
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.module, name)
+
+    def check_document(self, document: Any, doc_type: Any) -> Any:
+        rss = _peak_rss()
+        start = time.perf_counter()
+        try:
+            return self.module.check_document(document, doc_type)
+        finally:
+            elapsed = time.perf_counter() - start
+            growth = None if rss is None else _peak_rss() - rss
+            with self._lock:
+                stats = self.stats
+                stats.runs += 1
+                stats.run_seconds += elapsed
+                stats.max_run_seconds = max(stats.max_run_seconds, elapsed)
+                if growth is not None:
+                    stats.peak_rss_growth = max(stats.peak_rss_growth or 0, growth)
+            logger.debug(f"Plugin {stats.name} ({stats.category}) ran in {elapsed:.3f}s")
+
+
+def _disabled_from_env() -> Set[str]:
+    value = os.getenv(DISABLED_PLUGINS_ENV, "")
+    return {name.strip() for name in value.split(",") if name.strip()}
+
+
+class PluginManager:
+    """Entry point plugins, loaded per category on first request."""
+
+    def __init__(
+        self,
+        plugin_entry_points: Optional[Iterable[EntryPoint]] = None,
+        disabled: Optional[Iterable[str]] = None,
+    ) -> None:
+        self._entry_points = None if plugin_entry_points is None else list(plugin_entry_points)
+        self._disabled = _disabled_from_env() if disabled is None else set(disabled)
+        self._plugins: Dict[str, Optional[Plugin]] = {}
+        self._stats: Dict[Tuple[str, str], PluginStats] = {}
+        self._lock = threading.Lock()
+
+    def _discover(self) -> List[EntryPoint]:
+        if self._entry_points is None:
+            self._entry_points = list(entry_points(group=ENTRY_POINT_GROUP))
+            logger.debug(f"Discovered {len(self._entry_points)} plugin entry points")
+        return self._entry_points
+
+    def _stats_for(self, entry_point: EntryPoint) -> PluginStats:
+        key = (entry_point.name, entry_point.value)
+        if key not in self._stats:
+            dist = getattr(entry_point, "dist", None)
+            self._stats[key] = PluginStats(
+                name=entry_point.value,
+                category=entry_point.name,
+                distribution=dist.name if dist is not None else None,
+            )
+        return self._stats[key]
+
+    def _is_disabled(self, *names: Optional[str]) -> bool:
+        return any(name in self._disabled for name in names if name)
+
+    def categories(self) -> List[str]:
+        """Categories served by plugins that are not disabled, without importing them."""
+        found: List[str] = []
+        for entry_point in self._discover():
+            stats = self._stats_for(entry_point)
+            if stats.disabled or self._is_disabled(stats.distribution):
+                continue
+            if entry_point.name not in found:
+                found.append(entry_point.name)
+        return found
+
+    def signature(self) -> List[str]:
+        """Describe the discovered entry points and the disabled plugin names.
+
+        Each entry point is listed with the version of its distribution, so
+        installing, upgrading, removing or disabling a plugin changes the
+        signature. Nothing is imported.
+        """
+        entries = []
+        for entry_point in self._discover():
+            dist = getattr(entry_point, "dist", None)
+            release = f"{dist.name}=={dist.version}" if dist is not None else "unknown"
+            entries.append(f"{entry_point.name}={entry_point.value} ({release})")
+        with self._lock:
+            disabled = ",".join(sorted(self._disabled))
+        return sorted(entries) + [f"disabled={disabled}"]
+
+    def set_enabled(self, name: str, enabled: bool = True) -> None:
+        """Enable or disable plugins by plugin or distribution name."""
+        with self._lock:
+            if enabled:
+                self._disabled.discard(name)
+            else:
+                self._disabled.add(name)
+            for stats in self._stats.values():
+                stats.disabled = self._is_disabled(stats.name, stats.distribution)
+
+    def _load(self, entry_point: EntryPoint, stats: PluginStats) -> Optional[Plugin]:
+        """Import, instantiate and register the plugin behind ``entry_point`` once."""
+        if entry_point.value in self._plugins:
+            plugin = self._plugins[entry_point.value]
+        else:
+            plugin = None
+            start = time.perf_counter()
+            try:
+                with _traced_import() as usage:
+                    target = entry_point.load()
+                    plugin = target() if isinstance(target, type) else target
+                    if not isinstance(plugin, Plugin):
+                        raise TypeError(f"{entry_point.value} is not a Plugin")
+                    plugin.register()
+            except Exception as exc:
+                logger.error(f"Failed to load plugin {entry_point.value}: {exc}")
+                stats.error = str(exc)
+                plugin = None
+            else:
+                stats.import_seconds = time.perf_counter() - start
+                stats.import_memory = usage["retained"]
+                logger.info(
+                    f"Loaded plugin {plugin.name} for {entry_point.name} "
+                    f"in {stats.import_seconds:.3f}s"
+                )
+            self._plugins[entry_point.value] = plugin
+        if plugin is not None:
+            stats.name = plugin.name
+            stats.loaded = True
+            stats.disabled = self._is_disabled(stats.name, stats.distribution)
+        return plugin
+
+    def check_modules(self, categories: Iterable[str]) -> List[Tuple[Any, str]]:
+        """Return ``(module, category)`` pairs of the plugins serving ``categories``.
+
+        Plugins are loaded on the first request for one of their categories;
+        plugins that fail to load or are disabled contribute nothing.
+        """
+        wanted = set(categories)
+        modules: List[Tuple[Any, str]] = []
+        with self._lock:
+            for entry_point in self._discover():
+                if entry_point.name not in wanted:
+                    continue
+                stats = self._stats_for(entry_point)
+                if self._is_disabled(stats.distribution):
+                    stats.disabled = True
+                    continue
+                plugin = self._load(entry_point, stats)
+                if plugin is None or stats.disabled:
+                    continue
+                modules.extend(
+                    (_AccountedModule(module, stats, self._lock), category)
+                    for module, category in plugin.check_modules()
+                    if category == entry_point.name
+                )
+        return modules
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Return the recorded cost of every discovered plugin entry point."""
+        self._discover()
+        with self._lock:
+            for entry_point in self._entry_points or ():
+                self._stats_for(entry_point)
+            return [stats.to_dict() for stats in self._stats.values()]
+
+
+_MANAGER: Optional[PluginManager] = None
+_MANAGER_LOCK = threading.Lock()
+
+
+def get_plugin_manager() -> PluginManager:
+    """Return the process-wide plugin manager, discovering entry points on first use."""
+    global _MANAGER
+    if _MANAGER is None:
+        with _MANAGER_LOCK:
+            if _MANAGER is None:
+                _MANAGER = PluginManager()
+    return _MANAGER
+
+
+def set_plugin_manager(manager: Optional[PluginManager]) -> None:
+    """Replace the process-wide plugin manager; ``None`` rediscovers on next use."""
+    global _MANAGER
+    with _MANAGER_LOCK:
+        _MANAGER = manager
@@ -1,31 +1,44 @@
+import gc
 import logging
 import mimetypes
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from govdocverify.document_checker import FAADocumentChecker
-from govdocverify.models import DocumentCheckResult
+from govdocverify.models import DocumentCheckResult, VisibilitySettings
+from govdocverify.utils.boilerplate_utils import is_boilerplate
+from govdocverify.utils.result_index import ResultIndex
 from govdocverify.utils.terminology_utils import TerminologyManager
+from govdocverify.utils.text_source import TextFile
 
 logger = logging.getLogger(__name__)
 
 
+PRELOAD_ENV = "GOVDOCVERIFY_PRELOAD_RULES"
+
+
+def preload_shared_rules() -> None:
+    """Build the read-only rule data once, before worker processes fork.
+
+    Loads the rule set (mapping its published word table), the acronym and
+    boilerplate indexes and the checker singletons, then moves every live
+    object into the permanent GC generation so that collections in forked
+    workers do not write to the pages they share with the parent.
+    """
+    TerminologyManager().acronym_index
+    is_boilerplate("")
+    FAADocumentChecker()
+    gc.collect()
+    gc.freeze()
+
+
 def _read_file_content(file_path: str) -> str:
     """Read file content with fallback encoding."""
     logger.info(f"Reading file: {file_path}")
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return f.read()
-    except UnicodeDecodeError:
-        logger.warning("UTF-8 decode failed, trying with different encoding")
-        with open(file_path, "r", encoding="latin-1") as f:
-            return f.read()
+    return TextFile(file_path).read()
 
 
-def process_document(file_path: str, doc_type: str) -> DocumentCheckResult:
-    """Run all checks on the given document and return a result object."""
-    TerminologyManager()
-    checker = FAADocumentChecker()
-
+def document_source(file_path: str) -> Any:
+    """Return the check source for ``file_path``: the path of a DOCX file, else a text file."""
     mime_type, _ = mimetypes.guess_type(file_path)
     logger.info(f"Detected MIME type: {mime_type}")
 
@@ -33,22 +46,29 @@ def process_document(file_path: str, doc_type: str) -> DocumentCheckResult:
         mime_type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
         or file_path.lower().endswith(".docx")
     ):
-        logger.info("Processing as DOCX file")
-        return checker.run_all_document_checks(file_path, doc_type)
+        return file_path
+    # Text is decoded chunk by chunk as the checks stream its lines.
+    return TextFile(file_path)
 
-    content = _read_file_content(file_path)
-    logger.info("Running document checks (text file)")
-    return checker.run_all_document_checks(content, doc_type)
 
+def process_document(
+    file_path: str,
+    doc_type: str,
+    visibility_settings: Optional[VisibilitySettings] = None,
+) -> DocumentCheckResult:
+    """Run the checks on the given document and return a result object.
 
-def _check_results_have_issues(results_dict: Dict[str, Dict[str, Any]]) -> bool:
-    """Return True if any issue exists in the results dictionary."""
-    for checks in results_dict.values():
-        for res in checks.values():
-            issues = getattr(res, "issues", []) if hasattr(res, "issues") else res.get("issues", [])
-            if issues:
-                return True
-    return False
+    Categories hidden by ``visibility_settings`` are not executed.
+    """
+    TerminologyManager()
+    checker = FAADocumentChecker()
+
+    source = document_source(file_path)
+    if isinstance(source, TextFile):
+        logger.info(f"Running document checks (text file, {source.encoding})")
+    else:
+        logger.info("Processing as DOCX file")
+    return checker.run_all_document_checks(source, doc_type, visibility_settings)
 
 
 def _create_fallback_results_dict(results: DocumentCheckResult) -> Dict[str, Any]:
@@ -67,8 +87,12 @@ def _create_fallback_results_dict(results: DocumentCheckResult) -> Dict[str, Any
     return fallback
 
 
-def build_results_dict(results: DocumentCheckResult) -> Dict[str, Any]:
-    """Return a normalized results dictionary from a check result."""
+def index_results(results: DocumentCheckResult) -> ResultIndex:
+    """Return a :class:`ResultIndex` over the normalized results dictionary.
+
+    The index built by the checker during the run is reused when it still
+    matches ``per_check_results``; otherwise the results are indexed here.
+    """
     results_dict = getattr(results, "per_check_results", None)
     logger.debug("[DIAG] per_check_results present: %s", results_dict is not None)
 
@@ -81,20 +105,27 @@ def build_results_dict(results: DocumentCheckResult) -> Dict[str, Any]:
         logger.warning(
             "[DIAG] Fallback triggered: per_check_results is None. Using 'ALL' grouping."
         )
-        return _create_fallback_results_dict(results)
+        return ResultIndex(_create_fallback_results_dict(results))
 
-    has_issues = _check_results_have_issues(results_dict)
+    index = getattr(results, "result_index", None)
+    if not isinstance(index, ResultIndex) or index.results is not results_dict:
+        index = ResultIndex(results_dict)
 
-    if not has_issues and results.issues:
+    if not index.has_issues and results.issues:
         logger.warning(
             "[DIAG] Fallback triggered: per_check_results has no issues, "
             "but results.issues is non-empty (len=%d). Using 'ALL' grouping.",
             len(results.issues),
         )
         logger.debug("[DIAG] per_check_results content: %s", results_dict)
-        return _create_fallback_results_dict(results)
+        return ResultIndex(_create_fallback_results_dict(results))
 
     if results.partial_failures:
         results_dict["partial_failures"] = results.partial_failures
 
-    return results_dict
+    return index
+
+
+def build_results_dict(results: DocumentCheckResult) -> Dict[str, Any]:
+    """Return a normalized results dictionary from a check result."""
+    return index_results(results).results
@@ -0,0 +1,218 @@
+"""Run document checks in pooled, resource-limited worker processes.
+
+A :class:`SandboxPool` keeps a fixed number of single-process sandboxes.
+Each sandbox is a child interpreter with an address-space limit
+(``RLIMIT_AS``) and a CPU-time limit per document, and it is replaced after
+a number of documents so leaks do not accumulate. A document that exhausts
+its limits, or crashes the parser, takes down its own sandbox only: the
+caller gets a :class:`SandboxError` and the sandbox is restarted, while the
+other sandboxes keep serving.
+
+The pool is configured through environment variables:
+
+``GOVDOCVERIFY_SANDBOX_WORKERS``
+    Number of sandboxes; ``0`` (the default) checks documents in-process.
+``GOVDOCVERIFY_SANDBOX_MEMORY_MB``
+    Address-space limit of a sandbox in MiB (default 2048).
+``GOVDOCVERIFY_SANDBOX_CPU_SECONDS``
+    CPU seconds allowed per document (default 60).
+``GOVDOCVERIFY_SANDBOX_MAX_TASKS``
+    Documents a sandbox checks before it is replaced (default 50).
+
+Limits rely on the ``resource`` module and are not applied where it is
+missing (Windows).
+"""
+
+import logging
+import math
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
+
+from govdocverify.models import VisibilitySettings
+
+logger = logging.getLogger(__name__)
+
+WORKERS_ENV = "GOVDOCVERIFY_SANDBOX_WORKERS"
+MEMORY_ENV = "GOVDOCVERIFY_SANDBOX_MEMORY_MB"
+CPU_ENV = "GOVDOCVERIFY_SANDBOX_CPU_SECONDS"
+MAX_TASKS_ENV = "GOVDOCVERIFY_SANDBOX_MAX_TASKS"
+
+
+class SandboxError(Exception):
+    """Raised when a document exhausted its sandbox or crashed it."""
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(0, int(os.getenv(name, str(default))))
+    except ValueError:
+        logger.warning("Ignoring invalid %s value", name)
+        return default
+
+
+@dataclass(frozen=True)
+class SandboxLimits:
+    """Resource limits of a sandbox; ``0`` disables a limit."""
+
+    memory_mb: int = 2048
+    cpu_seconds: int = 60
+    max_tasks: int = 50
+
+    @classmethod
+    def from_env(cls) -> "SandboxLimits":
+        return cls(
+            memory_mb=_env_int(MEMORY_ENV, cls.memory_mb),
+            cpu_seconds=_env_int(CPU_ENV, cls.cpu_seconds),
+            max_tasks=_env_int(MAX_TASKS_ENV, cls.max_tasks),
+        )
+
+
+def sandbox_workers() -> int:
+    """Return the configured number of sandboxes (``0`` disables them)."""
+    return _env_int(WORKERS_ENV, 0)
+
+
+def _limit_memory(memory_mb: int) -> None:
+    """Initializer of a sandbox: cap its address space."""
+    if resource is not None and memory_mb:
+        limit = memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _run_limited(cpu_seconds: int, fn: Callable[..., Any], *args: Any) -> Any:
+    """Run ``fn`` in a sandbox with ``cpu_seconds`` more CPU time than used so far.
+
+    ``RLIMIT_CPU`` counts the whole life of the process, so the soft limit
+    is moved past the time earlier documents used before each run. Reaching
+    it sends ``SIGXCPU``, which terminates the sandbox.
+    """
+    if resource is not None and cpu_seconds:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        soft = math.ceil(usage.ru_utime + usage.ru_stime) + cpu_seconds
+        _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+        if hard != resource.RLIM_INFINITY:
+            soft = min(soft, hard)
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+    return fn(*args)
+
+
+def check_document(
+    file_path: str,
+    doc_type: str,
+    visibility_settings: Optional[VisibilitySettings] = None,
+    group_by: str = "category",
+) -> Dict[str, Any]:
+    """Check a document as :func:`govdocverify.cli.process_document` does.
+
+    The report is rendered here, so formatting runs inside the sandbox too
+    and the result is a plain, picklable dictionary.
+    """
+    from govdocverify.cli import process_document
+
+    result = process_document(file_path, doc_type, visibility_settings, group_by=group_by)
+    return {**result, "rendered": result["rendered"]}
+
+
+def compare_in_sandbox(
+    old_path: str,
+    new_path: str,
+    doc_type: str,
+    visibility_settings: Optional[VisibilitySettings] = None,
+) -> Dict[str, Any]:
+    """Compare two document versions as :func:`govdocverify.comparison.compare_documents`.
+
+    Both documents are parsed inside the sandbox; the result is the plain
+    dictionary of :meth:`~govdocverify.comparison.DocumentComparison.to_dict`.
+    """
+    from govdocverify.comparison import compare_documents
+
+    return compare_documents(old_path, new_path, doc_type, visibility_settings).to_dict()
+
+
+class SandboxPool:
+    """A fixed number of single-process sandboxes, each recycled independently."""
+
+    def __init__(self, workers: int, limits: Optional[SandboxLimits] = None) -> None:
+        self.limits = limits or SandboxLimits.from_env()
+        self.restarts = 0
+        methods = multiprocessing.get_all_start_methods()
+        self._context = multiprocessing.get_context(
+            "forkserver" if "forkserver" in methods else "spawn"
+        )
+        self._idle: "queue.Queue[ProcessPoolExecutor]" = queue.Queue()
+        self._closed = False
+        for _ in range(max(1, workers)):
+            self._idle.put(self._start())
+
+    def _start(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=self._context,
+            initializer=_limit_memory,
+            initargs=(self.limits.memory_mb,),
+            max_tasks_per_child=self.limits.max_tasks or None,
+        )
+
+    def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run ``fn(*args)`` in the next free sandbox and return its result.
+
+        ``fn`` and its arguments must be picklable. Exceptions raised by
+        ``fn`` propagate; a sandbox that died or ran out of memory is
+        replaced and :class:`SandboxError` is raised instead.
+        """
+        sandbox = self._idle.get()
+        try:
+            return sandbox.submit(_run_limited, self.limits.cpu_seconds, fn, *args).result()
+        except (BrokenProcessPool, MemoryError) as exc:
+            sandbox.shutdown(wait=False, cancel_futures=True)
+            sandbox = self._start()
+            self.restarts += 1
+            logger.warning(f"Restarted a document sandbox after {type(exc).__name__}")
+            raise SandboxError("document exceeded the sandbox resource limits") from exc
+        finally:
+            if self._closed:
+                sandbox.shutdown(wait=False, cancel_futures=True)
+            else:
+                self._idle.put(sandbox)
+
+    def shutdown(self) -> None:
+        """Stop the idle sandboxes; busy ones stop when their document finishes."""
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().shutdown(wait=False, cancel_futures=True)
+            except queue.Empty:
+                return
+
+
+_POOL: Optional[SandboxPool] = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_sandbox_pool() -> Optional[SandboxPool]:
+    """Return the process-wide sandbox pool, or ``None`` when sandboxes are disabled."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None and sandbox_workers():
+            _POOL = SandboxPool(sandbox_workers())
+        return _POOL
+
+
+def set_sandbox_pool(pool: Optional[SandboxPool]) -> None:
+    """Replace the process-wide sandbox pool, shutting down the previous one."""
+    global _POOL
+    with _POOL_LOCK:
+        previous, _POOL = _POOL, pool
+    if previous is not None and previous is not pool:
+        previous.shutdown()
@@ -1,6 +1,7 @@
 import re
+from typing import FrozenSet
 
-from govdocverify.config.boilerplate_texts import BOILERPLATE_PARAGRAPHS
+from govdocverify.utils.ruleset import RuleSet, get_ruleset
 
 _NORMALISE = re.compile(r"\s+")
 
@@ -9,7 +10,8 @@ def _norm(text: str) -> str:
     return _NORMALISE.sub(" ", text.strip()).lower()
 
 
-_NORMALISED = {_norm(p) for p in BOILERPLATE_PARAGRAPHS}
+def _normalised(ruleset: RuleSet) -> FrozenSet[str]:
+    return frozenset(_norm(p) for p in ruleset.boilerplate_paragraphs)
 
 
 def is_boilerplate(text: str) -> bool:
@@ -17,4 +19,4 @@ def is_boilerplate(text: str) -> bool:
     True if *text* matches a protected boiler-plate paragraph.
     Matching ignores case and collapses repeated whitespace.
     """
-    return _norm(text) in _NORMALISED
+    return _norm(text) in get_ruleset().derive("boilerplate", _normalised)
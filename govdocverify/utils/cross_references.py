@@ -0,0 +1,180 @@
+"""Cross-reference symbol table built in one pass over a document's lines.
+
+:class:`CrossReferenceIndex` records the labels a document defines (section
+numbers, ``Table X-Y`` and ``Figure X-Y`` captions, appendices) and every
+reference it makes to one, with the line and character offsets of the match.
+Checks resolve a reference with a dictionary lookup instead of re-scanning
+the document, and undefined or unreferenced labels fall out of the two
+collections directly.
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from govdocverify.utils.document_outline import DocumentOutline
+from govdocverify.utils.paragraph_table import ParagraphTable, paragraph_table_of
+
+SECTION = "section"
+TABLE = "table"
+FIGURE = "figure"
+APPENDIX = "appendix"
+KINDS = (SECTION, TABLE, FIGURE, APPENDIX)
+
+SECTION_LABEL = re.compile(r"^([A-Z]?\.?\d+(?:\.\d+)*)\s+(.+)$")
+CAPTION_LABEL = re.compile(r"^(table|figure)\s+(\d+(?:[.-]\d+)*)", re.IGNORECASE)
+APPENDIX_LABEL = re.compile(r"^appendix\s+([A-Z])\b", re.IGNORECASE)
+
+TABLE_FIGURE_REFERENCE = re.compile(r"\b([Tt]able|[Ff]igure)s?\s+(\d+(?:[\.-]\d+)*)")
+SECTION_REFERENCE = re.compile(
+    r"(paragraph|section|subsection|appendix)\s+([A-Z]?\.?\d+(?:\.\d+)*)", re.IGNORECASE
+)
+APPENDIX_REFERENCE = re.compile(r"\b(Appendix)\s+([A-Z])\b", re.IGNORECASE)
+_IGNORED = re.compile(r"[\"'()]")
+
+
+class Reference(NamedTuple):
+    """One reference found in the text.
+
+    ``word`` and ``number`` are the matched spelling (``"table"``, ``"2-1"``),
+    ``key`` the label it resolves against, and ``start``/``end`` the offsets
+    of the whole match within line ``line`` (0-based). ``text`` is the match
+    with any quotes or parentheses inside it removed.
+    ``is_label`` marks the caption or appendix title that defines the label
+    rather than refers to it.
+    """
+
+    kind: str
+    key: str
+    word: str
+    number: str
+    text: str
+    line: int
+    start: int
+    end: int
+    is_label: bool = False
+
+
+def _section_key(number: str) -> str:
+    return number.strip(".")
+
+
+class CrossReferenceIndex:
+    """Labels defined in a document and the references made to them."""
+
+    def __init__(self, lines: Sequence[str]) -> None:
+        self.lines = lines
+        self.labels: Dict[str, Dict[str, int]] = {kind: {} for kind in KINDS}
+        self.references: List[Reference] = []
+        self._by_line: Dict[int, List[Reference]] = {}
+
+    @classmethod
+    def from_lines(
+        cls, lines: Sequence[str], sections: Optional[Iterable[Tuple[str, int]]] = None
+    ) -> "CrossReferenceIndex":
+        """Index ``lines``.
+
+        Section labels are the ``(number, line)`` pairs in ``sections`` when
+        given (the numbered headings of a styled document); otherwise every
+        line that starts with a section number defines one.
+        """
+        index = cls(lines)
+        for line_idx, line in enumerate(lines):
+            label = index._define(line.strip(), line_idx, sections is None)
+            index._scan(line, line_idx, label)
+        for number, line_idx in sections or ():
+            index.labels[SECTION].setdefault(_section_key(number), line_idx)
+        return index
+
+    def _define(self, text: str, line_idx: int, numbered_lines: bool) -> Optional[Tuple[str, str]]:
+        """Record the label defined by ``text`` and return its caption ``(kind, key)``."""
+        if numbered_lines and (match := SECTION_LABEL.match(text)):
+            self.labels[SECTION].setdefault(_section_key(match.group(1)), line_idx)
+            return None
+        if match := CAPTION_LABEL.match(text):
+            label = (match.group(1).lower(), match.group(2))
+        elif match := APPENDIX_LABEL.match(text):
+            label = (APPENDIX, match.group(1).upper())
+        else:
+            return None
+        self.labels[label[0]].setdefault(label[1], line_idx)
+        return label
+
+    def _scan(self, line: str, line_idx: int, label: Optional[Tuple[str, str]]) -> None:
+        label_start = len(line) - len(line.lstrip())
+        found = []
+        # Quotes and parentheses are ignored inside table and figure
+        # references, so "Table (5)" counts; offsets map back to ``line``.
+        cleaned, kept = line, None
+        if _IGNORED.search(line):
+            kept = [i for i, char in enumerate(line) if not _IGNORED.match(char)]
+            cleaned = _IGNORED.sub("", line)
+        for match in TABLE_FIGURE_REFERENCE.finditer(cleaned):
+            word, number = match.group(1), match.group(2)
+            found.append((word.lower(), number, match))
+        for match in SECTION_REFERENCE.finditer(line):
+            found.append((SECTION, _section_key(match.group(2)), match))
+        for match in APPENDIX_REFERENCE.finditer(line):
+            found.append((APPENDIX, match.group(2).upper(), match))
+        for kind, key, match in found:
+            start, end = match.span()
+            if kind in (TABLE, FIGURE) and kept is not None:
+                start, end = kept[start], kept[end - 1] + 1
+            reference = Reference(
+                kind,
+                key,
+                match.group(1),
+                match.group(2),
+                match.group(),
+                line_idx,
+                start,
+                end,
+                is_label=(kind, key) == label and start == label_start,
+            )
+            self.references.append(reference)
+            self._by_line.setdefault(line_idx, []).append(reference)
+
+    def defines(self, kind: str, key: str) -> bool:
+        """Return ``True`` if the document defines label ``key`` of ``kind``."""
+        return key in self.labels[kind]
+
+    def references_on(self, line_idx: int, kind: Optional[str] = None) -> List[Reference]:
+        """Return the references on line ``line_idx``, optionally of one ``kind``."""
+        references = self._by_line.get(line_idx, [])
+        return references if kind is None else [r for r in references if r.kind == kind]
+
+    def undefined(self, kind: Optional[str] = None) -> List[Reference]:
+        """Return the references whose label is not defined in the document."""
+        return [
+            r
+            for r in self.references
+            if (kind is None or r.kind == kind) and not self.defines(r.kind, r.key)
+        ]
+
+    def unreferenced(self, kind: str) -> List[str]:
+        """Return the labels of ``kind`` that no reference points to, in document order."""
+        referenced = {r.key for r in self.references if r.kind == kind and not r.is_label}
+        labels = self.labels[kind]
+        return sorted((key for key in labels if key not in referenced), key=labels.__getitem__)
+
+
+def cross_reference_index_of(document: Any) -> Optional[CrossReferenceIndex]:
+    """Return the cross-reference index of ``document``.
+
+    Facet views return their cached ``cross_references`` facet and parsed DOCX
+    files are indexed from their paragraph table, with the numbered headings
+    of their outline as section labels. ``None`` is returned for other
+    documents so callers keep their own fallback.
+    """
+    index = getattr(document, "cross_references", None)
+    if isinstance(index, CrossReferenceIndex):
+        return index
+    table = paragraph_table_of(document)
+    if table is None:
+        return None
+    return index_table(table, DocumentOutline.from_table(table))
+
+
+def index_table(table: ParagraphTable, outline: DocumentOutline) -> CrossReferenceIndex:
+    """Index the paragraphs of ``table``; numbered headings define the sections."""
+    sections = [(heading.number, heading.index) for heading in outline.headings if heading.number]
+    return CrossReferenceIndex.from_lines(table.texts, sections)
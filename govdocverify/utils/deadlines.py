@@ -0,0 +1,157 @@
+"""Time budgets and cooperative cancellation for check runs.
+
+The orchestrator opens a :class:`Deadline` per document and one per check
+category; checks call :func:`raise_if_cancelled` between paragraphs, which raises
+:class:`CheckTimeout` carrying the issues found so far once a budget is spent.
+
+Budgets come from two environment variables:
+
+``GOVDOCVERIFY_DOCUMENT_TIMEOUT``
+    Seconds allowed for a whole document.
+``GOVDOCVERIFY_CHECK_TIMEOUT``
+    Seconds allowed per category, optionally followed by per-category
+    overrides, e.g. ``10,formatting=2,structure=5``.
+"""
+
+import logging
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+DOCUMENT_TIMEOUT_ENV = "GOVDOCVERIFY_DOCUMENT_TIMEOUT"
+CHECK_TIMEOUT_ENV = "GOVDOCVERIFY_CHECK_TIMEOUT"
+
+
+class CheckTimeout(Exception):
+    """Raised when a check exceeds its time budget.
+
+    ``partial`` holds whatever the check had produced at the cut-off (a
+    ``DocumentCheckResult`` or a list of issues), or ``None``.
+    """
+
+    def __init__(self, scope: str, budget: Optional[float], partial: Any = None) -> None:
+        self.scope = scope
+        self.budget = budget
+        self.partial = partial
+        super().__init__(
+            f"{scope} time budget of {budget:g}s exceeded" if budget is not None else scope
+        )
+
+    def with_partial(self, partial: Any) -> "CheckTimeout":
+        """Return a copy of this timeout carrying ``partial``."""
+        return CheckTimeout(self.scope, self.budget, partial)
+
+
+class Deadline:
+    """A time budget nested inside an optional parent budget.
+
+    ``partial`` is the latest partial result a check passed to :meth:`check`,
+    so a caller that stops waiting for the check can still report it.
+    """
+
+    def __init__(
+        self,
+        seconds: Optional[float],
+        scope: str,
+        parent: Optional["Deadline"] = None,
+    ) -> None:
+        self.seconds = seconds
+        self.scope = scope
+        self.parent = parent
+        self.partial: Any = None
+        self._expires_at = None if seconds is None else time.monotonic() + seconds
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left before this deadline or its parent expires, ``None`` if unbounded."""
+        own = None if self._expires_at is None else max(0.0, self._expires_at - time.monotonic())
+        inherited = self.parent.remaining() if self.parent is not None else None
+        if own is None or inherited is None:
+            return own if inherited is None else inherited
+        return min(own, inherited)
+
+    def expired(self) -> bool:
+        """Return ``True`` once this deadline or its parent has passed."""
+        return self._expired_scope() is not None
+
+    def check(self, partial: Any = None) -> None:
+        """Raise :class:`CheckTimeout` if the deadline has passed."""
+        if partial is not None:
+            self.partial = partial
+        expired = self._expired_scope()
+        if expired is not None:
+            raise CheckTimeout(expired.scope, expired.seconds, partial)
+
+    def _expired_scope(self) -> Optional["Deadline"]:
+        if self.parent is not None:
+            expired = self.parent._expired_scope()
+            if expired is not None:
+                return expired
+        if self._expires_at is not None and time.monotonic() >= self._expires_at:
+            return self
+        return None
+
+
+_current: ContextVar[Optional[Deadline]] = ContextVar("govdocverify_deadline", default=None)
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    """Make ``deadline`` the one :func:`raise_if_cancelled` consults in this context."""
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
+
+
+def raise_if_cancelled(partial: Any = None) -> None:
+    """Cancellation point for checks; a no-op unless a deadline is active and spent."""
+    deadline = _current.get()
+    if deadline is not None:
+        deadline.check(partial)
+
+
+def _parse_seconds(value: str) -> Optional[float]:
+    try:
+        seconds = float(value)
+    except ValueError:
+        logger.warning("Ignoring invalid time budget: %r", value)
+        return None
+    return seconds if seconds > 0 else None
+
+
+@dataclass
+class TimeBudgets:
+    """Per-document and per-category time budgets in seconds (``None`` = unbounded)."""
+
+    document: Optional[float] = None
+    default: Optional[float] = None
+    categories: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def enabled(self) -> bool:
+        return self.document is not None or self.default is not None or bool(self.categories)
+
+    def for_category(self, category: str) -> Optional[float]:
+        return self.categories.get(category, self.default)
+
+    @classmethod
+    def from_env(cls) -> "TimeBudgets":
+        budgets = cls(document=_parse_seconds(os.getenv(DOCUMENT_TIMEOUT_ENV, "0")))
+        for entry in os.getenv(CHECK_TIMEOUT_ENV, "").split(","):
+            name, sep, value = entry.strip().rpartition("=")
+            if not value:
+                continue
+            seconds = _parse_seconds(value)
+            if seconds is None:
+                continue
+            if sep:
+                budgets.categories[name.strip()] = seconds
+            else:
+                budgets.default = seconds
+        return budgets
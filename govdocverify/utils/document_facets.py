@@ -0,0 +1,248 @@
+"""Lazily computed views of a document shared by the check modules.
+
+A *facet* is one view of the input document: the parsed python-docx object,
+its paragraph list, the joined text, its sections, and so on. Checks declare
+the facets they consume when they register with
+:class:`~govdocverify.checks.check_registry.CheckRegistry`; a
+:class:`DocumentFacets` instance builds each facet at most once, and only when
+it is first requested, so a facet no enabled check needs is never parsed.
+"""
+
+import logging
+import threading
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
+
+from docx import Document
+
+from govdocverify.utils.cross_references import CrossReferenceIndex, index_table
+from govdocverify.utils.document_outline import DocumentOutline
+from govdocverify.utils.image_index import ImageIndex
+from govdocverify.utils.notes_index import NotesIndex
+from govdocverify.utils.paragraph_stream import ParagraphStream
+from govdocverify.utils.paragraph_table import ParagraphTable
+from govdocverify.utils.text_source import TextFile
+from govdocverify.utils.tracing import trace_span
+
+logger = logging.getLogger(__name__)
+
+
+class FacetUnavailable(AttributeError):
+    """Raised when a facet does not apply to the source (e.g. sections of plain text)."""
+
+
+class Facet(NamedTuple):
+    """A named document view and the facets it is derived from."""
+
+    name: str
+    requires: Tuple[str, ...]
+    build: Callable[["DocumentFacets"], Any]
+
+
+FACETS: Dict[str, Facet] = {}
+
+# Facets handed to checks that do not declare their own requirements; this is
+# what the checker passed to every module before facets were declared.
+DEFAULT_FACETS: FrozenSet[str] = frozenset({"paragraphs", "text"})
+
+
+def register_facet(
+    name: str, requires: Iterable[str] = ()
+) -> Callable[[Callable[["DocumentFacets"], Any]], Callable[["DocumentFacets"], Any]]:
+    """Decorator registering ``build`` as the builder of facet ``name``."""
+
+    def decorator(build: Callable[["DocumentFacets"], Any]) -> Callable[["DocumentFacets"], Any]:
+        FACETS[name] = Facet(name, tuple(requires), build)
+        return build
+
+    return decorator
+
+
+def facet_closure(names: Iterable[str]) -> List[List[str]]:
+    """Return ``names`` and their dependencies grouped into dependency levels.
+
+    Facets in the same level only depend on facets of earlier levels, so each
+    level can be built concurrently once the previous one is done.
+    """
+    depth: Dict[str, int] = {}
+
+    def visit(name: str, path: Tuple[str, ...]) -> int:
+        if name in depth:
+            return depth[name]
+        if name not in FACETS:
+            raise ValueError(f"Unknown document facet: {name}")
+        if name in path:
+            raise ValueError(f"Cyclic facet dependency: {' -> '.join(path + (name,))}")
+        level = 1 + max((visit(dep, path + (name,)) for dep in FACETS[name].requires), default=-1)
+        depth[name] = level
+        return level
+
+    for name in names:
+        visit(name, ())
+    levels: List[List[str]] = [[] for _ in range(max(depth.values(), default=-1) + 1)]
+    for name in sorted(depth):
+        levels[depth[name]].append(name)
+    return levels
+
+
+def _is_docx_path(source: Any) -> bool:
+    return isinstance(source, str) and source.lower().endswith((".docx", ".doc"))
+
+
+class DocumentFacets:
+    """Document view exposing registered facets as lazily built attributes.
+
+    ``facets.paragraphs`` and ``facets.text`` behave like the attributes of a
+    python-docx ``Document``; facets that do not apply to the source raise
+    ``AttributeError`` so ``hasattr`` checks in the modules keep working.
+    """
+
+    def __init__(self, source: Any) -> None:
+        self.source = source
+        self._values: Dict[str, Any] = {}
+        self._unavailable: Dict[str, FacetUnavailable] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_") or name not in FACETS:
+            raise AttributeError(name)
+        return self.get(name)
+
+    @property
+    def computed(self) -> FrozenSet[str]:
+        """Names of the facets built so far."""
+        return frozenset(self._values) | frozenset(self._unavailable)
+
+    def get(self, name: str) -> Any:
+        """Return facet ``name``, building it (and its dependencies) on first use."""
+        if name in self._values:
+            return self._values[name]
+        if name in self._unavailable:
+            raise self._unavailable[name]
+        with self._guard:
+            lock = self._locks.setdefault(name, threading.Lock())
+        with lock:
+            if name not in self._values and name not in self._unavailable:
+                self._build(name)
+        if name in self._unavailable:
+            raise self._unavailable[name]
+        return self._values[name]
+
+    def peek(self, name: str) -> Any:
+        """Return facet ``name`` if it has already been built, else ``None``."""
+        return self._values.get(name)
+
+    def provide(self, name: str, value: Any) -> None:
+        """Use ``value`` as facet ``name`` instead of building it from the source."""
+        if name not in FACETS:
+            raise ValueError(f"Unknown document facet: {name}")
+        with self._guard:
+            self._values[name] = value
+
+    def materialize(self, name: str) -> None:
+        """Build facet ``name`` if it applies to the source."""
+        try:
+            self.get(name)
+        except FacetUnavailable:
+            pass
+
+    def _build(self, name: str) -> None:
+        facet = FACETS[name]
+        for dep in facet.requires:
+            self.materialize(dep)
+        with trace_span(f"facet.{name}") as span:
+            try:
+                self._values[name] = facet.build(self)
+            except FacetUnavailable as exc:
+                self._unavailable[name] = exc
+                if span is not None:
+                    span.set(available=False)
+                return
+        logger.debug("Built document facet: %s", name)
+
+
+@register_facet("docx")
+def _docx(facets: DocumentFacets) -> Document:
+    if not _is_docx_path(facets.source):
+        raise FacetUnavailable("docx")
+    # Parsed once per view, i.e. per check run: a path may be rewritten or
+    # reused between runs, so parsed documents are not kept beyond it.
+    return Document(facets.source)
+
+
+@register_facet("paragraphs", requires=("docx",))
+def _paragraphs(facets: DocumentFacets) -> List[Any]:
+    try:
+        return list(facets.get("docx").paragraphs)
+    except FacetUnavailable:
+        pass
+    source = facets.source
+    lines = source if isinstance(source, (list, TextFile)) else str(source).splitlines()
+    return [SimpleNamespace(text=line) for line in lines]
+
+
+@register_facet("text", requires=("paragraphs",))
+def _text(facets: DocumentFacets) -> str:
+    return "\n".join(p.text for p in facets.get("paragraphs"))
+
+
+@register_facet("sections", requires=("docx",))
+def _sections(facets: DocumentFacets) -> Any:
+    return facets.get("docx").sections
+
+
+@register_facet("part", requires=("docx",))
+def _part(facets: DocumentFacets) -> Any:
+    return facets.get("docx").part
+
+
+@register_facet("inline_shapes", requires=("docx",))
+def _inline_shapes(facets: DocumentFacets) -> Any:
+    return facets.get("docx").inline_shapes
+
+
+@register_facet("images", requires=("docx",))
+def _images(facets: DocumentFacets) -> ImageIndex:
+    return ImageIndex.from_docx(facets.get("docx"))
+
+
+@register_facet("notes")
+def _notes(facets: DocumentFacets) -> NotesIndex:
+    if not _is_docx_path(facets.source):
+        raise FacetUnavailable("notes")
+    return NotesIndex.from_package(facets.source)
+
+
+@register_facet("paragraph_stream")
+def _paragraph_stream(facets: DocumentFacets) -> ParagraphStream:
+    def notes() -> Optional[NotesIndex]:
+        try:
+            return facets.get("notes")
+        except FacetUnavailable:
+            return None
+
+    return ParagraphStream(facets.source, loaded=lambda: facets.peek("paragraphs"), notes=notes)
+
+
+@register_facet("paragraph_table", requires=("docx",))
+def _paragraph_table(facets: DocumentFacets) -> ParagraphTable:
+    return ParagraphTable.from_docx(facets.get("docx"))
+
+
+@register_facet("outline", requires=("paragraph_table",))
+def _outline(facets: DocumentFacets) -> DocumentOutline:
+    table = facets.peek("paragraph_table")
+    if table is not None:
+        return DocumentOutline.from_table(table)
+    # Plain text carries no styles, so its outline has no headings.
+    return DocumentOutline.from_rows((None, p.text) for p in facets.get("paragraphs"))
+
+
+@register_facet("cross_references", requires=("paragraph_table", "outline"))
+def _cross_references(facets: DocumentFacets) -> CrossReferenceIndex:
+    table = facets.peek("paragraph_table")
+    if table is None:
+        lines = [p.text for p in facets.get("paragraphs")]
+        return CrossReferenceIndex.from_lines(lines)
+    return index_table(table, facets.get("outline"))
@@ -0,0 +1,144 @@
+"""Heading outline of a document, built once and shared by the checks.
+
+A heading is a paragraph whose style name starts with ``Heading``. Its level
+comes from the style name (``Heading 2`` is level 2) and its number from a
+leading ``1.2`` or ``A.1`` style prefix. :class:`DocumentOutline` keeps the
+headings in document order and as a tree in which each heading's section runs
+until the next heading of the same or a higher level.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+from govdocverify.utils.paragraph_table import ParagraphTable, paragraph_table_of
+
+HEADING_LEVEL = re.compile(r"Heading\s+(\d+)")
+HEADING_NUMBER = re.compile(r"^([A-Z]?\.?\d+(?:\.\d+)*)\s+(.+)$")
+
+
+@dataclass(eq=False)
+class OutlineNode:
+    """One heading paragraph and the section it opens.
+
+    ``text`` is the paragraph text as found; ``title`` is the text without
+    the heading number, whitespace collapsed and trailing periods removed.
+    ``level`` is ``None`` when the style name carries no level.
+    """
+
+    index: int
+    text: str
+    style: str
+    level: Optional[int]
+    number: Optional[str]
+    title: str
+    end: int = 0
+    children: List["OutlineNode"] = field(default_factory=list)
+    parent: Optional["OutlineNode"] = field(default=None, repr=False)
+
+    @property
+    def line_number(self) -> int:
+        """1-based paragraph number, as used for issue line numbers."""
+        return self.index + 1
+
+    @property
+    def span(self) -> range:
+        """Paragraph indexes of the section, heading and subsections included."""
+        return range(self.index, self.end)
+
+    @property
+    def depth(self) -> int:
+        return self.level or 1
+
+
+def _node(index: int, style: str, text: str) -> OutlineNode:
+    level = HEADING_LEVEL.search(style)
+    match = HEADING_NUMBER.match(text)
+    title = match.group(2) if match else text
+    return OutlineNode(
+        index=index,
+        text=text,
+        style=style,
+        level=int(level.group(1)) if level else None,
+        number=match.group(1) if match else None,
+        title=" ".join(title.split()).rstrip("."),
+    )
+
+
+class DocumentOutline:
+    """Headings of a document, flat (:attr:`headings`) and as a tree (:attr:`roots`)."""
+
+    def __init__(self, headings: List[OutlineNode], paragraph_count: int) -> None:
+        self.headings = headings
+        self.paragraph_count = paragraph_count
+        self.roots: List[OutlineNode] = []
+        stack: List[OutlineNode] = []
+        for node in headings:
+            while stack and stack[-1].depth >= node.depth:
+                stack.pop().end = node.index
+            if stack:
+                node.parent = stack[-1]
+                stack[-1].children.append(node)
+            else:
+                self.roots.append(node)
+            stack.append(node)
+        for node in stack:
+            node.end = paragraph_count
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[Optional[str], str]]) -> "DocumentOutline":
+        """Build the outline from ``(style name, text)`` rows, one per paragraph."""
+        headings = []
+        count = 0
+        for index, (style, text) in enumerate(rows):
+            count = index + 1
+            if style and style.startswith("Heading"):
+                headings.append(_node(index, style, text))
+        return cls(headings, count)
+
+    @classmethod
+    def from_table(cls, table: ParagraphTable) -> "DocumentOutline":
+        """Build the outline of a :class:`ParagraphTable`."""
+        return cls.from_rows(zip(table.styles, table.texts))
+
+    def sections(self) -> Iterator[Tuple[Optional[OutlineNode], range]]:
+        """Yield each heading with the paragraphs up to the next heading of any level.
+
+        Paragraphs before the first heading are yielded with ``None``; sections
+        without body paragraphs are skipped.
+        """
+        start, opener = 0, None
+        for node in self.headings:
+            if node.index > start:
+                yield opener, range(start, node.index)
+            start, opener = node.index + 1, node
+        if self.paragraph_count > start:
+            yield opener, range(start, self.paragraph_count)
+
+
+def outline_of(document: Any) -> Optional[DocumentOutline]:
+    """Return the heading outline of ``document``.
+
+    Facet views return their cached ``outline`` facet and parsed DOCX files
+    are read from their paragraph table. Other documents are read through
+    ``paragraphs`` and their string style names; ``None`` is returned when
+    there are no paragraphs to read.
+    """
+    outline = getattr(document, "outline", None)
+    if isinstance(outline, DocumentOutline):
+        return outline
+    table = paragraph_table_of(document)
+    if table is not None:
+        return DocumentOutline.from_table(table)
+    paragraphs = getattr(document, "paragraphs", None)
+    if paragraphs is None:
+        return None
+    return DocumentOutline.from_rows(
+        (_style_name(paragraph), getattr(paragraph, "text", str(paragraph)))
+        for paragraph in paragraphs
+    )
+
+
+def _style_name(paragraph: Any) -> Optional[str]:
+    name = getattr(getattr(paragraph, "style", None), "name", None)
+    return name if isinstance(name, str) else None
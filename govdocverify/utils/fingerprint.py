@@ -0,0 +1,54 @@
+"""Fingerprint of the checker besides its rule set.
+
+Findings depend on the rule set (see :mod:`govdocverify.utils.ruleset`) and
+on the code and inputs this module describes: the installed govdocverify
+version, the plugin entry points with their distribution versions and the
+plugins disabled through ``GOVDOCVERIFY_DISABLED_PLUGINS``, and the content
+of the ``GOVDOCVERIFY_DEPRECATED_URLS_FILE`` redirect table. A stored result
+can be reused only while both the rule set version and
+:func:`checker_fingerprint` are unchanged.
+
+:func:`result_id` names a stored result; the API and the crawl manifest both
+use it, so the same check of the same document gets the same id in either.
+"""
+
+import hashlib
+import json
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any, Dict, List
+
+from govdocverify.utils.link_utils import redirect_table_digest
+
+
+def package_version() -> str:
+    """Return the installed govdocverify version, ``unknown`` from a source tree."""
+    try:
+        return version("govdocverify")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def checker_parts() -> List[str]:
+    """Return the readable parts :func:`checker_fingerprint` hashes."""
+    from govdocverify.plugins import get_plugin_manager
+
+    return [
+        f"govdocverify=={package_version()}",
+        *get_plugin_manager().signature(),
+        f"redirects={redirect_table_digest()}",
+    ]
+
+
+def checker_fingerprint() -> str:
+    """Return a digest of the checker code and inputs besides the rule set."""
+    return hashlib.sha256("\0".join(checker_parts()).encode()).hexdigest()
+
+
+def result_id(payload: Dict[str, Any], doc_type: str) -> str:
+    """Return the id of a result ``payload`` checked as ``doc_type``.
+
+    The document type selects the report's heading section, so it is hashed
+    along with the payload.
+    """
+    hashed = json.dumps([doc_type, payload], sort_keys=True, default=str)
+    return hashlib.sha256(hashed.encode()).hexdigest()
@@ -1,7 +1,7 @@
 import logging
 from datetime import date, datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple, Union
 
 try:
     from colorama import Fore, Style
@@ -16,10 +16,19 @@ except ImportError:  # pragma: no cover - optional dependency
     Fore = _DummyFore()
     Style = _DummyStyle()
 
-from govdocverify.models import DocumentCheckResult, Severity
+from govdocverify.models import DocumentCheckResult
+from govdocverify.utils.result_index import SEVERITY_ORDER, ResultIndex
 
 logger = logging.getLogger(__name__)
 
+_SEVERITY_TITLES = {"error": "Errors", "warning": "Warnings", "info": "Info"}
+_SEVERITY_COLORS_HTML = {"error": "#721c24", "warning": "#856404", "info": "#0c5460"}
+_SEVERITY_ICONS = {"error": "❌", "warning": "⚠️", "info": "ℹ️"}
+
+
+def _severity_colors_cli() -> Dict[str, str]:
+    return {"error": Fore.RED, "warning": Fore.YELLOW, "info": Fore.CYAN}
+
 
 class FormatStyle(Enum):
     """Output format styles."""
@@ -38,6 +47,7 @@ class ResultFormatter:
         self.indent: int = 0
         self.suffix: str = ""
         self._setup_style()
+        self._templates = self._compile_templates()
 
         # Issue categories have been moved to README.md for documentation purposes
 
@@ -214,273 +224,250 @@ class ResultFormatter:
             + (f"\n      Fix: {rec}" if rec else "")
         )
 
-    def _add_header(self, output: List[str], metadata: Dict[str, Any] | None) -> None:
-        """Add header and optional metadata to the output."""
+    def _compile_templates(self) -> Dict[str, Any]:
+        """Build the report templates for the current style once.
 
-        if self._style == FormatStyle.HTML:
-            output.append('<div class="results-container">')
-            output.append(
-                '<h1 style="color: #0056b3; text-align: center;">Document Check Summary</h1>'
-            )
-            if metadata:
-                output.append('<div class="metadata">')
-                for key, value in metadata.items():
-                    label = key.replace("_", " ").title()
-                    out = self._simplify_metadata_value(value)
-                    output.append(f"<p><strong>{label}:</strong> {out}</p>")
-                output.append("</div>")
-            output.append('<hr style="border: 1px solid #0056b3;">')
-        else:
-            output.append("=" * 80)
-            output.append(self._format_colored_text("📋 DOCUMENT CHECK RESULTS SUMMARY", Fore.CYAN))
-            if metadata:
-                for key, value in metadata.items():
-                    label = key.replace("_", " ").title()
-                    out = self._simplify_metadata_value(value)
-                    output.append(f"{label}: {out}")
-            output.append("=" * 80)
-            output.append("")
-
-    def _collect_severity_buckets(self, results: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
-        """Collect and organize issues by severity."""
-        severity_buckets: Dict[str, List[Dict[str, Any]]] = {"error": [], "warning": [], "info": []}
-        for category_results in results.values():
-            if isinstance(category_results, dict):
-                for result in category_results.values():
-                    issues = (
-                        getattr(result, "issues", [])
-                        if hasattr(result, "issues")
-                        else result.get("issues", [])
-                    )
-                    for issue in issues:
-                        sev_obj = issue.get("severity")
-                        if isinstance(sev_obj, Severity):
-                            sev = sev_obj.value_str.lower()
-                        else:
-                            sev = (sev_obj or "info").lower()
-                        if sev in severity_buckets:
-                            severity_buckets[sev].append(issue)
-                        else:
-                            severity_buckets["info"].append(issue)
-        return severity_buckets
-
-    def _format_no_issues_message(self, output: List[str]) -> str:
-        """Format message when no issues are found."""
-        if self._style == FormatStyle.HTML:
-            output.append('<p style="color: #006400; text-align: center;">✓ All checks passed!</p>')
-            output.append("</div>")
-        else:
-            output.append(self._format_colored_text("✓ All checks passed!", Fore.GREEN))
-            output.append("")
-        return "\n".join(output)
-
-    def _format_severity_section(
-        self,
-        output: List[str],
-        sev: str,
-        issues: List[Dict[str, Any]],
-        severity_titles: Dict[str, str],
-        severity_colors_html: Dict[str, str],
-        severity_colors_cli: Dict[str, str],
-        severity_icons: Dict[str, str],
-    ) -> None:
-        """Format a section for a specific severity level."""
-        if self._style == FormatStyle.HTML:
+        Colors, separators and styles are baked into the templates so the
+        per-issue work while rendering is a single ``str.format`` call.
+        """
+        html = self._style == FormatStyle.HTML
+        if html:
             div_style = (
                 "margin-bottom: 40px; padding: 20px; background-color: #f8f9fa; border-radius: 8px;"
             )
-            output.append(f'<div class="category-section" style="{div_style}">')
-            h2_style = (
-                f"color: {severity_colors_html[sev]}; margin-bottom: 20px; "
-                f"border-bottom: 2px solid {severity_colors_html[sev]}; padding-bottom: 10px;"
-            )
-            output.append(f'<h2 style="{h2_style}">{severity_titles[sev]}</h2>')
-            output.append('<ul style="list-style-type: none; padding-left: 20px;">')
-            for issue in issues:
-                message = issue.get("message") or issue.get("error", str(issue))
-                span_style = f"color: {severity_colors_html[sev]}; font-weight: bold;"
-                li_content = (
-                    f"<li style='margin-bottom: 8px;'>"
-                    f"<span style='{span_style}'>[{sev.upper()}]</span> "
-                    f"{message}</li>"
-                )
-                output.append(li_content)
-            output.append("</ul>")
-            output.append("</div>")
-        else:
-            # CLI formatting
-            output.append("-" * 60)
-            output.append(
-                self._format_colored_text(
-                    f"{severity_icons[sev]} {severity_titles[sev].upper()}",
-                    severity_colors_cli[sev],
+            ul = '<ul style="list-style-type: none; padding-left: 20px;">'
+            severity_open = {}
+            severity_item = {}
+            for sev, title in _SEVERITY_TITLES.items():
+                color = _SEVERITY_COLORS_HTML[sev]
+                h2_style = (
+                    f"color: {color}; margin-bottom: 20px; "
+                    f"border-bottom: 2px solid {color}; padding-bottom: 10px;"
                 )
-            )
-            output.append("-" * 60)
-            for issue in issues:
-                message = issue.get("message") or issue.get("error", str(issue))
-                output.append(f"  • {message}")
-            output.append("")
-
-    def _format_by_severity(self, results: Dict[str, Any], output: List[str]) -> str:
-        """Format results grouped by severity."""
-        severity_buckets = self._collect_severity_buckets(results)
-        total_issues = sum(len(lst) for lst in severity_buckets.values())
-
-        if total_issues == 0:
-            return self._format_no_issues_message(output)
-
-        if self._style == FormatStyle.HTML:
-            html_style = "color: #856404; text-align: center;"
-            output.append(f'<p style="{html_style}">Found {total_issues} issues:</p>')
-        else:
-            output.append(self._format_colored_text(f"Found {total_issues} issues:", Fore.YELLOW))
-            output.append("")
-
-        severity_titles = {"error": "Errors", "warning": "Warnings", "info": "Info"}
-        severity_colors_html = {"error": "#721c24", "warning": "#856404", "info": "#0c5460"}
-        severity_colors_cli = {"error": Fore.RED, "warning": Fore.YELLOW, "info": Fore.CYAN}
-        severity_icons = {"error": "❌", "warning": "⚠️", "info": "ℹ️"}
-
-        for sev in ["error", "warning", "info"]:
-            issues = severity_buckets[sev]
-            if issues:
-                self._format_severity_section(
-                    output,
-                    sev,
-                    issues,
-                    severity_titles,
-                    severity_colors_html,
-                    severity_colors_cli,
-                    severity_icons,
+                severity_open[sev] = (
+                    f'<div class="category-section" style="{div_style}">',
+                    f'<h2 style="{h2_style}">{title}</h2>',
+                    ul,
                 )
-
-        if self._style == FormatStyle.HTML:
-            output.append("</div>")
-        return "\n".join(output)
-
-    def _collect_categories_with_issues(
-        self, results: Dict[str, Any]
-    ) -> Tuple[int, List[Tuple[str, List[Tuple[Any, List[Dict[str, Any]]]], int]]]:
-        """Collect categories that have issues."""
-        total_issues = 0
-        categories_with_issues: List[Tuple[str, List[Tuple[Any, List[Dict[str, Any]]]], int]] = []
-
-        for category, category_results in results.items():
-            if not category_results:
-                continue
-            cat_issues = 0
-            category_data: List[Tuple[Any, List[Dict[str, Any]]]] = []
-            for result in category_results.values():
-                issues = (
-                    getattr(result, "issues", [])
-                    if hasattr(result, "issues")
-                    else result.get("issues", [])
+                span_style = f"color: {color}; font-weight: bold;"
+                severity_item[sev] = (
+                    f"<li style='margin-bottom: 8px;'>"
+                    f"<span style='{span_style}'>[{sev.upper()}]</span> "
+                    "{message}</li>"
                 )
-                cat_issues += len(issues)
-                if issues:
-                    category_data.append((result, issues))
-
-            if cat_issues > 0:
-                total_issues += cat_issues
-                categories_with_issues.append((category, category_data, cat_issues))
-
-        return total_issues, categories_with_issues
-
-    def _format_category_section(
-        self,
-        output: List[str],
-        category: str,
-        category_data: List[Tuple[Any, List[Dict[str, Any]]]],
-        cat_issues: int,
-    ) -> None:
-        """Format a section for a specific category."""
-        category_title = category.replace("_", " ").title()
-
-        if self._style == FormatStyle.HTML:
-            div_style = (
-                "margin-bottom: 40px; padding: 20px; background-color: #f8f9fa; border-radius: 8px;"
-            )
-            output.append(f'<div class="category-section" style="{div_style}">')
             h2_style = (
                 "color: #0056b3; margin-bottom: 20px; "
                 "border-bottom: 2px solid #0056b3; padding-bottom: 10px;"
             )
-            output.append(f'<h2 style="{h2_style}">{category_title}</h2>')
-            output.append('<ul style="list-style-type: none; padding-left: 20px;">')
+            return {
+                "header": (
+                    '<div class="results-container">',
+                    '<h1 style="color: #0056b3; text-align: center;">Document Check Summary</h1>',
+                ),
+                "metadata_open": ('<div class="metadata">',),
+                "metadata_item": "<p><strong>{label}:</strong> {value}</p>",
+                "metadata_close": ("</div>",),
+                "header_close": ('<hr style="border: 1px solid #0056b3;">',),
+                "severity_none": (
+                    '<p style="color: #006400; text-align: center;">✓ All checks passed!</p>',
+                    "</div>",
+                ),
+                "severity_found": (
+                    '<p style="color: #856404; text-align: center;">Found {total} issues:</p>',
+                ),
+                "severity_open": severity_open,
+                "severity_item": severity_item,
+                "severity_close": ("</ul>", "</div>"),
+                "severity_footer": ("</div>",),
+                "category_none": (
+                    '<p style="color: #006400; text-align: center;">✓ All checks passed!</p>',
+                    "</div>",
+                ),
+                "category_found": (
+                    '<p style="color: #856404; text-align: center;">Found {total} issues.</p>',
+                ),
+                "category_open": (
+                    f'<div class="category-section" style="{div_style}">',
+                    f'<h2 style="{h2_style}">{{title}}</h2>',
+                    ul,
+                ),
+                "category_item": (
+                    "<li style='margin-bottom: 8px;'>"
+                    "<span style='color: #721c24; font-weight: bold;'>[{check}]</span> "
+                    "{message}</li>"
+                ),
+                "category_close": ("</ul>", "</div>"),
+                "category_footer": ("</div>",),
+                "unknown_group": (
+                    '<p style="color: #721c24;">'
+                    "[Internal error: No category grouping implemented]</p>",
+                    "</div>",
+                ),
+            }
 
-            for result, issues in category_data:
-                for issue in issues:
-                    message = issue.get("message") or issue.get("error", str(issue))
-                    check_name = self._resolve_check_name(result)
-                    span_style = "color: #721c24; font-weight: bold;"
-                    check_display = check_name.replace("_", " ").title()
-                    li_content = (
-                        f"<li style='margin-bottom: 8px;'>"
-                        f"<span style='{span_style}'>[{check_display}]</span> "
-                        f"{message}</li>"
-                    )
-                    output.append(li_content)
-            output.append("</ul>")
-            output.append("</div>")
-        else:
-            # CLI formatting
-            output.append("=" * 80)
-            output.append(
-                self._format_colored_text(
-                    f"📂 {category_title.upper()} ({cat_issues} issues)", Fore.CYAN
+        def colored(text: str, color: str) -> str:
+            return self._format_colored_text(text, color)
+
+        rule = "=" * 80
+        sev_rule = "-" * 60
+        return {
+            "header": (rule, colored("📋 DOCUMENT CHECK RESULTS SUMMARY", Fore.CYAN)),
+            "metadata_open": (),
+            "metadata_item": "{label}: {value}",
+            "metadata_close": (),
+            "header_close": (rule, ""),
+            "severity_none": (colored("✓ All checks passed!", Fore.GREEN), ""),
+            "severity_found": (colored("Found {total} issues:", Fore.YELLOW), ""),
+            "severity_open": {
+                sev: (
+                    sev_rule,
+                    colored(f"{_SEVERITY_ICONS[sev]} {title.upper()}", _severity_colors_cli()[sev]),
+                    sev_rule,
                 )
-            )
-            output.append("=" * 80)
+                for sev, title in _SEVERITY_TITLES.items()
+            },
+            "severity_item": {sev: "  • {message}" for sev in _SEVERITY_TITLES},
+            "severity_close": ("",),
+            "severity_footer": (),
+            "category_none": (colored("✓ All checks passed successfully!", Fore.GREEN), rule),
+            "category_found": (
+                colored("Found {total} issues across {count} categories:", Fore.YELLOW),
+                "",
+            ),
+            "category_open": (rule, colored("📂 {title} ({count} issues)", Fore.CYAN), rule),
+            "category_item": "  • " + colored("[{check}]", Fore.RED) + " {message}",
+            "category_close": ("",),
+            "category_footer": (rule,),
+            "unknown_group": (
+                colored("[Internal error: No implementation for group_by='{group_by}']", Fore.RED),
+                rule,
+            ),
+        }
 
+    @staticmethod
+    def _issue_message(issue: Dict[str, Any]) -> str:
+        return issue.get("message") or issue.get("error", str(issue))
+
+    def _iter_header(self, metadata: Dict[str, Any] | None) -> Iterator[str]:
+        """Yield the report header and optional metadata lines."""
+        t = self._templates
+        yield from t["header"]
+        if metadata:
+            yield from t["metadata_open"]
+            item = t["metadata_item"]
+            for key, value in metadata.items():
+                label = key.replace("_", " ").title()
+                yield item.format(label=label, value=self._simplify_metadata_value(value))
+            yield from t["metadata_close"]
+        yield from t["header_close"]
+
+    def _iter_by_severity(self, index: ResultIndex) -> Iterator[str]:
+        """Yield report lines grouped by severity."""
+        t = self._templates
+        if index.total == 0:
+            yield from t["severity_none"]
+            return
+
+        for line in t["severity_found"]:
+            yield line.format(total=index.total)
+        for sev in SEVERITY_ORDER:
+            issues = index.by_severity[sev]
+            if not issues:
+                continue
+            yield from t["severity_open"][sev]
+            item = t["severity_item"][sev]
+            for issue in issues:
+                yield item.format(message=self._issue_message(issue))
+            yield from t["severity_close"]
+        yield from t["severity_footer"]
+
+    def _iter_by_category(self, index: ResultIndex) -> Iterator[str]:
+        """Yield report lines grouped by category."""
+        t = self._templates
+        if index.total == 0:
+            yield from t["category_none"]
+            return
+
+        categories = index.categories()
+        for line in t["category_found"]:
+            yield line.format(total=index.total, count=len(categories))
+        item = t["category_item"]
+        for category, category_data, cat_issues in categories:
+            title = category.replace("_", " ").title()
+            if self._style != FormatStyle.HTML:
+                title = title.upper()
+            for line in t["category_open"]:
+                yield line.format(title=title, count=cat_issues)
             for result, issues in category_data:
+                check = self._resolve_check_name(result).replace("_", " ").title()
                 for issue in issues:
-                    message = issue.get("message") or issue.get("error", str(issue))
-                    check_name = self._resolve_check_name(result)
-                    check_label = self._format_colored_text(
-                        f"[{check_name.replace('_', ' ').title()}]", Fore.RED
-                    )
-                    output.append(f"  • {check_label} {message}")
-            output.append("")
-
-    def _format_by_category(self, results: Dict[str, Any], output: List[str]) -> str:
-        """Format results grouped by category."""
-        total_issues, categories_with_issues = self._collect_categories_with_issues(results)
+                    yield item.format(check=check, message=self._issue_message(issue))
+            yield from t["category_close"]
+        yield from t["category_footer"]
 
-        if total_issues == 0:
-            if self._style == FormatStyle.HTML:
-                output.append(
-                    '<p style="color: #006400; text-align: center;">✓ All checks passed!</p>'
-                )
-                output.append("</div>")
-            else:
-                output.append(
-                    self._format_colored_text("✓ All checks passed successfully!", Fore.GREEN)
-                )
-                output.append("=" * 80)
-            return "\n".join(output)
+    def iter_results(
+        self,
+        results: Dict[str, Any],
+        doc_type: str,
+        *,
+        group_by: str = "category",
+        metadata: Dict[str, Any] | None = None,
+        index: ResultIndex | None = None,
+    ) -> Iterator[str]:
+        """Yield the report produced by :meth:`format_results` one line at a time."""
+        if index is None:
+            index = ResultIndex(results)
+        yield from self._iter_header(metadata)
 
-        # Show summary
-        if self._style == FormatStyle.HTML:
-            html_style = "color: #856404; text-align: center;"
-            output.append(f'<p style="{html_style}">Found {total_issues} issues.</p>')
+        if group_by == "severity":
+            yield from self._iter_by_severity(index)
+        elif group_by == "category":
+            yield from self._iter_by_category(index)
         else:
-            message = (
-                f"Found {total_issues} issues across {len(categories_with_issues)} categories:"
+            # Fallback for unknown grouping
+            logger.error(
+                f"ResultFormatter.format_results: No implementation for group_by='{group_by}'."
             )
-            output.append(self._format_colored_text(message, Fore.YELLOW))
-            output.append("")
+            for line in self._templates["unknown_group"]:
+                yield line.replace("{group_by}", group_by)
 
-        # Display each category
-        for category, category_data, cat_issues in categories_with_issues:
-            self._format_category_section(output, category, category_data, cat_issues)
-
-        if self._style == FormatStyle.HTML:
-            output.append("</div>")
-        else:
-            output.append("=" * 80)
-
-        return "\n".join(output)
+    def write_results(
+        self,
+        stream: TextIO,
+        results: Dict[str, Any],
+        doc_type: str,
+        *,
+        group_by: str = "category",
+        metadata: Dict[str, Any] | None = None,
+        index: ResultIndex | None = None,
+        chunk_lines: int = 512,
+    ) -> int:
+        """Write the report to ``stream`` incrementally and return the characters written.
+
+        ``stream`` is any text file-like object, e.g. an open file or
+        ``socket.makefile("w")``. Lines are written in batches of
+        ``chunk_lines`` so the full report is never held in memory.
+        """
+        written = 0
+        batch: List[str] = []
+        first = True
+        for line in self.iter_results(
+            results, doc_type, group_by=group_by, metadata=metadata, index=index
+        ):
+            if not first:
+                batch.append("\n")
+            batch.append(line)
+            first = False
+            if len(batch) >= chunk_lines:
+                chunk = "".join(batch)
+                stream.write(chunk)
+                written += len(chunk)
+                batch.clear()
+        if batch:
+            chunk = "".join(batch)
+            stream.write(chunk)
+            written += len(chunk)
+        return written
 
     def format_results(
         self,
@@ -489,6 +476,7 @@ class ResultFormatter:
         *,
         group_by: str = "category",
         metadata: Dict[str, Any] | None = None,
+        index: ResultIndex | None = None,
     ) -> str:
         """
         Format check results into a detailed, user-friendly report.
@@ -497,36 +485,14 @@ class ResultFormatter:
             results: Dictionary of check results
             doc_type: Type of document being checked
             group_by: 'category' (default) or 'severity' for grouping output
+            index: Prebuilt :class:`ResultIndex` over ``results``; built here if omitted
 
         Returns:
             str: Formatted report with consistent styling
         """
-        output: List[str] = []
-        self._add_header(output, metadata)
-
-        if group_by == "severity":
-            return self._format_by_severity(results, output)
-        elif group_by == "category":
-            return self._format_by_category(results, output)
-        else:
-            # Fallback for unknown grouping
-            import logging
-
-            logging.error(
-                f"ResultFormatter.format_results: No implementation for group_by='{group_by}'."
-            )
-            if self._style == FormatStyle.HTML:
-                error_msg = "[Internal error: No category grouping implemented]"
-                output.append(f'<p style="color: #721c24;">{error_msg}</p>')
-                output.append("</div>")
-            else:
-                output.append(
-                    self._format_colored_text(
-                        f"[Internal error: No implementation for group_by='{group_by}']", Fore.RED
-                    )
-                )
-                output.append("=" * 80)
-            return "\n".join(output)
+        return "\n".join(
+            self.iter_results(results, doc_type, group_by=group_by, metadata=metadata, index=index)
+        )
 
     def save_report(self, results: Dict[str, Any], filepath: str, doc_type: str) -> None:
         """Save the formatted results to a file with proper formatting."""
@@ -0,0 +1,135 @@
+"""Index of the drawings in a document, built in one XML pass per part.
+
+python-docx exposes only the inline shapes of the body, one proxy per shape.
+:class:`ImageIndex` walks the ``wp:inline`` and ``wp:anchor`` elements of the
+body, headers and footers instead, so floating images, charts and drawings
+nested in tables are indexed too. Each :class:`ImageRecord` carries the
+``wp:docPr`` name, description, title and decorative flag, where the drawing
+sits and the size of the image part it shows.
+"""
+
+from typing import Any, Iterator, List, NamedTuple, Optional
+
+from docx.document import Document as DocxDocument
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from lxml import etree
+
+from govdocverify.utils.wordml import BODY, P, W
+
+WP = "{http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing}"
+A = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+R_EMBED = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed"
+INLINE = f"{WP}inline"
+ANCHOR = f"{WP}anchor"
+DOC_PR = f"{WP}docPr"
+BLIP = f"{A}blip"
+TC = f"{W}tc"
+# ``adec:decorative`` inside the ``a:extLst`` of ``wp:docPr`` (Office 2019+).
+DECORATIVE = "{http://schemas.microsoft.com/office/drawing/2017/decorative}decorative"
+
+
+class ImageRecord(NamedTuple):
+    """One drawing.
+
+    ``part`` is ``"body"`` or the header or footer part name. ``paragraph``
+    is the index of the top-level body paragraph holding the drawing, like
+    ``Document.paragraphs``; it is ``None`` for drawings in tables, headers
+    and footers. ``size`` is the byte size of the embedded image, ``None``
+    for drawings without one (charts, shapes, linked pictures).
+    """
+
+    kind: str
+    part: str
+    paragraph: Optional[int]
+    in_table: bool
+    name: Optional[str]
+    descr: Optional[str]
+    title: Optional[str]
+    decorative: bool
+    size: Optional[int]
+
+
+class ImageIndex:
+    """The drawings of a document in body, header, footer order."""
+
+    def __init__(self, records: Optional[List[ImageRecord]] = None) -> None:
+        self.records: List[ImageRecord] = records or []
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self) -> Iterator[ImageRecord]:
+        return iter(self.records)
+
+    @property
+    def total_size(self) -> int:
+        """Bytes of embedded image data, counting each drawing."""
+        return sum(record.size or 0 for record in self.records)
+
+    @classmethod
+    def from_docx(cls, document: DocxDocument) -> "ImageIndex":
+        index = cls()
+        index.add_part(document.part, "body")
+        for rel in document.part.rels.values():
+            if rel.reltype in (RT.HEADER, RT.FOOTER) and not rel.is_external:
+                part = rel.target_part
+                index.add_part(part, str(part.partname).rsplit("/", 1)[-1])
+        return index
+
+    def add_part(self, part: Any, label: str) -> None:
+        """Index the drawings of ``part``, a document, header or footer part."""
+        root = part.element
+        top_level = {}
+        body = root.find(BODY)
+        if body is not None:
+            top_level = {p: i for i, p in enumerate(body.iterchildren(P))}
+        for drawing in root.iter(INLINE, ANCHOR):
+            paragraph = next(drawing.iterancestors(P), None)
+            doc_pr = drawing.find(DOC_PR)
+            attrs = doc_pr.attrib if doc_pr is not None else {}
+            self.records.append(
+                ImageRecord(
+                    kind="inline" if drawing.tag == INLINE else "anchor",
+                    part=label,
+                    paragraph=top_level.get(paragraph),
+                    in_table=next(drawing.iterancestors(TC), None) is not None,
+                    name=attrs.get("name"),
+                    descr=attrs.get("descr"),
+                    title=attrs.get("title"),
+                    decorative=_is_decorative(doc_pr),
+                    size=_image_size(part, drawing),
+                )
+            )
+
+
+def _is_decorative(doc_pr: Any) -> bool:
+    if doc_pr is None:
+        return False
+    flag = next(doc_pr.iter(DECORATIVE), None)
+    return flag is not None and flag.get("val", "1").lower() in ("1", "true", "on")
+
+
+def _image_size(part: Any, drawing: Any) -> Optional[int]:
+    blip = next(drawing.iter(BLIP), None)
+    rid = blip.get(R_EMBED) if blip is not None else None
+    if not rid:
+        return None
+    try:
+        return len(part.related_parts[rid].blob)
+    except (KeyError, AttributeError):
+        return None
+
+
+def image_index_of(document: Any) -> Optional[ImageIndex]:
+    """Return the image index for ``document`` if it is a parsed DOCX.
+
+    Facet views return their cached ``images`` facet; a python-docx
+    ``Document`` gets a fresh index. Anything else yields ``None``.
+    """
+    images = getattr(document, "images", None)
+    if isinstance(images, ImageIndex):
+        return images
+    body = getattr(getattr(document, "element", None), "body", None)
+    if isinstance(document, DocxDocument) and isinstance(body, etree._Element):
+        return ImageIndex.from_docx(document)
+    return None
@@ -0,0 +1,204 @@
+"""Run many line rules in one regex pass per line.
+
+Each rule registered on a :class:`LineScanner` pairs a *trigger*, a regex
+that matches somewhere in every line the rule can report on, with a handler
+holding the rule's own logic. The triggers are fused into one master
+pattern: a lookahead gate on their alternation, followed by one optional
+lookahead capture group per rule. ``finditer`` over a line therefore stops
+only where some trigger matches and, at each stop, tells every rule
+triggered there (lookaheads do not consume text, so triggers never mask each
+other). Handlers run only for the rules a line triggered; rules without a
+trigger run on every line. Most lines trigger nothing and cost one scan.
+
+Triggers may be given as callables of the current rule set, so rules built
+from editable rule data follow a hot reload.
+"""
+
+import re
+import threading
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from govdocverify.models import DocumentCheckResult
+from govdocverify.utils.ruleset import RuleSet, get_ruleset
+
+Pattern = Union[str, "re.Pattern[str]"]
+Trigger = Union[Pattern, Sequence[Pattern], Callable[[RuleSet], Any]]
+Handler = Callable[[Any, "LineScan", DocumentCheckResult, int, str], None]
+Finisher = Callable[[Any, "LineScan", DocumentCheckResult], None]
+
+_SCOPED_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"), (re.VERBOSE, "x"))
+# A named group opening, or a numbered or named backreference, outside a character escape.
+_NAMED_GROUP = re.compile(r"(?<!\\)((?:\\\\)*)\(\?P<\w+>")
+_BACKREFERENCE = re.compile(r"(?<!\\)(?:\\\\)*(?:\\[1-9]|\(\?P=)")
+
+
+class LineRule(NamedTuple):
+    """A registered rule: its name, trigger, per-line handler and end-of-scan hook."""
+
+    name: str
+    trigger: Optional[Trigger]
+    handle: Handler
+    finish: Optional[Finisher]
+
+
+def _trigger_source(pattern: Pattern) -> str:
+    """Return ``pattern`` as a self-contained regex source for the master pattern."""
+    if isinstance(pattern, re.Pattern):
+        source = pattern.pattern
+        flags = "".join(char for flag, char in _SCOPED_FLAGS if pattern.flags & flag)
+    else:
+        source, flags = pattern, ""
+    if _BACKREFERENCE.search(source):
+        raise ValueError(f"Line rule triggers cannot use backreferences: {source!r}")
+    # Rule names own the named groups of the master pattern.
+    source = _NAMED_GROUP.sub(r"\1(?:", source)
+    return f"(?{flags}:{source})" if flags else f"(?:{source})"
+
+
+def _resolve(trigger: Trigger, ruleset: RuleSet) -> str:
+    if callable(trigger):
+        trigger = trigger(ruleset)
+    patterns = [trigger] if isinstance(trigger, (str, re.Pattern)) else list(trigger)
+    if not patterns:
+        return "(?!)"
+    return "|".join(_trigger_source(pattern) for pattern in patterns)
+
+
+class LineScanner:
+    """An ordered set of line rules scanned together.
+
+    Rules are registered with :meth:`rule` (as a decorator of the handler) or
+    :meth:`add_rule`. A handler is called as ``handle(owner, scan, results,
+    line_number, text)`` and records findings on ``results``, the rule's own
+    :class:`~govdocverify.models.DocumentCheckResult`; the optional
+    ``finish(owner, scan, results)`` hook runs once the last line was fed.
+    """
+
+    def __init__(self) -> None:
+        self._rules: Dict[str, LineRule] = {}
+        self._masters: Dict[Tuple[str, ...], "re.Pattern[str]"] = {}
+        self._lock = threading.Lock()
+
+    def add_rule(
+        self,
+        name: str,
+        handle: Handler,
+        trigger: Optional[Trigger] = None,
+        finish: Optional[Finisher] = None,
+    ) -> None:
+        """Register (or replace) the rule ``name``; new rules run after existing ones."""
+        if not name.isidentifier():
+            raise ValueError(f"Line rule names must be identifiers: {name!r}")
+        with self._lock:
+            self._rules[name] = LineRule(name, trigger, handle, finish)
+
+    def rule(
+        self, name: str, trigger: Optional[Trigger] = None, finish: Optional[Finisher] = None
+    ) -> Callable[[Handler], Handler]:
+        """Decorator registering the decorated function as the handler of ``name``."""
+
+        def decorator(handle: Handler) -> Handler:
+            self.add_rule(name, handle, trigger, finish)
+            return handle
+
+        return decorator
+
+    def remove_rule(self, name: str) -> None:
+        with self._lock:
+            self._rules.pop(name, None)
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._rules)
+
+    def _master(self, sources: Tuple[str, ...]) -> "re.Pattern[str]":
+        with self._lock:
+            if sources not in self._masters:
+                gate = "|".join(sources)
+                captures = "".join(
+                    f"(?:(?=(?P<r{index}>{source})))?" for index, source in enumerate(sources)
+                )
+                self._masters[sources] = re.compile(f"(?=(?:{gate})){captures}")
+            return self._masters[sources]
+
+    def start(
+        self,
+        owner: Any,
+        names: Optional[Iterable[str]] = None,
+        results: Optional[Dict[str, DocumentCheckResult]] = None,
+        lines: Optional[Sequence[str]] = None,
+        **context: Any,
+    ) -> "LineScan":
+        """Begin a scan running the rules ``names`` (all by default) for ``owner``.
+
+        ``results`` may supply the result of some rules; the others get a new
+        one. Handlers read rule data from ``scan.ruleset``, the rule set the
+        triggers were built from. ``lines`` gives handlers that look at
+        neighbouring lines the whole text, and ``context`` is available to
+        handlers as ``scan.context``.
+        """
+        wanted = None if names is None else set(names)
+        rules = [rule for rule in self._rules.values() if wanted is None or rule.name in wanted]
+        ruleset = get_ruleset()
+        triggered = [rule for rule in rules if rule.trigger is not None]
+        master = None
+        if triggered:
+            master = self._master(tuple(_resolve(rule.trigger, ruleset) for rule in triggered))
+        return LineScan(owner, ruleset, rules, triggered, master, results or {}, lines, context)
+
+
+class LineScan:
+    """One pass of a :class:`LineScanner` over the lines fed to it."""
+
+    def __init__(
+        self,
+        owner: Any,
+        ruleset: RuleSet,
+        rules: List[LineRule],
+        triggered: List[LineRule],
+        master: Optional["re.Pattern[str]"],
+        results: Dict[str, DocumentCheckResult],
+        lines: Optional[Sequence[str]],
+        context: Dict[str, Any],
+    ) -> None:
+        self.owner = owner
+        self.ruleset = ruleset
+        self.rules = rules
+        self.results = {
+            rule.name: results[rule.name] if rule.name in results else DocumentCheckResult()
+            for rule in rules
+        }
+        self.lines = lines
+        self.context = context
+        self.state: Dict[str, Any] = {}
+        self._master = master
+        self._groups = {f"r{index}": rule for index, rule in enumerate(triggered)}
+        self._always = [rule for rule in rules if rule.trigger is None]
+
+    def _rules_for(self, text: str) -> List[LineRule]:
+        hit: set = set()
+        if self._master is not None:
+            for match in self._master.finditer(text):
+                hit.update(
+                    self._groups[group].name
+                    for group, value in match.groupdict().items()
+                    if value is not None
+                )
+                if len(hit) == len(self._groups):
+                    break
+        if not hit:
+            return self._always
+        return [rule for rule in self.rules if rule.trigger is None or rule.name in hit]
+
+    def feed(self, lines: Iterable[str], first_line: int = 1) -> None:
+        """Run the rules over ``lines``, numbered from ``first_line``."""
+        for line_number, text in enumerate(lines, start=first_line):
+            for rule in self._rules_for(text):
+                rule.handle(self.owner, self, self.results[rule.name], line_number, text)
+
+    def finish(self) -> List[DocumentCheckResult]:
+        """Run the end-of-scan hooks and return the rule results in rule order."""
+        for rule in self.rules:
+            if rule.finish is not None:
+                rule.finish(self.owner, self, self.results[rule.name])
+        return list(self.results.values())
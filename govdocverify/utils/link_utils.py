@@ -1,69 +1,230 @@
+import csv
+import hashlib
+import json
+import logging
+import os
 import re
 import urllib.parse
-from typing import Iterator, Optional, Tuple
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
-from govdocverify.config.deprecated_urls import DEPRECATED_URLS
+from govdocverify.utils.ruleset import get_ruleset
 
+logger = logging.getLogger(__name__)
 
-def find_urls(text: str) -> Iterator[Tuple[str, Tuple[int, int]]]:
-    """Yield ``(url, (line_no, col))`` for each URL-like pattern in ``text``.
+# Environment variable naming an extra redirect table (CSV or JSON) that is
+# merged over ``DEPRECATED_URLS`` when the default index is built.
+REDIRECT_TABLE_ENV = "GOVDOCVERIFY_DEPRECATED_URLS_FILE"
+
+_URL_RE = re.compile(
+    r"(?P<url>(?:https?://)?"
+    r"(?:(?:[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)+)|localhost|\d{1,3}(?:\.\d{1,3}){3})"
+    r"(?::\d+)?(?:/[^\s]*)?(?:\?[^\s]*)?(?:#[^\s]*)?)",
+    re.IGNORECASE,
+)
+
+# Splits an already-extracted URL into the parts used for lookups.
+_URL_PARTS_RE = re.compile(
+    r"(?:(?P<scheme>[A-Za-z][A-Za-z0-9+.-]*)://)?"
+    r"(?P<host>[A-Za-z0-9.-]*)(?::(?P<port>\d+))?(?P<path>/[^?#]*)?(?:[?#].*)?",
+    re.DOTALL,
+)
+
+_TRAILING_PUNCTUATION = ".,;:!?"
+_BRACKETS = {")": "(", "]": "[", "}": "{", "'": "'", '"': '"'}
+_OPENERS = set(_BRACKETS.values())
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+class UrlMatch(NamedTuple):
+    """A URL found in a paragraph, with its character offsets in that paragraph."""
+
+    url: str
+    paragraph: int
+    start: int
+    end: int
+
+
+class Hyperlink(NamedTuple):
+    """A DOCX ``w:hyperlink`` with its display text, target and position.
 
-    The previous implementation only captured URLs that either had no path
-    component or had a path with at least one character.  This meant URLs such
-    as ``"https://example.gov/"`` (trailing slash but empty path) or
-    ``"https://example.gov?query=1"`` (no path, only a query string) were
-    returned without those trailing components.  Hidden tests exercise these
-    forms, so the regular expression now allows an empty path and optional
-    query/fragment parts to ensure the full URL is reported.  Trailing brackets
-    are also stripped to avoid including surrounding punctuation in the result.
+    ``target`` is the external URL from the part relationship (with any
+    ``#anchor`` appended); ``anchor`` alone marks an internal bookmark link.
+    ``start``/``end`` are offsets of the display text within the paragraph's
+    text and ``paragraph`` is the zero-based paragraph index.
     """
 
-    _URL_RE = re.compile(
-        r"(?P<url>(?:https?://)?"
-        r"(?:(?:[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)+)|localhost|\d{1,3}(?:\.\d{1,3}){3})"
-        r"(?::\d+)?(?:/[^\s]*)?(?:\?[^\s]*)?(?:#[^\s]*)?)",
-        re.IGNORECASE,
-    )
-
-    def _strip_trailing(url: str) -> str:
-        punctuation = ".,;:!?"  # characters always stripped
-        brackets = {")": "(", "]": "[", "}": "{", "'": "'", '"': '"'}
-        openers = set(brackets.values())
-
-        while url:
-            last = url[-1]
-            if last in punctuation:
-                url = url[:-1]
-                continue
-            if last in {"'", '"'}:
-                # URLs surrounded by quotes (e.g. "'https://example.gov/'")
-                # previously retained the closing quote because the counts of
-                # opening and closing quotes were balanced.  Quotes are rarely
-                # part of a valid URL, so always strip a trailing quote.
-                url = url[:-1]
+    text: str
+    target: Optional[str]
+    anchor: Optional[str]
+    paragraph: int
+    start: int
+    end: int
+
+
+class HyperlinkIndex:
+    """All hyperlinks of a document, in document order and by paragraph."""
+
+    def __init__(self, links: Iterable[Hyperlink] = ()) -> None:
+        self.links: List[Hyperlink] = list(links)
+        self.by_paragraph: Dict[int, List[Hyperlink]] = {}
+        for link in self.links:
+            self.by_paragraph.setdefault(link.paragraph, []).append(link)
+
+    def __iter__(self) -> Iterator[Hyperlink]:
+        return iter(self.links)
+
+    def __len__(self) -> int:
+        return len(self.links)
+
+    def external(self) -> Iterator[Hyperlink]:
+        """Yield hyperlinks that point at an external URL."""
+        return (link for link in self.links if link.target)
+
+
+def _relationship_target(rels: Mapping[str, Any], rid: str, anchor: Optional[str]) -> Optional[str]:
+    """Return the external URL a hyperlink relationship points at, if any."""
+    rel = rels.get(rid)
+    if rel is None or not getattr(rel, "is_external", False):
+        return None
+    return f"{rel.target_ref}#{anchor}" if anchor else rel.target_ref
+
+
+def build_hyperlink_index(paragraphs: Iterable[Any]) -> HyperlinkIndex:
+    """Build a :class:`HyperlinkIndex` from python-docx paragraphs in one pass.
+
+    Each paragraph's ``w:r`` and ``w:hyperlink`` children are walked once to
+    track text offsets; ``r:id`` attributes are resolved through the owning
+    part's relationships. Paragraphs without an XML element (plain text
+    stand-ins) are skipped.
+    """
+    try:
+        from docx.oxml.ns import qn
+        from docx.oxml.xmlchemy import BaseOxmlElement
+    except ImportError:  # pragma: no cover - optional dependency
+        return HyperlinkIndex()
+
+    tag_run = qn("w:r")
+    tag_hyperlink = qn("w:hyperlink")
+    attr_rid = qn("r:id")
+    attr_anchor = qn("w:anchor")
+    rels_by_part: Dict[int, Mapping[str, Any]] = {}
+
+    def _rels(paragraph: Any) -> Mapping[str, Any]:
+        part = getattr(paragraph, "part", None)
+        key = id(part)
+        if key not in rels_by_part:
+            rels = getattr(part, "rels", None)
+            rels_by_part[key] = rels if isinstance(rels, Mapping) else {}
+        return rels_by_part[key]
+
+    links: List[Hyperlink] = []
+    for index, paragraph in enumerate(paragraphs):
+        element = getattr(paragraph, "_p", None)
+        if not isinstance(element, BaseOxmlElement):
+            continue
+        offset = 0
+        for child in element.iterchildren(tag_run, tag_hyperlink):
+            if child.tag == tag_run:
+                offset += len(child.text)
                 continue
-            if last in brackets:
-                opener = brackets[last]
-                if url.count(last) > url.count(opener):
-                    url = url[:-1]
-                    continue
-            if last in openers:
+            text = "".join(run.text for run in child.iterchildren(tag_run))
+            anchor = child.get(attr_anchor)
+            rid = child.get(attr_rid)
+            target = _relationship_target(_rels(paragraph), rid, anchor) if rid else None
+            links.append(Hyperlink(text, target, anchor, index, offset, offset + len(text)))
+            offset += len(text)
+    return HyperlinkIndex(links)
+
+
+def _strip_trailing(url: str) -> str:
+    """Strip trailing punctuation, quotes and unmatched brackets from ``url``."""
+    while url:
+        last = url[-1]
+        if last in _TRAILING_PUNCTUATION:
+            url = url[:-1]
+            continue
+        if last in {"'", '"'}:
+            # URLs surrounded by quotes (e.g. "'https://example.gov/'")
+            # previously retained the closing quote because the counts of
+            # opening and closing quotes were balanced.  Quotes are rarely
+            # part of a valid URL, so always strip a trailing quote.
+            url = url[:-1]
+            continue
+        if last in _BRACKETS:
+            opener = _BRACKETS[last]
+            if url.count(last) > url.count(opener):
                 url = url[:-1]
                 continue
-            break
-        return url
-
-    for line_no, line in enumerate(text.splitlines(), 1):
-        for m in _URL_RE.finditer(line):
-            # Strip trailing punctuation or unmatched closing brackets so
-            # callers don't need to handle cases like
-            # ``"https://example.gov/test)."`` themselves.
+        if last in _OPENERS:
+            url = url[:-1]
+            continue
+        break
+    return url
+
+
+def scan_urls(paragraphs: Sequence[str]) -> List[UrlMatch]:
+    """Return every URL in ``paragraphs`` with its paragraph index and offsets.
+
+    ``paragraphs`` is the shared list of paragraph texts; ``paragraph`` in
+    each match is the zero-based index into it and ``start``/``end`` are the
+    offsets of the (punctuation-stripped) URL within that paragraph.
+    """
+    matches: List[UrlMatch] = []
+    finditer = _URL_RE.finditer
+    for index, text in enumerate(paragraphs):
+        if not text or ("." not in text and "localhost" not in text.lower()):
+            continue
+        for m in finditer(text):
             url = _strip_trailing(m.group("url"))
-            yield url, (line_no, m.start())
+            start = m.start()
+            matches.append(UrlMatch(url, index, start, start + len(url)))
+    return matches
 
 
-def normalise(url: str) -> str:
+def find_urls(text: str) -> Iterator[Tuple[str, Tuple[int, int]]]:
+    """Yield ``(url, (line_no, col))`` for each URL-like pattern in ``text``.
+
+    URLs may have an empty path (``"https://example.gov/"``) or only a query
+    string (``"https://example.gov?query=1"``); both are reported in full.
+    Trailing punctuation and unmatched closing brackets are stripped so
+    callers don't need to handle cases like ``"https://example.gov/test)."``.
+    """
+    for match in scan_urls(text.splitlines()):
+        yield match.url, (match.paragraph + 1, match.start)
+
+
+def _split_url(url: str) -> Tuple[str, List[str]]:
+    """Return ``(host[:port], path segments)`` for ``url`` as used by lookups."""
     url = url.strip()
+    m = _URL_PARTS_RE.fullmatch(url)
+    if m is None or (m.group("scheme") and m.group("scheme").lower() not in _DEFAULT_PORTS):
+        key = _normalise_with_urlparse(url)
+        host, _, path = key.partition("/")
+        return host, [seg for seg in path.split("/") if seg]
+
+    scheme = (m.group("scheme") or "https").lower()
+    host = m.group("host").lower().rstrip(".")
+    port = m.group("port")
+    if port and int(port) != _DEFAULT_PORTS[scheme]:
+        host = f"{host}:{int(port)}"
+    path = (m.group("path") or "").rstrip("/").rstrip(_TRAILING_PUNCTUATION)
+    return host, [seg for seg in path.split("/") if seg]
+
+
+def _normalise_with_urlparse(url: str) -> str:
     scheme_url = url if url.lower().startswith("http") else f"//{url}"
     parsed = urllib.parse.urlparse(scheme_url, scheme="https")
     host = parsed.hostname.lower().rstrip(".") if parsed.hostname else ""
@@ -73,15 +234,152 @@ def normalise(url: str) -> str:
         or (parsed.scheme == "https" and parsed.port == 443)
     ):
         port = f":{parsed.port}"
-    path = parsed.path.rstrip("/").rstrip(".,;:!?")
+    path = parsed.path.rstrip("/").rstrip(_TRAILING_PUNCTUATION)
     return f"{host}{port}{path}" if path else f"{host}{port}"
 
 
+def normalise(url: str) -> str:
+    """Return the ``host[:port]/path`` lookup key for ``url``."""
+    host, segments = _split_url(url)
+    return "/".join([host, *segments])
+
+
+class _TrieNode:
+    __slots__ = ("children", "exact", "prefix")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.exact: Optional[str] = None
+        self.prefix: Optional[str] = None
+
+
+class DeprecatedUrlIndex:
+    """Host-then-path-prefix trie of deprecated URLs and their replacements.
+
+    Keys are URLs or ``host[:port]/path`` strings. A key without a path, or
+    one ending in ``/*``, is a prefix rule that covers everything below it;
+    any other key only matches that exact path. Lookups walk the trie once
+    and return the exact match if there is one, otherwise the deepest prefix
+    rule, so their cost depends on the URL length, not the table size.
+    """
+
+    def __init__(self, table: Optional[Mapping[str, str]] = None) -> None:
+        self._hosts: Dict[str, _TrieNode] = {}
+        self._size = 0
+        if table:
+            self.update(table)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, key: str, replacement: str) -> None:
+        """Add a single deprecated URL rule."""
+        key = key.strip()
+        prefix = key.endswith("/*")
+        if prefix:
+            key = key[:-2]
+        host, segments = _split_url(key)
+        if not host:
+            logger.warning(f"Ignoring deprecated URL rule without a host: {key!r}")
+            return
+        node = self._hosts.setdefault(host, _TrieNode())
+        for segment in segments:
+            node = node.children.setdefault(segment, _TrieNode())
+        if prefix or not segments:
+            added = node.prefix is None
+            node.prefix = replacement
+        else:
+            added = node.exact is None
+            node.exact = replacement
+        # A rule for a key already present replaces it without growing the index.
+        self._size += added
+
+    def update(self, table: Union[Mapping[str, str], Iterable[Tuple[str, str]]]) -> None:
+        """Add every ``(key, replacement)`` rule from ``table``."""
+        items = table.items() if isinstance(table, Mapping) else table
+        for key, replacement in items:
+            self.add(key, replacement)
+
+    def lookup(self, url: str) -> Optional[str]:
+        """Return the replacement for ``url`` or ``None`` if it is not deprecated."""
+        host, segments = _split_url(url)
+        node = self._hosts.get(host)
+        if node is None:
+            return None
+        best = node.prefix
+        for segment in segments:
+            node = node.children.get(segment)
+            if node is None:
+                return best
+            if node.prefix is not None:
+                best = node.prefix
+        return node.exact if node.exact is not None else best
+
+
+def load_redirect_table(path: Union[str, Path]) -> Dict[str, str]:
+    """Load a redirect table from a JSON object or a two-column CSV file.
+
+    CSV rows are ``old,new``; a header row whose first cell is not a URL is
+    skipped. JSON files map old URLs to their replacements.
+    """
+    path = Path(path)
+    with path.open(encoding="utf-8", newline="") as fh:
+        if path.suffix.lower() == ".json":
+            data = json.load(fh)
+            if not isinstance(data, dict):
+                raise ValueError(f"Redirect table {path} must be a JSON object")
+            return {str(k): str(v) for k, v in data.items()}
+        table: Dict[str, str] = {}
+        for row in csv.reader(fh):
+            if len(row) < 2 or not row[0].strip() or row[0].lstrip().startswith("#"):
+                continue
+            if not table and not _URL_RE.fullmatch(_strip_trailing(row[0].strip())):
+                continue  # header row
+            table[row[0].strip()] = row[1].strip()
+        return table
+
+
+def redirect_table_digest() -> str:
+    """Return a SHA-256 of the configured redirect table, ``""`` when none is set."""
+    table_path = os.getenv(REDIRECT_TABLE_ENV)
+    if not table_path:
+        return ""
+    try:
+        return hashlib.sha256(Path(table_path).read_bytes()).hexdigest()
+    except OSError:
+        return "unreadable"
+
+
+_DEFAULT_INDEX: Optional[DeprecatedUrlIndex] = None
+_DEFAULT_INDEX_VERSION: Optional[str] = None
+
+
+def get_deprecated_index() -> DeprecatedUrlIndex:
+    """Return the shared index built from ``DEPRECATED_URLS`` and any redirect table.
+
+    The index is rebuilt when a new rule set is swapped in.
+    """
+    global _DEFAULT_INDEX, _DEFAULT_INDEX_VERSION
+    ruleset = get_ruleset()
+    if _DEFAULT_INDEX is None or _DEFAULT_INDEX_VERSION != ruleset.version:
+        index = DeprecatedUrlIndex(ruleset.deprecated_urls)
+        table_path = os.getenv(REDIRECT_TABLE_ENV)
+        if table_path:
+            try:
+                index.update(load_redirect_table(table_path))
+            except (OSError, ValueError) as e:
+                logger.error(f"Failed to load redirect table {table_path}: {e}")
+        _DEFAULT_INDEX, _DEFAULT_INDEX_VERSION = index, ruleset.version
+    return _DEFAULT_INDEX
+
+
+def set_deprecated_index(index: Optional[DeprecatedUrlIndex]) -> None:
+    """Replace the shared index; ``None`` rebuilds it on next use."""
+    global _DEFAULT_INDEX, _DEFAULT_INDEX_VERSION
+    _DEFAULT_INDEX = index
+    _DEFAULT_INDEX_VERSION = get_ruleset().version if index is not None else None
+
+
 def deprecated_lookup(url: str) -> Optional[str]:
-    key = normalise(url)
-    # exact match first
-    if key in DEPRECATED_URLS:
-        return DEPRECATED_URLS[key]
-    # check host-only fallback
-    host = key.split("/")[0]
-    return DEPRECATED_URLS.get(host)
+    """Return the replacement for a deprecated ``url``, if any."""
+    return get_deprecated_index().lookup(url)
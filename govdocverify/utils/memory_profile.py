@@ -0,0 +1,157 @@
+"""Allocation profiling of a document run with ``tracemalloc``.
+
+:func:`profile_memory` traces allocations while a document is processed and
+writes a JSON report when it ends. The pipeline marks its stages with
+:func:`memory_stage`: loading, each check category, aggregation and
+formatting. Each stage records the traced bytes at its start, the peak
+reached during it, the bytes it left allocated and the source lines that
+allocated the most. Stages outside a profile cost nothing.
+
+``tracemalloc`` traces the whole process, so one profile runs at a time and
+the checker runs categories one after another while it is active.
+
+``GOVDOCVERIFY_PERF_DIR``
+    Directory for the reports, ``perf/artifacts`` by default.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+PERF_DIR_ENV = "GOVDOCVERIFY_PERF_DIR"
+DEFAULT_PERF_DIR = "perf/artifacts"
+TOP_SITES = 10
+TRACE_FRAMES = 1
+
+_LOCK = threading.Lock()
+_active: Optional["MemoryProfile"] = None
+# Allocations by the profiler itself are not attributed to a stage.
+_IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+class MemoryProfile:
+    """The stages measured during one document run."""
+
+    def __init__(self, label: str, doc_type: Optional[str] = None, top: int = TOP_SITES) -> None:
+        self.label = label
+        self.doc_type = doc_type
+        self.top = top
+        self.stages: List[Dict[str, Any]] = []
+        self.peak_bytes = 0
+        self.path: Optional[Path] = None
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Measure the allocations of the enclosed block as stage ``name``."""
+        before = tracemalloc.take_snapshot().filter_traces(_IGNORED)
+        start, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        began = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - began
+            current, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot().filter_traces(_IGNORED)
+            self.peak_bytes = max(self.peak_bytes, peak)
+            self.stages.append(
+                {
+                    "stage": name,
+                    "seconds": round(seconds, 6),
+                    "start_bytes": start,
+                    "peak_bytes": peak,
+                    "peak_increase_bytes": peak - start,
+                    "retained_bytes": current - start,
+                    "top_allocations": self._top_sites(before, after),
+                }
+            )
+
+    def _top_sites(
+        self, before: tracemalloc.Snapshot, after: tracemalloc.Snapshot
+    ) -> List[Dict[str, Any]]:
+        grown = [stat for stat in after.compare_to(before, "lineno") if stat.size_diff > 0]
+        sites = []
+        for stat in sorted(grown, key=lambda stat: stat.size_diff, reverse=True)[: self.top]:
+            frame = stat.traceback[0]
+            sites.append(
+                {
+                    "site": f"{frame.filename}:{frame.lineno}",
+                    "size_bytes": stat.size_diff,
+                    "count": stat.count_diff,
+                }
+            )
+        return sites
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "document": self.label,
+            "doc_type": self.doc_type,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "peak_bytes": self.peak_bytes,
+            "stages": self.stages,
+        }
+
+    def write(self, directory: Optional[str] = None) -> Path:
+        """Write the report as JSON into ``directory`` and return its path."""
+        folder = Path(directory or os.getenv(PERF_DIR_ENV) or DEFAULT_PERF_DIR)
+        folder.mkdir(parents=True, exist_ok=True)
+        stem = re.sub(r"[^A-Za-z0-9_.-]+", "_", Path(self.label).stem) or "document"
+        path = folder / f"memory-{stem}-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}.json"
+        path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+        self.path = path
+        return path
+
+
+def active_memory_profile() -> Optional[MemoryProfile]:
+    """Return the profile being recorded, if any."""
+    return _active
+
+
+@contextmanager
+def memory_stage(name: str) -> Iterator[None]:
+    """Record the enclosed block as stage ``name`` of the active profile, if any."""
+    profile = _active
+    if profile is None:
+        yield
+        return
+    with profile.stage(name):
+        yield
+
+
+@contextmanager
+def profile_memory(
+    label: str, doc_type: Optional[str] = None, directory: Optional[str] = None
+) -> Iterator[MemoryProfile]:
+    """Trace allocations for the enclosed run, then write the report.
+
+    Waits for a profile running in another thread to finish first. The
+    report is written even when the run raises; its path is ``profile.path``.
+    """
+    global _active
+    with _LOCK:
+        profile = MemoryProfile(label, doc_type)
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start(TRACE_FRAMES)
+        _active = profile
+        try:
+            yield profile
+        finally:
+            _active = None
+            if started:
+                tracemalloc.stop()
+            path = profile.write(directory)
+            logger.info(f"Wrote memory profile to {path}")
@@ -0,0 +1,173 @@
+"""Footnotes and endnotes of a document, parsed once.
+
+python-docx does not load ``word/footnotes.xml`` or ``word/endnotes.xml``,
+so note text was never checked and footnote references were only found by
+walking the runs of every paragraph. :class:`NotesIndex` reads both note
+parts once and collects the ``w:footnoteReference`` and
+``w:endnoteReference`` elements of the body in one pass, giving the
+sequence checks a short array of references and the text checks the note
+text, placed at the paragraph that references it. DOCX files are read
+straight from the package zip, like the paragraph stream, so the text
+checks get the notes without loading the document.
+"""
+
+import zipfile
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from docx.document import Document as DocxDocument
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from lxml import etree
+
+from govdocverify.utils.paragraph_stream import main_document_name, related_part_name
+from govdocverify.utils.wordml import BODY, HYPERLINK, P, W, paragraph_text
+
+KINDS = {"footnote": RT.FOOTNOTES, "endnote": RT.ENDNOTES}
+_PARSER = {"resolve_entities": False, "no_network": True}
+_REFERENCES = {f"{W}footnoteReference": "footnote", f"{W}endnoteReference": "endnote"}
+
+
+class Note(NamedTuple):
+    """A footnote or endnote and its text, paragraphs joined by spaces."""
+
+    kind: str
+    id: int
+    text: str
+
+
+class NoteReference(NamedTuple):
+    """A note reference in the body.
+
+    ``paragraph`` is the index of the top-level body paragraph holding the
+    reference, like ``Document.paragraphs``; references inside tables and
+    other block containers get the index of the last paragraph before the
+    container and ``nested`` set. ``in_hyperlink`` marks references in runs
+    of a ``w:hyperlink``.
+    """
+
+    kind: str
+    id: int
+    paragraph: int
+    nested: bool = False
+    in_hyperlink: bool = False
+
+
+class NotesIndex:
+    """The notes of a document and the body references to them."""
+
+    def __init__(
+        self, notes: Optional[List[Note]] = None, references: Optional[List[NoteReference]] = None
+    ) -> None:
+        self.notes: List[Note] = notes or []
+        self.references: List[NoteReference] = references or []
+        self._by_key: Dict[Tuple[str, int], Note] = {(n.kind, n.id): n for n in self.notes}
+
+    def __len__(self) -> int:
+        return len(self.notes)
+
+    def note(self, kind: str, note_id: int) -> Optional[Note]:
+        return self._by_key.get((kind, note_id))
+
+    def paragraphs_with(self, kind: str = "footnote") -> List[int]:
+        """Sorted indexes of the top-level paragraphs referencing notes of ``kind``."""
+        return sorted({r.paragraph for r in self.references if r.kind == kind and not r.nested})
+
+    def text_windows(self) -> Iterator[Tuple[int, List[str]]]:
+        """Yield ``(line, [note text])`` per referenced note, at its first reference.
+
+        Lines are 1-based, so findings in note text point at the paragraph
+        that references the note.
+        """
+        seen = set()
+        for reference in self.references:
+            key = (reference.kind, reference.id)
+            note = self._by_key.get(key)
+            if note is None or key in seen or not note.text:
+                continue
+            seen.add(key)
+            yield reference.paragraph + 1, [note.text]
+
+    @classmethod
+    def from_docx(cls, document: DocxDocument) -> "NotesIndex":
+        notes: List[Note] = []
+        for rel in document.part.rels.values():
+            for kind, reltype in KINDS.items():
+                if rel.reltype == reltype and not rel.is_external:
+                    notes.extend(_parse_notes(kind, _part_root(rel.target_part)))
+        return cls(notes, list(_references(document.element.body.iterchildren())))
+
+    @classmethod
+    def from_package(cls, path: str) -> "NotesIndex":
+        """Build the index from the DOCX package at ``path`` without loading it."""
+        notes: List[Note] = []
+        with zipfile.ZipFile(path) as zf:
+            document_name = main_document_name(zf)
+            for kind in KINDS:
+                name = related_part_name(zf, document_name, f"/{kind}s")
+                if name is not None and name in zf.namelist():
+                    root = etree.fromstring(zf.read(name), etree.XMLParser(**_PARSER))  # nosec
+                    notes.extend(_parse_notes(kind, root))
+            with zf.open(document_name) as fh:
+                return cls(notes, list(_references(_body_children(fh))))
+
+
+def _part_root(part: Any) -> Any:
+    root = getattr(part, "element", None)
+    if root is not None:
+        return root
+    return etree.fromstring(part.blob, etree.XMLParser(**_PARSER))  # nosec B320
+
+
+def _body_children(fh: Any) -> Iterator[Any]:
+    """Yield the body children of a streamed document part, dropping each after use."""
+    events = etree.iterparse(  # nosec B320 - entities and network access disabled
+        fh, events=("end",), tag=(P, f"{W}tbl", f"{W}sdt"), **_PARSER
+    )
+    for _, element in events:
+        parent = element.getparent()
+        if parent is None or parent.tag != BODY:
+            continue
+        yield element
+        element.clear(keep_tail=True)
+        while element.getprevious() is not None:
+            del parent[0]
+
+
+def _parse_notes(kind: str, root: Any) -> Iterator[Note]:
+    for element in root.iterchildren(f"{W}{kind}"):
+        # Separator notes carry a ``w:type`` and hold no text of their own.
+        note_id = element.get(f"{W}id") or ""
+        if element.get(f"{W}type") or not note_id.lstrip("-").isdigit() or int(note_id) <= 0:
+            continue
+        text = " ".join(paragraph_text(p) for p in element.iter(P)).strip()
+        yield Note(kind, int(note_id), text)
+
+
+def _references(children: Iterator[Any]) -> Iterator[NoteReference]:
+    paragraph = -1
+    for child in children:
+        nested = child.tag != P
+        if not nested:
+            paragraph += 1
+        for element in child.iter(*_REFERENCES):
+            note_id = element.get(f"{W}id") or ""
+            if not note_id.isdigit():
+                continue
+            in_hyperlink = next(element.iterancestors(HYPERLINK), None) is not None
+            yield NoteReference(
+                _REFERENCES[element.tag], int(note_id), max(paragraph, 0), nested, in_hyperlink
+            )
+
+
+def notes_index_of(document: Any) -> Optional[NotesIndex]:
+    """Return the notes index for ``document`` if it is a parsed DOCX.
+
+    Facet views return their cached ``notes`` facet; a python-docx
+    ``Document`` gets a fresh index. Anything else yields ``None``.
+    """
+    notes = getattr(document, "notes", None)
+    if isinstance(notes, NotesIndex):
+        return notes
+    body = getattr(getattr(document, "element", None), "body", None)
+    if isinstance(document, DocxDocument) and isinstance(body, etree._Element):
+        return NotesIndex.from_docx(document)
+    return None
@@ -0,0 +1,236 @@
+"""Stream paragraph records from a document without materializing it.
+
+DOCX bodies are read with ``lxml.etree.iterparse`` straight from the package
+zip, and each body-level paragraph is discarded once its record has been
+yielded, so memory stays proportional to one window of records rather than
+to the document. Plain-text sources are split lazily with ``str.splitlines``
+semantics, and text files are decoded chunk by chunk from a memory map.
+Record text matches python-docx ``Paragraph.text`` and record indexes match
+positions in ``Document.paragraphs``.
+"""
+
+import logging
+import os
+import posixpath
+import re
+import zipfile
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from lxml import etree
+
+from govdocverify.utils.text_source import TextFile
+from govdocverify.utils.wordml import BODY, P, StyleMap, W, paragraph_style_id, paragraph_text
+
+logger = logging.getLogger(__name__)
+
+STREAM_WINDOW_ENV = "GOVDOCVERIFY_STREAM_WINDOW"
+DEFAULT_WINDOW = 256
+
+_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+_OFFICE_DOCUMENT = "/officeDocument"
+_STYLES = "/styles"
+
+# Line boundaries recognised by ``str.splitlines``.
+_LINE_BREAK = re.compile("\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+
+class ParagraphRecord(NamedTuple):
+    """One paragraph: its 0-based position, text and paragraph style name."""
+
+    index: int
+    text: str
+    style: Optional[str] = None
+
+
+def stream_window() -> int:
+    """Return the configured window size in paragraphs."""
+    try:
+        return max(1, int(os.getenv(STREAM_WINDOW_ENV, DEFAULT_WINDOW)))
+    except ValueError:
+        logger.warning("Ignoring invalid %s value", STREAM_WINDOW_ENV)
+        return DEFAULT_WINDOW
+
+
+def iter_lines(text: str) -> Iterator[str]:
+    """Yield ``text.splitlines()`` lazily."""
+    start = 0
+    for match in _LINE_BREAK.finditer(text):
+        yield text[start : match.start()]
+        start = match.end()
+    if start < len(text):
+        yield text[start:]
+
+
+def _parser_kwargs() -> Dict[str, Any]:
+    return {"resolve_entities": False, "no_network": True}
+
+
+def _relationship_target(zf: zipfile.ZipFile, rels_name: str, suffix: str) -> Optional[str]:
+    """Return the zip name targeted by the first relationship of type ``*suffix``."""
+    try:
+        data = zf.read(rels_name)
+    except KeyError:
+        return None
+    root = etree.fromstring(data, etree.XMLParser(**_parser_kwargs()))  # nosec B320
+    base = posixpath.dirname(posixpath.dirname(rels_name))
+    for rel in root.iter(_REL):
+        if rel.get("Type", "").endswith(suffix) and rel.get("TargetMode") != "External":
+            target = rel.get("Target", "")
+            if target.startswith("/"):
+                return target.lstrip("/")
+            return posixpath.normpath(posixpath.join(base, target))
+    return None
+
+
+def main_document_name(zf: zipfile.ZipFile) -> str:
+    """Return the zip name of the main document part of a DOCX package."""
+    return _relationship_target(zf, "_rels/.rels", _OFFICE_DOCUMENT) or "word/document.xml"
+
+
+def related_part_name(zf: zipfile.ZipFile, part_name: str, suffix: str) -> Optional[str]:
+    """Return the zip name of the first part related to ``part_name`` by type ``*suffix``."""
+    rels_name = posixpath.join(
+        posixpath.dirname(part_name), "_rels", posixpath.basename(part_name) + ".rels"
+    )
+    return _relationship_target(zf, rels_name, suffix)
+
+
+def _style_map(zf: zipfile.ZipFile, document_name: str) -> StyleMap:
+    """Return the paragraph styles of the main document part."""
+    styles_name = related_part_name(zf, document_name, _STYLES)
+    if styles_name is None or styles_name not in zf.namelist():
+        return StyleMap()
+    return StyleMap(
+        etree.fromstring(zf.read(styles_name), etree.XMLParser(**_parser_kwargs()))  # nosec
+    )
+
+
+def iter_docx_records(path: str) -> Iterator[ParagraphRecord]:
+    """Yield a record per body-level paragraph of the DOCX at ``path``."""
+    with zipfile.ZipFile(path) as zf:
+        document_name = main_document_name(zf)
+        styles = _style_map(zf, document_name)
+        with zf.open(document_name) as fh:
+            events = etree.iterparse(  # nosec B320 - entities and network access disabled
+                fh, events=("end",), tag=(P, f"{W}tbl", f"{W}sdt"), **_parser_kwargs()
+            )
+            index = 0
+            for _, element in events:
+                parent = element.getparent()
+                if parent is None or parent.tag != BODY:
+                    continue
+                if element.tag == P:
+                    style = styles.resolve(paragraph_style_id(element))
+                    yield ParagraphRecord(
+                        index, paragraph_text(element), style.name if style else None
+                    )
+                    index += 1
+                # Drop the finished body child and everything before it.
+                element.clear(keep_tail=True)
+                while element.getprevious() is not None:
+                    del parent[0]
+
+
+def _loaded_style_map(paragraphs: Sequence[Any]) -> Optional[StyleMap]:
+    """Return the style map of python-docx ``paragraphs``, ``None`` for other objects."""
+    first = paragraphs[0] if paragraphs else None
+    if getattr(first, "_p", None) is None:
+        return None
+    try:
+        return StyleMap(first.part.styles.element)
+    except AttributeError:
+        return None
+
+
+def _replay(paragraphs: Sequence[Any]) -> Iterator[ParagraphRecord]:
+    """Yield records for already parsed paragraphs.
+
+    Style names of python-docx paragraphs are resolved through one
+    :class:`StyleMap`; ``Paragraph.style`` searches the styles part on every
+    call.
+    """
+    styles = _loaded_style_map(paragraphs)
+    for index, p in enumerate(paragraphs):
+        if styles is not None:
+            info = styles.resolve(paragraph_style_id(p._p))
+            style = info.name if info is not None else None
+        else:
+            style = getattr(getattr(p, "style", None), "name", None)
+        yield ParagraphRecord(index, p.text, style)
+
+
+class ParagraphStream:
+    """Re-iterable stream of :class:`ParagraphRecord` for a document source.
+
+    ``source`` is a DOCX path, a raw string, a list of lines or a
+    :class:`~govdocverify.utils.text_source.TextFile`, as accepted by
+    :class:`~govdocverify.utils.document_facets.DocumentFacets`. Every
+    iteration re-reads the source, unless ``loaded`` returns paragraphs that
+    another check already parsed, in which case those are replayed instead.
+    ``notes`` returns the document's
+    :class:`~govdocverify.utils.notes_index.NotesIndex`, if it has one.
+    """
+
+    def __init__(
+        self,
+        source: Any,
+        loaded: Optional[Callable[[], Optional[Sequence[Any]]]] = None,
+        notes: Optional[Callable[[], Any]] = None,
+    ) -> None:
+        self.source = source
+        self.loaded = loaded
+        self.notes = notes
+
+    def __iter__(self) -> Iterator[ParagraphRecord]:
+        paragraphs = self.loaded() if self.loaded is not None else None
+        if paragraphs is not None:
+            return _replay(paragraphs)
+        source = self.source
+        if isinstance(source, str) and source.lower().endswith((".docx", ".doc")):
+            return iter_docx_records(source)
+        lines = source if isinstance(source, (list, TextFile)) else iter_lines(str(source))
+        return (ParagraphRecord(index, text) for index, text in enumerate(lines))
+
+    def windows(self, size: Optional[int] = None) -> Iterator[List[ParagraphRecord]]:
+        """Yield consecutive lists of at most ``size`` records."""
+        size = size or stream_window()
+        window: List[ParagraphRecord] = []
+        for record in self:
+            window.append(record)
+            if len(window) == size:
+                yield window
+                window = []
+        if window:
+            yield window
+
+    def note_windows(self) -> Iterator[Tuple[int, List[str]]]:
+        """Yield ``(line, [note text])`` per note referenced from the document."""
+        index = self.notes() if self.notes is not None else None
+        return iter(()) if index is None else index.text_windows()
+
+
+def paragraph_stream_of(document: Any) -> Optional[ParagraphStream]:
+    """Return the paragraph stream of a facet view, ``None`` for other documents."""
+    stream = getattr(document, "paragraph_stream", None)
+    return stream if isinstance(stream, ParagraphStream) else None
+
+
+def paragraph_windows(
+    document: Any, size: Optional[int] = None, notes: bool = False
+) -> Iterator[Tuple[int, List[str]]]:
+    """Yield ``(first_line, texts)`` windows of the paragraph text of ``document``.
+
+    Facet views are streamed window by window; any other document object is
+    read through its ``paragraphs`` attribute as a single window. Line
+    numbers are 1-based. With ``notes``, the footnotes and endnotes of a
+    facet view follow as one window each, numbered with the line that
+    references them.
+    """
+    stream = paragraph_stream_of(document)
+    if stream is None:
+        yield 1, [p.text for p in document.paragraphs]
+        return
+    for window in stream.windows(size):
+        yield window[0].index + 1, [record.text for record in window]
+    if notes:
+        yield from stream.note_windows()
@@ -0,0 +1,179 @@
+"""Columnar paragraph data built in one walk over a document body.
+
+python-docx recomputes ``Paragraph.text``, ``Paragraph.style`` and
+``Paragraph.runs`` from the XML on every access, and several checks touch
+those accessors repeatedly. :class:`ParagraphTable` reads each body paragraph
+once and keeps the results in parallel lists indexed like
+``Document.paragraphs``.
+"""
+
+from bisect import bisect_right
+from typing import Any, List, NamedTuple, Optional, Tuple
+
+from docx.document import Document as DocxDocument
+from lxml import etree
+
+from govdocverify.utils.wordml import (
+    HYPERLINK,
+    P,
+    R,
+    StyleMap,
+    W,
+    is_on,
+    paragraph_properties,
+    paragraph_style_id,
+    run_text,
+)
+
+FOOTNOTE_REFERENCE = f"{W}footnoteReference"
+
+
+class RunSpan(NamedTuple):
+    """A run's character range within its paragraph text and its formatting.
+
+    ``bold`` and ``italic`` reflect the run's direct properties, like
+    ``Run.bold`` and ``Run.italic``. ``hyperlink`` marks runs nested in a
+    ``w:hyperlink``, which ``Paragraph.runs`` does not return. ``footnotes``
+    holds the ids of footnote references inside the run.
+    """
+
+    start: int
+    end: int
+    bold: bool = False
+    italic: bool = False
+    hyperlink: bool = False
+    footnotes: Tuple[int, ...] = ()
+
+
+class ParagraphTable:
+    """Parallel per-paragraph columns for one block container.
+
+    Columns:
+
+    ``texts``
+        Paragraph text, identical to ``Paragraph.text``.
+    ``styles``
+        Paragraph style UI name, identical to ``Paragraph.style.name``.
+    ``outline_levels``
+        0-based outline level set on the paragraph or inherited from its
+        style, ``None`` for body text.
+    ``numbering``
+        ``(numId, ilvl)`` of list numbering, ``None`` when not numbered.
+    ``offsets``
+        Start of each paragraph in :attr:`text` (paragraphs joined by ``"\\n"``).
+    ``runs``
+        Tuple of :class:`RunSpan` per paragraph.
+    """
+
+    def __init__(self) -> None:
+        self.texts: List[str] = []
+        self.styles: List[Optional[str]] = []
+        self.outline_levels: List[Optional[int]] = []
+        self.numbering: List[Optional[Tuple[int, int]]] = []
+        self.offsets: List[int] = []
+        self.runs: List[Tuple[RunSpan, ...]] = []
+        self._text: Optional[str] = None
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    @property
+    def text(self) -> str:
+        """All paragraph text joined by newlines."""
+        if self._text is None:
+            self._text = "\n".join(self.texts)
+        return self._text
+
+    @classmethod
+    def from_docx(cls, document: DocxDocument) -> "ParagraphTable":
+        """Build the table for the body paragraphs of a python-docx ``Document``."""
+        return cls.from_element(document.element.body, StyleMap(document.styles.element))
+
+    @classmethod
+    def from_element(cls, container: Any, styles: StyleMap) -> "ParagraphTable":
+        """Build the table for the ``w:p`` children of ``container``."""
+        table = cls()
+        offset = 0
+        for paragraph in container.iterchildren(P):
+            spans, text = _runs(paragraph)
+            ppr = paragraph.find(f"{W}pPr")
+            outline, num_id, ilvl = paragraph_properties(ppr)
+            style = styles.resolve(paragraph_style_id(paragraph))
+            if style is not None:
+                outline = style.outline_level if outline is None else outline
+                num_id = style.num_id if num_id is None else num_id
+                ilvl = style.ilvl if ilvl is None else ilvl
+            table.texts.append(text)
+            table.styles.append(style.name if style is not None else None)
+            table.outline_levels.append(outline)
+            table.numbering.append((num_id, ilvl or 0) if num_id else None)
+            table.offsets.append(offset)
+            table.runs.append(spans)
+            offset += len(text) + 1
+        return table
+
+    def paragraph_at(self, offset: int) -> int:
+        """Return the index of the paragraph containing global ``offset``."""
+        return max(0, bisect_right(self.offsets, offset) - 1)
+
+    def italic_regions(self, index: int) -> List[Tuple[int, int]]:
+        """Return merged ``(start, end)`` ranges of italic text in paragraph ``index``."""
+        regions: List[Tuple[int, int]] = []
+        for span in self.runs[index]:
+            if not span.italic:
+                continue
+            if regions and regions[-1][1] == span.start:
+                regions[-1] = (regions[-1][0], span.end)
+            else:
+                regions.append((span.start, span.end))
+        return regions
+
+
+def _runs(paragraph: Any) -> Tuple[Tuple[RunSpan, ...], str]:
+    spans = []
+    parts = []
+    position = 0
+    for child in paragraph:
+        if child.tag == R:
+            runs, hyperlink = (child,), False
+        elif child.tag == HYPERLINK:
+            runs, hyperlink = tuple(run for run in child if run.tag == R), True
+        else:
+            continue
+        for run in runs:
+            text = run_text(run)
+            rpr = run.find(f"{W}rPr")
+            footnotes = tuple(
+                int(ref.get(f"{W}id"))
+                for ref in run.iter(FOOTNOTE_REFERENCE)
+                if (ref.get(f"{W}id") or "").isdigit()
+            )
+            spans.append(
+                RunSpan(
+                    position,
+                    position + len(text),
+                    rpr is not None and is_on(rpr.find(f"{W}b")),
+                    rpr is not None and is_on(rpr.find(f"{W}i")),
+                    hyperlink,
+                    footnotes,
+                )
+            )
+            parts.append(text)
+            position += len(text)
+    return tuple(spans), "".join(parts)
+
+
+def paragraph_table_of(document: Any) -> Optional[ParagraphTable]:
+    """Return the paragraph table for ``document`` if it is a parsed DOCX.
+
+    Facet views return their cached ``paragraph_table`` facet; a python-docx
+    ``Document`` gets a fresh table. Anything else (plain text, mocks) yields
+    ``None`` so callers fall back to the paragraph proxies.
+    """
+    table = getattr(document, "paragraph_table", None)
+    if isinstance(table, ParagraphTable):
+        return table
+    body = getattr(getattr(document, "element", None), "body", None)
+    if isinstance(document, DocxDocument) and isinstance(body, etree._Element):
+        return ParagraphTable.from_docx(document)
+    return None
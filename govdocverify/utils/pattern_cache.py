@@ -2,49 +2,74 @@ import json
 import re
 import threading
 import warnings
-from pathlib import Path
-from typing import Any, Dict, List, cast
+from typing import Any, Dict, List, Optional, cast
+
+from govdocverify.utils.ruleset import get_ruleset
+
+PATTERN_CATEGORIES = ("required_language", "boilerplate")
+
+
+def _registry_of(patterns_data: Dict[str, Any]) -> Dict[str, Dict[str, List[str]]]:
+    """Return the pattern categories of ``patterns_data`` by document type."""
+    registry: Dict[str, Dict[str, List[str]]] = {}
+    # Support both top-level and nested under 'patterns'
+    for category in PATTERN_CATEGORIES:
+        if category in patterns_data:
+            registry[category] = cast(Dict[str, List[str]], patterns_data[category])
+        elif "patterns" in patterns_data and category in patterns_data["patterns"]:
+            registry[category] = cast(Dict[str, List[str]], patterns_data["patterns"][category])
+    return registry
 
 
 class PatternCache:
-    """Thread-safe cache for compiled regex patterns and pattern registry."""
+    """Thread-safe cache for compiled regex patterns and pattern registry.
+
+    Without a ``patterns_file`` the registry is looked up in the current rule
+    set on every call, so a reloaded rule set takes effect for long-lived
+    caches too.
+    """
 
     def __init__(self, patterns_file: str | None = None) -> None:
         self._cache: Dict[str, re.Pattern[str]] = {}
         self._lock = threading.Lock()
-        self._pattern_registry: Dict[str, Dict[str, List[str]]] = {}
-        # Default to config/terminology.json
+        self._file_registry: Optional[Dict[str, Dict[str, List[str]]]] = None
         if patterns_file is None:
-            patterns_file = str(Path(__file__).parent.parent / "config" / "terminology.json")
-        elif patterns_file.endswith("patterns.json"):
+            self._compile_registry()
+            return
+        if patterns_file.endswith("patterns.json"):
             warnings.warn("patterns.json is deprecated. Use config/terminology.json instead.")
         self._load_patterns(patterns_file)
 
+    @property
+    def _pattern_registry(self) -> Dict[str, Dict[str, List[str]]]:
+        """The registry of the loaded file, or of the current rule set."""
+        if self._file_registry is not None:
+            return self._file_registry
+        return get_ruleset().derive(
+            "pattern_cache.registry", lambda ruleset: _registry_of(ruleset.terminology)
+        )
+
     def _load_patterns(self, patterns_file: str) -> None:
         """Load patterns from JSON file into the registry."""
         try:
             with open(patterns_file, "r") as f:
                 patterns_data: Dict[str, Any] = json.load(f)
-
-            # Support both top-level and nested under 'patterns'
-            for category in ["required_language", "boilerplate"]:
-                if category in patterns_data:
-                    self._pattern_registry[category] = cast(
-                        Dict[str, List[str]], patterns_data[category]
-                    )
-                elif "patterns" in patterns_data and category in patterns_data["patterns"]:
-                    self._pattern_registry[category] = cast(
-                        Dict[str, List[str]], patterns_data["patterns"][category]
-                    )
-            # Pre-compile and cache all patterns
-            for category in ["required_language", "boilerplate"]:
-                if category in self._pattern_registry:
-                    for doc_type, patterns in self._pattern_registry[category].items():
-                        for pattern in patterns:
-                            self.get_pattern(pattern)
+            self._register_patterns(patterns_data)
         except Exception as e:
             raise ValueError(f"Failed to load patterns from {patterns_file}: {str(e)}")
 
+    def _register_patterns(self, patterns_data: Dict[str, Any]) -> None:
+        """Add the pattern categories of ``patterns_data`` to the registry and compile them."""
+        self._file_registry = {**(self._file_registry or {}), **_registry_of(patterns_data)}
+        self._compile_registry()
+
+    def _compile_registry(self) -> None:
+        """Pre-compile and cache all patterns of the registry."""
+        for doc_patterns in self._pattern_registry.values():
+            for patterns in doc_patterns.values():
+                for pattern in patterns:
+                    self.get_pattern(pattern)
+
     def get_pattern(self, pattern_str: str) -> re.Pattern[str]:
         """Get a compiled pattern from cache or compile and cache it."""
         with self._lock:
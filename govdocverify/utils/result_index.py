@@ -0,0 +1,136 @@
+"""Single-pass index over grouped check results.
+
+Check results travel through the pipeline as a ``{category: {check: result}}``
+mapping whose leaves are either :class:`~govdocverify.models.DocumentCheckResult`
+objects or plain dictionaries with an ``issues`` list. The checker, the
+processing helpers, the CLI and the formatter all need the same views of that
+mapping (does it contain issues, issues by severity, issues per category), so
+:class:`ResultIndex` walks it once and keeps those views together with their
+counts.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from govdocverify.models import Severity
+
+SEVERITY_ORDER: Tuple[str, ...] = ("error", "warning", "info")
+
+# (result object, issues of that result) pairs kept per category for display.
+CategoryEntry = Tuple[Any, List[Dict[str, Any]]]
+
+
+def result_issues(result: Any) -> List[Any]:
+    """Return the issue list of a result object or result dictionary."""
+    if hasattr(result, "issues"):
+        return getattr(result, "issues", None) or []
+    if isinstance(result, dict):
+        return result.get("issues", None) or []
+    return []
+
+
+def issue_severity(issue: Any) -> str:
+    """Return the lower-case severity bucket (``error``/``warning``/``info``) of an issue."""
+    sev = issue.get("severity") if isinstance(issue, dict) else None
+    if isinstance(sev, Severity):
+        return sev.value_str
+    if isinstance(sev, str) and sev.lower() in SEVERITY_ORDER:
+        return sev.lower()
+    return "info"
+
+
+def issue_line(issue: Any) -> Optional[int]:
+    """Return the line number of an issue if it carries one."""
+    if not isinstance(issue, dict):
+        return None
+    line = issue.get("line_number")
+    if isinstance(line, int) and not isinstance(line, bool):
+        return line
+    line = issue.get("line")
+    if isinstance(line, int) and not isinstance(line, bool):
+        return line
+    return None
+
+
+class ResultIndex:
+    """Issues of a results mapping grouped by category, check, severity and line.
+
+    The index keeps a reference to the mapping it was built from as
+    :attr:`results`. Keys whose value is not a mapping of checks (for example
+    ``partial_failures``) are carried along in :attr:`results` but not indexed.
+    """
+
+    def __init__(self, results: Optional[Dict[str, Any]] = None) -> None:
+        self.results: Dict[str, Any] = results if results is not None else {}
+        self._entries: List[Tuple[str, str, Any, List[Any]]] = []
+        for category, checks in self.results.items():
+            if not isinstance(checks, Mapping):
+                continue
+            for check, result in checks.items():
+                issues = result_issues(result)
+                if issues:
+                    self._entries.append((category, check, result, issues))
+        self._build()
+
+    @classmethod
+    def _from_entries(
+        cls, results: Dict[str, Any], entries: Iterable[Tuple[str, str, Any, List[Any]]]
+    ) -> "ResultIndex":
+        index = cls.__new__(cls)
+        index.results = results
+        index._entries = list(entries)
+        index._build()
+        return index
+
+    def _build(self) -> None:
+        self.by_category: Dict[str, List[CategoryEntry]] = {}
+        self.by_check: Dict[Tuple[str, str], List[Any]] = {}
+        self.by_severity: Dict[str, List[Any]] = {sev: [] for sev in SEVERITY_ORDER}
+        self.by_line: Dict[int, List[Any]] = {}
+        self.category_counts: Dict[str, int] = {}
+
+        for category, check, result, issues in self._entries:
+            self.by_category.setdefault(category, []).append((result, issues))
+            self.by_check.setdefault((category, check), []).extend(issues)
+            self.category_counts[category] = self.category_counts.get(category, 0) + len(issues)
+            for issue in issues:
+                self.by_severity[issue_severity(issue)].append(issue)
+                line = issue_line(issue)
+                if line is not None:
+                    self.by_line.setdefault(line, []).append(issue)
+
+        self.severity_counts: Dict[str, int] = {
+            sev: len(issues) for sev, issues in self.by_severity.items()
+        }
+        self.total: int = sum(self.category_counts.values())
+
+    @property
+    def has_issues(self) -> bool:
+        """Return ``True`` if any indexed result carries at least one issue."""
+        return self.total > 0
+
+    def categories(self) -> List[Tuple[str, List[CategoryEntry], int]]:
+        """Return ``(category, entries, issue_count)`` for categories with issues."""
+        return [
+            (category, entries, self.category_counts[category])
+            for category, entries in self.by_category.items()
+        ]
+
+    def select(self, keep: Callable[[str], bool]) -> "ResultIndex":
+        """Return an index restricted to the top-level keys accepted by ``keep``.
+
+        The filtered index reuses the entries collected here instead of walking
+        the results again.
+        """
+        results = {key: value for key, value in self.results.items() if keep(key)}
+        entries = (entry for entry in self._entries if entry[0] in results)
+        return self._from_entries(results, entries)
+
+    def summary(self) -> Dict[str, Any]:
+        """Return the precomputed counts as a JSON-serializable dictionary."""
+        return {
+            "total": self.total,
+            "by_severity": dict(self.severity_counts),
+            "by_category": dict(self.category_counts),
+        }
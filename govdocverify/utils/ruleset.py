@@ -0,0 +1,447 @@
+"""Versioned, precompiled rule artifact built from the ``config`` sources.
+
+The style rules live in several files: ``terminology.json``,
+``terminology_rules.py``, ``validation_patterns.py``, ``boilerplate_texts.py``,
+``deprecated_urls.py`` and the ``valid_words.txt`` word list. :func:`compile_ruleset`
+turns them into one :class:`RuleSet` holding the raw rule data, precompiled
+matchers and a content hash (``version``). When a cache file is configured, the
+plain rule data is written there as JSON so that later processes skip
+executing the rule modules while the sources are unchanged; loading it only
+recompiles the patterns. The word list is published next to the cache file as
+a memory-mapped :class:`~govdocverify.utils.word_table.WordTable`, so every
+process loading the cache maps the same pages instead of holding its own copy
+of the words. Word tables of other versions are removed when a new one is
+published.
+
+Running processes share the current rule set through :func:`get_ruleset`.
+:func:`refresh_ruleset` checks the source modification times (at most once per
+``GOVDOCVERIFY_RULESET_CHECK_INTERVAL`` seconds) and swaps in a newly compiled
+rule set when they change. The swap replaces a single module reference, so
+checks that already hold a rule set finish with it while new checks pick up the
+new one.
+
+Environment variables:
+
+``GOVDOCVERIFY_RULES_DIR``
+    Directory with replacement rule files. Files present there override the
+    packaged file with the same name.
+``GOVDOCVERIFY_RULESET_CACHE``
+    Path of the cache file. Unset (the default) or ``off`` disables caching.
+``GOVDOCVERIFY_RULESET_CHECK_INTERVAL``
+    Minimum number of seconds between modification time checks (default 2).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, TypeVar
+
+from govdocverify.utils.word_table import WordTable
+
+logger = logging.getLogger(__name__)
+
+RULES_DIR_ENV = "GOVDOCVERIFY_RULES_DIR"
+RULESET_CACHE_ENV = "GOVDOCVERIFY_RULESET_CACHE"
+RULESET_CHECK_INTERVAL_ENV = "GOVDOCVERIFY_RULESET_CHECK_INTERVAL"
+
+# Bump when the layout of the cached rule data changes so stale caches are ignored.
+RULESET_FORMAT = 3
+
+CONFIG_DIR = Path(__file__).parent.parent / "config"
+VALID_WORDS_FILE = Path(__file__).parent.parent.parent / "valid_words.txt"
+
+SOURCE_FILES: Dict[str, Path] = {
+    "terminology": CONFIG_DIR / "terminology.json",
+    "terminology_rules": CONFIG_DIR / "terminology_rules.py",
+    "validation_patterns": CONFIG_DIR / "validation_patterns.py",
+    "boilerplate_texts": CONFIG_DIR / "boilerplate_texts.py",
+    "deprecated_urls": CONFIG_DIR / "deprecated_urls.py",
+    "valid_words": VALID_WORDS_FILE,
+}
+
+# (term, message or replacement, compiled matcher)
+Matcher = Tuple[str, str, "re.Pattern[str]"]
+T = TypeVar("T")
+
+
+@dataclass
+class RuleSet:
+    """Rule data and precompiled matchers for one version of the rule sources."""
+
+    version: str
+    paths: Dict[str, str]
+    stamps: Dict[str, Tuple[int, int]]
+    terminology: Dict[str, Any]
+    term_replacements: Dict[str, str]
+    forbidden_terms: Dict[str, str]
+    terminology_variants: Dict[str, List[str]]
+    multiple_accepted_forms: Dict[str, List[str]]
+    forbidden_matchers: List[Matcher]
+    variant_matchers: List[Matcher]
+    acronym_ignore_patterns: List["re.Pattern[str]"]
+    required_language: Dict[str, List["re.Pattern[str]"]]
+    phone_patterns: List["re.Pattern[str]"]
+    placeholder_patterns: List["re.Pattern[str]"]
+    date_incorrect: "re.Pattern[str]"
+    date_skip_patterns: List["re.Pattern[str]"]
+    boilerplate_paragraphs: Tuple[str, ...]
+    deprecated_urls: Dict[str, str]
+    valid_words: WordTable
+    # The plain rule data the matchers were compiled from, as cached.
+    rule_data: Dict[str, Any] = field(default_factory=dict, repr=False, compare=False)
+    format: int = RULESET_FORMAT
+    _derived: Dict[str, Any] = field(default_factory=dict, repr=False, compare=False)
+
+    def derive(self, key: str, factory: Callable[["RuleSet"], T]) -> T:
+        """Return an index derived from this rule set, building it on first use.
+
+        Derived indexes live on the rule set, so swapping in a new rule set
+        discards them together with the rules they were built from.
+        """
+        try:
+            return self._derived[key]
+        except KeyError:
+            return self._derived.setdefault(key, factory(self))
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = dict(self.__dict__)
+        state["_derived"] = {}
+        return state
+
+
+def source_paths(rules_dir: Optional[str] = None) -> Dict[str, Path]:
+    """Return the rule source files, preferring overrides from ``rules_dir``."""
+    rules_dir = rules_dir if rules_dir is not None else os.getenv(RULES_DIR_ENV)
+    paths = dict(SOURCE_FILES)
+    if rules_dir:
+        for name, default in SOURCE_FILES.items():
+            override = Path(rules_dir) / default.name
+            if override.is_file():
+                paths[name] = override
+    return paths
+
+
+def _stamp(path: Path) -> Tuple[int, int]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return (-1, -1)
+    return (stat.st_size, stat.st_mtime_ns)
+
+
+def _read_sources(paths: Mapping[str, Path]) -> Tuple[Dict[str, bytes], str]:
+    """Read every source and return the contents with their combined hash."""
+    digest = hashlib.sha256(f"ruleset-format-{RULESET_FORMAT}".encode())
+    contents: Dict[str, bytes] = {}
+    for name in sorted(paths):
+        try:
+            data = paths[name].read_bytes()
+        except FileNotFoundError:
+            logger.warning(f"Rule source {name} not found at {paths[name]}")
+            data = b""
+        contents[name] = data
+        digest.update(name.encode() + b"\0" + hashlib.sha256(data).digest())
+    return contents, digest.hexdigest()
+
+
+def _run_module(
+    name: str, paths: Mapping[str, Path], contents: Mapping[str, bytes]
+) -> Dict[str, Any]:
+    """Execute the Python rule source ``name`` and return its globals.
+
+    The bytes that were hashed are executed, so the version always describes
+    the rules that were compiled even if the file changes meanwhile.
+    """
+    namespace: Dict[str, Any] = {"__name__": f"govdocverify_rules_{name}"}
+    if contents[name]:
+        # Rule modules are configuration shipped with the package or chosen by
+        # the operator through GOVDOCVERIFY_RULES_DIR, never user uploads.
+        exec(compile(contents[name], str(paths[name]), "exec"), namespace)  # nosec B102
+    return namespace
+
+
+def _compile_all(patterns: List[str], flags: int = 0) -> List["re.Pattern[str]"]:
+    return [re.compile(pattern, flags) for pattern in patterns]
+
+
+def _word_matchers(terms: Mapping[str, str]) -> List[Matcher]:
+    return [
+        (term, message, re.compile(rf"\b{re.escape(term)}\b", re.IGNORECASE))
+        for term, message in terms.items()
+    ]
+
+
+def _variant_matchers(variants: Mapping[str, List[str]]) -> List[Matcher]:
+    matchers: List[Matcher] = []
+    for standard, forms in variants.items():
+        for variant in forms:
+            flags = 0 if variant.lower() == standard.lower() else re.IGNORECASE
+            matchers.append((standard, variant, re.compile(rf"\b{re.escape(variant)}\b", flags)))
+    return matchers
+
+
+def _valid_words(data: bytes) -> WordTable:
+    text = data.decode("utf-8", errors="replace")
+    return WordTable.from_words(word.strip().lower() for word in text.splitlines() if word.strip())
+
+
+def _rule_data(contents: Mapping[str, bytes], paths: Mapping[str, Path]) -> Dict[str, Any]:
+    """Parse the rule sources into plain, JSON-serialisable rule data."""
+    terminology: Dict[str, Any] = json.loads(contents["terminology"] or b"{}")
+    rules = _run_module("terminology_rules", paths, contents)
+    validation = _run_module("validation_patterns", paths, contents)
+    boilerplate = _run_module("boilerplate_texts", paths, contents)
+    urls = _run_module("deprecated_urls", paths, contents)
+    return {
+        "terminology": terminology,
+        "term_replacements": dict(rules.get("TERM_REPLACEMENTS", {})),
+        "forbidden_terms": dict(rules.get("FORBIDDEN_TERMS", {})),
+        "terminology_variants": dict(rules.get("TERMINOLOGY_VARIANTS", {})),
+        "multiple_accepted_forms": dict(rules.get("MULTIPLE_ACCEPTED_FORMS", {})),
+        "phone_patterns": list(validation.get("PHONE_PATTERNS", [])),
+        "placeholder_patterns": list(validation.get("PLACEHOLDER_PATTERNS", [])),
+        "date_patterns": dict(validation.get("DATE_PATTERNS", {})),
+        "boilerplate_paragraphs": list(boilerplate.get("BOILERPLATE_PARAGRAPHS", ())),
+        "deprecated_urls": dict(urls.get("DEPRECATED_URLS", {})),
+    }
+
+
+def _build_ruleset(
+    version: str,
+    paths: Mapping[str, Path],
+    stamps: Dict[str, Tuple[int, int]],
+    data: Dict[str, Any],
+    valid_words: WordTable,
+) -> RuleSet:
+    """Compile the matchers of ``data`` into a :class:`RuleSet`."""
+    terminology = data["terminology"]
+    date_patterns = data["date_patterns"]
+    ignore_patterns = terminology.get("patterns", {}).get("ignore_patterns", [])
+    return RuleSet(
+        version=version,
+        paths={name: str(path) for name, path in paths.items()},
+        stamps=stamps,
+        terminology=terminology,
+        term_replacements=data["term_replacements"],
+        forbidden_terms=data["forbidden_terms"],
+        terminology_variants=data["terminology_variants"],
+        multiple_accepted_forms=data["multiple_accepted_forms"],
+        forbidden_matchers=_word_matchers(data["forbidden_terms"]),
+        variant_matchers=_variant_matchers(data["terminology_variants"]),
+        acronym_ignore_patterns=_compile_all(ignore_patterns),
+        required_language={
+            doc_type: _compile_all(patterns)
+            for doc_type, patterns in terminology.get("required_language", {}).items()
+        },
+        phone_patterns=_compile_all(data["phone_patterns"]),
+        placeholder_patterns=_compile_all(data["placeholder_patterns"]),
+        date_incorrect=re.compile(date_patterns.get("incorrect", r"(?!)")),
+        date_skip_patterns=_compile_all(date_patterns.get("skip_patterns", [])),
+        boilerplate_paragraphs=tuple(data["boilerplate_paragraphs"]),
+        deprecated_urls=data["deprecated_urls"],
+        valid_words=valid_words,
+        rule_data=data,
+    )
+
+
+def compile_ruleset(paths: Optional[Mapping[str, Path]] = None) -> RuleSet:
+    """Compile the rule sources into a :class:`RuleSet`.
+
+    Raises:
+        ValueError: If a source cannot be parsed or a pattern does not compile
+    """
+    paths = dict(paths or source_paths())
+    stamps = {name: _stamp(path) for name, path in paths.items()}
+    contents, version = _read_sources(paths)
+    try:
+        data = _rule_data(contents, paths)
+        return _build_ruleset(version, paths, stamps, data, _valid_words(contents["valid_words"]))
+    except (re.error, SyntaxError, json.JSONDecodeError) as e:
+        raise ValueError(f"Failed to compile rule set: {e}") from e
+
+
+def default_cache_path() -> Optional[Path]:
+    """Return the configured cache file, or ``None`` when caching is disabled."""
+    configured = os.getenv(RULESET_CACHE_ENV, "").strip()
+    if configured.lower() in {"", "0", "off", "false"}:
+        return None
+    return Path(configured)
+
+
+def words_path(cache_path: Path, version: str) -> Path:
+    """Return where the word table of rule set ``version`` is published."""
+    return cache_path.with_name(f"{cache_path.stem}-{version[:16]}.words")
+
+
+def _load_cached(cache_path: Path, version: str, paths: Mapping[str, Path]) -> Optional[RuleSet]:
+    """Rebuild rule set ``version`` from the cache file, if it holds that version."""
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            cached = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:  # unreadable or corrupt cache
+        logger.warning(f"Ignoring unreadable rule set cache {cache_path}: {e}")
+        return None
+    if not isinstance(cached, dict) or cached.get("format") != RULESET_FORMAT:
+        return None
+    if cached.get("version") != version:
+        return None
+    # The cache may have been written by a process that saw other paths or
+    # modification times for identical content.
+    stamps = {name: _stamp(path) for name, path in paths.items()}
+    try:
+        words = WordTable.open(words_path(cache_path, version))
+        return _build_ruleset(version, paths, stamps, cached["rules"], words)
+    except (OSError, ValueError, KeyError, TypeError, AttributeError, re.error) as e:
+        logger.warning(f"Ignoring incomplete rule set cache {cache_path}: {e}")
+        return None
+
+
+def _remove_stale_words(cache_path: Path, current: Path) -> None:
+    """Delete word tables published for other rule set versions.
+
+    Processes that still map a removed table keep their mapping.
+    """
+    for path in cache_path.parent.glob(f"{cache_path.stem}-*.words"):
+        if path != current:
+            try:
+                path.unlink()
+            except OSError as e:
+                logger.debug(f"Could not remove stale word table {path}: {e}")
+
+
+def _write_cache(cache_path: Path, ruleset: RuleSet) -> None:
+    """Write ``ruleset`` to ``cache_path`` atomically; failures are only logged.
+
+    The word table is published first and swapped into ``ruleset``, so this
+    process maps the same file as later processes loading the cache.
+    """
+    try:
+        words = words_path(cache_path, ruleset.version)
+        ruleset.valid_words = WordTable.publish(ruleset.valid_words, words)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache_path.parent, prefix=".ruleset-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "format": RULESET_FORMAT,
+                        "version": ruleset.version,
+                        "rules": ruleset.rule_data,
+                    },
+                    f,
+                )
+            os.replace(tmp, cache_path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        _remove_stale_words(cache_path, words)
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning(f"Could not write rule set cache {cache_path}: {e}")
+
+
+def load_ruleset(
+    paths: Optional[Mapping[str, Path]] = None, cache_path: Optional[Path] = None
+) -> RuleSet:
+    """Return the rule set for ``paths``, from the cache file when it is current."""
+    paths = dict(paths or source_paths())
+    if cache_path is None:
+        cache_path = default_cache_path()
+    if cache_path is not None:
+        _, version = _read_sources(paths)
+        cached = _load_cached(cache_path, version, paths)
+        if cached is not None:
+            logger.debug(f"Loaded rule set {version[:12]} from {cache_path}")
+            return cached
+
+    start = time.perf_counter()
+    ruleset = compile_ruleset(paths)
+    logger.info(f"Compiled rule set {ruleset.version[:12]} in {time.perf_counter() - start:.3f}s")
+    if cache_path is not None:
+        _write_cache(cache_path, ruleset)
+    return ruleset
+
+
+_CURRENT: Optional[RuleSet] = None
+_LOCK = threading.Lock()
+_LAST_CHECK = 0.0
+
+
+def _check_interval() -> float:
+    try:
+        return float(os.getenv(RULESET_CHECK_INTERVAL_ENV, "2"))
+    except ValueError:
+        return 2.0
+
+
+def get_ruleset() -> RuleSet:
+    """Return the current rule set, loading it on first use."""
+    global _CURRENT
+    ruleset = _CURRENT
+    if ruleset is None:
+        with _LOCK:
+            if _CURRENT is None:
+                _CURRENT = load_ruleset()
+            ruleset = _CURRENT
+    return ruleset
+
+
+def set_ruleset(ruleset: Optional[RuleSet]) -> None:
+    """Replace the current rule set; ``None`` reloads it on next use."""
+    global _CURRENT, _LAST_CHECK
+    with _LOCK:
+        _CURRENT = ruleset
+        _LAST_CHECK = 0.0
+
+
+def refresh_ruleset(force: bool = False, raise_errors: bool = False) -> RuleSet:
+    """Swap in a newly compiled rule set if any rule source changed.
+
+    Modification times are checked at most once per check interval unless
+    ``force`` is set, in which case the sources are always re-read. A rule set
+    that fails to compile is logged and the current one is kept, unless
+    ``raise_errors`` is set.
+
+    Raises:
+        ValueError: If ``raise_errors`` is set and the sources do not compile
+    """
+    global _CURRENT, _LAST_CHECK
+    current = get_ruleset()
+    now = time.monotonic()
+    if not force and now - _LAST_CHECK < _check_interval():
+        return current
+    _LAST_CHECK = now
+
+    paths = source_paths()
+    stamps = {name: _stamp(path) for name, path in paths.items()}
+    if not force and stamps == current.stamps:
+        return current
+
+    with _LOCK:
+        if _CURRENT is not current:  # another thread already swapped
+            return _CURRENT or current
+        try:
+            ruleset = load_ruleset(paths)
+        except (OSError, ValueError) as e:
+            logger.error(f"Keeping rule set {current.version[:12]}: {e}")
+            if raise_errors:
+                raise ValueError(str(e)) from e
+            return current
+        if ruleset.version == current.version:
+            # Same content: keep derived indexes, just remember the new stamps.
+            current.stamps = ruleset.stamps
+            current.paths = ruleset.paths
+            return current
+        logger.info(f"Switched rule set {current.version[:12]} -> {ruleset.version[:12]}")
+        _CURRENT = ruleset
+        return ruleset
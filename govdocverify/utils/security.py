@@ -2,10 +2,12 @@ import asyncio
 import logging
 import os
 import re
+import struct
 import time
+import zipfile
 from functools import wraps
 from pathlib import Path
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, Optional
 from urllib.parse import urlparse
 
 import filetype
@@ -23,6 +25,15 @@ logger = logging.getLogger(__name__)
 
 # Constants
 MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
+# Limits on the ZIP package of a DOCX, read from its central directory.
+MAX_UNCOMPRESSED_SIZE = 100 * 1024 * 1024  # 100MB
+MAX_ARCHIVE_ENTRIES = 1000
+MAX_COMPRESSION_RATIO = 100
+# Entries smaller than this may compress better than the ratio limit.
+RATIO_CHECK_MIN_SIZE = 1024 * 1024
+_END_OF_CENTRAL_DIRECTORY = b"PK\x05\x06"
+_EOCD_SIZE = 22
+_MAX_COMMENT = 0xFFFF
 ALLOWED_MIME_TYPES = {
     "application/vnd.openxmlformats-officedocument.wordprocessingml.document": ".docx",
 }
@@ -89,6 +100,8 @@ def validate_file(file_path: str) -> None:
             raise SecurityError(
                 f"Invalid file type. Allowed types: {', '.join(ALLOWED_MIME_TYPES.values())}"
             )
+        if zipfile.is_zipfile(file_path):
+            inspect_archive(file_path)
 
         logger.info(f"File validation successful for {file_path}")
 
@@ -97,6 +110,65 @@ def validate_file(file_path: str) -> None:
         raise SecurityError(f"File validation failed: {str(e)}")
 
 
+def _declared_entry_count(file_path: str) -> Optional[int]:
+    """Return the entry count of the end-of-central-directory record, if found.
+
+    Only the tail of the file is read, so an archive declaring a huge number
+    of entries is rejected before its central directory is loaded.
+    """
+    with open(file_path, "rb") as fh:
+        fh.seek(0, os.SEEK_END)
+        size = fh.tell()
+        fh.seek(max(0, size - _EOCD_SIZE - _MAX_COMMENT))
+        tail = fh.read()
+    offset = tail.rfind(_END_OF_CENTRAL_DIRECTORY)
+    if offset < 0 or len(tail) - offset < _EOCD_SIZE:
+        return None
+    (entries,) = struct.unpack_from("<H", tail, offset + 10)
+    return None if entries == 0xFFFF else entries  # 0xFFFF: see the ZIP64 record
+
+
+def inspect_archive(file_path: str) -> None:
+    """Check the ZIP central directory of a DOCX before anything parses it.
+
+    Nothing is decompressed: the entry count, the total uncompressed size
+    and the compression ratio of each large entry are taken from the
+    central directory, whose sizes Python's ``zipfile`` also enforces when
+    the entries are read later.
+
+    Raises:
+        SecurityError: If the archive is corrupt, encrypted or exceeds a limit
+    """
+    declared = _declared_entry_count(file_path)
+    if declared is not None and declared > MAX_ARCHIVE_ENTRIES:
+        raise SecurityError(f"Archive has {declared} entries; the limit is {MAX_ARCHIVE_ENTRIES}")
+    try:
+        with zipfile.ZipFile(file_path) as archive:
+            entries = archive.infolist()
+    except (zipfile.BadZipFile, zipfile.LargeZipFile) as exc:
+        raise SecurityError(f"Corrupt archive: {exc}") from exc
+    if len(entries) > MAX_ARCHIVE_ENTRIES:
+        raise SecurityError(
+            f"Archive has {len(entries)} entries; the limit is {MAX_ARCHIVE_ENTRIES}"
+        )
+    total = 0
+    for entry in entries:
+        if entry.flag_bits & 0x1:
+            raise SecurityError(f"Archive entry {entry.filename} is encrypted")
+        total += entry.file_size
+        ratio = entry.file_size / max(entry.compress_size, 1)
+        if entry.file_size >= RATIO_CHECK_MIN_SIZE and ratio > MAX_COMPRESSION_RATIO:
+            raise SecurityError(
+                f"Archive entry {entry.filename} expands {ratio:.0f} times; "
+                f"the limit is {MAX_COMPRESSION_RATIO}"
+            )
+    if total > MAX_UNCOMPRESSED_SIZE:
+        raise SecurityError(
+            f"Archive expands to {total / 1024 / 1024:.0f}MB; "
+            f"the limit is {MAX_UNCOMPRESSED_SIZE / 1024 / 1024:.0f}MB"
+        )
+
+
 class RateLimiter:
     """Simple rate limiter implementation."""
 
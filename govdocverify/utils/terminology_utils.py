@@ -1,12 +1,28 @@
+import copy
 import json
 import logging
 import re
+from bisect import bisect_left
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, cast
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    cast,
+)
 
 from ..models import DocumentCheckResult
+from .ruleset import RuleSet, get_ruleset, refresh_ruleset
+from .word_table import WordTable
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +37,74 @@ class AcronymDefinition:
     context: Optional[str] = None
 
 
+ACRONYM_DEFINED = "defined"
+ACRONYM_STANDARD = "standard"
+ACRONYM_UNDEFINED = "undefined"
+ACRONYM_IGNORED = "ignored"
+
+
+class AcronymToken(NamedTuple):
+    """A candidate acronym found by :meth:`TerminologyManager.scan_acronyms`.
+
+    ``kind`` is one of ``defined``, ``standard``, ``undefined`` or ``ignored``
+    and ``canonical`` is the spelling the token resolved to (the token itself
+    when it did not match a defined or known acronym).
+    """
+
+    token: str
+    canonical: str
+    kind: str
+    start: int
+    end: int
+
+
+class AcronymIndex:
+    """Case-folded acronym lookups precomputed once per terminology ruleset."""
+
+    def __init__(self, acronyms: Dict[str, str], valid_words: Iterable[str]) -> None:
+        self.acronyms = acronyms
+        self.by_fold = {acronym.lower(): acronym for acronym in acronyms}
+        # The rule set's table is already lowercased; share it rather than copy.
+        self.valid_words: AbstractSet[str] = (
+            valid_words
+            if isinstance(valid_words, WordTable)
+            else frozenset(word.lower() for word in valid_words)
+        )
+
+    def resolve(self, token: str) -> Optional[str]:
+        """Return the known acronym matching ``token`` case-insensitively."""
+        return self.by_fold.get(token.lower())
+
+
+class DefinitionIndex:
+    """Acronyms defined in one document, indexed as the definitions are found."""
+
+    def __init__(self) -> None:
+        self.definitions: Dict[str, str] = {}
+        self.by_fold: Dict[str, str] = {}
+
+    def __contains__(self, acronym: object) -> bool:
+        return acronym in self.definitions
+
+    def add(self, acronym: str, definition: str) -> None:
+        """Record ``definition`` for ``acronym``; later definitions win."""
+        self.definitions[acronym] = definition
+        self.by_fold[acronym.lower()] = acronym
+
+    def resolve(self, token: str) -> Optional[str]:
+        """Return the defined acronym matching ``token`` case-insensitively."""
+        return self.by_fold.get(token.lower())
+
+
+def _ruleset_acronyms(ruleset: RuleSet) -> Dict[str, str]:
+    acronyms = ruleset.terminology.get("acronyms", {})
+    return {**acronyms.get("standard", {}), **acronyms.get("custom", {})}
+
+
+def _build_acronym_index(ruleset: RuleSet) -> AcronymIndex:
+    return AcronymIndex(ruleset.derive("acronyms", _ruleset_acronyms), ruleset.valid_words)
+
+
 class TerminologyManager:
     """Manages terminology, acronyms, and their definitions from a single source of truth."""
 
@@ -38,8 +122,10 @@ class TerminologyManager:
         if self._initialized:
             return
 
-        self.terminology_file = Path(__file__).parent.parent / "config" / "terminology.json"
-        self.terminology_data = self._load_terminology()
+        self._ruleset = get_ruleset()
+        self.terminology_file = Path(self._ruleset.paths["terminology"])
+        self.terminology_data = copy.deepcopy(self._ruleset.terminology)
+        self._acronym_index: Optional[AcronymIndex] = None
         self.defined_acronyms: Dict[str, str] = {}
         self.used_acronyms: Set[str] = set()
         # Precompute a set of common roman numerals (1-50) to avoid false
@@ -49,8 +135,7 @@ class TerminologyManager:
         logger.info("Initialized TerminologyManager")
         self.definition_pattern = re.compile(r"\b([\w\s&]+?)\s*\((\b[A-Z]{2,}\b)\)")
         self.usage_pattern = re.compile(r"(?<!\()\b[A-Za-z]{2,}\b(?!\s*[:.]\s*)")
-        ignore_patterns_raw = self.terminology_data.get("patterns", {}).get("ignore_patterns", [])
-        self.ignored_patterns = [re.compile(pattern) for pattern in ignore_patterns_raw]
+        self.ignored_patterns = list(self._ruleset.acronym_ignore_patterns)
         self._initialized = True
 
     def _validate_config(self) -> None:
@@ -61,41 +146,26 @@ class TerminologyManager:
                 raise ValueError(f"Missing required section '{section}' in terminology.json")
         logger.debug("Configuration validation passed")
 
-    def _load_terminology(self) -> Dict[str, Any]:
-        """Load terminology data from JSON file.
+    def _apply_ruleset(self, ruleset: RuleSet) -> None:
+        """Switch to the terminology data and matchers of ``ruleset``."""
+        self._ruleset = ruleset
+        self.terminology_file = Path(ruleset.paths["terminology"])
+        self.terminology_data = copy.deepcopy(ruleset.terminology)
+        self.ignored_patterns = list(ruleset.acronym_ignore_patterns)
+        self._acronym_index = None
+        self._validate_config()
 
-        Returns:
-            Dictionary containing all terminology data
-        """
-        try:
-            with open(self.terminology_file, "r") as f:
-                data: Dict[str, Any] = json.load(f)
-                return data
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Terminology file not found at {self.terminology_file}")
-        except json.JSONDecodeError:
-            raise ValueError(f"Invalid JSON in terminology file at {self.terminology_file}")
+    def _sync_ruleset(self) -> None:
+        """Pick up a rule set that was swapped in since the last check."""
+        ruleset = get_ruleset()
+        if ruleset.version != self._ruleset.version:
+            logger.info("Terminology rules changed; switching to rule set %s", ruleset.version[:12])
+            self._apply_ruleset(ruleset)
 
     @lru_cache(maxsize=1000)
     def _is_valid_word(self, word: str) -> bool:
-        """Cached check for valid words."""
-        return word in self._load_valid_words()
-
-    def _load_valid_words(self) -> Set[str]:
-        """Load valid words from a file (one word per line, both cases)."""
-        valid_words_file = Path(__file__).parent.parent.parent / "valid_words.txt"
-        try:
-            with open(valid_words_file, "r") as f:
-                words = set()
-                for word in f:
-                    word = word.strip()
-                    if word:
-                        words.add(word.upper())  # Add uppercase version
-                        words.add(word.lower())  # Add lowercase version
-                return words
-        except FileNotFoundError:
-            logger.warning(f"Valid words file not found at {valid_words_file}")
-            return set()
+        """Cached check for valid words (the word list holds both cases of each word)."""
+        return word in (word.lower(), word.upper()) and word.lower() in self._ruleset.valid_words
 
     @staticmethod
     def _generate_roman_numerals(limit: int) -> Set[str]:
@@ -133,28 +203,59 @@ class TerminologyManager:
 
     def check_text(self, text: str) -> DocumentCheckResult:
         """Check text for acronym definitions and usage."""
+        return self.check_windows(lambda: (text,))
+
+    def check_windows(self, windows: Callable[[], Iterable[str]]) -> DocumentCheckResult:
+        """Check a document supplied as consecutive windows of text.
+
+        ``windows`` is called twice and must yield the same windows each time,
+        each window holding whole lines: the first pass collects the acronym
+        definitions of the whole document, the second classifies usages
+        against them. Only the definitions and the set of used acronyms are
+        kept between windows.
+        """
         logger.debug("--- Acronym check start ---")
-        logger.debug(f"Text to check: {text}")
 
         # Don't ignore the entire text if it happens to contain an
         # ignored pattern.  Instead, handle the skip logic for each
         # potential acronym so valid issues elsewhere are still
         # reported.
 
+        self._sync_ruleset()
+
         # Initialize tracking variables
         check_state = self._initialize_check_state()
 
         # Process definitions and usages
-        self._process_definitions(text, check_state)
-        self._process_usages(text, check_state)
+        for process in (self._process_definitions, self._process_usages):
+            check_state["line_base"] = 0
+            for text in windows():
+                check_state["line_breaks"] = None
+                process(text, check_state)
+                check_state["line_base"] += text.count("\n") + 1
 
         # Check for unused acronyms
         issues = self._check_unused_acronyms(check_state)
 
-        logger.debug(f"Final state - issues: {issues}")
+        logger.debug("Acronym check found %d issues", len(issues))
         logger.debug("--- Acronym check end ---")
         return DocumentCheckResult(success=len(issues) == 0, issues=issues)
 
+    @property
+    def acronym_index(self) -> AcronymIndex:
+        """Case-folded acronym and valid-word lookups for the loaded ruleset.
+
+        The index is shared with the rule set unless :meth:`add_custom_acronym`
+        changed the acronym lists, in which case it is rebuilt for this manager.
+        """
+        if self._acronym_index is None:
+            ruleset = self._ruleset
+            if self.get_all_acronyms() == ruleset.derive("acronyms", _ruleset_acronyms):
+                self._acronym_index = ruleset.derive("acronym_index", _build_acronym_index)
+            else:
+                self._acronym_index = AcronymIndex(self.get_all_acronyms(), ruleset.valid_words)
+        return self._acronym_index
+
     def _should_ignore_text(self, text: str) -> bool:
         """Check if text should be ignored based on patterns."""
         for pattern in self.ignored_patterns:
@@ -168,99 +269,116 @@ class TerminologyManager:
         return {
             "issues": [],
             "issue_keys": set(),
-            "defined_acronyms": set(),
+            "definitions": DefinitionIndex(),
             "used_acronyms": set(),
-            "defined_acronyms_info": {},
-            "all_known_acronyms": self.get_all_acronyms(),
-            "valid_words": set(w.lower() for w in self._load_valid_words()),
             "unused_candidates": set(),
+            "line_breaks": None,
+            "line_base": 0,
         }
 
+    @staticmethod
+    def _line_number(text: str, offset: int, check_state: Dict[str, Any]) -> int:
+        """Return the 1-based document line of ``offset`` in the current window."""
+        if check_state["line_breaks"] is None:
+            check_state["line_breaks"] = [m.start() for m in re.finditer("\n", text)]
+        return check_state["line_base"] + bisect_left(check_state["line_breaks"], offset) + 1
+
     def _process_definitions(self, text: str, check_state: Dict[str, Any]) -> None:
         """Process acronym definitions in the text."""
-        logger.debug("Processing definitions...")
-
         for match in self.definition_pattern.finditer(text):
             definition = match.group(1).strip()
             acronym = match.group(2)
             full_text = match.group(0)
 
-            if self._should_skip_acronym(acronym, full_text, "definition"):
+            if self._should_skip_acronym(acronym, full_text):
                 continue
 
-            logger.debug(f"Found definition: '{definition}' ({acronym})")
             self._handle_acronym_definition(
                 acronym, definition, full_text, match, text, check_state
             )
 
-        logger.debug(
-            f"After definition processing - defined_acronyms: {check_state['defined_acronyms']}"
-        )
-        logger.debug(
-            f"After definition processing - unused_candidates: {check_state['unused_candidates']}"
-        )
+        logger.debug("Found %d acronym definitions", len(check_state["definitions"].definitions))
 
     def _process_usages(self, text: str, check_state: Dict[str, Any]) -> None:
         """Process acronym usages in the text."""
-        logger.debug("Processing usages...")
+        used = check_state["used_acronyms"]
+        for token in self.scan_acronyms(text, check_state["definitions"]):
+            if token.kind == ACRONYM_UNDEFINED:
+                self._report_undefined_acronym(token, text, check_state)
+            if token.kind != ACRONYM_IGNORED:
+                used.add(token.canonical)
+
+        logger.debug("Found %d used acronyms", len(used))
+
+    def scan_acronyms(
+        self, text: str, definitions: Optional[DefinitionIndex] = None
+    ) -> Iterator[AcronymToken]:
+        """Classify every candidate acronym usage in ``text`` in a single pass.
+
+        Tokens matching an acronym defined in ``definitions`` are ``defined``,
+        tokens matching a standard or custom acronym are ``standard`` and
+        remaining all-uppercase tokens are ``undefined``. Skipped tokens
+        (ignore patterns, roman numerals, valid words, lowercase words) are
+        ``ignored``; a skipped token that was itself defined still counts as
+        ``defined`` so its definition is not reported as unused.
+
+        Args:
+            text: The text to scan
+            definitions: Acronyms defined in the document, if already collected
 
+        Yields:
+            AcronymToken for each word matched by the usage pattern
+        """
+        rules = self.acronym_index
+        defined = definitions if definitions is not None else DefinitionIndex()
         for match in self.usage_pattern.finditer(text):
-            acronym = match.group(0)
+            token = match.group(0)
+            start, end = match.span()
             # Provide some surrounding context so ignored patterns that span
             # beyond the acronym itself can be detected.
-            context_window = text[max(0, match.start() - 20) : match.end() + 20]
-
-            if self._should_skip_acronym(acronym, context_window, "usage"):
-                # If we skip due to an ignore pattern but the acronym was
-                # previously defined, consider it used so the definition is
-                # not flagged as unused later.
-                if acronym in check_state["defined_acronyms"]:
-                    check_state["used_acronyms"].add(acronym)
+            if self._should_skip_acronym(token, text[max(0, start - 20) : end + 20]):
+                kind = ACRONYM_DEFINED if token in defined else ACRONYM_IGNORED
+                yield AcronymToken(token, token, kind, start, end)
                 continue
 
-            if self._handle_acronym_usage(acronym, match, text, check_state):
+            if token.lower() in rules.valid_words:
+                yield AcronymToken(token, token, ACRONYM_IGNORED, start, end)
                 continue
 
-        logger.debug(
-            f"After usage processing - defined_acronyms: {check_state['defined_acronyms']}"
-        )
-        logger.debug(f"After usage processing - used_acronyms: {check_state['used_acronyms']}")
+            canonical = defined.resolve(token)
+            if canonical is not None:
+                yield AcronymToken(token, canonical, ACRONYM_DEFINED, start, end)
+                continue
 
-    def _should_skip_acronym(self, acronym: str, full_text: str, context: str) -> bool:
-        """Check if an acronym should be skipped."""
-        logger.debug(f"Processing {context} - acronym: {acronym}, length: {len(acronym)}")
-        logger.debug(f"Full text of match: {full_text}")
+            canonical = rules.resolve(token)
+            if canonical is not None:
+                yield AcronymToken(token, canonical, ACRONYM_STANDARD, start, end)
+                continue
+
+            # Only all-uppercase words that matched nothing above are acronyms.
+            kind = ACRONYM_UNDEFINED if token.isupper() else ACRONYM_IGNORED
+            yield AcronymToken(token, token, kind, start, end)
 
+    def _should_skip_acronym(self, acronym: str, full_text: str) -> bool:
+        """Check if an acronym should be skipped."""
         # Skip long acronyms immediately
         if len(acronym) >= 10:
-            logger.debug(f"Skipping long acronym {context}: {acronym} (length: {len(acronym)})")
             return True
 
         # Skip common roman numerals (e.g. "II", "III") to avoid false positives
         if acronym in self.roman_numerals:
-            logger.debug(f"Skipping roman numeral {context}: {acronym}")
             return True
 
         # Skip "Washington, DC" style location references
-        if acronym == "DC" and re.search(r"Washington", full_text):
-            logger.debug("Skipping location reference for DC")
+        if acronym == "DC" and "Washington" in full_text:
             return True
 
         # Skip references to USC without periods to avoid false positives
         if acronym == "USC":
-            logger.debug("Skipping unpunctuated USC reference")
             return True
 
         # Check if the full context matches any ignored patterns
-        for pattern in self.ignored_patterns:
-            if pattern.search(full_text):
-                logger.debug(
-                    f"Skipping ignored pattern {context}: {full_text} "
-                    f"(matches pattern: {pattern.pattern})"
-                )
-                return True
-
-        return False
+        return any(pattern.search(full_text) for pattern in self.ignored_patterns)
 
     def _handle_acronym_definition(
         self,
@@ -272,32 +390,26 @@ class TerminologyManager:
         check_state: Dict[str, Any],
     ) -> None:
         """Handle processing of an acronym definition."""
-        all_known_acronyms = check_state["all_known_acronyms"]
-
-        if acronym in all_known_acronyms:
+        standard_def = self.acronym_index.acronyms.get(acronym)
+        if standard_def is not None:
             self._validate_standard_definition(
-                acronym, definition, full_text, match, text, check_state
+                acronym, definition, standard_def, full_text, match, text, check_state
             )
 
-        # Add to tracking sets
-        check_state["defined_acronyms"].add(acronym)
-        check_state["defined_acronyms_info"][acronym] = definition
+        check_state["definitions"].add(acronym, definition)
         check_state["unused_candidates"].add(acronym)
 
-        status = "standard" if acronym in all_known_acronyms else "non-standard"
-        logger.debug(f"Added '{acronym}' to defined_acronyms and unused_candidates ({status})")
-
     def _validate_standard_definition(
         self,
         acronym: str,
         definition: str,
+        standard_def: str,
         full_text: str,
         match: re.Match[str],
         text: str,
         check_state: Dict[str, Any],
     ) -> None:
         """Validate a standard acronym definition."""
-        standard_def = check_state["all_known_acronyms"][acronym]
 
         def _strip_leading_article(value: str) -> str:
             stripped = value.strip()
@@ -313,89 +425,27 @@ class TerminologyManager:
                 {
                     "type": "acronym_definition",
                     "message": f"Acronym '{acronym}' defined with non-standard definition",
-                    "line": text[: match.start()].count("\n") + 1,
+                    "line": self._line_number(text, match.start(), check_state),
                     "context": full_text,
                     "category": "acronym",
                 },
             )
 
-    def _handle_acronym_usage(
-        self, acronym: str, match: re.Match[str], text: str, check_state: Dict[str, Any]
-    ) -> bool:
-        """Handle processing of an acronym usage. Returns True if processing should continue."""
-        # Skip if it's a valid word (case-insensitive)
-        if acronym.lower() in check_state["valid_words"]:
-            logger.debug(f"Skipping valid word usage: {acronym}")
-            return True
-
-        # Try case-insensitive matching with defined acronyms
-        if self._try_match_defined_acronym(acronym, check_state):
-            return True
-
-        # Try case-insensitive matching with known acronyms
-        if self._try_match_known_acronym(acronym, check_state):
-            return True
-
-        # Only consider all-uppercase usages as valid acronym usages if not already matched
-        if not acronym.isupper():
-            logger.debug(f"Skipping non-uppercase usage: {acronym}")
-            return True
-
-        # Check if acronym is defined or in all known acronyms
-        self._validate_acronym_usage(acronym, match, text, check_state)
-        check_state["used_acronyms"].add(acronym)
-        logger.debug(f"Added '{acronym}' to used_acronyms")
-        return False
-
-    def _try_match_defined_acronym(self, acronym: str, check_state: Dict[str, Any]) -> bool:
-        """Try to match acronym with defined acronyms (case-insensitive)."""
-        defined_lower = {a.lower(): a for a in check_state["defined_acronyms"]}
-        logger.debug(
-            f"Case-insensitive match for {acronym} against defined acronyms: {defined_lower}"
-        )
-
-        if acronym.lower() in defined_lower:
-            original_case = defined_lower[acronym.lower()]
-            logger.debug(f"Found case-insensitive match: {acronym} -> {original_case}")
-            check_state["used_acronyms"].add(original_case)
-            logger.debug(f"Added {original_case} to used_acronyms")
-            return True
-        return False
-
-    def _try_match_known_acronym(self, acronym: str, check_state: Dict[str, Any]) -> bool:
-        """Try to match acronym with known acronyms (case-insensitive)."""
-        known_lower = {a.lower(): a for a in check_state["all_known_acronyms"]}
-        logger.debug(f"Case-insensitive match for {acronym} against known acronyms: {known_lower}")
-
-        if acronym.lower() in known_lower:
-            original_case = known_lower[acronym.lower()]
-            logger.debug(
-                f"Found case-insensitive match in known acronyms: {acronym} -> {original_case}"
-            )
-            check_state["used_acronyms"].add(original_case)
-            logger.debug(f"Added {original_case} to used_acronyms")
-            return True
-        return False
-
-    def _validate_acronym_usage(
-        self, acronym: str, match: re.Match[str], text: str, check_state: Dict[str, Any]
+    def _report_undefined_acronym(
+        self, token: AcronymToken, text: str, check_state: Dict[str, Any]
     ) -> None:
-        """Validate that an acronym usage is properly defined."""
-        if (
-            acronym not in check_state["defined_acronyms"]
-            and acronym not in check_state["all_known_acronyms"]
-        ):
-            logger.warning(f"Undefined acronym found: {acronym}")
-            self._add_issue(
-                check_state,
-                {
-                    "type": "acronym_usage",
-                    "message": f"Confirm '{acronym}' was defined at its first use",
-                    "line": text[: match.start()].count("\n") + 1,
-                    "context": match.group(0),
-                    "category": "acronym",
-                },
-            )
+        """Report an uppercase acronym that is neither defined nor known."""
+        logger.warning(f"Undefined acronym found: {token.token}")
+        self._add_issue(
+            check_state,
+            {
+                "type": "acronym_usage",
+                "message": f"Confirm '{token.token}' was defined at its first use",
+                "line": self._line_number(text, token.start, check_state),
+                "context": token.token,
+                "category": "acronym",
+            },
+        )
 
     def _check_unused_acronyms(self, check_state: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Check for unused acronyms and return all issues."""
@@ -422,7 +472,7 @@ class TerminologyManager:
                     "type": "acronym_usage",
                     "message": f"Acronym '{acronym}' is defined but never used",
                     "line": 1,
-                    "context": f"{check_state['defined_acronyms_info'][acronym]} ({acronym})",
+                    "context": f"{check_state['definitions'].definitions[acronym]} ({acronym})",
                     "category": "acronym",
                 },
             )
@@ -463,6 +513,7 @@ class TerminologyManager:
             raise ValueError(f"'{acronym}' is a standard acronym and cannot be redefined")
 
         self.terminology_data["acronyms"]["custom"][acronym] = definition
+        self._acronym_index = None
 
     def get_all_acronyms(self) -> Dict[str, str]:
         """Get all acronym definitions.
@@ -554,9 +605,8 @@ class TerminologyManager:
         return None
 
     def load_config(self) -> None:
-        """Reload the configuration from the config file."""
-        # Reload the config file
-        self.terminology_data = self._load_terminology()
+        """Reload the configuration from the rule sources."""
+        self._apply_ruleset(refresh_ruleset(force=True))
         # Update the internal state with the new config
         self.defined_acronyms = {}
         self.used_acronyms.clear()
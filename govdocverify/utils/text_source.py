@@ -0,0 +1,118 @@
+"""Plain-text and Markdown files read through a memory map.
+
+:class:`TextFile` stands in for the file's content wherever a raw string is
+accepted as a document source. Its encoding is detected from a prefix of
+the file, and iterating it decodes the mapped bytes chunk by chunk with an
+incremental decoder, yielding lines with ``str.splitlines`` semantics, so
+the paragraph stream never holds more than one chunk of the file as text.
+
+Files without a byte order mark are read as UTF-8 unless their prefix is not
+valid UTF-8, in which case they are read as latin-1. Invalid UTF-8 found
+after the prefix is decoded byte by byte as latin-1, which is what reading
+the whole file as latin-1 would have produced for those bytes.
+"""
+
+import codecs
+import mmap
+import os
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+CHUNK_SIZE = 1 << 20
+PREFIX_SIZE = 1 << 16
+
+_LATIN1_FALLBACK = "govdocverify.latin-1"
+
+# Longest byte order marks first: the UTF-32-LE mark starts with the UTF-16-LE one.
+_BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+def _latin1_fallback(error: UnicodeError) -> tuple:
+    if not isinstance(error, UnicodeDecodeError):
+        raise error
+    return error.object[error.start : error.end].decode("latin-1"), error.end
+
+
+codecs.register_error(_LATIN1_FALLBACK, _latin1_fallback)
+
+
+def detect_encoding(prefix: bytes, truncated: bool = False) -> str:
+    """Return the encoding of a file starting with ``prefix``.
+
+    ``truncated`` tells that the file continues after ``prefix``, so a
+    multi-byte character may be cut off at its end.
+    """
+    for bom, encoding in _BOMS:
+        if prefix.startswith(bom):
+            return encoding
+    try:
+        prefix.decode("utf-8")
+    except UnicodeDecodeError as exc:
+        cut_off = exc.reason == "unexpected end of data" and exc.end == len(prefix)
+        if not (truncated and cut_off):
+            return "latin-1"
+    return "utf-8"
+
+
+class TextFile:
+    """A plain-text file used as a document source.
+
+    Iterating yields the file's lines without their line breaks, as
+    ``read().splitlines()`` would, while reading at most ``chunk_size``
+    bytes ahead.
+    """
+
+    def __init__(self, path: str, chunk_size: int = CHUNK_SIZE) -> None:
+        self.path = path
+        self.chunk_size = chunk_size
+        self._encoding: Optional[str] = None
+
+    def __repr__(self) -> str:
+        return f"TextFile({self.path!r})"
+
+    @contextmanager
+    def _mapped(self) -> Iterator[Optional[mmap.mmap]]:
+        with open(self.path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:  # empty files cannot be mapped
+                yield None
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped
+
+    @property
+    def encoding(self) -> str:
+        """Encoding detected from the first :data:`PREFIX_SIZE` bytes."""
+        if self._encoding is None:
+            with self._mapped() as mapped:
+                size = len(mapped) if mapped is not None else 0
+                prefix = mapped[:PREFIX_SIZE] if mapped is not None else b""
+                self._encoding = detect_encoding(prefix, truncated=size > PREFIX_SIZE)
+        return self._encoding
+
+    def read(self) -> str:
+        """Return the whole decoded content."""
+        with self._mapped() as mapped:
+            if mapped is None:
+                return ""
+            return str(mapped, self.encoding, _LATIN1_FALLBACK)
+
+    def __iter__(self) -> Iterator[str]:
+        decoder = codecs.getincrementaldecoder(self.encoding)(_LATIN1_FALLBACK)
+        with self._mapped() as mapped:
+            pending = ""
+            size = len(mapped) if mapped is not None else 0
+            for start in range(0, size, self.chunk_size):
+                chunk = mapped[start : start + self.chunk_size]
+                lines = (pending + decoder.decode(chunk)).splitlines(True)
+                # The last line may continue in the next chunk (or be a "\r"
+                # whose "\n" does), so it is carried over.
+                pending = lines.pop() if lines else ""
+                for line in lines:
+                    yield line.splitlines()[0]
+            yield from (pending + decoder.decode(b"", final=True)).splitlines()
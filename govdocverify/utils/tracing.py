@@ -0,0 +1,201 @@
+"""Request-scoped tracing spans without a tracing backend.
+
+:func:`start_trace` opens a :class:`Trace` for one request and
+:func:`trace_span` records a nested span in the trace of the current
+context, timing the enclosed block; outside a trace it does nothing. Spans
+carry attributes such as the document type, size, paragraph count and
+issue count, set when the span opens or later with
+:func:`set_span_attributes`.
+
+A finished trace can be rendered as a ``Server-Timing`` header value and is
+appended as one line of OTLP/JSON (the shape OpenTelemetry collectors read
+from files) to the file named by ``GOVDOCVERIFY_TRACE_FILE``, when set.
+Nothing is sent over the network.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+TRACE_FILE_ENV = "GOVDOCVERIFY_TRACE_FILE"
+SERVICE_NAME = "govdocverify"
+
+# OTLP span kinds and status codes.
+KIND_INTERNAL = 1
+KIND_SERVER = 2
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+_current: ContextVar[Optional[Tuple["Trace", "Span"]]] = ContextVar(
+    "govdocverify_span", default=None
+)
+_FILE_LOCK = threading.Lock()
+_NOT_TOKEN = re.compile(r"[^!#$%&'*+\-.^_`|~0-9A-Za-z]")
+
+
+class Span:
+    """One timed operation of a trace."""
+
+    def __init__(
+        self,
+        name: str,
+        parent: Optional["Span"] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+        kind: int = KIND_INTERNAL,
+    ) -> None:
+        self.name = name
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent.span_id if parent is not None else None
+        self.kind = kind
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.start_ns = time.time_ns()
+        self._started = time.perf_counter_ns()
+        self.duration_ns: Optional[int] = None
+        self.error: Optional[str] = None
+
+    def set(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    def end(self) -> None:
+        self.duration_ns = time.perf_counter_ns() - self._started
+
+    @property
+    def elapsed_ms(self) -> float:
+        """Duration in milliseconds, up to now while the span is open."""
+        duration = self.duration_ns
+        if duration is None:
+            duration = time.perf_counter_ns() - self._started
+        return duration / 1e6
+
+    def to_otlp(self, trace_id: str) -> Dict[str, Any]:
+        duration = self.duration_ns if self.duration_ns is not None else 0
+        span: Dict[str, Any] = {
+            "traceId": trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.start_ns + duration),
+            "attributes": [_attribute(k, v) for k, v in self.attributes.items() if v is not None],
+            "status": (
+                {"code": STATUS_ERROR, "message": self.error}
+                if self.error is not None
+                else {"code": STATUS_OK}
+            ),
+        }
+        if self.parent_id is not None:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+
+def _attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
+
+
+class Trace:
+    """The spans recorded for one request, in the order they started."""
+
+    def __init__(self) -> None:
+        self.trace_id = os.urandom(16).hex()
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def add(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def server_timing(self) -> str:
+        """Return the spans as a ``Server-Timing`` header value."""
+        return ", ".join(
+            f"{_NOT_TOKEN.sub('_', span.name)};dur={span.elapsed_ms:.1f}" for span in self.spans
+        )
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """Return the trace as an OTLP/JSON ``ExportTraceServiceRequest``."""
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": [_attribute("service.name", SERVICE_NAME)]},
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": __name__},
+                            "spans": [span.to_otlp(self.trace_id) for span in self.spans],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    def export(self, path: Optional[str] = None) -> Optional[str]:
+        """Append the trace as one JSON line to ``path`` or ``GOVDOCVERIFY_TRACE_FILE``."""
+        path = path or os.getenv(TRACE_FILE_ENV)
+        if not path:
+            return None
+        line = json.dumps(self.to_otlp(), separators=(",", ":"))
+        try:
+            with _FILE_LOCK, open(path, "a", encoding="utf-8") as fh:
+                fh.write(line + "\n")
+        except OSError as exc:
+            logger.warning(f"Could not write trace to {path}: {exc}")
+            return None
+        return path
+
+
+@contextmanager
+def _open_span(trace: Trace, span: Span) -> Iterator[Span]:
+    trace.add(span)
+    token = _current.set((trace, span))
+    try:
+        yield span
+    except BaseException as exc:
+        span.error = f"{type(exc).__name__}: {exc}"
+        raise
+    finally:
+        span.end()
+        _current.reset(token)
+
+
+@contextmanager
+def start_trace(name: str, **attributes: Any) -> Iterator[Trace]:
+    """Record a new trace whose root span covers the enclosed block, then export it."""
+    trace = Trace()
+    try:
+        with _open_span(trace, Span(name, attributes=attributes, kind=KIND_SERVER)):
+            yield trace
+    finally:
+        trace.export()
+
+
+@contextmanager
+def trace_span(name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    """Record the enclosed block as a child of the current span, if there is a trace."""
+    current = _current.get()
+    if current is None:
+        yield None
+        return
+    trace, parent = current
+    with _open_span(trace, Span(name, parent, attributes)) as span:
+        yield span
+
+
+def set_span_attributes(**attributes: Any) -> None:
+    """Set attributes on the current span, if there is a trace."""
+    current = _current.get()
+    if current is not None:
+        current[1].set(**attributes)
@@ -0,0 +1,150 @@
+"""Sorted, memory-mappable word list with hashed membership tests.
+
+A ``frozenset`` of 25k words costs every process a few megabytes of string
+and hash-table objects, and reference count updates on those objects keep
+forked workers from sharing the pages. :class:`WordTable` instead keeps the
+lowercased words as one sorted UTF-8 blob plus an offset array and an
+open-addressing hash index keyed on CRC-32. Published to
+a file with :meth:`WordTable.publish` and opened with :meth:`WordTable.open`,
+the table is a read-only memory map: every process that opens the same file
+shares the page cache copy and no per-word Python objects exist.
+
+File layout (native byte order, the file is a machine-local cache)::
+
+    magic | count | slot count | offsets ((count + 1) x uint32)
+          | slots (slot count x uint32, word index + 1 or 0) | words
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import tempfile
+import zlib
+from array import array
+from collections.abc import Set
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional, Tuple, Union
+
+MAGIC = b"GDVWORD2"
+_HEADER = struct.Struct("=8sII")
+
+
+def _encode(words: Iterable[str]) -> bytes:
+    encoded = sorted({word.encode("utf-8") for word in words})
+    offsets = array("I", [0])
+    for word in encoded:
+        offsets.append(offsets[-1] + len(word))
+    # Power-of-two slot count at most half full keeps probe chains short.
+    mask = (1 << max(3, (2 * len(encoded)).bit_length())) - 1
+    slots = array("I", bytes(4 * (mask + 1)))
+    for index, word in enumerate(encoded):
+        slot = zlib.crc32(word) & mask
+        while slots[slot]:
+            slot = (slot + 1) & mask
+        slots[slot] = index + 1
+    header = _HEADER.pack(MAGIC, len(encoded), mask + 1)
+    return header + offsets.tobytes() + slots.tobytes() + b"".join(encoded)
+
+
+class WordTable(Set):
+    """Read-only set of words stored in one sorted buffer.
+
+    Lookups are exact: callers lowercase words before building the table and
+    before testing membership, as they did with the ``frozenset`` it replaces.
+    """
+
+    def __init__(self, buffer: Union[bytes, mmap.mmap], path: Optional[Path] = None) -> None:
+        magic, count, slots = _HEADER.unpack_from(buffer)
+        if magic != MAGIC:
+            raise ValueError("Not a word table")
+        self._buffer = buffer
+        self._path = path
+        self._count = count
+        self._mask = slots - 1
+        view = memoryview(buffer)
+        start = _HEADER.size
+        slots_start = start + (count + 1) * 4
+        self._data_start = slots_start + slots * 4
+        self._offsets = view[start:slots_start].cast("I")
+        self._slots = view[slots_start : self._data_start].cast("I")
+
+    @classmethod
+    def from_words(cls, words: Iterable[str]) -> "WordTable":
+        """Build an in-memory table from ``words``."""
+        return cls(_encode(words))
+
+    @classmethod
+    def open(cls, path: Union[str, Path]) -> "WordTable":
+        """Memory-map the table published at ``path``.
+
+        Raises:
+            OSError: If the file cannot be opened
+            ValueError: If the file is not a word table
+        """
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(mapped, Path(path))
+
+    @classmethod
+    def publish(cls, words: Iterable[str], path: Union[str, Path]) -> "WordTable":
+        """Write ``words`` to ``path`` unless a table is already there, then map it.
+
+        The file is written atomically, so concurrent publishers of the same
+        content simply replace each other's identical file. An existing file
+        with another layout is replaced.
+        """
+        path = Path(path)
+        if path.is_file():
+            try:
+                return cls.open(path)
+            except ValueError:  # left behind by an older layout; rewrite it
+                pass
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".words-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_encode(words))
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        return cls.open(path)
+
+    @property
+    def path(self) -> Optional[Path]:
+        """File backing the table, ``None`` for in-memory tables."""
+        return self._path
+
+    def _word(self, index: int) -> bytes:
+        base = self._data_start
+        return self._buffer[base + self._offsets[index] : base + self._offsets[index + 1]]
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str):
+            return False
+        key = word.encode("utf-8")
+        slot = zlib.crc32(key) & self._mask
+        while entry := self._slots[slot]:
+            if self._word(entry - 1) == key:
+                return True
+            slot = (slot + 1) & self._mask
+        return False
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(self._count):
+            yield self._word(index).decode("utf-8")
+
+    def __hash__(self) -> int:
+        return self._hash()
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # File-backed tables pickle as their path, so unpickling attaches to
+        # the shared mapping instead of carrying a copy of the words.
+        if self._path is not None:
+            return (WordTable.open, (str(self._path),))
+        return (WordTable, (bytes(self._buffer),))
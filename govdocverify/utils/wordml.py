@@ -0,0 +1,142 @@
+"""Minimal WordprocessingML readers shared by the paragraph stream and table.
+
+These helpers work on raw lxml elements and reproduce what python-docx
+reports through its proxy objects (``Paragraph.text``, ``Run.text``,
+``Paragraph.style.name``) without creating a proxy per access.
+"""
+
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from docx.styles import BabelFish
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+P = f"{W}p"
+R = f"{W}r"
+HYPERLINK = f"{W}hyperlink"
+BODY = f"{W}body"
+
+_FALSE = ("0", "false", "off")
+
+
+def run_text(run: Any) -> str:
+    """Return the text of a ``w:r`` element as python-docx ``Run.text`` does."""
+    parts = []
+    for child in run:
+        tag = child.tag
+        if tag == f"{W}t":
+            parts.append(child.text or "")
+        elif tag in (f"{W}tab", f"{W}ptab"):
+            parts.append("\t")
+        elif tag == f"{W}br":
+            parts.append("\n" if child.get(f"{W}type", "textWrapping") == "textWrapping" else "")
+        elif tag == f"{W}cr":
+            parts.append("\n")
+        elif tag == f"{W}noBreakHyphen":
+            parts.append("-")
+    return "".join(parts)
+
+
+def paragraph_text(paragraph: Any) -> str:
+    """Return the text of a ``w:p`` element as python-docx ``Paragraph.text`` does."""
+    parts = []
+    for child in paragraph:
+        if child.tag == R:
+            parts.append(run_text(child))
+        elif child.tag == HYPERLINK:
+            parts.extend(run_text(run) for run in child if run.tag == R)
+    return "".join(parts)
+
+
+def is_on(element: Any) -> bool:
+    """Return ``True`` for a present on/off property such as ``w:b`` or ``w:i``."""
+    return element is not None and element.get(f"{W}val", "true").lower() not in _FALSE
+
+
+def is_on_attr(value: Optional[str]) -> bool:
+    """Return ``True`` for an ``ST_OnOff`` attribute value."""
+    return value is not None and value.lower() not in _FALSE
+
+
+def paragraph_style_id(paragraph: Any) -> Optional[str]:
+    """Return the ``w:pStyle`` id of a ``w:p`` element, if any."""
+    style = paragraph.find(f"{W}pPr/{W}pStyle")
+    return style.get(f"{W}val") if style is not None else None
+
+
+def _int_val(element: Any) -> Optional[int]:
+    if element is None:
+        return None
+    try:
+        return int(element.get(f"{W}val", ""))
+    except ValueError:
+        return None
+
+
+def paragraph_properties(ppr: Any) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+    """Return ``(outline level, numId, ilvl)`` set directly on a ``w:pPr``."""
+    if ppr is None:
+        return None, None, None
+    return (
+        _int_val(ppr.find(f"{W}outlineLvl")),
+        _int_val(ppr.find(f"{W}numPr/{W}numId")),
+        _int_val(ppr.find(f"{W}numPr/{W}ilvl")),
+    )
+
+
+class StyleInfo(NamedTuple):
+    """Resolved paragraph style: UI name plus inherited outline level and numbering."""
+
+    name: Optional[str]
+    outline_level: Optional[int] = None
+    num_id: Optional[int] = None
+    ilvl: Optional[int] = None
+
+
+class StyleMap:
+    """Paragraph style lookup over a ``w:styles`` element.
+
+    Unknown, missing or non-paragraph style ids resolve to the default
+    paragraph style, as ``Paragraph.style`` does. Outline level and numbering
+    are inherited along the ``w:basedOn`` chain.
+    """
+
+    def __init__(self, styles: Any = None) -> None:
+        self._elements: Dict[str, Any] = {}
+        self._default: Any = None
+        self._resolved: Dict[Optional[str], Optional[StyleInfo]] = {}
+        for style in styles.iterchildren(f"{W}style") if styles is not None else ():
+            style_id = style.get(f"{W}styleId")
+            self._elements.setdefault(style_id, style)
+            if self._is_paragraph(style) and is_on_attr(style.get(f"{W}default")):
+                self._default = style
+
+    @staticmethod
+    def _is_paragraph(style: Any) -> bool:
+        return style.get(f"{W}type", "paragraph") == "paragraph"
+
+    def resolve(self, style_id: Optional[str]) -> Optional[StyleInfo]:
+        """Return the :class:`StyleInfo` a paragraph with ``style_id`` gets."""
+        if style_id not in self._resolved:
+            element = self._elements.get(style_id) if style_id is not None else None
+            if element is None or not self._is_paragraph(element):
+                element = self._default
+            self._resolved[style_id] = None if element is None else self._info(element)
+        return self._resolved[style_id]
+
+    def _info(self, element: Any) -> StyleInfo:
+        name_el = element.find(f"{W}name")
+        name = name_el.get(f"{W}val") if name_el is not None else None
+        outline = num_id = ilvl = None
+        seen = set()
+        while element is not None and id(element) not in seen:
+            seen.add(id(element))
+            level, style_num, style_ilvl = paragraph_properties(element.find(f"{W}pPr"))
+            outline = level if outline is None else outline
+            num_id = style_num if num_id is None else num_id
+            ilvl = style_ilvl if ilvl is None else ilvl
+            based_on = element.find(f"{W}basedOn")
+            element = self._elements.get(based_on.get(f"{W}val")) if based_on is not None else None
+        return StyleInfo(
+            None if name is None else BabelFish.internal2ui(name), outline, num_id, ilvl
+        )
@@ -7,6 +7,15 @@ returns a non-zero exit code if any document fails or raises an
 exception. The implementation is intentionally lightweight so that it
 can be imported from tests without requiring the ``scripts`` directory to
 be installed as a package.
+
+With a cache directory (``--cache-dir`` or ``GOVDOCVERIFY_CI_CACHE``), each
+document's verdict is stored under its git blob id and a fingerprint of the
+rule set, document type and checker (package version, installed plugins and
+redirect table). CI can persist the directory between pipelines; a document
+whose content and rules are unchanged is then not processed again, and its
+stored verdict decides the ``STRICT_MODE`` exit code as a fresh run would.
+Runs cut short by a time budget are never cached, and in ``STRICT_MODE`` a
+timed-out check fails the batch.
 """
 
 from __future__ import annotations
@@ -14,15 +23,133 @@ from __future__ import annotations
 import argparse
 import fnmatch
 import glob
+import hashlib
+import json
+import logging
 import os
 import subprocess
+import tempfile
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Any, Iterable, Sequence
 
 from govdocverify.cli import process_document
+from govdocverify.utils.fingerprint import checker_fingerprint
+from govdocverify.utils.ruleset import get_ruleset
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_ENV = "GOVDOCVERIFY_CI_CACHE"
+# Bump when the stored verdict layout changes so old entries are ignored.
+CACHE_FORMAT = 2
+
+
+def blob_ids(paths: Sequence[str]) -> dict[str, str]:
+    """Return the git blob id of each file in ``paths``.
+
+    ``git hash-object`` computes the ids in one call, applying the
+    repository's clean filters; without git they are computed directly.
+    """
+    if not paths:
+        return {}
+    try:
+        result = subprocess.run(
+            ["git", "hash-object", "--stdin-paths"],
+            input="\n".join(paths),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        ids = result.stdout.split()
+        if len(ids) == len(paths):
+            return dict(zip(paths, ids))
+    except (OSError, subprocess.CalledProcessError):
+        pass
+    return {path: _blob_id(path) for path in paths}
+
+
+def _blob_id(path: str) -> str:
+    data = Path(path).read_bytes()
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def ruleset_fingerprint(doc_type: str) -> str:
+    """Return a digest of everything besides the document that decides a verdict."""
+    parts = [str(CACHE_FORMAT), get_ruleset().version, doc_type, checker_fingerprint()]
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+class ResultCache:
+    """Directory of stored verdicts keyed by blob id and rule set fingerprint."""
+
+    def __init__(self, directory: str | Path, fingerprint: str) -> None:
+        self.directory = Path(directory)
+        self.fingerprint = fingerprint
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, blob_id: str) -> Path:
+        key = hashlib.sha256(f"{blob_id}\0{self.fingerprint}".encode()).hexdigest()
+        return self.directory / key[:2] / f"{key}.json"
 
+    def get(self, blob_id: str) -> dict[str, Any] | None:
+        try:
+            verdict = json.loads(self._path(blob_id).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return verdict
 
-def run_batch(patterns: Iterable[str], doc_type: str) -> int:
+    def put(self, blob_id: str, verdict: dict[str, Any]) -> None:
+        path = self._path(blob_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Written aside and renamed, so concurrent jobs never read a partial entry.
+        with tempfile.NamedTemporaryFile(
+            "w", dir=path.parent, suffix=".tmp", delete=False, encoding="utf-8"
+        ) as tmp:
+            json.dump(verdict, tmp)
+        os.replace(tmp.name, path)
+
+
+def _verdict(result: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "has_errors": bool(result.get("has_errors", False)),
+        "severity": result.get("severity"),
+    }
+
+
+def _partial_failures(result: dict[str, Any]) -> list[dict[str, Any]]:
+    """Return the check categories that did not complete, e.g. on a time budget."""
+    return list((result.get("by_category") or {}).get("partial_failures") or [])
+
+
+def _fails_strict(verdict: dict[str, Any]) -> bool:
+    severity = str(verdict.get("severity", "")).upper()
+    return bool(verdict.get("has_errors", False)) and severity in {"ERROR", "HIGH"}
+
+
+def _check_file(
+    file_path: str, doc_type: str, cache: ResultCache | None, blob_id: str | None
+) -> tuple[dict[str, Any], bool]:
+    """Return the verdict for ``file_path`` and whether a check timed out.
+
+    A verdict is only cached when every check category completed, so a run
+    degraded by a time budget is repeated by the next pipeline.
+    """
+    verdict = cache.get(blob_id) if cache is not None else None
+    if verdict is not None:
+        return verdict, False
+    result = process_document(file_path, doc_type)
+    verdict = _verdict(result)
+    failures = _partial_failures(result)
+    if failures:
+        logger.warning(f"{file_path}: {len(failures)} check categories did not complete")
+    elif cache is not None:
+        cache.put(blob_id, verdict)
+    return verdict, any(failure.get("timeout") for failure in failures)
+
+
+def run_batch(patterns: Iterable[str], doc_type: str, cache_dir: str | Path | None = None) -> int:
     """Process all files matching ``patterns``.
 
     Parameters
@@ -31,6 +158,9 @@ def run_batch(patterns: Iterable[str], doc_type: str) -> int:
         An iterable of file paths or glob patterns to process.
     doc_type:
         The document type understood by :func:`govdocverify.cli.process_document`.
+    cache_dir:
+        Optional directory of cached verdicts. Files whose verdict is cached
+        for their blob id and the current rule set are not processed.
 
     Returns
     -------
@@ -39,20 +169,26 @@ def run_batch(patterns: Iterable[str], doc_type: str) -> int:
         document produced errors or raised an exception.
     """
     strict_mode = os.getenv("STRICT_MODE") not in {None, "0", "false", "False"}
+    # ``glob`` expands both explicit files and patterns. Sorting ensures
+    # deterministic ordering which simplifies testing.
+    files = [path for pattern in patterns for path in sorted(glob.glob(pattern))]
+    cache = ids = None
+    if cache_dir is not None:
+        cache = ResultCache(cache_dir, ruleset_fingerprint(doc_type))
+        ids = blob_ids(files)
     exit_code = 0
-    for pattern in patterns:
-        # ``glob`` expands both explicit files and patterns. Sorting ensures
-        # deterministic ordering which simplifies testing.
-        for file_path in sorted(glob.glob(pattern)):
-            try:
-                result = process_document(file_path, doc_type)
-                if strict_mode:
-                    severity = str(result.get("severity", "")).upper()
-                    if result.get("has_errors", False) and severity in {"ERROR", "HIGH"}:
-                        exit_code = 1
-                # In non-strict mode we ignore result issues unless an exception occurs
-            except Exception:
+    for file_path in files:
+        try:
+            verdict, timed_out = _check_file(
+                file_path, doc_type, cache, ids[file_path] if ids is not None else None
+            )
+            # In non-strict mode we ignore result issues unless an exception occurs
+            if strict_mode and (timed_out or _fails_strict(verdict)):
                 exit_code = 1
+        except Exception:
+            exit_code = 1
+    if cache is not None:
+        logger.info(f"Result cache: {cache.hits} hits, {cache.misses} misses")
     return exit_code
 
 
@@ -106,14 +242,20 @@ def main() -> int:  # pragma: no cover - exercised via tests
         help="Glob pattern used with --changed-from to filter files",
     )
     parser.add_argument("--type", required=True, help="Document type to check")
+    parser.add_argument(
+        "--cache-dir",
+        default=os.getenv(CACHE_DIR_ENV),
+        help=f"Directory of cached verdicts to reuse and update (default ${CACHE_DIR_ENV})",
+    )
     args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
 
     if args.files:
         targets = args.files
     else:
         targets = get_changed_files(args.changed_from, [args.pattern])
 
-    return run_batch(targets, args.type)
+    return run_batch(targets, args.type, args.cache_dir)
 
 
 if __name__ == "__main__":  # pragma: no cover - CLI entry point
@@ -20,3 +20,14 @@ def managers():
 
     tm = TerminologyManager()
     return FormatChecks(tm), FormattingChecker(tm)
+
+
+@pytest.fixture(autouse=True)
+def _reset_check_cache():
+    """Keep identical uploads in different tests from reusing each other's results."""
+    yield
+    api = sys.modules.get("backend.api")
+    if api is not None:
+        with api._RENDERED_LOCK:
+            api._CHECKED.clear()
+            api._RENDERED.clear()
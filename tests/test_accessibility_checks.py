@@ -19,6 +19,23 @@ from tests.test_base import TestBase
 logger = logging.getLogger(__name__)
 
 
+def _add_hyperlink(paragraph, text, url):
+    """Append an external ``w:hyperlink`` with ``text`` to ``paragraph``."""
+    from docx.opc.constants import RELATIONSHIP_TYPE as RT
+    from docx.oxml import OxmlElement
+    from docx.oxml.ns import qn
+
+    r_id = paragraph.part.relate_to(url, RT.HYPERLINK, is_external=True)
+    hyperlink = OxmlElement("w:hyperlink")
+    hyperlink.set(qn("r:id"), r_id)
+    run = OxmlElement("w:r")
+    text_el = OxmlElement("w:t")
+    text_el.text = text
+    run.append(text_el)
+    hyperlink.append(run)
+    paragraph._p.append(hyperlink)
+
+
 @pytest.fixture
 def accessibility_checks():
     return AccessibilityChecks()
@@ -580,24 +597,57 @@ class TestAccessibilityChecks(TestBase):
 
     def test_check_hyperlinks_with_document(self):
         """Test _check_hyperlinks with Document content containing non-descriptive links."""
-        mock_run = Mock()
-        mock_run._element = Mock()
-        mock_run._element.xpath.return_value = [True]
-        mock_run.text = "click here"
-        mock_paragraph = Mock()
-        mock_paragraph.runs = [mock_run]
-        mock_paragraph.text = "Some paragraph text"
-        mock_document = Mock(spec=Document)
-        mock_document.paragraphs = [mock_paragraph]
+        doc = Document()
+        paragraph = doc.add_paragraph("For details ")
+        _add_hyperlink(paragraph, "click here", "https://www.example.gov/details")
         mock_results = DocumentCheckResult()
 
-        self.accessibility_checks._check_hyperlinks(mock_document, mock_results)
+        self.accessibility_checks._check_hyperlinks(doc, mock_results)
 
         self.assertFalse(mock_results.success)
         self.assertEqual(len(mock_results.issues), 1)
         self.assertIn("Non-descriptive link text", mock_results.issues[0]["message"])
         self.assertEqual(mock_results.issues[0]["severity"], Severity.WARNING)
 
+    def test_deprecated_hyperlink_target_behind_link_text(self):
+        """Deprecated targets are caught even when the link text is descriptive."""
+        doc = Document()
+        doc.add_paragraph("Intro")
+        paragraph = doc.add_paragraph("See the ")
+        _add_hyperlink(paragraph, "Regulatory Library", "https://rgl.faa.gov/index.html")
+        _add_hyperlink(doc.add_paragraph(), "rgl.faa.gov", "https://rgl.faa.gov")
+
+        result = self.accessibility_checks.check_document(doc, "ORDER")
+
+        messages = [i["message"] for i in result.issues if i["severity"] == Severity.ERROR]
+        assert messages == [
+            "Change URL from 'rgl.faa.gov' to 'https://drs.faa.gov'.",
+            "Change the target of link 'Regulatory Library' from "
+            "'https://rgl.faa.gov/index.html' to 'https://drs.faa.gov'.",
+        ]
+
+    def test_hyperlink_index_records_targets_and_offsets(self):
+        """Hyperlinks are indexed with relationship targets and text offsets."""
+        from govdocverify.utils.link_utils import build_hyperlink_index
+
+        doc = Document()
+        doc.add_paragraph("No links")
+        paragraph = doc.add_paragraph("Visit ")
+        _add_hyperlink(paragraph, "FAA", "https://www.faa.gov")
+        paragraph.add_run(" today")
+
+        index = build_hyperlink_index(doc.paragraphs)
+
+        assert len(index) == 1
+        link = index.by_paragraph[1][0]
+        assert (link.text, link.target, link.start, link.end) == (
+            "FAA",
+            "https://www.faa.gov",
+            6,
+            9,
+        )
+        assert doc.paragraphs[1].text[link.start : link.end] == "FAA"
+
     def test_unknown_paragraph_style_triggers_heading_issue(self):
         """VR-02: paragraphs with non-whitelisted styles are flagged."""
         doc = Document()
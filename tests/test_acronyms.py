@@ -8,7 +8,7 @@ import pytest
 
 from govdocverify.checks.acronym_checks import AcronymChecker
 from govdocverify.models import DocumentCheckResult
-from govdocverify.utils.terminology_utils import TerminologyManager
+from govdocverify.utils.terminology_utils import DefinitionIndex, TerminologyManager
 
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
@@ -504,6 +504,40 @@ class TestAcronyms(unittest.TestCase):
 
         self.assert_issue_contains(result, "Acronym 'NTSB' is defined but never used")
 
+    def test_scan_acronyms_classifies_tokens(self):
+        """Each candidate is classified as defined, standard, undefined or ignored."""
+        definitions = DefinitionIndex()
+        definitions.add("EPA", "Environmental Protection Agency")
+        tokens = {
+            t.token: (t.kind, t.canonical)
+            for t in self.terminology_manager.scan_acronyms(
+                "The EPA met the FAA, Epa and XQZ in Section II", definitions
+            )
+        }
+        self.assertEqual(tokens["EPA"], ("defined", "EPA"))
+        self.assertEqual(tokens["Epa"], ("defined", "EPA"))
+        self.assertEqual(tokens["FAA"], ("standard", "FAA"))
+        self.assertEqual(tokens["XQZ"], ("undefined", "XQZ"))
+        self.assertEqual(tokens["II"][0], "ignored")
+        self.assertEqual(tokens["met"][0], "ignored")
+
+    def test_acronym_index_rebuilt_after_custom_acronym(self):
+        """The precomputed index is reused across checks and refreshed on changes."""
+        manager = self.terminology_manager
+        index = manager.acronym_index
+        self.assertIs(manager.acronym_index, index)
+        self.assertFalse(manager.check_text("The QZX is new").success)
+
+        custom = manager.terminology_data["acronyms"]["custom"]
+        try:
+            manager.add_custom_acronym("QZX", "Quartz Zone Exchange")
+            self.assertIsNot(manager.acronym_index, index)
+            self.assertEqual(manager.acronym_index.resolve("qzx"), "QZX")
+            self.assertTrue(manager.check_text("The QZX is new").success)
+        finally:
+            custom.pop("QZX", None)
+            manager._acronym_index = None
+
     def assert_issue_contains(self, result: DocumentCheckResult, message: str):
         """Helper method to check if result contains an issue with the given message."""
         self.assertTrue(
@@ -0,0 +1,38 @@
+# pytest -v tests/test_app.py
+
+import json
+from unittest.mock import patch
+
+from docx import Document
+
+from app import process_document
+from govdocverify.models import VisibilitySettings
+
+
+def _memo(tmp_path):
+    path = tmp_path / "memo.docx"
+    doc = Document()
+    doc.add_paragraph("This memo has a date of 1/2/2024.")
+    doc.save(path)
+    return str(path)
+
+
+@patch("app.ResultFormatter.format_results", return_value="report")
+def test_process_document_renders_lazily(mock_format, tmp_path):
+    """The app formats its HTML report only when ``rendered`` is requested."""
+    result = process_document(_memo(tmp_path), "ADVISORY_CIRCULAR", VisibilitySettings())
+    data = json.loads(json.dumps(result))
+    assert "rendered" not in data
+    assert "by_category" in data
+    assert not result.is_rendered
+    mock_format.assert_not_called()
+
+    assert result["rendered"] == "report"
+    mock_format.assert_called_once()
+
+
+@patch("app._run_checks", side_effect=PermissionError)
+def test_process_document_error_is_rendered(mock_run, tmp_path):
+    result = process_document(_memo(tmp_path), "ADVISORY_CIRCULAR", VisibilitySettings())
+    assert result["has_errors"]
+    assert "Permission denied" in result["rendered"]
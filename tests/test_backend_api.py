@@ -4,6 +4,7 @@ import pytest
 from fastapi.testclient import TestClient
 
 from backend.main import app
+from govdocverify.cli import RenderedResult
 from govdocverify.utils.security import RateLimiter, rate_limiter
 
 
@@ -162,6 +163,30 @@ def test_process_idempotent(monkeypatch):
     assert first == second
 
 
+def test_process_render_cache_separates_document_types(monkeypatch):
+    """Identical results checked as other document types get their own report."""
+    client = TestClient(app)
+
+    def proc(tmp_path, doc_type, *_, **__):
+        data = {"has_errors": False, "by_category": {}}
+        return RenderedResult(data, render=lambda: f"{doc_type} report", write=None)
+
+    monkeypatch.setattr("backend.api.process_document", proc)
+    monkeypatch.setattr("backend.api.validate_file", lambda *a, **k: None)
+
+    def send(doc_type):
+        return client.post(
+            "/process",
+            files={"doc_file": ("x.docx", b"ok")},
+            data={"doc_type": doc_type},
+        ).json()
+
+    order, circular = send("ORDER"), send("ADVISORY_CIRCULAR")
+    assert order["rendered"] == "ORDER report"
+    assert circular["rendered"] == "ADVISORY_CIRCULAR report"
+    assert order["result_id"] != circular["result_id"]
+
+
 def test_process_concurrent_requests(monkeypatch):
     """API-04: concurrent requests finish successfully."""
     client = TestClient(app)
@@ -254,3 +279,63 @@ def test_download_from_disk(monkeypatch):
         bapi._RESULTS.clear()
     resp2 = client.get(f"/results/{result_id}.pdf")
     assert resp2.status_code == 200
+
+
+def test_rendered_report_cached_per_result_and_grouping(monkeypatch):
+    """Identical lazy results are rendered once per ``group_by``."""
+    from govdocverify.cli import RenderedResult
+
+    client = TestClient(app)
+    monkeypatch.setattr("backend.api.validate_file", lambda *a, **k: None)
+    calls: list[str] = []
+
+    def proc(tmp_path, doc_type, vis, group_by="category"):
+        def render() -> str:
+            calls.append(group_by)
+            return f"report-{group_by}"
+
+        data = {"has_errors": False, "by_category": {"cache": {"x": {"issues": []}}}}
+        return RenderedResult(data, render=render, write=lambda stream: 0)
+
+    monkeypatch.setattr("backend.api.process_document", proc)
+    ids = set()
+    for group_by in ("category", "category", "severity"):
+        resp = client.post(
+            "/process",
+            files={"doc_file": ("x.docx", b"ok")},
+            data={"doc_type": "AC", "group_by": group_by},
+        )
+        assert resp.json()["rendered"] == f"report-{group_by}"
+        ids.add(resp.json()["result_id"])
+
+    assert calls == ["category", "severity"]
+    assert len(ids) == 1
+
+
+def test_repeated_upload_is_not_checked_again(monkeypatch):
+    """A repeat of an upload with the same options reuses the earlier check."""
+    client = TestClient(app)
+    monkeypatch.setattr("backend.api.validate_file", lambda *a, **k: None)
+    calls: list[bytes] = []
+
+    def proc(tmp_path, doc_type, vis, group_by="category"):
+        with open(tmp_path, "rb") as fh:
+            calls.append(fh.read())
+        data = {"has_errors": False, "by_category": {"cache": {"x": {"issues": []}}}}
+        return RenderedResult(data, render=lambda: "report", write=lambda stream: 0)
+
+    monkeypatch.setattr("backend.api.process_document", proc)
+
+    def post(content: bytes, doc_type: str = "AC"):
+        return client.post(
+            "/process", files={"doc_file": ("x.docx", content)}, data={"doc_type": doc_type}
+        )
+
+    first = post(b"ok").json()
+    again = post(b"ok").json()
+    assert again == first
+    assert calls == [b"ok"]
+
+    post(b"changed")
+    post(b"ok", doc_type="Order")
+    assert calls == [b"ok", b"changed", b"ok"]
@@ -1,5 +1,6 @@
 # pytest -v tests/test_check_registry.py --log-cli-level=DEBUG
 
+import copy
 import logging
 
 import pytest
@@ -16,9 +17,14 @@ logger = logging.getLogger(__name__)
 @pytest.fixture(autouse=True)
 def clear_registry() -> None:
     """Ensure registry state does not leak between tests."""
+    saved = {
+        attr: copy.deepcopy(getattr(CheckRegistry, attr))
+        for attr in ("_checks", "_requirements", "_disabled")
+    }
     CheckRegistry.clear_registry()
     yield
-    CheckRegistry.clear_registry()
+    for attr, value in saved.items():
+        setattr(CheckRegistry, attr, value)
 
 
 def test_check_registration():
@@ -0,0 +1,121 @@
+"""Tests for declared check facets and the check scheduler."""
+
+import copy
+
+import pytest
+from docx import Document
+
+from govdocverify.checks.check_registry import CheckRegistry
+from govdocverify.checks.check_scheduler import CHECK_WORKERS_ENV, plan_checks
+from govdocverify.document_checker import FAADocumentChecker
+from govdocverify.utils.document_facets import DEFAULT_FACETS, DocumentFacets
+
+DOCX = "tests/test_data/valid_spacing.docx"
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Isolate registry mutations made by a test."""
+    for attr in ("_checks", "_requirements", "_disabled"):
+        monkeypatch.setattr(CheckRegistry, attr, copy.deepcopy(getattr(CheckRegistry, attr)))
+    return CheckRegistry
+
+
+def test_facets_are_built_lazily_and_once():
+    facets = DocumentFacets(["First line", "Second line"])
+    assert facets.computed == frozenset()
+
+    assert facets.text == "First line\nSecond line"
+    assert facets.paragraphs is facets.paragraphs
+    assert facets.computed == {"docx", "paragraphs", "text"}
+    assert not hasattr(facets, "sections")
+
+
+def test_plan_orders_facets_and_drops_disabled_requirements(registry):
+    @registry.register("demo", requires=("paragraphs",))
+    def check_demo():
+        pass
+
+    @registry.register("demo", requires=("sections", "part"))
+    def _check_demo_headers():
+        pass
+
+    plan = plan_checks([(object(), "demo"), (object(), "undeclared")])
+    assert plan.facet_levels == [["docx"], ["paragraphs", "part", "sections"], ["text"]]
+    assert plan.checks[1].requires == DEFAULT_FACETS
+
+    registry.set_enabled("demo", "_check_demo_headers", False)
+    assert _check_demo_headers() is None
+    assert "sections" not in plan_checks([(object(), "demo")]).facets
+
+    registry.set_enabled("demo", "check_demo", False)
+    assert plan_checks([(object(), "demo")]).checks == []
+
+
+def test_disabled_watermark_check_skips_header_facets(registry, monkeypatch):
+    checker = FAADocumentChecker()
+    views = []
+    load = checker._load_document
+
+    def capture(path):
+        views.append(load(path))
+        return views[-1]
+
+    monkeypatch.setattr(checker, "_load_document", capture)
+
+    checker.run_all_document_checks(DOCX, "Advisory Circular")
+    assert {"sections", "part"} <= views[-1].computed
+
+    registry.set_enabled("structure", "_check_watermark", False)
+    result = checker.run_all_document_checks(DOCX, "Advisory Circular")
+    assert not {"sections", "part"} & views[-1].computed
+    assert not result.partial_failures
+
+
+def test_reference_checks_declare_their_facets(registry, monkeypatch):
+    assert registry.get_requirements("formatting") == {"paragraph_table", "cross_references"}
+
+    checker = FAADocumentChecker()
+    views = []
+    load = checker._load_document
+
+    def capture(path):
+        views.append(load(path))
+        return views[-1]
+
+    monkeypatch.setattr(checker, "_load_document", capture)
+    checker.run_all_document_checks(DOCX, "Advisory Circular")
+    assert "cross_references" in views[-1].computed
+    assert "text" not in views[-1].computed
+
+
+def test_parallel_workers_match_sequential_results(monkeypatch):
+    checker = FAADocumentChecker()
+    sequential = checker.run_all_document_checks(DOCX, "Advisory Circular")
+    monkeypatch.setenv(CHECK_WORKERS_ENV, "4")
+    parallel = checker.run_all_document_checks(DOCX, "Advisory Circular")
+    assert parallel.issues == sequential.issues
+    assert list(parallel.per_check_results) == list(sequential.per_check_results)
+
+
+def test_failing_category_is_reported_once(monkeypatch):
+    checker = FAADocumentChecker()
+
+    def fail(doc, doc_type):
+        raise RuntimeError("broken")
+
+    monkeypatch.setattr(checker.structure_checks, "check_document", fail)
+    result = checker.run_all_document_checks(DOCX, "Advisory Circular")
+
+    assert len(CheckRegistry.get_checks_for_category("structure")) > 1
+    assert list(result.per_check_results["structure"]) == ["run_checks"]
+    assert [f["category"] for f in result.partial_failures] == ["structure"]
+
+
+def test_docx_facet_reads_the_file_as_it_is_now(tmp_path):
+    path = str(tmp_path / "memo.docx")
+    for text in ("First draft.", "Second draft."):
+        doc = Document()
+        doc.add_paragraph(text)
+        doc.save(path)
+        assert DocumentFacets(path).text == text
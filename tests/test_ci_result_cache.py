@@ -0,0 +1,132 @@
+"""Tests for the blob id keyed result cache of the CI batch script."""
+
+from __future__ import annotations
+
+import importlib.util
+import subprocess
+from pathlib import Path
+
+import pytest
+
+CI_BATCH_PATH = Path(__file__).resolve().parents[1] / "scripts" / "ci_batch.py"
+
+
+@pytest.fixture
+def ci_batch():
+    spec = importlib.util.spec_from_file_location("ci_batch", CI_BATCH_PATH)
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def calls(ci_batch, monkeypatch):
+    processed = []
+
+    def fake_process(path, _doc_type):
+        processed.append(Path(path).name)
+        return {"has_errors": True, "severity": "ERROR"}
+
+    monkeypatch.setattr(ci_batch, "process_document", fake_process)
+    return processed
+
+
+def test_blob_ids_match_git(ci_batch, tmp_path):
+    path = tmp_path / "a.docx"
+    path.write_bytes(b"doc1\n")
+    expected = subprocess.run(
+        ["git", "hash-object", str(path)], capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+    assert ci_batch.blob_ids([str(path)]) == {str(path): expected}
+    assert ci_batch._blob_id(str(path)) == expected
+
+
+def test_cache_hits_skip_processing_and_replay_strict_verdict(
+    ci_batch, calls, tmp_path, monkeypatch
+):
+    cache = tmp_path / "cache"
+    (tmp_path / "a.docx").write_text("doc1")
+    (tmp_path / "b.docx").write_text("doc2")
+    pattern = str(tmp_path / "*.docx")
+    monkeypatch.setenv("STRICT_MODE", "1")
+
+    assert ci_batch.run_batch([pattern], "ORDER", cache) == 1
+    assert calls == ["a.docx", "b.docx"]
+
+    assert ci_batch.run_batch([pattern], "ORDER", cache) == 1
+    assert calls == ["a.docx", "b.docx"]
+
+    monkeypatch.delenv("STRICT_MODE")
+    assert ci_batch.run_batch([pattern], "ORDER", cache) == 0
+
+    # New content is a new blob; the unchanged file still hits.
+    (tmp_path / "b.docx").write_text("doc2 updated")
+    ci_batch.run_batch([pattern], "ORDER", cache)
+    assert calls == ["a.docx", "b.docx", "b.docx"]
+
+
+def test_fingerprint_separates_document_types_and_rule_sets(ci_batch, calls, tmp_path):
+    cache = tmp_path / "cache"
+    (tmp_path / "a.docx").write_text("doc1")
+    files = [str(tmp_path / "a.docx")]
+
+    ci_batch.run_batch(files, "ORDER", cache)
+    ci_batch.run_batch(files, "ADVISORY_CIRCULAR", cache)
+    assert calls == ["a.docx", "a.docx"]
+
+    fingerprint = ci_batch.ruleset_fingerprint("ORDER")
+    stale = ci_batch.ResultCache(cache, fingerprint.replace(fingerprint[0], "x"))
+    assert stale.get(ci_batch.blob_ids(files)[files[0]]) is None
+    assert ci_batch.ResultCache(cache, fingerprint).get(ci_batch._blob_id(files[0])) == {
+        "has_errors": True,
+        "severity": "ERROR",
+    }
+
+
+def test_runs_cut_short_by_a_budget_are_not_cached(ci_batch, tmp_path, monkeypatch):
+    processed = []
+
+    def degraded(path, _doc_type):
+        processed.append(Path(path).name)
+        failure = {"category": "formatting", "timeout": True, "scope": "document"}
+        return {
+            "has_errors": True,
+            "severity": None,
+            "by_category": {"partial_failures": [failure]},
+        }
+
+    monkeypatch.setattr(ci_batch, "process_document", degraded)
+    monkeypatch.setenv("STRICT_MODE", "1")
+    cache = tmp_path / "cache"
+    (tmp_path / "a.docx").write_text("doc1")
+    files = [str(tmp_path / "a.docx")]
+
+    assert ci_batch.run_batch(files, "ORDER", cache) == 1
+    assert ci_batch.run_batch(files, "ORDER", cache) == 1
+    assert processed == ["a.docx", "a.docx"]
+    assert not list(cache.rglob("*.json"))
+
+
+def test_fingerprint_covers_plugins_and_redirect_table(ci_batch, tmp_path, monkeypatch):
+    from importlib.metadata import EntryPoint
+
+    from govdocverify.plugins import loader
+    from govdocverify.utils.link_utils import REDIRECT_TABLE_ENV
+
+    monkeypatch.setattr(loader, "_MANAGER", loader.PluginManager(plugin_entry_points=[]))
+    baseline = ci_batch.ruleset_fingerprint("ORDER")
+
+    table = tmp_path / "redirects.csv"
+    table.write_text("old,new\nhttps://legacy.faa.gov/*,https://drs.faa.gov\n")
+    monkeypatch.setenv(REDIRECT_TABLE_ENV, str(table))
+    with_table = ci_batch.ruleset_fingerprint("ORDER")
+    table.write_text("old,new\nhttps://legacy.faa.gov/*,https://www.faa.gov\n")
+    edited = ci_batch.ruleset_fingerprint("ORDER")
+
+    plugin = EntryPoint("hazmat", "acme_rules.hazmat:HazmatPlugin", loader.ENTRY_POINT_GROUP)
+    monkeypatch.setattr(loader, "_MANAGER", loader.PluginManager(plugin_entry_points=[plugin]))
+    with_plugin = ci_batch.ruleset_fingerprint("ORDER")
+
+    assert len({baseline, with_table, edited, with_plugin}) == 4
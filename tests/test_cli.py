@@ -40,6 +40,37 @@ class TestCLI:
         assert isinstance(result["by_category"], dict)
         assert "metadata" in result
 
+    @patch("govdocverify.cli.ResultFormatter.format_results")
+    @patch("govdocverify.processing.FAADocumentChecker")
+    def test_process_document_renders_lazily(self, mock_checker, mock_format):
+        """The report is only formatted when ``rendered`` is requested."""
+        import json
+
+        mock_result = type(
+            "MockResult",
+            (),
+            {
+                "success": False,
+                "issues": [],
+                "partial_failures": [],
+                "per_check_results": {
+                    "format": {"general": {"issues": [{"message": "Bad date"}]}},
+                },
+            },
+        )()
+        mock_checker.return_value.run_all_document_checks.return_value = mock_result
+        mock_format.return_value = "report"
+
+        result = process_document("test.docx", "ADVISORY_CIRCULAR")
+        data = json.loads(json.dumps(result))
+        assert "rendered" not in data
+        assert data["summary"]["total"] == 1
+        mock_format.assert_not_called()
+
+        assert result["rendered"] == "report"
+        assert result.get("rendered") == "report"
+        mock_format.assert_called_once()
+
     @patch("govdocverify.cli.process_document")
     def test_main_success(self, mock_process):
         mock_process.return_value = {"has_errors": False, "rendered": "", "by_category": {}}
@@ -0,0 +1,82 @@
+"""Tests for comparing two versions of a document."""
+
+import json
+import sys
+from collections import Counter
+
+from govdocverify import cli
+from govdocverify.comparison import ParagraphAlignment, classify_issues, compare_documents
+from govdocverify.document_checker import FAADocumentChecker
+from govdocverify.utils.text_source import TextFile
+
+OLD = [
+    "The applicant must submit the form.",
+    "Pilots shall file a flight plan.",
+    "This paragraph stays the same.",
+    "Operators shall keep records.",
+    "Closing remarks.",
+]
+NEW = [
+    "The applicant must submit the form.",
+    "Pilots must file a flight plan.",
+    "This paragraph stays the same.",
+    "A new sentence says the operator shall notify the FAA.",
+    "Operators shall keep records.",
+    "Closing remarks.",
+]
+
+
+def _write(path, lines):
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return str(path)
+
+
+def _key(issue):
+    return (issue.get("category"), issue.get("message"), issue.get("line_number"))
+
+
+def test_alignment_anchors_unchanged_and_changed_paragraphs():
+    alignment = ParagraphAlignment.from_texts(OLD, NEW)
+
+    assert alignment.changed == frozenset({1, 3})
+    assert alignment.old_line(5) == 4 and alignment.old_line(2) is None
+    assert alignment.anchor(2, old=False) == alignment.anchor(2, old=True)
+
+    old = [{"category": "x", "severity": 1, "message": "Fix line 4", "line_number": 4}]
+    new = [
+        {"category": "x", "severity": 1, "message": "Fix line 5", "line_number": 5},
+        {"category": "x", "severity": 1, "message": "Fix line 4", "line_number": 4},
+    ]
+    added, resolved, persisting = classify_issues(old, new, alignment)
+    assert persisting == [new[0]] and added == [new[1]] and resolved == []
+
+
+def test_compare_matches_a_full_check_of_the_new_version(tmp_path):
+    old_path = _write(tmp_path / "old.txt", OLD)
+    new_path = _write(tmp_path / "new.txt", NEW)
+    checker = FAADocumentChecker()
+
+    comparison = compare_documents(old_path, new_path, "ORDER", checker=checker)
+    full = checker.run_all_document_checks(TextFile(new_path), "ORDER")
+
+    reported = comparison.new_issues + comparison.persisting_issues
+    assert Counter(map(_key, reported)) == Counter(map(_key, full.issues))
+    assert comparison.paragraphs == {"old": 5, "new": 6, "unchanged": 4, "changed": 2}
+    # "shall" was rewritten in paragraph 2 and added in paragraph 4.
+    assert any(issue["line_number"] == 4 for issue in comparison.new_issues)
+    assert any(issue["line_number"] == 2 for issue in comparison.resolved_issues)
+
+
+def test_compare_subcommand_reports_json_and_exit_code(tmp_path, monkeypatch, capsys):
+    old_path = _write(tmp_path / "old.txt", OLD)
+    new_path = _write(tmp_path / "new.txt", NEW)
+    argv = ["govdocverify", "compare", "--old", old_path, "--type", "ORDER", "--json"]
+
+    monkeypatch.setattr(sys, "argv", [*argv, "--new", new_path])
+    assert cli.main() == 1
+    data = json.loads(capsys.readouterr().out.splitlines()[-1])
+    assert data["summary"]["new"] == len(data["new"]) > 0
+
+    monkeypatch.setattr(sys, "argv", [*argv, "--new", old_path])
+    assert cli.main() == 0
+    assert json.loads(capsys.readouterr().out.splitlines()[-1])["summary"]["new"] == 0
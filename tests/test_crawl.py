@@ -0,0 +1,162 @@
+"""Tests for the resumable corpus crawl and its manifest."""
+
+import json
+import os
+import shutil
+
+import pytest
+from docx import Document
+
+from backend import api
+from govdocverify.cli import process_document
+from govdocverify.crawl import CrawlManifest, RuleChange, crawl, might_contain, word_filter
+from govdocverify.utils import ruleset as rs
+from govdocverify.utils.link_utils import REDIRECT_TABLE_ENV
+from govdocverify.utils.terminology_utils import TerminologyManager
+from tests.test_notes_index import _add_parts, _notes_part, _reference
+
+DOCUMENTS = {
+    "a/memo.txt": "The applicant must submit the form.\n",
+    "a/zeppelin.txt": "Moor the zeppelin at the mast.\n",
+    "b/notes.txt": "Operators keep records.\n",
+}
+
+
+@pytest.fixture
+def rules_dir(tmp_path, monkeypatch):
+    rules = tmp_path / "rules"
+    rules.mkdir()
+    shutil.copy(rs.SOURCE_FILES["terminology_rules"], rules / "terminology_rules.py")
+    monkeypatch.setenv(rs.RULES_DIR_ENV, str(rules))
+    monkeypatch.setenv(rs.RULESET_CACHE_ENV, "off")
+    rs.set_ruleset(None)
+    yield rules
+    monkeypatch.delenv(rs.RULES_DIR_ENV)
+    rs.set_ruleset(None)
+    TerminologyManager().load_config()
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "docs"
+    for name, text in DOCUMENTS.items():
+        (root / name).parent.mkdir(parents=True, exist_ok=True)
+        (root / name).write_text(text, encoding="utf-8")
+    return root
+
+
+def _crawl(root, manifest):
+    return crawl(str(root), "ORDER", str(manifest), patterns=["*.txt"], workers=1)
+
+
+def test_crawl_resumes_and_skips_unchanged_files(tree, tmp_path):
+    manifest = tmp_path / "manifest.sqlite"
+    reports = []
+    stats = crawl(str(tree), "ORDER", str(manifest), ["*.txt"], workers=2, progress=reports.append)
+    assert (stats.found, stats.checked, stats.failed) == (3, 3, 0)
+    assert reports and reports[-1].eta == 0
+
+    again = _crawl(tree, manifest)
+    assert (again.skipped, again.queued) == (3, 0)
+
+    # A touched file is hashed and kept; an edited one is checked again.
+    memo = tree / "a" / "memo.txt"
+    os.utime(memo, ns=(0, memo.stat().st_mtime_ns + 1_000_000_000))
+    (tree / "b" / "notes.txt").write_text("Operators shall keep records.\n", encoding="utf-8")
+    assert _crawl(tree, manifest).queued == 1
+
+    stored = CrawlManifest(str(manifest))
+    entry = stored.entry(str(tree / "b" / "notes.txt"))
+    assert entry["ruleset_version"] == rs.get_ruleset().version
+    assert "shall" in str(stored.result(entry["result_id"])["by_category"])
+    stored.close()
+
+
+def test_crawl_result_ids_match_the_api(tree, tmp_path, monkeypatch):
+    monkeypatch.setattr(api, "_RESULTS_DIR", tmp_path)
+    manifest = tmp_path / "manifest.sqlite"
+    _crawl(tree, manifest)
+    path = str(tree / "a" / "memo.txt")
+    response = api._result_response(process_document(path, "ORDER"), "ORDER", "category")
+    stored = CrawlManifest(str(manifest))
+    assert stored.entry(path)["result_id"] == json.loads(response.body)["result_id"]
+    stored.close()
+
+
+def test_word_rule_change_rechecks_only_documents_with_the_word(tree, tmp_path, rules_dir):
+    manifest = tmp_path / "manifest.sqlite"
+    assert _crawl(tree, manifest).checked == 3
+
+    path = rules_dir / "terminology_rules.py"
+    path.write_text(
+        path.read_text().replace(
+            "FORBIDDEN_TERMS = {", 'FORBIDDEN_TERMS = {\n    "zeppelin": "Say airship",', 1
+        )
+    )
+    rs.set_ruleset(None)
+
+    stats = _crawl(tree, manifest)
+    assert (stats.skipped, stats.checked) == (2, 1)
+    stored = CrawlManifest(str(manifest))
+    entry = stored.entry(str(tree / "a" / "zeppelin.txt"))
+    assert "Say airship" in str(stored.result(entry["result_id"]))
+    stored.close()
+
+
+def test_word_rule_change_rechecks_documents_with_the_word_in_a_note(tree, tmp_path, rules_dir):
+    doc = Document()
+    _reference(doc.add_paragraph("Moor the airship at the mast."), "footnote", 1)
+    path = tree / "c" / "mast.docx"
+    path.parent.mkdir()
+    doc.save(str(path))
+    _add_parts(path, {"footnote": _notes_part("footnote", {1: "Formerly a zeppelin."})})
+    manifest = tmp_path / "manifest.sqlite"
+    crawl(str(tree), "ORDER", str(manifest), patterns=["*.docx"], workers=1)
+
+    rules = rules_dir / "terminology_rules.py"
+    rules.write_text(
+        rules.read_text().replace(
+            "FORBIDDEN_TERMS = {", 'FORBIDDEN_TERMS = {\n    "zeppelin": "Say airship",', 1
+        )
+    )
+    rs.set_ruleset(None)
+
+    stats = crawl(str(tree), "ORDER", str(manifest), patterns=["*.docx"], workers=1)
+    assert (stats.skipped, stats.checked) == (0, 1)
+    stored = CrawlManifest(str(manifest))
+    assert "Say airship" in str(stored.result(stored.entry(str(path))["result_id"]))
+    stored.close()
+
+
+def test_checker_change_rechecks_everything(tree, tmp_path, monkeypatch):
+    manifest = tmp_path / "manifest.sqlite"
+    assert _crawl(tree, manifest).checked == 3
+    assert _crawl(tree, manifest).skipped == 3
+
+    table = tmp_path / "redirects.csv"
+    table.write_text("old,new\nhttps://legacy.faa.gov/*,https://drs.faa.gov\n")
+    monkeypatch.setenv(REDIRECT_TABLE_ENV, str(table))
+    assert _crawl(tree, manifest).checked == 3
+    assert _crawl(tree, manifest).skipped == 3
+
+    # Entries of a manifest from before checker fingerprints are re-checked.
+    stored = CrawlManifest(str(manifest))
+    stored._db.execute("UPDATE documents SET checker = NULL")
+    stored.close()
+    assert _crawl(tree, manifest).checked == 3
+
+
+def test_rule_change_scope():
+    snapshot = {
+        "others": "a",
+        "word_rules": {"terminology_variants": {"email": ["e-mail"]}},
+        "valid_words": ["faa"],
+    }
+    bloom = word_filter({"send", "an", "e", "mail"})
+    assert might_contain(bloom, {"mail"}) and not might_contain(bloom, {"zeppelin"})
+
+    variant = {**snapshot, "word_rules": {"terminology_variants": {"email": ["e-mail", "E-Mail"]}}}
+    assert RuleChange(snapshot, variant).affects(bloom)
+    assert not RuleChange(snapshot, {**snapshot, "valid_words": ["faa", "ntsb"]}).affects(bloom)
+    assert RuleChange(snapshot, {**snapshot, "others": "b"}).affects(bloom)
+    assert RuleChange(None, snapshot).everything
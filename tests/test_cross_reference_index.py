@@ -0,0 +1,80 @@
+"""Tests for the cross-reference index shared by the structure and reference checks."""
+
+from docx import Document
+
+from govdocverify.checks.reference_checks import TableFigureReferenceCheck
+from govdocverify.checks.structure_checks import StructureChecks
+from govdocverify.utils.cross_references import (
+    APPENDIX,
+    FIGURE,
+    SECTION,
+    TABLE,
+    CrossReferenceIndex,
+    cross_reference_index_of,
+)
+from govdocverify.utils.document_facets import DocumentFacets
+
+
+def test_labels_references_and_resolution():
+    lines = [
+        "1.2 Scope",
+        "Table 2-1. Limits",
+        "See table 2-1 and Figure 3, as described in section 1.2 and paragraph 4.1.",
+        "Appendix A",
+        "Refer to Appendix A and Appendix B.",
+    ]
+    index = CrossReferenceIndex.from_lines(lines)
+
+    assert index.labels[SECTION] == {"1.2": 0}
+    assert index.labels[TABLE] == {"2-1": 1}
+    assert index.labels[APPENDIX] == {"A": 3}
+    caption = index.references_on(1, TABLE)[0]
+    assert caption.is_label
+    reference = index.references_on(2, TABLE)[0]
+    assert not reference.is_label
+    assert lines[2][reference.start : reference.end] == "table 2-1"
+    assert [(r.kind, r.key) for r in index.undefined()] == [
+        (FIGURE, "3"),
+        (SECTION, "4.1"),
+        (APPENDIX, "B"),
+    ]
+    assert index.unreferenced(TABLE) == []
+    assert index.unreferenced(SECTION) == []
+
+
+def test_offsets_map_through_ignored_characters():
+    line = 'As shown in "Table (5)", values vary.'
+    reference = CrossReferenceIndex.from_lines([line]).references_on(0, TABLE)[0]
+
+    assert reference.number == "5"
+    assert reference.text == "Table 5"
+    assert line[reference.start : reference.end] == "Table (5"
+
+
+def test_styled_sections_and_shared_facet(tmp_path):
+    doc = Document()
+    doc.add_paragraph("1 PURPOSE", style="Heading 1")
+    doc.add_paragraph("2 Not a heading")
+    doc.add_paragraph("Table 1. Data")
+    doc.add_paragraph("See section 2 and Table 1 and Table 4.")
+    path = tmp_path / "xref.docx"
+    doc.save(path)
+
+    index = cross_reference_index_of(Document(path))
+    assert set(index.labels[SECTION]) == {"1"}
+
+    facets = DocumentFacets(str(path))
+    assert cross_reference_index_of(facets) is cross_reference_index_of(facets)
+    issues = StructureChecks().check_cross_references(str(path)).issues
+    assert [issue["message"] for issue in issues] == [
+        "Referenced Table 4 not found in document",
+        "Reference to '2' not found. Please check this section exists: "
+        "'See section 2 and Table 1 and Table 4.'",
+    ]
+    shared = TableFigureReferenceCheck().check_document(facets, "ORDER")
+    direct = TableFigureReferenceCheck().check_text("\n".join(p.text for p in doc.paragraphs))
+    assert [i["correct_form"] for i in direct.issues] == ["table 1", "table 4"]
+    assert [
+        i["message"].endswith(f"to '{form}'")
+        for i, form in zip(shared.issues, ["table 1", "table 4"])
+    ] == [True, True]
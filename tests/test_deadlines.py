@@ -0,0 +1,129 @@
+"""Tests for check time budgets and cooperative cancellation."""
+
+import threading
+import time
+
+import pytest
+
+from govdocverify.checks.reference_checks import DocumentTitleFormatCheck
+from govdocverify.document_checker import FAADocumentChecker
+from govdocverify.models import DocumentCheckResult, Severity, VisibilitySettings
+from govdocverify.utils.deadlines import (
+    CHECK_TIMEOUT_ENV,
+    DOCUMENT_TIMEOUT_ENV,
+    CheckTimeout,
+    Deadline,
+    TimeBudgets,
+    deadline_scope,
+    raise_if_cancelled,
+)
+
+TITLE_LINE = 'See AC 25-1A, "Aircraft Design Guidance," dated 1/1/20'
+STALL_LINE = "See AC 1-1, " + '"x" ' * 40
+
+
+def test_budgets_from_env(monkeypatch):
+    monkeypatch.setenv(DOCUMENT_TIMEOUT_ENV, "30")
+    monkeypatch.setenv(CHECK_TIMEOUT_ENV, "10, formatting=2.5,bogus=x")
+    budgets = TimeBudgets.from_env()
+    assert budgets.document == 30
+    assert budgets.for_category("formatting") == 2.5
+    assert budgets.for_category("structure") == 10
+
+    monkeypatch.delenv(DOCUMENT_TIMEOUT_ENV)
+    monkeypatch.delenv(CHECK_TIMEOUT_ENV)
+    assert not TimeBudgets.from_env().enabled
+
+
+def test_nested_deadline_reports_expired_scope():
+    document = Deadline(0, "document")
+    category = Deadline(60, "structure", document)
+    with deadline_scope(category):
+        with pytest.raises(CheckTimeout) as info:
+            raise_if_cancelled(["partial"])
+    assert info.value.scope == "document"
+    assert info.value.partial == ["partial"]
+    raise_if_cancelled()  # no active deadline outside the scope
+
+
+def test_category_timeout_keeps_issues_found_before_cut_off(monkeypatch):
+    check_title = DocumentTitleFormatCheck._check_title_format
+
+    def slow_check_title(self, *args, **kwargs):
+        time.sleep(0.1)
+        return check_title(self, *args, **kwargs)
+
+    monkeypatch.setattr(DocumentTitleFormatCheck, "_check_title_format", slow_check_title)
+    checker = FAADocumentChecker()
+    checker.time_budgets = TimeBudgets(categories={"formatting": 0.05})
+    settings = VisibilitySettings()
+    settings._show_only_set = {"formatting"}
+
+    result = checker.run_all_document_checks(
+        "\n".join([TITLE_LINE] * 50), "Advisory Circular", settings
+    )
+
+    timeouts = [f for f in result.partial_failures if f.get("timeout")]
+    assert {f["scope"] for f in timeouts} == {"formatting"}
+    assert any("italics" in issue["message"] for issue in result.issues)
+    assert not result.success
+
+
+def test_category_budget_stops_waiting_for_a_stuck_check():
+    release = threading.Event()
+
+    class StuckCheck:
+        def check_document(self, doc, doc_type):
+            results = DocumentCheckResult()
+            results.add_issue("found before the cut-off", Severity.WARNING)
+            raise_if_cancelled(results)
+            release.wait()  # ignores its budget, like a long-running match
+            return results
+
+    checker = FAADocumentChecker()
+    checker.time_budgets = TimeBudgets(categories={"stuck": 0.05})
+    try:
+        result = checker.run_all_document_checks(
+            TITLE_LINE, "Advisory Circular", check_modules=[(StuckCheck(), "stuck")]
+        )
+        assert not release.is_set()  # returned while the check was still stuck
+    finally:
+        release.set()
+
+    (failure,) = result.partial_failures
+    assert failure["timeout"] and failure["scope"] == "stuck"
+    assert failure["partial_issues"] == 1
+    assert [issue["message"] for issue in result.issues] == ["found before the cut-off"]
+
+
+@pytest.mark.parametrize(
+    "line, title",
+    [
+        (TITLE_LINE, '"Aircraft Design Guidance,"'),
+        ('See AC 25-1A, Aircraft "Design Guidance, dated 1/1/20', 'Aircraft "Design Guidance'),
+        (
+            'See AC 25-1A, "Design, Guidance" and "Aircraft dated 1/1/20',
+            '"Design, Guidance" and "Aircraft',
+        ),
+        ("See AC 25-1A, Design, Guidance dated 1/1/20", None),
+        ("See AC 25-1A, dated 1/1/20", ""),
+    ],
+)
+def test_title_matching_keeps_the_original_pattern_behaviour(line, title):
+    check = DocumentTitleFormatCheck()
+    titles = [line[start:end] for start, end in check._find_document_titles(line)]
+    assert titles == ([] if title is None else [title])
+
+
+def test_title_scan_is_linear_in_the_quote_count():
+    # Unclosed title references: the nested-quantifier title pattern used to
+    # backtrack exponentially on these while holding the GIL.
+    text = "\n".join([STALL_LINE, 'See AC 1-1, "x" ' * 2000])
+    checker = FAADocumentChecker()
+    checker.time_budgets = TimeBudgets(categories={"formatting": 30})
+    settings = VisibilitySettings()
+    settings._show_only_set = {"formatting"}
+
+    result = checker.run_all_document_checks(text, "Advisory Circular", settings)
+
+    assert not result.partial_failures
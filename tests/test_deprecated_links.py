@@ -21,3 +21,66 @@ def test_deprecated_links():
             if i.get("severity") in (Severity.ERROR, Severity.WARNING)
         ]
         assert any(expected in m for m in msgs), f"Expected suggestion '{expected}' in {msgs}"
+
+
+def test_scan_urls_reports_paragraph_offsets():
+    from govdocverify.utils.link_utils import scan_urls
+
+    paragraphs = ["No links here", "See (https://rgl.faa.gov/x).", "", "localhost:8000/a"]
+    matches = scan_urls(paragraphs)
+    assert [(m.url, m.paragraph, m.start, m.end) for m in matches] == [
+        ("https://rgl.faa.gov/x", 1, 5, 26),
+        ("localhost:8000/a", 3, 0, 16),
+    ]
+    assert paragraphs[1][5:26] == "https://rgl.faa.gov/x"
+
+
+def test_index_exact_and_prefix_rules():
+    from govdocverify.utils.link_utils import DeprecatedUrlIndex
+
+    index = DeprecatedUrlIndex(
+        {
+            "old.faa.gov": "https://new.faa.gov",
+            "www.faa.gov/info": "https://www.faa.gov",
+            "https://www.faa.gov/docs/*": "https://drs.faa.gov",
+            "www.faa.gov/docs/ac/*": "https://drs.faa.gov/ac",
+        }
+    )
+    assert len(index) == 4
+    assert index.lookup("http://OLD.faa.gov/any/path?q=1") == "https://new.faa.gov"
+    assert index.lookup("www.faa.gov/info/") == "https://www.faa.gov"
+    assert index.lookup("www.faa.gov/info/sub") is None
+    assert index.lookup("www.faa.gov/docs") == "https://drs.faa.gov"
+    assert index.lookup("www.faa.gov/docs/ac/150-5370") == "https://drs.faa.gov/ac"
+    assert index.lookup("www.faa.gov/other") is None
+
+    # A merged table overriding existing keys replaces them.
+    index.update({"https://old.faa.gov/": "https://newer.faa.gov", "www.faa.gov/info": "x"})
+    assert len(index) == 4
+    assert index.lookup("old.faa.gov/a") == "https://newer.faa.gov"
+
+
+def test_redirect_table_loaded_from_env(tmp_path, monkeypatch):
+    from govdocverify.utils import link_utils
+
+    table = tmp_path / "redirects.csv"
+    table.write_text("old,new\nhttps://legacy.faa.gov/regs/*,https://drs.faa.gov\n")
+    monkeypatch.setenv(link_utils.REDIRECT_TABLE_ENV, str(table))
+    link_utils.set_deprecated_index(None)
+    try:
+        result = checker.check_text("# Title\nSee legacy.faa.gov/regs/part-25 now.")
+        msgs = [i["message"] for i in result.issues]
+        assert "Change URL from 'legacy.faa.gov/regs/part-25' to 'https://drs.faa.gov'." in msgs
+        assert link_utils.deprecated_lookup("rgl.faa.gov") == "https://drs.faa.gov"
+    finally:
+        link_utils.set_deprecated_index(None)
+
+
+def test_load_redirect_table_json(tmp_path):
+    import json
+
+    from govdocverify.utils.link_utils import load_redirect_table
+
+    table = tmp_path / "redirects.json"
+    table.write_text(json.dumps({"a.faa.gov/x": "https://b.faa.gov"}))
+    assert load_redirect_table(table) == {"a.faa.gov/x": "https://b.faa.gov"}
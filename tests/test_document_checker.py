@@ -6,7 +6,7 @@ from time import perf_counter
 from unittest.mock import ANY, MagicMock, Mock, patch
 
 from govdocverify.document_checker import FAADocumentChecker
-from govdocverify.models import DocumentCheckResult
+from govdocverify.models import DocumentCheckResult, VisibilitySettings
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
@@ -271,6 +271,29 @@ class TestFAADocumentChecker(unittest.TestCase):
         self.assertEqual(len(mock_checks), 8, "Expected 8 check modules to be run")
         logger.debug("Completed test_all_check_modules_are_run")
 
+    def test_hidden_categories_are_not_executed(self):
+        """Only categories visible in the settings run; hidden ones never execute."""
+        modules = ["heading_checks", "readability_checks", "terminology_checks", "acronym_checker"]
+        for attr in modules:
+            mock = Mock()
+            mock.check_document.return_value = DocumentCheckResult()
+            setattr(self.checker, attr, mock)
+
+        settings = VisibilitySettings(show_readability=False)
+        settings._show_only_set = {"terminology", "headings"}
+        result = self.checker.run_all_document_checks("Test document content", None, settings)
+
+        self.checker.heading_checks.check_document.assert_called_once()
+        self.checker.terminology_checks.check_document.assert_called_once()
+        self.checker.readability_checks.check_document.assert_not_called()
+        self.checker.acronym_checker.check_document.assert_not_called()
+        self.assertEqual(set(result.per_check_results), {"heading", "terminology"})
+
+        hidden = VisibilitySettings(show_acronym=False)
+        self.checker.run_all_document_checks("Test document content", None, hidden)
+        self.checker.readability_checks.check_document.assert_called_once()
+        self.checker.acronym_checker.check_document.assert_not_called()
+
     def test_stress_document_runs_fast_and_deterministic(self):
         """VR-10: large document finishes quickly with stable issue count."""
         lines = ["1. INTRODUCTION."] + [f"Paragraph {i}" for i in range(200)]
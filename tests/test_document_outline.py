@@ -0,0 +1,69 @@
+"""Tests for the shared document outline."""
+
+from docx import Document
+
+from govdocverify.checks.accessibility_checks import AccessibilityChecks
+from govdocverify.checks.heading_checks import HeadingChecks
+from govdocverify.checks.structure_checks import StructureChecks
+from govdocverify.models import DocumentCheckResult
+from govdocverify.utils.document_facets import DocumentFacets
+from govdocverify.utils.document_outline import DocumentOutline, outline_of
+
+ROWS = [
+    ("Normal", "Preamble"),
+    ("Heading 1", "1. PURPOSE."),
+    ("Normal", "Body"),
+    ("Heading 2", "1.1  Scope  of  work."),
+    ("Normal", "Details"),
+    ("Heading 2", "1.2 Audience"),
+    ("Heading 1", "2. BACKGROUND"),
+    ("Normal", "More"),
+]
+
+
+def test_tree_spans_numbers_and_titles():
+    outline = DocumentOutline.from_rows(ROWS)
+
+    assert [h.line_number for h in outline.headings] == [2, 4, 6, 7]
+    purpose, background = outline.roots
+    assert [c.title for c in purpose.children] == ["Scope of work", "Audience"]
+    assert purpose.children[0].parent is purpose
+    assert purpose.span == range(1, 6) and background.span == range(6, 8)
+    assert [(h.number, h.title) for h in outline.headings] == [
+        (None, "1. PURPOSE"),
+        ("1.1", "Scope of work"),
+        ("1.2", "Audience"),
+        (None, "2. BACKGROUND"),
+    ]
+    assert [(h and h.index, list(body)) for h, body in outline.sections()] == [
+        (None, [0]),
+        (1, [2]),
+        (3, [4]),
+        (6, [7]),
+    ]
+
+
+def test_checks_share_one_outline_facet():
+    doc = Document()
+    for style, text in ROWS:
+        doc.add_paragraph(text, style=style)
+    doc.add_paragraph("2.1.1 Skipped", style="Heading 3")
+    facets = DocumentFacets("unused.docx")
+    facets._values["docx"] = doc
+
+    outline = outline_of(facets)
+    assert outline is facets.outline
+
+    results = DocumentCheckResult()
+    HeadingChecks().run_checks(facets, "ORDER", results)
+    assert [i["line_number"] for i in results.issues if "Missing heading" in i["message"]] == [9]
+    assert AccessibilityChecks()._extract_docx_headings(facets)[0] == (1, "1. PURPOSE.")
+    assert StructureChecks()._extract_paragraph_numbering(facets)[-1] == ("2.1.1", "Skipped")
+    assert outline_of(facets) is outline
+
+
+def test_plain_text_outline_has_no_headings():
+    outline = DocumentFacets("PURPOSE.\nBody text").outline
+
+    assert outline.headings == [] and outline.paragraph_count == 2
+    assert list(outline.sections()) == [(None, range(0, 2))]
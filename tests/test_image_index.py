@@ -0,0 +1,106 @@
+"""Tests for the drawing index read by the alt-text checks."""
+
+import copy
+from unittest.mock import Mock
+
+import pytest
+from docx import Document
+from docx.oxml.ns import qn
+from lxml import etree
+
+from govdocverify.checks.accessibility_checks import AccessibilityChecks
+from govdocverify.document_checker import FAADocumentChecker
+from govdocverify.models import DocumentCheckResult
+from govdocverify.utils.document_facets import DocumentFacets
+from govdocverify.utils.image_index import DECORATIVE, ImageIndex, image_index_of
+
+PNG = (
+    b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x06\x00\x00\x00"
+    b"\x1f\x15\xc4\x89\x00\x00\x00\nIDATx\x9cc\x00\x01\x00\x00\x05\x00\x01\r\n-\xb4\x00\x00"
+    b"\x00\x00IEND\xaeB`\x82"
+)
+
+
+def _picture(run, image, name, descr=None):
+    run.add_picture(str(image))
+    inline = run._r.xpath(".//wp:inline")[-1]
+    doc_pr = inline.find(qn("wp:docPr"))
+    doc_pr.set("name", name)
+    if descr:
+        doc_pr.set("descr", descr)
+    return inline
+
+
+def _float(inline):
+    """Turn an inline drawing into an anchored (floating) one."""
+    anchor = etree.SubElement(inline.getparent(), qn("wp:anchor"))
+    for child in inline:
+        anchor.append(copy.deepcopy(child))
+    inline.getparent().remove(inline)
+
+
+def _mark_decorative(inline):
+    ext_list = etree.SubElement(inline.find(qn("wp:docPr")), qn("a:extLst"))
+    ext = etree.SubElement(ext_list, qn("a:ext"), uri="{C183D7F6-B498-43B3-948B-1728B52AA6E4}")
+    etree.SubElement(ext, DECORATIVE, val="1")
+
+
+@pytest.fixture
+def document(tmp_path):
+    image = tmp_path / "dot.png"
+    image.write_bytes(PNG)
+    doc = Document()
+    doc.add_paragraph("Intro.")
+    _picture(doc.add_paragraph().add_run(), image, "described", descr="A dot")
+    _float(_picture(doc.add_paragraph().add_run(), image, "floating"))
+    cell = doc.add_table(rows=1, cols=1).cell(0, 0)
+    _picture(cell.paragraphs[0].add_run(), image, "in cell")
+    _mark_decorative(_picture(doc.add_paragraph().add_run(), image, "rule"))
+    _picture(doc.sections[0].header.paragraphs[0].add_run(), image, "seal")
+    path = tmp_path / "images.docx"
+    doc.save(str(path))
+    return path
+
+
+def test_index_covers_inline_floating_table_and_header_drawings(document):
+    images = ImageIndex.from_docx(Document(str(document)))
+
+    assert [(i.name, i.kind, i.part, i.paragraph, i.in_table) for i in images] == [
+        ("described", "inline", "body", 1, False),
+        ("floating", "anchor", "body", 2, False),
+        ("in cell", "inline", "body", None, True),
+        ("rule", "inline", "body", 3, False),
+        ("seal", "inline", "header1.xml", None, False),
+    ]
+    assert [i.decorative for i in images] == [False, False, False, True, False]
+    assert images.records[0].descr == "A dot"
+    assert all(i.size == len(PNG) for i in images) and images.total_size == 5 * len(PNG)
+
+
+def test_pipeline_reports_every_undescribed_drawing(document):
+    result = FAADocumentChecker().run_all_document_checks(str(document), "ORDER")
+
+    missing = [
+        (issue["message"], issue.get("line_number"))
+        for issue in result.issues
+        if "missing alt text" in issue["message"]
+    ]
+    assert missing == [
+        ("Image 'floating' is missing alt text", 3),
+        ("Image 'in cell' is missing alt text", None),
+        ("Image 'seal' in header1.xml is missing alt text", None),
+    ]
+
+
+def test_index_is_a_facet_and_absent_for_mocks(document):
+    view = DocumentFacets(str(document))
+    assert image_index_of(view) is view.images and len(view.images) == 5
+    assert image_index_of(Mock(spec=Document)) is None
+    assert image_index_of(DocumentFacets(["plain text"])) is None
+
+    # Documents without XML still go through their inline shapes.
+    mock_document = Mock(spec=Document)
+    mock_document.inline_shapes = [Mock(_inline=Mock(docPr={"name": "legacy"}))]
+    results = DocumentCheckResult()
+    AccessibilityChecks()._check_alt_text(mock_document, results)
+    assert [issue["message"] for issue in results.issues] == ["Image 'legacy' is missing alt text"]
@@ -0,0 +1,96 @@
+"""Tests for the fused single-pass line rule scanner."""
+
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from govdocverify.checks.format_checks import FormatChecks, FormattingChecker
+from govdocverify.models import Severity
+from govdocverify.utils.line_scanner import LineScanner
+
+
+def _recorder(calls):
+    def handle(owner, scan, results, line_number, text):
+        calls.append((line_number, text))
+        results.add_issue(text, Severity.INFO, line_number)
+
+    return handle
+
+
+def test_overlapping_triggers_do_not_mask_each_other():
+    scanner = LineScanner()
+    word, capital, every = [], [], []
+    scanner.add_rule("word", _recorder(word), trigger=r"(?P<w>ab)c")
+    scanner.add_rule("capital", _recorder(capital), trigger=re.compile("ABC", re.IGNORECASE))
+    scanner.add_rule("every", _recorder(every))
+
+    scan = scanner.start(owner=None)
+    scan.feed(["xabc", "nothing", "abd", "ABC"], first_line=5)
+    results = scan.finish()
+
+    assert word == [(5, "xabc")]
+    assert capital == [(5, "xabc"), (8, "ABC")]
+    assert [line for line, _ in every] == [5, 6, 7, 8]
+    assert [len(result.issues) for result in results] == [1, 2, 4]
+
+    with pytest.raises(ValueError):
+        scanner.add_rule("echo", _recorder([]), trigger=r"(a)\1")
+        scanner.start(owner=None)
+
+
+def test_text_rules_keep_per_check_results():
+    lines = [
+        "1. First",
+        "2. Second",
+        "Prose between (items",
+        "3. Third",
+        "• lonely bullet",
+        'Call 123-456-7890 by 12/31/2024 "today".',
+        "Or call (123) 456-7890.",
+    ]
+    checker = FormattingChecker()
+    combined = checker.check_text("\n".join(lines)).issues
+
+    separate = [
+        *checker.check_punctuation(lines).issues,
+        *checker.check_spacing(lines).issues,
+        *checker.check_parentheses(lines).issues,
+        *checker.check_section_symbol_usage(lines).issues,
+        *checker.check_list_formatting(lines).issues,
+        *checker.check_quotation_marks(lines).issues,
+        *checker.check_placeholders(lines).issues,
+        *checker._check_date_formats_text(lines),
+        *checker._check_phone_numbers_text(lines),
+    ]
+    assert [(i["message"], i["line_number"]) for i in combined] == [
+        (i["message"], i["line_number"]) for i in separate
+    ]
+    # The prose line ends the list, so "3." is not a numbering gap.
+    assert not any("expected" in issue["message"] for issue in combined)
+    assert any("not part of a list" in issue["message"] for issue in combined)
+    assert [issue["line_number"] for issue in combined if "phone" in issue["message"]] == [6, 7]
+
+
+def test_registered_format_rule_runs_in_the_fused_pass():
+    def handle(owner, scan, results, line_number, text):
+        results.add_issue("Spell out the hazmat class.", Severity.WARNING, line_number, "format")
+
+    FormatChecks.line_rules.add_rule("hazmat_class", handle, trigger=r"\bclass \d\b")
+    try:
+        document = SimpleNamespace(
+            paragraphs=[
+                SimpleNamespace(text=text, style=None)
+                for text in ("Store class 3 items here.", "TODO: confirm.", "Ship class 9.")
+            ]
+        )
+        issues = FormatChecks().check_document(document, "Order").issues
+    finally:
+        FormatChecks.line_rules.remove_rule("hazmat_class")
+
+    assert [(issue["line_number"], issue["severity"]) for issue in issues] == [
+        (2, Severity.ERROR),
+        (1, Severity.WARNING),
+        (3, Severity.WARNING),
+    ]
+    assert "hazmat_class" not in FormatChecks.line_rules.names
@@ -0,0 +1,92 @@
+"""Tests for the per-stage memory profile of a document run."""
+
+import json
+import tracemalloc
+from unittest import mock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.main import app
+from govdocverify import cli
+from govdocverify.utils.memory_profile import PERF_DIR_ENV, memory_stage, profile_memory
+from govdocverify.utils.security import rate_limiter
+
+DOCX = "tests/test_data/invalid_acronyms.docx"
+DOCX_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+
+@pytest.fixture
+def perf_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv(PERF_DIR_ENV, str(tmp_path / "artifacts"))
+    return tmp_path / "artifacts"
+
+
+def _reports(directory):
+    return [json.loads(path.read_text()) for path in sorted(directory.glob("memory-*.json"))]
+
+
+def test_profile_reports_every_stage(perf_dir):
+    with memory_stage("ignored"):
+        assert not tracemalloc.is_tracing()
+
+    with profile_memory(DOCX, "Advisory Circular") as profile:
+        result = cli.process_document(DOCX, "Advisory Circular")
+        with memory_stage("format"):
+            assert result["rendered"]
+    assert not tracemalloc.is_tracing()
+
+    (report,) = _reports(perf_dir)
+    assert profile.path.parent == perf_dir and report["document"] == DOCX
+    stages = [stage["stage"] for stage in report["stages"]]
+    assert stages[:2] == ["metadata", "load"]
+    assert {"category:terminology", "category:acronym", "category:structure"} <= set(stages)
+    assert stages[-3:] == ["aggregate", "index", "format"]
+    load = report["stages"][1]
+    assert load["peak_bytes"] >= load["start_bytes"] + load["peak_increase_bytes"] > 0
+    assert load["top_allocations"] and all(s["size_bytes"] > 0 for s in load["top_allocations"])
+    assert report["peak_bytes"] == max(stage["peak_bytes"] for stage in report["stages"])
+
+
+def test_cli_flag_writes_a_report(perf_dir, capsys):
+    argv = ["govdocverify", "--file", DOCX, "--type", "Advisory Circular", "--json"]
+    with mock.patch("sys.argv", argv + ["--profile-memory"]):
+        cli.main()
+    (report,) = _reports(perf_dir)
+    assert report["doc_type"] == "Advisory Circular"
+    assert report["stages"][-1]["stage"] == "format"
+
+    with mock.patch("sys.argv", argv):
+        cli.main()
+    assert len(_reports(perf_dir)) == 1
+    capsys.readouterr()
+
+
+def test_api_header_needs_the_admin_token(perf_dir, monkeypatch):
+    client = TestClient(app)
+    rate_limiter.requests.clear()
+    monkeypatch.setenv("GOVDOCVERIFY_ADMIN_TOKEN", "secret")
+    with open(DOCX, "rb") as fh:
+        content = fh.read()
+
+    def post(headers):
+        with mock.patch("govdocverify.utils.security.filetype.guess") as guess:
+            guess.return_value = mock.Mock(mime=DOCX_MIME)
+            return client.post(
+                "/process",
+                files={"doc_file": ("memo.docx", content)},
+                data={"doc_type": "Advisory Circular"},
+                headers=headers,
+            )
+
+    assert post({"X-Profile-Memory": "1"}).status_code == 403
+    assert "X-Memory-Profile" not in post({"X-Profile-Memory": "0"}).headers
+    resp = post({"X-Profile-Memory": "1", "X-Admin-Token": "secret"})
+    rate_limiter.requests.clear()
+
+    assert resp.status_code == 200
+    (path,) = perf_dir.glob("memory-memo-*.json")
+    assert resp.headers["X-Memory-Profile"] == path.name
+    (report,) = _reports(perf_dir)
+    assert report["document"] == "memo.docx"
+    assert report["stages"][-1]["stage"] == "format"
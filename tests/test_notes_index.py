@@ -0,0 +1,132 @@
+"""Tests for the footnote and endnote index."""
+
+import zipfile
+
+import pytest
+from docx import Document
+from docx.oxml.ns import qn
+from lxml import etree
+
+from govdocverify.checks.structure_checks import StructureChecks
+from govdocverify.document_checker import FAADocumentChecker
+from govdocverify.models import DocumentCheckResult
+from govdocverify.utils.document_facets import DocumentFacets
+from govdocverify.utils.notes_index import NoteReference, NotesIndex, notes_index_of
+from govdocverify.utils.paragraph_table import ParagraphTable
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+RELS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.{}s+xml"
+
+
+def _notes_part(kind, notes):
+    body = "".join(
+        f'<w:{kind} w:id="{note_id}"><w:p><w:r><w:t>{text}</w:t></w:r></w:p></w:{kind}>'
+        for note_id, text in notes.items()
+    )
+    separators = (
+        f'<w:{kind} w:type="separator" w:id="-1"><w:p/></w:{kind}>'
+        f'<w:{kind} w:type="continuationSeparator" w:id="0"><w:p/></w:{kind}>'
+    )
+    return f'<w:{kind}s xmlns:w="{W_NS}">{separators}{body}</w:{kind}s>'
+
+
+def _reference(paragraph, kind, note_id):
+    run = paragraph.add_run()
+    etree.SubElement(run._r, qn(f"w:{kind}Reference"), {qn("w:id"): str(note_id)})
+
+
+def _add_parts(path, parts):
+    """Add note parts to a saved package, with their relationship and content type."""
+    with zipfile.ZipFile(path) as package:
+        files = {name: package.read(name) for name in package.namelist()}
+    for kind, xml in parts.items():
+        files[f"word/{kind}s.xml"] = xml.encode()
+        files["word/_rels/document.xml.rels"] = files["word/_rels/document.xml.rels"].replace(
+            b"</Relationships>",
+            f'<Relationship Id="rId{kind}" Type="{RELS}/{kind}s" Target="{kind}s.xml"/>'
+            "</Relationships>".encode(),
+        )
+        files["[Content_Types].xml"] = files["[Content_Types].xml"].replace(
+            b"</Types>",
+            f'<Override PartName="/word/{kind}s.xml" ContentType="{CONTENT_TYPE.format(kind)}"/>'
+            "</Types>".encode(),
+        )
+    with zipfile.ZipFile(path, "w") as package:
+        for name, data in files.items():
+            package.writestr(name, data)
+
+
+@pytest.fixture
+def document(tmp_path):
+    doc = Document()
+    doc.add_paragraph("Intro.")
+    _reference(doc.add_paragraph("The rule applies."), "footnote", 1)
+    doc.add_paragraph("See the table [3].")
+    _reference(doc.add_paragraph("Records are kept."), "endnote", 1)
+    cell = doc.add_table(rows=1, cols=1).cell(0, 0)
+    _reference(cell.paragraphs[0], "footnote", 2)
+    doc.add_paragraph("Appendix A. Forms", style="Heading 1")
+    _reference(doc.add_paragraph("Forms are listed."), "footnote", 2)
+    path = tmp_path / "notes.docx"
+    doc.save(str(path))
+    _add_parts(
+        path,
+        {
+            "footnote": _notes_part(
+                "footnote", {1: "Clearly, this applies.", 2: "See the form list."}
+            ),
+            "endnote": _notes_part("endnote", {1: "Keep them five years."}),
+        },
+    )
+    return path
+
+
+def test_index_reads_notes_and_references(document):
+    notes = NotesIndex.from_package(str(document))
+
+    assert [(n.kind, n.id, n.text) for n in notes.notes] == [
+        ("footnote", 1, "Clearly, this applies."),
+        ("footnote", 2, "See the form list."),
+        ("endnote", 1, "Keep them five years."),
+    ]
+    assert notes.references == [
+        NoteReference("footnote", 1, 1),
+        NoteReference("endnote", 1, 3),
+        NoteReference("footnote", 2, 3, nested=True),
+        NoteReference("footnote", 2, 5),
+    ]
+    assert notes.paragraphs_with("footnote") == [1, 5]
+    assert list(notes.text_windows()) == [
+        (2, ["Clearly, this applies."]),
+        (4, ["Keep them five years."]),
+        (4, ["See the form list."]),
+    ]
+    loaded = NotesIndex.from_docx(Document(str(document)))
+    assert (loaded.notes, loaded.references) == (notes.notes, notes.references)
+
+
+def test_note_text_is_checked_at_the_referencing_line(document):
+    result = FAADocumentChecker().run_all_document_checks(str(document), "ORDER")
+
+    clearly = [i for i in result.issues if "'clearly'" in i["message"]]
+    assert [i.get("line_number") for i in clearly] == [2]
+
+
+def test_footnote_sequence_matches_the_full_paragraph_scan(document):
+    docx = Document(str(document))
+    view = DocumentFacets(str(document))
+    assert notes_index_of(view) is view.notes and notes_index_of(docx) is not None
+    assert notes_index_of(DocumentFacets(["plain text"])) is None
+
+    checks = StructureChecks()
+    legacy, indexed = DocumentCheckResult(), DocumentCheckResult()
+    checks._check_footnote_sequence(docx.paragraphs, legacy)
+    table = ParagraphTable.from_docx(docx)
+    checks._check_footnote_sequence(docx.paragraphs, indexed, table, view.notes)
+
+    assert indexed.issues == legacy.issues
+    assert [(i["line_number"], i["message"].split(":")[0]) for i in indexed.issues] == [
+        (3, "Footnote numbering gap detected"),
+        (6, "Footnote numbering gap detected"),
+    ]
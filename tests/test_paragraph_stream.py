@@ -0,0 +1,82 @@
+"""Tests for streamed paragraph records and the windowed check pipeline."""
+
+import glob
+
+import pytest
+from docx import Document
+
+from govdocverify.checks.acronym_checks import AcronymChecker
+from govdocverify.checks.format_checks import FormatChecks
+from govdocverify.checks.terminology_checks import TerminologyChecks
+from govdocverify.document_checker import FAADocumentChecker
+from govdocverify.models import VisibilitySettings
+from govdocverify.utils.document_facets import DocumentFacets
+from govdocverify.utils.paragraph_stream import (
+    STREAM_WINDOW_ENV,
+    ParagraphStream,
+    iter_lines,
+)
+from govdocverify.utils.terminology_utils import TerminologyManager
+
+DOCX_FILES = sorted(glob.glob("tests/test_data/*.docx"))
+
+TEXT = "\n".join(
+    [
+        "The Federal Aviation Administration (FAA) issued this AC on 01/02/2024.",
+        "Call (123) 456-7890 for help - or see the section above.",
+        "Table 5 shows the TBD values.",
+        "Contact 123.456.7890 and ask the FAA about the XYZ program.",
+        "The Quality Management System (QMS) is described in Figure 2-1.",
+    ]
+    * 3
+)
+
+
+@pytest.mark.parametrize("path", DOCX_FILES)
+def test_records_match_python_docx(path):
+    paragraphs = Document(path).paragraphs
+    records = list(ParagraphStream(path))
+    assert [r.text for r in records] == [p.text for p in paragraphs]
+    assert [r.style for r in records] == [p.style.name for p in paragraphs]
+    assert [r.index for r in records] == list(range(len(paragraphs)))
+
+
+def test_iter_lines_matches_splitlines():
+    text = "a\nb\r\nc\rd\x0be f\n\n"
+    assert list(iter_lines(text)) == text.splitlines()
+
+
+@pytest.mark.parametrize("window", ["1", "2", "256"])
+def test_windowed_checks_match_whole_document(monkeypatch, window):
+    monkeypatch.setenv(STREAM_WINDOW_ENV, window)
+    manager = TerminologyManager()
+    whole = DocumentFacets(TEXT.splitlines())
+    whole.materialize("paragraphs")  # replayed from memory in one window
+    for checker in (
+        FormatChecks(manager),
+        TerminologyChecks(manager),
+        AcronymChecker(manager),
+    ):
+        expected = checker.check_document(whole, "Advisory Circular")
+        streamed = checker.check_document(DocumentFacets(TEXT), "Advisory Circular")
+        assert streamed.issues == expected.issues
+        assert expected.issues
+
+
+def test_streaming_categories_never_parse_the_docx(monkeypatch):
+    checker = FAADocumentChecker()
+    views = []
+    load = checker._load_document
+
+    def capture(path):
+        views.append(load(path))
+        return views[-1]
+
+    monkeypatch.setattr(checker, "_load_document", capture)
+    settings = VisibilitySettings()
+    settings._show_only_set = {"format", "terminology", "acronym"}
+
+    result = checker.run_all_document_checks(DOCX_FILES[0], "Advisory Circular", settings)
+
+    assert not result.partial_failures
+    assert views[-1].computed == {"paragraph_stream", "notes"}
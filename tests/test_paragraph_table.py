@@ -0,0 +1,56 @@
+"""Tests for the columnar paragraph table."""
+
+import glob
+
+import pytest
+from docx import Document
+
+from govdocverify.checks.reference_checks import DocumentTitleFormatCheck
+from govdocverify.checks.structure_checks import StructureChecks
+from govdocverify.utils.document_facets import DocumentFacets
+from govdocverify.utils.paragraph_table import ParagraphTable, paragraph_table_of
+
+
+@pytest.mark.parametrize("path", sorted(glob.glob("tests/test_data/*.docx")))
+def test_columns_match_python_docx(path):
+    doc = Document(path)
+    table = ParagraphTable.from_docx(doc)
+    checks = StructureChecks()
+
+    assert table.texts == [p.text for p in doc.paragraphs]
+    assert table.styles == [p.style.name for p in doc.paragraphs]
+    for index, paragraph in enumerate(doc.paragraphs):
+        direct = [span for span in table.runs[index] if not span.hyperlink]
+        assert [table.texts[index][s.start : s.end] for s in direct] == [
+            r.text for r in paragraph.runs
+        ]
+        assert [s.italic for s in direct] == [bool(r.italic) for r in paragraph.runs]
+        assert checks._table_footnote_numbers(table, index) == checks._extract_footnote_numbers(
+            paragraph
+        )
+
+
+def test_outline_numbering_offsets_and_italics():
+    doc = Document()
+    doc.add_paragraph("1. PURPOSE.", style="Heading 1")
+    doc.add_paragraph("First step", style="List Number")
+    paragraph = doc.add_paragraph("See AC 25-1, ")
+    paragraph.add_run("Aircraft ").italic = True
+    paragraph.add_run("Design").italic = True
+    paragraph.add_run(", dated 1/1/20")
+
+    table = ParagraphTable.from_docx(doc)
+
+    assert table.outline_levels == [0, None, None]
+    assert table.numbering[0] is None and table.numbering[1][1] == 0
+    assert table.offsets == [0, 12, 23]
+    assert table.paragraph_at(table.text.index("Design")) == 2
+    assert table.italic_regions(2) == [(13, 28)]
+    assert DocumentTitleFormatCheck().check_document(doc, "Advisory Circular").success
+
+
+def test_facet_is_shared_and_plain_text_falls_back():
+    facets = DocumentFacets("tests/test_data/valid_spacing.docx")
+    assert paragraph_table_of(facets) is paragraph_table_of(facets)
+    assert "paragraph_table" in facets.computed
+    assert paragraph_table_of(DocumentFacets("Plain text only")) is None
@@ -0,0 +1,98 @@
+"""Tests for entry point plugin discovery, lazy loading and cost accounting."""
+
+from importlib.metadata import EntryPoint
+
+import pytest
+
+from govdocverify.document_checker import FAADocumentChecker
+from govdocverify.models import DocumentCheckResult, Severity, VisibilitySettings
+from govdocverify.plugins import ENTRY_POINT_GROUP, Plugin, PluginManager
+from govdocverify.utils.text_source import TextFile
+
+LOADS = []
+
+
+class PlacardChecks:
+    def check_document(self, document, doc_type) -> DocumentCheckResult:
+        results = DocumentCheckResult()
+        for number, paragraph in enumerate(document.paragraphs, start=1):
+            if "placard" in paragraph.text.lower():
+                results.add_issue("Confirm the placard class.", Severity.INFO, number, "hazmat")
+        return results
+
+
+class HazmatPlugin(Plugin):
+    @property
+    def name(self) -> str:
+        return "hazmat-pack"
+
+    def register(self) -> None:
+        LOADS.append(self.name)
+
+    def check_modules(self):
+        return [(PlacardChecks(), "hazmat")]
+
+
+def _entry_point(category: str, value: str) -> EntryPoint:
+    return EntryPoint(name=category, value=value, group=ENTRY_POINT_GROUP)
+
+
+@pytest.fixture
+def manager():
+    LOADS.clear()
+    return PluginManager(
+        [
+            _entry_point("hazmat", f"{__name__}:HazmatPlugin"),
+            _entry_point("broken", "tests.no_such_plugin_module:Plugin"),
+        ],
+        disabled=(),
+    )
+
+
+def test_categories_are_listed_without_importing(manager):
+    assert manager.categories() == ["hazmat", "broken"]
+    assert LOADS == []
+    assert manager.check_modules(["hazmat"]) and LOADS == ["hazmat-pack"]
+    assert manager.check_modules(["hazmat"]) and LOADS == ["hazmat-pack"]
+
+    stats = {s["category"]: s for s in manager.stats()}
+    assert stats["hazmat"]["name"] == "hazmat-pack" and stats["hazmat"]["loaded"]
+    assert stats["hazmat"]["import_seconds"] >= 0
+    assert stats["hazmat"]["import_memory"] >= 0
+    assert not stats["broken"]["loaded"] and stats["broken"]["error"] is None
+
+
+def test_plugin_checks_run_in_the_orchestrator(manager, tmp_path):
+    path = tmp_path / "doc.txt"
+    path.write_text("Mount the placard here.\n", encoding="utf-8")
+    checker = FAADocumentChecker()
+    checker.plugins = manager
+
+    result = checker.run_all_document_checks(TextFile(str(path)), "ORDER")
+
+    assert any(issue["category"] == "hazmat" for issue in result.issues)
+    stats = {s["category"]: s for s in manager.stats()}
+    assert stats["hazmat"]["runs"] == 1
+    assert stats["hazmat"]["run_seconds"] >= stats["hazmat"]["max_run_seconds"] > 0
+    # The failing plugin is reported, not raised.
+    assert "no_such_plugin_module" in stats["broken"]["error"]
+    assert not result.partial_failures
+
+
+def test_hidden_and_disabled_plugins_are_skipped(manager, tmp_path):
+    path = tmp_path / "doc.txt"
+    path.write_text("Mount the placard here.\n", encoding="utf-8")
+    checker = FAADocumentChecker()
+    checker.plugins = manager
+    settings = VisibilitySettings()
+    settings._show_only_set = {"format"}
+
+    result = checker.run_all_document_checks(TextFile(str(path)), "ORDER", settings)
+    assert LOADS == [] and "format" in result.per_check_results
+
+    manager.set_enabled("hazmat-pack", False)
+    assert manager.check_modules(["hazmat"]) == []
+    assert {s["category"]: s for s in manager.stats()}["hazmat"]["disabled"]
+
+    manager.set_enabled("hazmat-pack")
+    assert len(manager.check_modules(["hazmat"])) == 1
@@ -194,3 +194,26 @@ def test_non_ascii_metadata_preserved_in_html() -> None:
     html = fmt.format_results(data, "AC", metadata=metadata)
     assert "Résumé" in html
     assert "Jörg" in html
+
+
+def test_write_results_streams_same_report() -> None:
+    """Streaming output matches ``format_results`` for every style and grouping."""
+    import io
+
+    result = _make_result(
+        issues=[
+            {"message": "Problem", "severity": Severity.ERROR},
+            {"message": "Hint", "severity": Severity.INFO},
+        ]
+    )
+    data = {"section": {"check": result}, "partial_failures": [{"error": "x"}]}
+    for style in FormatStyle:
+        fmt = ResultFormatter(style=style)
+        for group_by in ("category", "severity"):
+            expected = fmt.format_results(data, "AC", group_by=group_by, metadata={"title": "T"})
+            buf = io.StringIO()
+            written = fmt.write_results(
+                buf, data, "AC", group_by=group_by, metadata={"title": "T"}, chunk_lines=3
+            )
+            assert buf.getvalue() == expected
+            assert written == len(expected)
@@ -0,0 +1,71 @@
+"""Tests for the single-pass result aggregation index."""
+
+from govdocverify.document_checker import FAADocumentChecker
+from govdocverify.models import DocumentCheckResult, Severity, VisibilitySettings
+from govdocverify.processing import build_results_dict, index_results
+from govdocverify.utils.formatting import ResultFormatter
+from govdocverify.utils.result_index import ResultIndex
+
+
+def _sample_results():
+    heading = DocumentCheckResult(
+        success=False,
+        issues=[
+            {"message": "Bad heading", "severity": Severity.ERROR, "line_number": 3},
+            {"message": "Period", "severity": Severity.WARNING, "line_number": 7},
+        ],
+    )
+    return {
+        "heading": {"run_checks": heading},
+        "format": {"general": {"success": False, "issues": [{"message": "Date", "line": 3}]}},
+        "structure": {},
+        "partial_failures": [{"error": "boom", "category": "structure"}],
+    }
+
+
+def test_index_groups_and_counts():
+    index = ResultIndex(_sample_results())
+
+    assert index.has_issues
+    assert index.total == 3
+    assert index.category_counts == {"heading": 2, "format": 1}
+    assert index.severity_counts == {"error": 1, "warning": 1, "info": 1}
+    assert [i["message"] for i in index.by_line[3]] == ["Bad heading", "Date"]
+    assert len(index.by_check[("heading", "run_checks")]) == 2
+    assert [cat for cat, _, _ in index.categories()] == ["heading", "format"]
+
+
+def test_select_reuses_entries_and_keeps_extra_keys():
+    index = ResultIndex(_sample_results()).select(lambda cat: cat != "heading")
+
+    assert set(index.results) == {"format", "structure", "partial_failures"}
+    assert index.summary() == {
+        "total": 1,
+        "by_severity": {"error": 0, "warning": 0, "info": 1},
+        "by_category": {"format": 1},
+    }
+
+
+def test_formatter_uses_index_counts():
+    results = _sample_results()
+    fmt = ResultFormatter()
+
+    by_category = fmt.format_results(results, "ORDER", index=ResultIndex(results))
+    by_severity = fmt.format_results(results, "ORDER", group_by="severity")
+
+    assert "Found 3 issues across 2 categories" in by_category
+    assert "Found 3 issues:" in by_severity
+
+
+def test_checker_index_reused_by_processing():
+    checker = FAADocumentChecker()
+    settings = VisibilitySettings()
+    settings._show_only_set = {"terminology"}
+    result = checker.run_all_document_checks(
+        "PURPOSE\nThe FAA will utilize this", "ORDER", settings
+    )
+
+    index = index_results(result)
+    assert index is result.result_index
+    assert index.category_counts["terminology"] == 1
+    assert build_results_dict(result) is result.per_check_results
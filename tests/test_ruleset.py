@@ -0,0 +1,153 @@
+"""Tests for the compiled rule set artifact and its hot reload."""
+
+import json
+import os
+import re
+import shutil
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.main import app
+from govdocverify.checks.structure_checks import StructureChecks
+from govdocverify.checks.terminology_checks import TerminologyChecks
+from govdocverify.models import DocumentCheckResult
+from govdocverify.utils import ruleset as rs
+from govdocverify.utils.pattern_cache import PatternCache
+from govdocverify.utils.terminology_utils import TerminologyManager
+
+
+@pytest.fixture
+def rules_dir(tmp_path, monkeypatch):
+    """A rules directory overriding ``terminology_rules.py``, with caching disabled."""
+    shutil.copy(rs.SOURCE_FILES["terminology_rules"], tmp_path / "terminology_rules.py")
+    monkeypatch.setenv(rs.RULES_DIR_ENV, str(tmp_path))
+    monkeypatch.setenv(rs.RULESET_CACHE_ENV, "off")
+    monkeypatch.setenv(rs.RULESET_CHECK_INTERVAL_ENV, "0")
+    rs.set_ruleset(None)
+    yield tmp_path
+    monkeypatch.delenv(rs.RULES_DIR_ENV)
+    rs.set_ruleset(None)
+    TerminologyManager().load_config()
+
+
+def _add_forbidden_term(rules_dir, term):
+    path = rules_dir / "terminology_rules.py"
+    source = path.read_text().replace(
+        "FORBIDDEN_TERMS = {", f'FORBIDDEN_TERMS = {{\n    "{term}": "Avoid {term}",', 1
+    )
+    path.write_text(source)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_compile_uses_override_and_hashes_content(rules_dir):
+    packaged = rs.compile_ruleset(dict(rs.SOURCE_FILES))
+    overridden = rs.compile_ruleset()
+    assert overridden.paths["terminology_rules"] == str(rules_dir / "terminology_rules.py")
+    assert overridden.version == packaged.version
+
+    _add_forbidden_term(rules_dir, "henceforth")
+    changed = rs.compile_ruleset()
+    assert changed.version != packaged.version
+    assert changed.forbidden_terms["henceforth"] == "Avoid henceforth"
+    assert changed.forbidden_matchers[0][2].search("HENCEFORTH we agree")
+
+
+def test_cache_file_round_trip(rules_dir, tmp_path):
+    cache = tmp_path / "cache" / "ruleset.json"
+    compiled = rs.load_ruleset(cache_path=cache)
+    assert cache.exists()
+
+    cached = rs.load_ruleset(cache_path=cache)
+    assert cached.version == compiled.version
+    assert cached.date_incorrect.search("on 01/02/2024")
+
+    _add_forbidden_term(rules_dir, "henceforth")
+    assert rs.load_ruleset(cache_path=cache).version != compiled.version
+
+
+def test_cache_is_plain_json_and_keeps_one_word_table(rules_dir, tmp_path, monkeypatch):
+    monkeypatch.delenv(rs.RULESET_CACHE_ENV)
+    assert rs.default_cache_path() is None  # nothing is written unless configured
+
+    cache = tmp_path / "cache" / "ruleset.json"
+    first = rs.load_ruleset(cache_path=cache)
+    assert json.loads(cache.read_text())["version"] == first.version
+    cached = rs.load_ruleset(cache_path=cache)
+    assert cached.forbidden_matchers == first.forbidden_matchers
+    assert cached.rule_data == first.rule_data
+
+    _add_forbidden_term(rules_dir, "henceforth")
+    second = rs.load_ruleset(cache_path=cache)
+    assert [path.name for path in cache.parent.glob("*.words")] == [
+        rs.words_path(cache, second.version).name
+    ]
+    assert "aardvark" in first.valid_words and "aardvark" in second.valid_words
+
+
+def test_refresh_swaps_ruleset_for_running_checks(rules_dir):
+    checks = TerminologyChecks(TerminologyManager())
+    before = rs.get_ruleset()
+    assert not checks.check_text("henceforth we agree").issues
+
+    assert rs.refresh_ruleset() is before  # unchanged sources keep the rule set
+    _add_forbidden_term(rules_dir, "henceforth")
+    after = rs.refresh_ruleset()
+
+    assert after is not before and rs.get_ruleset() is after
+    messages = [issue["message"] for issue in checks.check_text("henceforth we agree").issues]
+    assert "Avoid henceforth" in messages
+
+
+def test_pattern_cache_follows_reloaded_ruleset(rules_dir):
+    cache = PatternCache()
+    path = rules_dir / "terminology.json"
+    terminology = json.loads(rs.SOURCE_FILES["terminology"].read_text())
+    path.write_text(json.dumps(terminology))
+    rs.refresh_ruleset(force=True)
+    assert re.compile("henceforth") not in cache.get_required_language_patterns("ORDER")
+
+    terminology["required_language"]["ORDER"].append("henceforth")
+    path.write_text(json.dumps(terminology))
+    rs.refresh_ruleset(force=True)
+
+    patterns = [p.pattern for p in cache.get_required_language_patterns("ORDER")]
+    assert patterns[-1] == "henceforth"
+
+
+def test_required_ac_paragraphs_follow_reloaded_ruleset(rules_dir):
+    required = list(rs.get_ruleset().boilerplate_paragraphs[1:5])
+    checks = StructureChecks()
+    results = DocumentCheckResult()
+    checks._check_required_ac_paragraphs(required, "Advisory Circular", results)
+    assert not results.issues
+
+    paragraphs = list(rs.get_ruleset().boilerplate_paragraphs)
+    paragraphs[1] = "The reloaded required paragraph."
+    (rules_dir / "boilerplate_texts.py").write_text(f"BOILERPLATE_PARAGRAPHS = {paragraphs!r}\n")
+    rs.refresh_ruleset(force=True)
+
+    results = DocumentCheckResult()
+    checks._check_required_ac_paragraphs(required, "Advisory Circular", results)
+    assert [issue["message"] for issue in results.issues] == [
+        "Required Advisory Circular paragraph missing: 'The reloaded required paragraph.'"
+    ]
+
+
+def test_admin_reload_endpoint(rules_dir, monkeypatch):
+    client = TestClient(app)
+    monkeypatch.delenv("GOVDOCVERIFY_ADMIN_TOKEN", raising=False)
+    assert client.post("/admin/ruleset/reload").status_code == 404
+
+    monkeypatch.setenv("GOVDOCVERIFY_ADMIN_TOKEN", "secret")
+    resp = client.post("/admin/ruleset/reload", headers={"X-Admin-Token": "wrong"})
+    assert resp.status_code == 403
+
+    previous = rs.get_ruleset().version
+    _add_forbidden_term(rules_dir, "henceforth")
+    resp = client.post("/admin/ruleset/reload", headers={"X-Admin-Token": "secret"})
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["reloaded"] and body["previous_version"] == previous
+    assert rs.get_ruleset().version == body["version"]
@@ -0,0 +1,116 @@
+"""Tests for ZIP pre-inspection and the document sandboxes."""
+
+import sys
+import zipfile
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from fastapi.testclient import TestClient
+
+import govdocverify.utils.security as security_module
+from backend.main import app
+from govdocverify.cli import process_document
+from govdocverify.comparison import compare_documents
+from govdocverify.sandbox import (
+    SandboxError,
+    SandboxLimits,
+    SandboxPool,
+    check_document,
+    compare_in_sandbox,
+    set_sandbox_pool,
+)
+from govdocverify.utils.security import SecurityError, inspect_archive, rate_limiter
+
+DOCX = "tests/test_data/invalid_acronyms.docx"
+DOCX_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+
+def _zip(path, entries):
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in entries.items():
+            archive.writestr(name, data)
+    return str(path)
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    # Sandboxes inherit ``sys.path``; other test modules put the stale ``src``
+    # tree first, which would shadow the package under test in the children.
+    src = str(Path(__file__).resolve().parent.parent / "src")
+    monkeypatch.setattr(sys, "path", [entry for entry in sys.path if entry != src])
+    pool = SandboxPool(1, SandboxLimits(memory_mb=1024, cpu_seconds=1, max_tasks=5))
+    yield pool
+    pool.shutdown()
+
+
+def test_inspection_rejects_zip_bombs(tmp_path, monkeypatch):
+    inspect_archive(DOCX)
+
+    bomb = _zip(tmp_path / "ratio.docx", {"word/document.xml": b"\0" * (2 * 1024 * 1024)})
+    with pytest.raises(SecurityError, match="expands"):
+        inspect_archive(bomb)
+
+    many = _zip(tmp_path / "many.docx", {f"part{i}.xml": b"" for i in range(1001)})
+    with pytest.raises(SecurityError, match="1001 entries"):
+        inspect_archive(many)
+
+    monkeypatch.setattr(security_module, "MAX_UNCOMPRESSED_SIZE", 1024)
+    with pytest.raises(SecurityError, match="Archive expands"):
+        inspect_archive(DOCX)
+    with mock.patch("govdocverify.utils.security.filetype.guess") as guess:
+        guess.return_value = mock.Mock(mime=DOCX_MIME)
+        with pytest.raises(SecurityError, match="Archive expands"):
+            security_module.validate_file(DOCX)
+
+
+def test_sandbox_checks_like_the_parent_and_survives_crashes(pool):
+    result = pool.run(check_document, DOCX, "Advisory Circular", None, "category")
+    expected = process_document(DOCX, "Advisory Circular")
+    assert result["by_category"] == expected["by_category"]
+    assert result["rendered"] == expected["rendered"]
+    comparison = pool.run(compare_in_sandbox, DOCX, DOCX, "Advisory Circular")
+    assert comparison == compare_documents(DOCX, DOCX, "Advisory Circular").to_dict()
+
+    with pytest.raises(SandboxError):
+        pool.run(bytearray, 4 * 1024**3)
+    with pytest.raises(SandboxError):
+        pool.run(sum, range(10**12))
+    assert pool.restarts == 2
+    with pytest.raises(ValueError):
+        pool.run(int, "not a number")
+    assert pool.restarts == 2 and pool.run(len, "abc") == 3
+
+
+@pytest.mark.parametrize(
+    "endpoint, fields, sandboxed",
+    [
+        ("/process", ("doc_file",), check_document),
+        ("/compare", ("old_file", "new_file"), compare_in_sandbox),
+    ],
+)
+def test_api_answers_422_when_the_sandbox_gives_up(endpoint, fields, sandboxed):
+    client = TestClient(app)
+    rate_limiter.requests.clear()
+    crashed = mock.Mock(run=mock.Mock(side_effect=SandboxError("limits exceeded")))
+    set_sandbox_pool(crashed)
+    try:
+        with (
+            open(DOCX, "rb") as fh,
+            mock.patch("govdocverify.utils.security.filetype.guess") as guess,
+        ):
+            guess.return_value = mock.Mock(mime=DOCX_MIME)
+            data = fh.read()
+            resp = client.post(
+                endpoint,
+                files={field: ("memo.docx", data) for field in fields},
+                data={"doc_type": "Advisory Circular"},
+            )
+    finally:
+        set_sandbox_pool(None)
+        rate_limiter.requests.clear()
+
+    assert resp.status_code == 422
+    assert resp.json()["detail"] == "limits exceeded"
+    crashed.run.assert_called_once()
+    assert crashed.run.call_args.args[0] is sandboxed
@@ -0,0 +1,60 @@
+"""Tests for memory-mapped, chunked text file ingestion."""
+
+import codecs
+
+import pytest
+
+from govdocverify.processing import process_document
+from govdocverify.utils.document_facets import DocumentFacets
+from govdocverify.utils.paragraph_stream import ParagraphStream
+from govdocverify.utils.text_source import PREFIX_SIZE, TextFile, detect_encoding
+
+TEXT = "First line\r\nSecond – line\rThird\n\nFifth sixth\x0cseventh\r\n"
+
+
+@pytest.mark.parametrize("encoding", ["utf-8", "utf-8-sig", "utf-16", "utf-32"])
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 1 << 20])
+def test_lines_match_splitlines(tmp_path, encoding, chunk_size):
+    path = tmp_path / "doc.txt"
+    path.write_bytes(TEXT.encode(encoding))
+    source = TextFile(str(path), chunk_size=chunk_size)
+
+    assert list(source) == TEXT.splitlines()
+    assert source.read() == TEXT
+
+
+def test_encoding_detection_and_late_latin1_bytes(tmp_path):
+    assert detect_encoding(codecs.BOM_UTF16_LE + b"a\x00") == "utf-16"
+    assert detect_encoding("café".encode("utf-8")[:-1], truncated=True) == "utf-8"
+    assert detect_encoding("café".encode("latin-1")) == "latin-1"
+
+    path = tmp_path / "late.txt"
+    path.write_bytes(b"a" * PREFIX_SIZE + "\ncafé".encode("latin-1"))
+    source = TextFile(str(path), chunk_size=4096)
+    assert source.encoding == "utf-8"
+    assert list(source)[-1] == "café"
+
+    empty = tmp_path / "empty.txt"
+    empty.write_bytes(b"")
+    assert list(TextFile(str(empty))) == [] and TextFile(str(empty)).read() == ""
+
+
+def test_facets_and_stream_read_text_file(tmp_path):
+    path = tmp_path / "doc.txt"
+    path.write_text(TEXT, encoding="utf-8")
+    facets = DocumentFacets(TextFile(str(path)))
+
+    assert [record.text for record in ParagraphStream(facets.source)] == TEXT.splitlines()
+    assert [p.text for p in facets.paragraphs] == TEXT.splitlines()
+    assert facets.peek("docx") is None
+
+
+def test_process_document_checks_text_file(tmp_path):
+    path = tmp_path / "doc.txt"
+    path.write_text("The FAA issued this AC.\nSee section 2.1 for details.\n", encoding="utf-8")
+
+    result = process_document(str(path), "Advisory Circular")
+
+    assert not result.partial_failures
+    assert not any("file format" in issue["message"] for issue in result.issues)
+    assert any("section 2.1" in issue["message"] for issue in result.issues)
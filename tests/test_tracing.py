@@ -0,0 +1,107 @@
+"""Tests for the request-scoped tracing spans."""
+
+import json
+from unittest import mock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.main import app
+from govdocverify.checks.check_scheduler import CHECK_WORKERS_ENV
+from govdocverify.document_checker import FAADocumentChecker
+from govdocverify.utils.security import rate_limiter
+from govdocverify.utils.tracing import (
+    TRACE_FILE_ENV,
+    set_span_attributes,
+    start_trace,
+    trace_span,
+)
+
+DOCX = "tests/test_data/invalid_acronyms.docx"
+DOCX_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+
+def _attributes(span):
+    return {a["key"]: next(iter(a["value"].values())) for a in span["attributes"]}
+
+
+def test_spans_nest_and_export_as_otlp_json_lines(tmp_path, monkeypatch):
+    trace_file = tmp_path / "traces.jsonl"
+    monkeypatch.setenv(TRACE_FILE_ENV, str(trace_file))
+    with trace_span("outside") as span:
+        assert span is None
+
+    with start_trace("request", doc_type="Order") as trace:
+        with trace_span("load", size=10):
+            set_span_attributes(paragraph_count=3)
+        with pytest.raises(ValueError), trace_span("broken"):
+            raise ValueError("bad")
+    with start_trace("second"):
+        pass
+
+    lines = trace_file.read_text().splitlines()
+    assert len(lines) == 2
+    (resource,) = json.loads(lines[0])["resourceSpans"]
+    spans = resource["scopeSpans"][0]["spans"]
+    root, load, broken = spans
+    assert [s["name"] for s in spans] == ["request", "load", "broken"]
+    assert {s["traceId"] for s in spans} == {trace.trace_id}
+    assert "parentSpanId" not in root and root["kind"] == 2
+    assert load["parentSpanId"] == broken["parentSpanId"] == root["spanId"]
+    assert _attributes(root) == {"doc_type": "Order"}
+    assert _attributes(load) == {"size": "10", "paragraph_count": "3"}
+    assert broken["status"] == {"code": 2, "message": "ValueError: bad"}
+    assert int(root["endTimeUnixNano"]) >= int(load["endTimeUnixNano"])
+
+    assert trace.server_timing().startswith("request;dur=")
+    assert [entry.split(";")[0] for entry in trace.server_timing().split(", ")] == [
+        "request",
+        "load",
+        "broken",
+    ]
+
+
+def test_check_spans_follow_the_categories_into_worker_threads(monkeypatch):
+    monkeypatch.setenv(CHECK_WORKERS_ENV, "3")
+    with start_trace("run") as trace:
+        FAADocumentChecker().run_all_document_checks(DOCX, "Advisory Circular")
+
+    by_name = {span.name: span for span in trace.spans}
+    run_checks = by_name["run_checks"]
+    checks = [span for span in trace.spans if span.name.startswith("check.")]
+    assert {"check.terminology", "check.structure", "check.acronym"} <= set(by_name)
+    assert all(span.parent_id == run_checks.span_id for span in checks)
+    assert by_name["facet.docx"].parent_id == run_checks.span_id
+    assert run_checks.attributes["paragraph_count"] > 0
+    assert run_checks.attributes["issue_count"] == sum(
+        span.attributes["issue_count"] for span in checks
+    )
+
+
+def test_process_endpoint_returns_server_timing(tmp_path, monkeypatch):
+    trace_file = tmp_path / "traces.jsonl"
+    monkeypatch.setenv(TRACE_FILE_ENV, str(trace_file))
+    rate_limiter.requests.clear()
+    with open(DOCX, "rb") as fh, mock.patch("govdocverify.utils.security.filetype.guess") as guess:
+        guess.return_value = mock.Mock(mime=DOCX_MIME)
+        resp = TestClient(app).post(
+            "/process",
+            files={"doc_file": ("memo.docx", fh.read())},
+            data={"doc_type": "Advisory Circular"},
+        )
+    rate_limiter.requests.clear()
+
+    assert resp.status_code == 200
+    timings = [entry.split(";")[0] for entry in resp.headers["Server-Timing"].split(", ")]
+    assert timings[:3] == ["process", "upload.write", "validate_file"]
+    for name in ("extract_docx_metadata", "facet.docx", "check.terminology"):
+        assert name in timings
+    assert timings[-3:] == ["build_results_dict", "format", "save_result"]
+
+    (line,) = trace_file.read_text().splitlines()
+    spans = json.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    root = _attributes(spans[0])
+    assert root["doc_type"] == "Advisory Circular"
+    run_checks = _attributes(next(span for span in spans if span["name"] == "run_checks"))
+    assert int(root["size"]) > 0 and int(run_checks["paragraph_count"]) > 0
+    assert int(root["issue_count"]) == int(run_checks["issue_count"]) > 0
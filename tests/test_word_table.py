@@ -0,0 +1,60 @@
+"""Tests for the memory-mapped word table and shared rule data."""
+
+import gc
+import pickle
+
+from govdocverify.processing import preload_shared_rules
+from govdocverify.utils import ruleset as rs
+from govdocverify.utils.terminology_utils import AcronymIndex
+from govdocverify.utils.word_table import WordTable
+
+
+def test_table_behaves_like_the_word_set():
+    words = ["faa", "a.m.", "zulu", "école", "faa"]
+    table = WordTable.from_words(words)
+
+    assert table == frozenset(words)
+    assert list(table) == sorted(set(words), key=str.encode)
+    assert all(word in table for word in words)
+    assert "fa" not in table and "zz" not in table and 3 not in table
+    assert pickle.loads(pickle.dumps(table)) == table
+
+
+def test_published_table_is_mapped_and_pickled_by_path(tmp_path):
+    path = tmp_path / "words.words"
+    table = WordTable.publish(["beta", "alpha"], path)
+
+    assert table.path == path and "alpha" in table
+    copy = pickle.loads(pickle.dumps(table))
+    assert copy.path == path and copy == table
+    assert len(pickle.dumps(table)) < 200
+
+
+def test_cached_ruleset_attaches_to_published_words(tmp_path):
+    cache = tmp_path / "ruleset.json"
+    compiled = rs.load_ruleset(dict(rs.SOURCE_FILES), cache_path=cache)
+    assert compiled.valid_words.path == rs.words_path(cache, compiled.version)
+
+    cached = rs.load_ruleset(dict(rs.SOURCE_FILES), cache_path=cache)
+    assert cached is not compiled
+    assert cached.valid_words.path == compiled.valid_words.path
+    assert "aardvark" in cached.valid_words
+    assert cache.stat().st_size < compiled.valid_words.path.stat().st_size
+
+    index = AcronymIndex({"FAA": "Federal Aviation Administration"}, cached.valid_words)
+    assert index.valid_words is cached.valid_words
+
+
+def test_preload_freezes_shared_objects():
+    try:
+        preload_shared_rules()
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+
+def test_publish_replaces_file_with_other_layout(tmp_path):
+    path = tmp_path / "words.words"
+    path.write_bytes(b"GDVWORD0" + bytes(16))
+
+    assert "alpha" in WordTable.publish(["alpha"], path)